@@ -39,6 +39,8 @@ from neonworks.engine.core.event_interpreter import EventInterpreter
 class DemoGameState(GameState):
     """Demo game state implementation"""
 
+    reports_changes = True
+
     def __init__(self):
         self.switches: Dict[int, bool] = {}
         self.variables: Dict[int, int] = {}
@@ -50,6 +52,7 @@ class DemoGameState(GameState):
 
     def set_switch(self, switch_id: int, value: bool):
         self.switches[switch_id] = value
+        self.notify_changed("switch", switch_id)
         print(f"  [STATE] Switch {switch_id} = {value}")
 
     def get_variable(self, variable_id: int) -> int:
@@ -57,6 +60,7 @@ class DemoGameState(GameState):
 
     def set_variable(self, variable_id: int, value: int):
         self.variables[variable_id] = value
+        self.notify_changed("variable", variable_id)
         print(f"  [STATE] Variable {variable_id} = {value}")
 
     def has_item(self, item_id: int) -> bool:
@@ -670,6 +670,11 @@ class AudioManager:
         self._sound_pools.clear()
         print("Audio cache cleared")
 
+    @property
+    def playing_count(self) -> int:
+        """Number of sound instances being tracked as playing"""
+        return len(self._playing_sounds)
+
     def get_cache_info(self) -> Dict[str, int]:
         """Get cache statistics"""
         return {
@@ -8,6 +8,9 @@ Commands:
     validate <project_name> - Validate project configuration
     list                    - List all projects
     templates               - List available templates
+    simulate <database>     - Run headless batch battles for balancing
+    export-sprites <kind>   - Export character or face presets to PNGs in parallel
+    bench                   - Run the headless benchmark suite
 Usage:
     neonworks create my_game
     neonworks run my_game
@@ -51,6 +54,8 @@ ProjectSettings = None
 Project = None
 validate_project_config = None
 ValidationError = None
+# Battle simulator policies (listed here so argparse doesn't import the simulator)
+SIMULATION_POLICIES = ["ai", "attack", "random", "weighted", "scripted"]
 # Template configurations
 TEMPLATES = {
     "basic_game": {
@@ -441,6 +446,176 @@ if __name__ == '__main__':
             scripted_answers=scripted_answers,
         )
         print(f"   Bible draft, summary, and transcript saved to {project_dir/'bible'}")
+    def simulate_battles(
+        self,
+        database_path: Path,
+        party: list[int],
+        troop: list[int],
+        battles: int = 1000,
+        seed: int = 0,
+        level: Optional[int] = None,
+        party_policy: str = "ai",
+        troop_policy: str = "weighted",
+        script_path: Optional[Path] = None,
+        max_turns: int = 100,
+        workers: Optional[int] = None,
+        output: Optional[Path] = None,
+        report_format: Optional[str] = None,
+    ) -> bool:
+        """Run seeded headless battles between database actors and enemies"""
+        from neonworks.engine.data.database_manager import DatabaseError, DatabaseManager
+        from neonworks.gameplay.battle_simulator import (
+            BattleSetup,
+            ScriptedPolicy,
+            run_simulation,
+        )
+        database = DatabaseManager()
+        try:
+            database.load_from_file(Path(database_path))
+            setup = BattleSetup.from_database(database, party, troop, level)
+        except DatabaseError as e:
+            print(f"❌ Error: {e}")
+            return False
+        except KeyError as e:
+            print(f"❌ Error: Unknown actor, class or enemy ID {e}")
+            return False
+        policies = [party_policy, troop_policy]
+        if "scripted" in policies:
+            if script_path is None:
+                print("❌ Error: The scripted policy needs --script")
+                return False
+            with Path(script_path).open("r", encoding="utf-8") as handle:
+                scripted = ScriptedPolicy(json.load(handle))
+            policies = [scripted if policy == "scripted" else policy for policy in policies]
+        print(f"⚔️  Simulating {battles} battle(s) from seed {seed}")
+        print(f"   Party: {', '.join(c.name for c in setup.party)} ({party_policy})")
+        print(f"   Troop: {', '.join(c.name for c in setup.troop)} ({troop_policy})")
+        report = run_simulation(
+            setup,
+            battles,
+            seed=seed,
+            party_policy=policies[0],
+            troop_policy=policies[1],
+            max_turns=max_turns,
+            workers=workers,
+        )
+        data = report.to_dict()
+        outcomes = data["outcomes"]
+        print(f"\n   Win rate: {data['win_rate']:.1%}")
+        print(
+            f"   Outcomes: {outcomes['party']} won, {outcomes['troop']} lost, "
+            f"{outcomes['draw']} drawn"
+        )
+        turns = data["turns"]
+        print(f"   Turns: mean {turns['mean']:.1f}, median {turns['p50']}, p90 {turns['p90']}")
+        print("\n   Most impactful skills:")
+        for skill in data["skills"][:5]:
+            print(
+                f"   • [{skill['side']}] {skill['skill']}: {skill['impact']:.1f}/battle, "
+                f"{skill['uses']} use(s), {skill['win_rate_when_used']:.0%} win rate when used"
+            )
+        if output:
+            path = report.write(output, report_format)
+            print(f"\n✅ Report written to {path}")
+        return True
+    def export_sprites(
+        self,
+        kind: str,
+        preset_paths: list[Path],
+        library: Path,
+        output: Path,
+        sizes: Optional[list[int]] = None,
+        workers: Optional[int] = None,
+    ) -> bool:
+        """Export character or face preset JSON files to PNGs, skipping up-to-date outputs"""
+        from neonworks.engine.tools.batch_export import export_characters, export_faces
+        from neonworks.engine.tools.character_generator import CharacterPreset
+        from neonworks.engine.tools.face_generator import FacePreset
+        if kind == "character":
+            preset_class, export = CharacterPreset, export_characters
+        else:
+            preset_class, export = FacePreset, export_faces
+        files = []
+        for path in map(Path, preset_paths):
+            files.extend(sorted(path.glob("*.json")) if path.is_dir() else [path])
+        presets = []
+        for path in files:
+            try:
+                with path.open("r", encoding="utf-8") as handle:
+                    presets.append(preset_class.from_dict(json.load(handle)))
+            except (OSError, ValueError, KeyError) as e:
+                print(f"❌ Error: Could not load preset {path}: {e}")
+                return False
+        if not presets:
+            print("❌ Error: No preset files found")
+            return False
+        print(f"🎨 Exporting {len(presets)} {kind} preset(s) to {output}")
+        def report_progress(stats):
+            print(
+                f"   [{stats.done}/{stats.total}] {stats.files} file(s), "
+                f"{stats.files_per_second:.1f} files/s"
+            )
+        stats = export(
+            presets, library, output, sizes=sizes, workers=workers, on_progress=report_progress
+        )
+        print(f"\n✅ {stats.summary()}")
+        return True
+    def run_benchmarks(
+        self,
+        names: Optional[list[str]] = None,
+        scale: float = 1.0,
+        seed: int = 0,
+        repeat: int = 5,
+        output: Optional[Path] = None,
+        baseline: Optional[Path] = None,
+        tolerance: float = 0.1,
+    ) -> bool:
+        """Run seeded headless benchmarks, optionally checking them against a baseline"""
+        from neonworks.utils.benchmark_suite import BENCHMARKS, BenchmarkReport, run_benchmarks
+        unknown = [name for name in names or [] if name not in BENCHMARKS]
+        if unknown:
+            print(f"❌ Error: Unknown benchmark(s): {', '.join(unknown)}")
+            print(f"   Available: {', '.join(BENCHMARKS)}")
+            return False
+        baseline_report = None
+        if baseline:
+            try:
+                baseline_report = BenchmarkReport.load(baseline)
+            except (OSError, ValueError, KeyError) as e:
+                print(f"❌ Error: Could not load baseline {baseline}: {e}")
+                return False
+            if (baseline_report.scale, baseline_report.seed) != (scale, seed):
+                print(
+                    f"❌ Error: Baseline was run with --scale {baseline_report.scale} "
+                    f"--seed {baseline_report.seed}"
+                )
+                return False
+        print(f"⏱️  Running benchmarks at scale {scale} from seed {seed} ({repeat} run(s) each)")
+        def report_result(result):
+            print(
+                f"   {result.name:<20} median {result.median_ms:>10.3f}ms, "
+                f"min {result.min_ms:>10.3f}ms, stdev {result.stdev_ms:.3f}ms"
+            )
+        report = run_benchmarks(
+            names, scale=scale, seed=seed, repeat=repeat, on_result=report_result
+        )
+        if output:
+            path = report.write(output)
+            print(f"\n✅ Results written to {path}")
+        if baseline_report is None:
+            return True
+        print(f"\n📊 Compared with {baseline} (tolerance {tolerance:.0%}):")
+        comparisons = report.compare(baseline_report, tolerance)
+        for comparison in comparisons:
+            print(f"   {comparison.describe()}")
+        if baseline_report.machine != report.machine:
+            print("   ⚠️  Baseline was recorded on a different machine or library versions")
+        regressions = [comparison.name for comparison in comparisons if comparison.regressed]
+        if regressions:
+            print(f"\n❌ {len(regressions)} regression(s): {', '.join(regressions)}")
+            return False
+        print("\n✅ No regressions")
+        return True
 def main():
     """Main CLI entry point"""
     parser = argparse.ArgumentParser(
@@ -454,6 +629,9 @@ Examples:
   neonworks validate my_game                      # Validate project config
   neonworks list                                  # List all projects
   neonworks templates                             # List templates
+  neonworks simulate db.json --party 1 2 --troop 3 -n 5000 -o report.json
+  neonworks export-sprites character presets/ --library assets/characters -o out/
+  neonworks bench --scale 0.5 -o bench.json --baseline baseline.json
 For more information, see the documentation at docs/cli_tools.md
         """,
     )
@@ -513,6 +691,109 @@ For more information, see the documentation at docs/cli_tools.md
         help="List available templates",
         description="List all available project templates",
     )
+    # Simulate command
+    simulate_parser = subparsers.add_parser(
+        "simulate",
+        help="Run headless batch battles",
+        description="Simulate seeded battles between database actors and enemies for balancing",
+    )
+    simulate_parser.add_argument("database", type=Path, help="Path to the database JSON file")
+    simulate_parser.add_argument(
+        "--party", type=int, nargs="+", required=True, help="Party actor IDs"
+    )
+    simulate_parser.add_argument(
+        "--troop",
+        type=int,
+        nargs="+",
+        required=True,
+        help="Troop enemy IDs (repeat an ID for several of one enemy)",
+    )
+    simulate_parser.add_argument(
+        "--battles", "-n", type=int, default=1000, help="Number of battles (default: 1000)"
+    )
+    simulate_parser.add_argument(
+        "--seed", type=int, default=0, help="Seed of the first battle (default: 0)"
+    )
+    simulate_parser.add_argument(
+        "--level", type=int, help="Party level (default: each actor's initial level)"
+    )
+    simulate_parser.add_argument(
+        "--party-policy",
+        default="ai",
+        choices=SIMULATION_POLICIES,
+        help="How the party picks actions (default: ai)",
+    )
+    simulate_parser.add_argument(
+        "--troop-policy",
+        default="weighted",
+        choices=SIMULATION_POLICIES,
+        help="How the troop picks actions (default: weighted, from enemy action ratings)",
+    )
+    simulate_parser.add_argument(
+        "--script",
+        type=Path,
+        help="JSON mapping combatant names to skill ID sequences for the scripted policy",
+    )
+    simulate_parser.add_argument(
+        "--max-turns", type=int, default=100, help="Rounds before a draw (default: 100)"
+    )
+    simulate_parser.add_argument(
+        "--workers", "-j", type=int, help="Worker processes (default: one per CPU)"
+    )
+    simulate_parser.add_argument("--output", "-o", type=Path, help="Report file to write")
+    simulate_parser.add_argument(
+        "--format",
+        dest="report_format",
+        choices=["json", "csv"],
+        help="Report format (default: from the output extension)",
+    )
+    # Export sprites command
+    export_parser = subparsers.add_parser(
+        "export-sprites",
+        help="Export character or face presets to PNGs",
+        description="Render preset JSON files to PNGs in parallel, skipping unchanged presets",
+    )
+    export_parser.add_argument("kind", choices=["character", "face"], help="Kind of preset")
+    export_parser.add_argument(
+        "presets", type=Path, nargs="+", help="Preset JSON files or directories of them"
+    )
+    export_parser.add_argument(
+        "--library", "-l", type=Path, required=True, help="Component library directory"
+    )
+    export_parser.add_argument("--output", "-o", type=Path, required=True, help="Output directory")
+    export_parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        help="Sizes to export (default: 32 48 64 for characters, 128 for faces)",
+    )
+    export_parser.add_argument(
+        "--workers", "-j", type=int, help="Worker processes (default: one per CPU)"
+    )
+    # Bench command
+    bench_parser = subparsers.add_parser(
+        "bench",
+        help="Run the headless benchmark suite",
+        description="Time seeded engine benchmarks and compare them against a stored baseline",
+    )
+    bench_parser.add_argument("benchmarks", nargs="*", help="Benchmarks to run (default: all)")
+    bench_parser.add_argument(
+        "--scale", type=float, default=1.0, help="Workload size factor (default: 1.0)"
+    )
+    bench_parser.add_argument("--seed", type=int, default=0, help="Workload seed (default: 0)")
+    bench_parser.add_argument(
+        "--repeat", "-r", type=int, default=5, help="Timed runs per benchmark (default: 5)"
+    )
+    bench_parser.add_argument("--output", "-o", type=Path, help="Results JSON file to write")
+    bench_parser.add_argument(
+        "--baseline", "-b", type=Path, help="Results JSON file of an earlier run to compare with"
+    )
+    bench_parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.1,
+        help="Allowed slowdown of a median before it is a regression (default: 0.1 = 10%%)",
+    )
     # Parse arguments
     args = parser.parse_args()
     if not args.command:
@@ -540,6 +821,41 @@ For more information, see the documentation at docs/cli_tools.md
             success = cli.list_projects()
         elif args.command == "templates":
             success = cli.list_templates()
+        elif args.command == "simulate":
+            success = cli.simulate_battles(
+                args.database,
+                args.party,
+                args.troop,
+                battles=args.battles,
+                seed=args.seed,
+                level=args.level,
+                party_policy=args.party_policy,
+                troop_policy=args.troop_policy,
+                script_path=args.script,
+                max_turns=args.max_turns,
+                workers=args.workers,
+                output=args.output,
+                report_format=args.report_format,
+            )
+        elif args.command == "export-sprites":
+            success = cli.export_sprites(
+                args.kind,
+                args.presets,
+                args.library,
+                args.output,
+                sizes=args.sizes,
+                workers=args.workers,
+            )
+        elif args.command == "bench":
+            success = cli.run_benchmarks(
+                args.benchmarks,
+                scale=args.scale,
+                seed=args.seed,
+                repeat=args.repeat,
+                output=args.output,
+                baseline=args.baseline,
+                tolerance=args.tolerance,
+            )
         else:
             parser.print_help()
             return 1
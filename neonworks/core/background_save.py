@@ -0,0 +1,258 @@
+"""
+Background Saves
+
+Write-behind saving for autosaves. The state is snapshotted on the main
+thread, which is the only part the game loop waits for. Encoding and writing
+then run on a worker thread. Files are written to a temporary file, synced to
+disk and renamed into place, so a crash mid-save never leaves a torn save.
+"""
+
+import gc
+import os
+import threading
+import time
+import traceback
+from collections import deque
+from contextlib import contextmanager
+from enum import Enum
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Dict, Iterator, Optional, TypeVar
+
+from neonworks.utils.trace_recorder import trace_span
+
+T = TypeVar("T")
+
+# Snapshots taking longer than this (seconds) are counted as over budget.
+# This is a warning metric, not a limit: over-budget saves still run.
+DEFAULT_SNAPSHOT_BUDGET = 0.005
+
+_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+def snapshot_value(value: Any) -> Any:
+    """
+    Copy the containers of a value so later edits to the live state don't
+    reach the snapshot.
+
+    Only dicts, lists, tuples and sets are copied; strings, numbers and other
+    leaf values are shared, since the game loop replaces them rather than
+    mutating them.
+
+    Args:
+        value: Value to snapshot
+
+    Returns:
+        Snapshot of the value
+    """
+    # Containers of scalars (the common case) are shared or shallow-copied
+    value_type = type(value)
+    if value_type is tuple:
+        if _SCALAR_TYPES.issuperset(map(type, value)):
+            return value
+        return tuple(snapshot_value(item) for item in value)
+    if value_type is list:
+        if _SCALAR_TYPES.issuperset(map(type, value)):
+            return value.copy()
+        return [snapshot_value(item) for item in value]
+    if value_type is dict:
+        if _SCALAR_TYPES.issuperset(map(type, value.values())):
+            return value.copy()
+        return {key: snapshot_value(item) for key, item in value.items()}
+    if value_type is set:
+        return value.copy()
+    return value
+
+
+@contextmanager
+def atomic_write(path: Path) -> Iterator[BinaryIO]:
+    """
+    Open a file for writing so readers see either the old or the new contents.
+
+    The data goes to a temporary file next to the target, which is synced and
+    renamed over the target when the block exits without an exception.
+
+    Args:
+        path: File to write
+
+    Yields:
+        Binary file object to write to
+    """
+    path = Path(path)
+    temp_path = path.with_name(path.name + ".tmp")
+    try:
+        with open(temp_path, "wb") as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+    _fsync_directory(path.parent)
+
+
+class SaveStatus(Enum):
+    """Result of starting a background save"""
+
+    STARTED = "started"
+    BUSY = "busy"  # The previous save is still being written
+    FAILED = "failed"  # The snapshot raised an exception
+
+    def __bool__(self) -> bool:
+        return self is SaveStatus.STARTED
+
+
+class BackgroundSaver:
+    """
+    Runs one save at a time on a worker thread.
+
+    A save that is requested while the previous one is still writing is
+    skipped, so two saves never overlap.
+
+    The snapshot budget is reported, not enforced: a slow snapshot is counted
+    in over_budget_count and the save still goes ahead, since deferring saves
+    would trade a hitch for lost progress.
+    """
+
+    def __init__(self, snapshot_budget: float = DEFAULT_SNAPSHOT_BUDGET, pause_gc: bool = True):
+        """
+        Initialize background saver.
+
+        Args:
+            snapshot_budget: Snapshot time (seconds) above which a save is
+                counted as over budget
+            pause_gc: Disable the cyclic GC while snapshotting. gc.disable()
+                is process-wide, so other threads don't collect during the
+                snapshot either; pass False if that matters to the host.
+        """
+        self.snapshot_budget = snapshot_budget
+        self.pause_gc = pause_gc
+
+        # Main-thread pause per save (snapshot plus thread start)
+        self.hitch_times: deque = deque(maxlen=100)
+        self.saves_started = 0
+        self.saves_completed = 0
+        self.saves_failed = 0
+        self.saves_skipped = 0
+        self.over_budget_count = 0
+        self.last_snapshot_time = 0.0
+        self.max_snapshot_time = 0.0
+        self.last_write_time = 0.0
+        self.last_error: Optional[BaseException] = None
+
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def busy(self) -> bool:
+        """True while a save is being written"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def save(self, snapshot: Callable[[], T], write: Callable[[T], None]) -> SaveStatus:
+        """
+        Snapshot on this thread, then write on the worker thread.
+
+        Args:
+            snapshot: Captures the state to save (runs on the calling thread)
+            write: Encodes and writes the snapshot (runs on the worker thread)
+
+        Returns:
+            STARTED if the save was started, BUSY if one is still in progress,
+            or FAILED if the snapshot raised an exception
+        """
+        if self.busy:
+            self.saves_skipped += 1
+            return SaveStatus.BUSY
+
+        # The snapshot allocates many small objects but no reference cycles;
+        # pausing the cyclic GC keeps it from triggering full collections.
+        # The pause covers every thread but lasts only as long as the snapshot.
+        gc_paused = self.pause_gc and gc.isenabled()
+        if gc_paused:
+            gc.disable()
+        start = time.perf_counter()
+        try:
+            with trace_span("save_snapshot", "save"):
+                state = snapshot()
+        except Exception as e:
+            self.saves_failed += 1
+            self.last_error = e
+            print(f"Error during save snapshot: {e}")
+            traceback.print_exc()
+            return SaveStatus.FAILED
+        finally:
+            if gc_paused:
+                gc.enable()
+        snapshot_time = time.perf_counter() - start
+        self.last_snapshot_time = snapshot_time
+        self.max_snapshot_time = max(self.max_snapshot_time, snapshot_time)
+
+        self._thread = threading.Thread(
+            target=self._run, args=(write, state), name="neonworks-save", daemon=True
+        )
+        self._thread.start()
+        self.saves_started += 1
+        self.hitch_times.append(time.perf_counter() - start)
+
+        if snapshot_time > self.snapshot_budget:
+            self.over_budget_count += 1
+        return SaveStatus.STARTED
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for the save in progress to finish.
+
+        Args:
+            timeout: Maximum time to wait in seconds (None waits forever)
+
+        Returns:
+            True if no save is in progress anymore
+        """
+        if self._thread is not None:
+            self._thread.join(timeout)
+        return not self.busy
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get save counts, snapshot times and main-thread hitch times (seconds)"""
+        hitches = list(self.hitch_times)
+        return {
+            "saves_started": self.saves_started,
+            "saves_completed": self.saves_completed,
+            "saves_failed": self.saves_failed,
+            "saves_skipped": self.saves_skipped,
+            "over_budget": self.over_budget_count,
+            "snapshot_budget": self.snapshot_budget,
+            "last_snapshot": self.last_snapshot_time,
+            "max_snapshot": self.max_snapshot_time,
+            "last_hitch": hitches[-1] if hitches else 0.0,
+            "max_hitch": max(hitches) if hitches else 0.0,
+            "avg_hitch": sum(hitches) / len(hitches) if hitches else 0.0,
+            "last_write_time": self.last_write_time,
+        }
+
+    def _run(self, write: Callable[[Any], None], state: Any):
+        start = time.perf_counter()
+        try:
+            with trace_span("save_write", "save"):
+                write(state)
+            self.saves_completed += 1
+        except Exception as e:
+            self.saves_failed += 1
+            self.last_error = e
+            print(f"Error during background save: {e}")
+            traceback.print_exc()
+        finally:
+            self.last_write_time = time.perf_counter() - start
+
+
+def _fsync_directory(directory: Path):
+    """Persist a rename (not supported on every platform)"""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
@@ -0,0 +1,551 @@
+"""
+Binary Save Format
+
+Compact, versioned container for saved worlds, shared by
+core.serialization.GameSerializer and data.serialization.SaveGameManager.
+
+File layout:
+    MAGIC | format version (u16) | flags (u16) | header length (u32)
+    header: UTF-8 JSON with save metadata (readable without touching the body)
+    body:   record stream, zlib-compressed when FLAG_COMPRESSED is set
+
+Body records are written entity by entity. Strings are interned: each distinct
+string is defined once and referenced by index afterwards. Component types are
+registered by (name, field names) and referenced by a type id, and each
+combination of numeric field types gets a signature whose numeric fields are
+struct-packed in one call. Everything else uses a small tagged encoding that
+covers the JSON value domain, so a binary save loads into exactly what the
+JSON save of the same world would.
+"""
+
+import json
+import struct
+import zlib
+from operator import itemgetter
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+MAGIC = b"NWSV"
+FORMAT_VERSION = 1
+
+# Header flags
+FLAG_COMPRESSED = 0x1
+
+COMPRESSION_LEVEL = 1  # Fast; most of the size win comes from interning and packing
+
+# Body bytes buffered before being handed to the compressor / file
+FLUSH_SIZE = 64 * 1024
+
+_FILE_HEADER = struct.Struct("<HHI")
+_U32 = struct.Struct("<I")
+_I64 = struct.Struct("<q")
+_F64 = struct.Struct("<d")
+_COMPONENT = struct.Struct("<HH")
+
+# Record opcodes
+_OP_STRING = 0x53  # "S": string definition
+_OP_TYPE = 0x54  # "T": component type definition
+_OP_SIGNATURE = 0x47  # "G": field signature definition
+_OP_ENTITY = 0x45  # "E": entity
+_OP_END = 0x5A  # "Z": end of body, followed by the entity count
+
+# Value tags
+_TAG_NONE = 0x4E  # "N"
+_TAG_TRUE = 0x54  # "T"
+_TAG_FALSE = 0x46  # "F"
+_TAG_INT = 0x49  # "I": int64
+_TAG_BIGINT = 0x42  # "B": decimal string id
+_TAG_FLOAT = 0x44  # "D": float64
+_TAG_STRING = 0x53  # "S": string id
+_TAG_LIST = 0x4C  # "L": count, items
+_TAG_DICT = 0x4D  # "M": count, (key string id, value) pairs
+
+# Field signature codes: packed bool / int64 / float64, or tagged value
+_PACK_CODES = {bool: "?", int: "q", float: "d"}
+_VALUE_CODE = "v"
+
+# (type name, field names, field values) as handed to the writer
+ComponentFields = Tuple[str, Sequence[str], Sequence[Any]]
+
+# Writer-side field layout: (signature id, packer, packed value picker, tagged positions)
+_Layout = Tuple[int, Optional[struct.Struct], Optional[Callable], Tuple[int, ...]]
+
+
+class SaveFormatError(ValueError):
+    """Raised for unreadable or unencodable binary saves"""
+
+    pass
+
+
+def is_binary_save(stream: BinaryIO) -> bool:
+    """Check if a stream starts with the binary save magic (stream position is kept)"""
+    position = stream.tell()
+    try:
+        return stream.read(len(MAGIC)) == MAGIC
+    finally:
+        stream.seek(position)
+
+
+def read_header(stream: BinaryIO) -> Tuple[Dict[str, Any], int]:
+    """
+    Read the metadata header of a binary save without reading the body.
+
+    Args:
+        stream: Binary stream positioned at the start of the file
+
+    Returns:
+        Tuple of (header dict, flags)
+
+    Raises:
+        SaveFormatError: If the stream is not a binary save of a supported version
+    """
+    if stream.read(len(MAGIC)) != MAGIC:
+        raise SaveFormatError("Not a binary save file")
+
+    fixed = stream.read(_FILE_HEADER.size)
+    if len(fixed) != _FILE_HEADER.size:
+        raise SaveFormatError("Truncated save header")
+    version, flags, header_length = _FILE_HEADER.unpack(fixed)
+    if version > FORMAT_VERSION:
+        raise SaveFormatError(f"Unsupported save format version: {version}")
+
+    raw = stream.read(header_length)
+    if len(raw) != header_length:
+        raise SaveFormatError("Truncated save header")
+    try:
+        header = json.loads(raw.decode("utf-8"))
+    except ValueError as e:
+        raise SaveFormatError(f"Corrupt save header: {e}")
+    return header, flags
+
+
+class BinarySaveWriter:
+    """
+    Streaming writer for binary saves.
+
+    Writes the header immediately, then one entity record per write_entity()
+    call. close() terminates the body; a save without its end record is
+    rejected by the reader.
+    """
+
+    def __init__(
+        self,
+        stream: BinaryIO,
+        header: Dict[str, Any],
+        compress: bool = True,
+        fallback: Optional[Callable[[Any], Any]] = None,
+    ):
+        """
+        Start a binary save.
+
+        Args:
+            stream: Binary stream to write to
+            header: JSON-serializable metadata stored in front of the body
+            compress: Compress the body with zlib
+            fallback: Converts values outside the JSON domain (enums, nested
+                dataclasses, ...) into encodable values; without it they raise
+        """
+        self._stream = stream
+        self._compressor = zlib.compressobj(COMPRESSION_LEVEL) if compress else None
+        self._fallback = fallback
+
+        self._strings: Dict[str, int] = {}
+        self._types: Dict[Tuple[str, Tuple[str, ...]], int] = {}
+        self._signatures: Dict[str, int] = {}
+        self._layouts: Dict[Tuple[int, Tuple[type, ...]], _Layout] = {}
+
+        self._buffer = bytearray()
+        self.entity_count = 0
+        self._closed = False
+
+        header_bytes = json.dumps(header, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        flags = FLAG_COMPRESSED if compress else 0
+        stream.write(MAGIC + _FILE_HEADER.pack(FORMAT_VERSION, flags, len(header_bytes)))
+        stream.write(header_bytes)
+
+    def write_entity(
+        self,
+        entity_id: Any,
+        active: bool,
+        tags: Iterable[str],
+        components: Iterable[ComponentFields],
+    ):
+        """
+        Append one entity.
+
+        Args:
+            entity_id: Entity id
+            active: Entity active flag
+            tags: Entity tags
+            components: (type name, field names, field values) per component
+        """
+        tags = list(tags)
+        components = list(components)
+
+        # Definitions discovered while encoding go straight to the buffer,
+        # ahead of the record that uses them
+        record = bytearray()
+        record.append(_OP_ENTITY)
+        self._encode_value(record, entity_id)
+        record.append(1 if active else 0)
+        record += _U32.pack(len(tags))
+        for tag in tags:
+            self._encode_value(record, tag)
+
+        record += _U32.pack(len(components))
+        for type_name, names, values in components:
+            self._encode_component(record, type_name, names, values)
+
+        self._buffer += record
+        self.entity_count += 1
+        if len(self._buffer) >= FLUSH_SIZE:
+            self._flush()
+
+    def close(self):
+        """Write the end record and flush everything to the stream"""
+        if self._closed:
+            return
+        self._buffer.append(_OP_END)
+        self._buffer += _U32.pack(self.entity_count)
+        self._flush()
+        if self._compressor is not None:
+            self._stream.write(self._compressor.flush())
+        self._closed = True
+
+    def __enter__(self) -> "BinarySaveWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        if exc_type is None:
+            self.close()
+
+    def _flush(self):
+        if not self._buffer:
+            return
+        data = bytes(self._buffer)
+        self._buffer.clear()
+        if self._compressor is not None:
+            data = self._compressor.compress(data)
+        if data:
+            self._stream.write(data)
+
+    def _string_id(self, value: str) -> int:
+        string_id = self._strings.get(value)
+        if string_id is None:
+            string_id = len(self._strings)
+            self._strings[value] = string_id
+            encoded = value.encode("utf-8", "surrogatepass")
+            self._buffer.append(_OP_STRING)
+            self._buffer += _U32.pack(len(encoded))
+            self._buffer += encoded
+        return string_id
+
+    def _encode_component(
+        self, record: bytearray, type_name: str, names: Sequence[str], values: Sequence[Any]
+    ):
+        type_key = (type_name, tuple(names))
+        type_id = self._types.get(type_key)
+        if type_id is None:
+            type_id = self._define_type(type_key)
+
+        layout_key = (type_id, tuple(map(type, values)))
+        layout = self._layouts.get(layout_key)
+        if layout is None:
+            layout = self._define_layout(layout_key)
+        signature_id, packer, pick, tagged = layout
+
+        if packer is not None:
+            try:
+                packed = packer.pack(*(values if pick is None else pick(values)))
+            except struct.error:
+                # An int outside int64 range: encode this instance fully tagged
+                signature_id = self._signature_id(_VALUE_CODE * len(values))
+                packer, tagged = None, range(len(values))
+
+        record += _COMPONENT.pack(type_id, signature_id)
+        if packer is not None:
+            record += packed
+        for position in tagged:
+            self._encode_value(record, values[position])
+
+    def _define_type(self, type_key: Tuple[str, Tuple[str, ...]]) -> int:
+        type_id = len(self._types)
+        if type_id > 0xFFFF:
+            raise SaveFormatError("Too many component types")
+        type_name, names = type_key
+        definition = bytearray()
+        definition.append(_OP_TYPE)
+        definition += _U32.pack(self._string_id(type_name))
+        definition += _U32.pack(len(names))
+        for name in names:
+            definition += _U32.pack(self._string_id(name))
+        self._buffer += definition
+        self._types[type_key] = type_id
+        return type_id
+
+    def _define_layout(self, layout_key: Tuple[int, Tuple[type, ...]]) -> _Layout:
+        _, value_types = layout_key
+        codes = "".join(_PACK_CODES.get(t, _VALUE_CODE) for t in value_types)
+        signature_id = self._signature_id(codes)
+
+        packed = [i for i, code in enumerate(codes) if code != _VALUE_CODE]
+        tagged = tuple(i for i, code in enumerate(codes) if code == _VALUE_CODE)
+        packer = struct.Struct("<" + "".join(codes[i] for i in packed)) if packed else None
+        if not packed or not tagged:
+            pick = None  # All values packed (or none): no need to select
+        elif len(packed) == 1:
+            index = packed[0]
+            pick = lambda values: (values[index],)  # noqa: E731
+        else:
+            pick = itemgetter(*packed)
+
+        layout = (signature_id, packer, pick, tagged)
+        self._layouts[layout_key] = layout
+        return layout
+
+    def _signature_id(self, codes: str) -> int:
+        signature_id = self._signatures.get(codes)
+        if signature_id is None:
+            signature_id = len(self._signatures)
+            if signature_id > 0xFFFF:
+                raise SaveFormatError("Too many field signatures")
+            encoded = codes.encode("ascii")
+            self._buffer.append(_OP_SIGNATURE)
+            self._buffer += _U32.pack(len(encoded))
+            self._buffer += encoded
+            self._signatures[codes] = signature_id
+        return signature_id
+
+    def _encode_value(self, out: bytearray, value: Any, converted: bool = False):
+        value_type = type(value)
+        if value_type is str:
+            out.append(_TAG_STRING)
+            out += _U32.pack(self._string_id(value))
+        elif value_type is float:
+            out.append(_TAG_FLOAT)
+            out += _F64.pack(value)
+        elif value_type is int:
+            if -(2**63) <= value < 2**63:
+                out.append(_TAG_INT)
+                out += _I64.pack(value)
+            else:
+                out.append(_TAG_BIGINT)
+                out += _U32.pack(self._string_id(str(value)))
+        elif value_type is bool:
+            out.append(_TAG_TRUE if value else _TAG_FALSE)
+        elif value is None:
+            out.append(_TAG_NONE)
+        elif value_type is list or value_type is tuple:
+            out.append(_TAG_LIST)
+            out += _U32.pack(len(value))
+            for item in value:
+                self._encode_value(out, item)
+        elif value_type is dict:
+            out.append(_TAG_DICT)
+            out += _U32.pack(len(value))
+            for key, item in value.items():
+                out += _U32.pack(self._string_id(_json_key(key)))
+                self._encode_value(out, item)
+        elif isinstance(value, str):
+            # str-based enums etc. are written by their string content, like json
+            self._encode_value(out, str.__str__(value))
+        elif isinstance(value, int):
+            self._encode_value(out, int(value))
+        elif isinstance(value, float):
+            self._encode_value(out, float(value))
+        elif self._fallback is not None and not converted:
+            self._encode_value(out, self._fallback(value), converted=True)
+        else:
+            raise SaveFormatError(f"Cannot encode value of type {value_type.__name__}")
+
+
+class BinarySaveReader:
+    """Reader for binary saves"""
+
+    def __init__(self, stream: BinaryIO):
+        """
+        Open a binary save.
+
+        Args:
+            stream: Binary stream positioned at the start of the file
+
+        Raises:
+            SaveFormatError: If the header is missing or invalid
+        """
+        self._stream = stream
+        self.header, self.flags = read_header(stream)
+
+    def entities(self) -> Iterator[Tuple[Any, bool, List[Any], List[Tuple[str, Dict[str, Any]]]]]:
+        """
+        Decode the body.
+
+        Yields:
+            (entity id, active, tags, [(component type name, field dict), ...])
+
+        Raises:
+            SaveFormatError: If the body is corrupt or truncated
+        """
+        data = self._stream.read()
+        if self.flags & FLAG_COMPRESSED:
+            try:
+                decompressor = zlib.decompressobj()
+                data = decompressor.decompress(data)
+            except zlib.error as e:
+                raise SaveFormatError(f"Corrupt save body: {e}")
+            if not decompressor.eof:
+                raise SaveFormatError("Truncated save body")
+
+        try:
+            yield from self._parse(data)
+        except (struct.error, IndexError, KeyError, UnicodeDecodeError) as e:
+            raise SaveFormatError(f"Corrupt save body: {e}")
+
+    def _parse(self, data: bytes):
+        strings: List[str] = []
+        types: List[Tuple[str, Tuple[str, ...]]] = []
+        signatures: List[Tuple[Optional[struct.Struct], Tuple[int, ...], Tuple[int, ...]]] = []
+        decode = self._decode_value
+
+        position = 0
+        count = 0
+        end = len(data)
+        while position < end:
+            op = data[position]
+            position += 1
+
+            if op == _OP_ENTITY:
+                entity_id, position = decode(data, position, strings)
+                active = data[position] == 1
+                position += 1
+
+                (tag_count,) = _U32.unpack_from(data, position)
+                position += 4
+                tags = []
+                for _ in range(tag_count):
+                    tag, position = decode(data, position, strings)
+                    tags.append(tag)
+
+                (component_count,) = _U32.unpack_from(data, position)
+                position += 4
+                components = []
+                for _ in range(component_count):
+                    type_id, signature_id = _COMPONENT.unpack_from(data, position)
+                    position += 4
+                    type_name, names = types[type_id]
+                    unpacker, packed, tagged = signatures[signature_id]
+
+                    values: List[Any] = [None] * len(names)
+                    if unpacker is not None:
+                        for index, value in zip(packed, unpacker.unpack_from(data, position)):
+                            values[index] = value
+                        position += unpacker.size
+                    for index in tagged:
+                        values[index], position = decode(data, position, strings)
+                    components.append((type_name, dict(zip(names, values))))
+
+                count += 1
+                yield entity_id, active, tags, components
+
+            elif op == _OP_STRING:
+                (length,) = _U32.unpack_from(data, position)
+                position += 4
+                strings.append(data[position : position + length].decode("utf-8", "surrogatepass"))
+                position += length
+
+            elif op == _OP_TYPE:
+                name_id, field_count = struct.unpack_from("<II", data, position)
+                position += 8
+                field_ids = struct.unpack_from(f"<{field_count}I", data, position)
+                position += 4 * field_count
+                types.append((strings[name_id], tuple(strings[i] for i in field_ids)))
+
+            elif op == _OP_SIGNATURE:
+                (length,) = _U32.unpack_from(data, position)
+                position += 4
+                codes = data[position : position + length].decode("ascii")
+                position += length
+                packed = tuple(i for i, code in enumerate(codes) if code != _VALUE_CODE)
+                tagged = tuple(i for i, code in enumerate(codes) if code == _VALUE_CODE)
+                unpacker = (
+                    struct.Struct("<" + "".join(codes[i] for i in packed)) if packed else None
+                )
+                signatures.append((unpacker, packed, tagged))
+
+            elif op == _OP_END:
+                (expected,) = _U32.unpack_from(data, position)
+                if expected != count:
+                    raise SaveFormatError(f"Expected {expected} entities, found {count}")
+                return
+
+            else:
+                raise SaveFormatError(f"Unknown record type {op:#x} at offset {position - 1}")
+
+        raise SaveFormatError("Truncated save body")
+
+    @staticmethod
+    def _decode_value(data: bytes, position: int, strings: List[str]) -> Tuple[Any, int]:
+        decode = BinarySaveReader._decode_value
+        tag = data[position]
+        position += 1
+
+        if tag == _TAG_STRING:
+            return strings[_U32.unpack_from(data, position)[0]], position + 4
+        if tag == _TAG_FLOAT:
+            return _F64.unpack_from(data, position)[0], position + 8
+        if tag == _TAG_INT:
+            return _I64.unpack_from(data, position)[0], position + 8
+        if tag == _TAG_TRUE:
+            return True, position
+        if tag == _TAG_FALSE:
+            return False, position
+        if tag == _TAG_NONE:
+            return None, position
+        if tag == _TAG_LIST:
+            (count,) = _U32.unpack_from(data, position)
+            position += 4
+            items = []
+            for _ in range(count):
+                item, position = decode(data, position, strings)
+                items.append(item)
+            return items, position
+        if tag == _TAG_DICT:
+            (count,) = _U32.unpack_from(data, position)
+            position += 4
+            result = {}
+            for _ in range(count):
+                key = strings[_U32.unpack_from(data, position)[0]]
+                result[key], position = decode(data, position + 4, strings)
+            return result, position
+        if tag == _TAG_BIGINT:
+            return int(strings[_U32.unpack_from(data, position)[0]]), position + 4
+
+        raise SaveFormatError(f"Unknown value tag {tag:#x} at offset {position - 1}")
+
+
+def _json_key(key: Any) -> str:
+    """Convert a dict key the same way json.dumps does"""
+    if isinstance(key, str):
+        return str.__str__(key)
+    if key is True:
+        return "true"
+    if key is False:
+        return "false"
+    if key is None:
+        return "null"
+    if isinstance(key, int):
+        return int.__repr__(key)
+    if isinstance(key, float):
+        return json.dumps(float(key))
+    raise SaveFormatError(
+        f"Dict keys must be str, int, float, bool or None, not {type(key).__name__}"
+    )
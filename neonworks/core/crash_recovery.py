@@ -2,6 +2,10 @@
 Crash Recovery and Auto-Save System
 
 Provides automatic saving and crash recovery for the engine.
+
+Auto-saves triggered by update() snapshot the save data on the main thread and
+write it on a background thread, so the game loop doesn't stall on encoding
+and disk I/O.
 """
 
 import json
@@ -12,25 +16,45 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Callable, Dict, Optional
 
+from neonworks.core.background_save import (
+    DEFAULT_SNAPSHOT_BUDGET,
+    BackgroundSaver,
+    SaveStatus,
+    atomic_write,
+    snapshot_value,
+)
+
 
 class AutoSaveManager:
     """Manages automatic saving of project state"""
 
-    def __init__(self, save_dir: str = "autosaves", interval: float = 300.0):
+    def __init__(
+        self,
+        save_dir: str = "autosaves",
+        interval: float = 300.0,
+        background: bool = True,
+        snapshot_budget: float = DEFAULT_SNAPSHOT_BUDGET,
+    ):
         """
         Initialize auto-save manager.
 
         Args:
             save_dir: Directory to store auto-saves
             interval: Auto-save interval in seconds (default: 5 minutes)
+            background: Write timed auto-saves on a background thread
+            snapshot_budget: Main-thread snapshot time (seconds) above which a
+                save is counted as over budget
         """
         self.save_dir = Path(save_dir)
         self.interval = interval
         self.last_save_time: float = 0.0
         self.enabled: bool = True
+        self.background = background
         self.save_callback: Optional[Callable[[], Dict[str, Any]]] = None
         self.max_autosaves: int = 10  # Keep last 10 autosaves
 
+        self._saver = BackgroundSaver(snapshot_budget)
+
         # Create autosave directory
         self.save_dir.mkdir(parents=True, exist_ok=True)
 
@@ -56,12 +80,16 @@ class AutoSaveManager:
         self.last_save_time += dt
 
         if self.last_save_time >= self.interval:
-            self.save()
+            if not self.background:
+                self.save()
+            elif self.save_async() is SaveStatus.BUSY:
+                return  # Previous auto-save still writing; retry next update
+            # A failed save waits for the next interval instead of retrying every frame
             self.last_save_time = 0.0
 
     def save(self) -> bool:
         """
-        Perform auto-save.
+        Perform auto-save and wait for it to be written.
 
         Returns:
             True if save was successful
@@ -70,24 +98,11 @@ class AutoSaveManager:
             print("Warning: No save callback registered for auto-save")
             return False
 
-        try:
-            # Get save data
-            data = self.save_callback()
-
-            # Generate filename with timestamp
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"autosave_{timestamp}.json"
-            filepath = self.save_dir / filename
-
-            # Save to file
-            with open(filepath, "w") as f:
-                json.dump(data, f, indent=2)
-
-            print(f"Auto-save successful: {filename}")
-
-            # Clean up old autosaves
-            self._cleanup_old_saves()
+        # Never overlap a background auto-save
+        self._saver.wait()
 
+        try:
+            self._write_autosave(self.save_callback())
             return True
 
         except Exception as e:
@@ -95,6 +110,55 @@ class AutoSaveManager:
             traceback.print_exc()
             return False
 
+    def save_async(self) -> SaveStatus:
+        """
+        Start an auto-save that is written on a background thread.
+
+        Only the snapshot of the save data is taken on the calling thread.
+
+        Returns:
+            STARTED if the save was started, BUSY if the previous auto-save is
+            still being written, or FAILED if there is no save callback or
+            taking the snapshot raised an exception
+        """
+        if not self.save_callback:
+            print("Warning: No save callback registered for auto-save")
+            return SaveStatus.FAILED
+
+        return self._saver.save(lambda: snapshot_value(self.save_callback()), self._write_autosave)
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for a background auto-save to finish.
+
+        Args:
+            timeout: Maximum time to wait in seconds (None waits forever)
+
+        Returns:
+            True if no auto-save is being written anymore
+        """
+        return self._saver.wait(timeout)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get background auto-save counts and main-thread hitch times"""
+        return self._saver.get_stats()
+
+    def _write_autosave(self, data: Dict[str, Any]):
+        """Encode and write one auto-save file"""
+        # Generate filename with timestamp
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filename = f"autosave_{timestamp}.json"
+        filepath = self.save_dir / filename
+
+        # Save to file
+        with atomic_write(filepath) as f:
+            f.write(json.dumps(data, indent=2).encode("utf-8"))
+
+        print(f"Auto-save successful: {filename}")
+
+        # Clean up old autosaves
+        self._cleanup_old_saves()
+
     def _cleanup_old_saves(self):
         """Remove old auto-saves, keeping only the most recent ones"""
         try:
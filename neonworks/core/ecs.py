@@ -4,10 +4,17 @@ Entity Component System (ECS)
 A flexible ECS implementation for managing game entities, components, and systems.
 """
 
+import time
 import uuid
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Set, Type
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple, Type
+
+from neonworks.core.grid_index import GridIndex
+
+if TYPE_CHECKING:
+    from neonworks.utils.system_profiler import SystemProfiler
+    from neonworks.utils.trace_recorder import TraceRecorder
 
 
 class Component:
@@ -35,6 +42,32 @@ class GridPosition(Component):
     grid_y: int = 0
     layer: int = 0  # For multi-layer maps
 
+    def __setattr__(self, name: str, value: Any):
+        object.__setattr__(self, name, value)
+
+        # Keep the owning world's grid index in sync with position changes
+        index = self.__dict__.get("_grid_index")
+        if index is not None and name in ("grid_x", "grid_y", "layer"):
+            index.move(self._grid_entity_id, self.grid_x, self.grid_y, self.layer)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Never copy or pickle the binding to a world's index
+        state = dict(self.__dict__)
+        state.pop("_grid_index", None)
+        state.pop("_grid_entity_id", None)
+        return state
+
+    def _bind_index(self, index: Optional[GridIndex], entity_id: Optional[str] = None):
+        """Attach to (or detach from, when index is None) a world's grid index"""
+        old_index = self.__dict__.get("_grid_index")
+        if old_index is not None:
+            old_index.remove(self._grid_entity_id)
+
+        object.__setattr__(self, "_grid_index", index)
+        object.__setattr__(self, "_grid_entity_id", entity_id)
+        if index is not None:
+            index.insert(entity_id, self.grid_x, self.grid_y, self.layer)
+
 
 @dataclass
 class Sprite(Component):
@@ -111,6 +144,7 @@ class Navmesh(Component):
 
     walkable_cells: Set[tuple] = field(default_factory=set)  # Set of (x, y) tuples
     cost_multipliers: Dict[tuple, float] = field(default_factory=dict)  # Movement costs
+    version: int = 0  # Bumped on edits; the only invalidation for pathfinding caches
 
     def is_walkable(self, x: int, y: int) -> bool:
         return (x, y) in self.walkable_cells
@@ -118,6 +152,23 @@ class Navmesh(Component):
     def get_cost(self, x: int, y: int) -> float:
         return self.cost_multipliers.get((x, y), 1.0)
 
+    def set_walkable(self, x: int, y: int, walkable: bool = True):
+        """Mark a cell walkable or blocked and invalidate cached reachability"""
+        if walkable:
+            self.walkable_cells.add((x, y))
+        else:
+            self.walkable_cells.discard((x, y))
+        self.version += 1
+
+    def set_cost(self, x: int, y: int, cost: float):
+        """Set the movement cost of a cell and invalidate cached reachability"""
+        self.cost_multipliers[(x, y)] = cost
+        self.version += 1
+
+    def mark_dirty(self):
+        """Invalidate cached reachability after mutating the cell sets directly"""
+        self.version += 1
+
 
 @dataclass
 class TurnActor(Component):
@@ -161,31 +212,62 @@ class Entity:
         self.id = entity_id or str(uuid.uuid4())
         self._components: Dict[Type[Component], Component] = {}
         self.tags: Set[str] = set()
-        self.active: bool = True
         self._world: Optional["World"] = None  # Reference to the world this entity belongs to
+        self._active: bool = True
+
+    @property
+    def active(self) -> bool:
+        return self._active
+
+    @active.setter
+    def active(self, value: bool):
+        self._active = value
+        self.mark_dirty()
+
+    def mark_dirty(self):
+        """
+        Record that this entity changed since the world's last delta save.
+
+        Adding or removing components and tags marks the entity automatically;
+        call this after mutating component fields in place.
+        """
+        world = self._world
+        if world is not None and world._dirty_entities is not None:
+            world._dirty_entities.add(self.id)
 
     def add_component(self, component: Component) -> "Entity":
         """Add a component to this entity"""
         component_type = type(component)
+        previous = self._components.get(component_type)
         self._components[component_type] = component
 
         # Update world's component index if entity is in a world
         if self._world is not None:
+            self.mark_dirty()
             if component_type not in self._world._component_to_entities:
                 self._world._component_to_entities[component_type] = set()
             self._world._component_to_entities[component_type].add(self.id)
 
+            if component_type is GridPosition:
+                if previous is not None and previous is not component:
+                    previous._bind_index(None)
+                component._bind_index(self._world.grid_index, self.id)
+
         return self
 
     def remove_component(self, component_type: Type[Component]) -> "Entity":
         """Remove a component from this entity"""
         if component_type in self._components:
-            del self._components[component_type]
+            component = self._components.pop(component_type)
+            self.mark_dirty()
 
             # Update world's component index if entity is in a world
             if self._world is not None and component_type in self._world._component_to_entities:
                 self._world._component_to_entities[component_type].discard(self.id)
 
+            if component_type is GridPosition and self._world is not None:
+                component._bind_index(None)
+
         return self
 
     def get_component(self, component_type: Type[Component]) -> Optional[Component]:
@@ -213,6 +295,7 @@ class Entity:
 
         # Update world's tag index if entity is in a world
         if self._world is not None:
+            self.mark_dirty()
             if tag not in self._world._tags_to_entities:
                 self._world._tags_to_entities[tag] = set()
             self._world._tags_to_entities[tag].add(self.id)
@@ -229,6 +312,7 @@ class Entity:
             return self
 
         self.tags.discard(tag)
+        self.mark_dirty()
 
         # Update world's tag index if entity is in a world
         if self._world is not None and tag in self._world._tags_to_entities:
@@ -273,6 +357,18 @@ class World:
         # Component indexing for fast queries
         self._component_to_entities: Dict[Type[Component], Set[str]] = {}
 
+        # Spatial index of GridPosition entities (cell -> entity ids, per layer)
+        self.grid_index = GridIndex()
+
+        # Entities added/changed and removed since the last delta save (None
+        # while change tracking is off)
+        self._dirty_entities: Optional[Set[str]] = None
+        self._removed_entities: Optional[Set[str]] = None
+
+        # Per-system timings and timeline spans (None while off)
+        self._profiler: Optional["SystemProfiler"] = None
+        self._tracer: Optional["TraceRecorder"] = None
+
     def create_entity(self, entity_id: Optional[str] = None) -> Entity:
         """Create a new entity"""
         entity = Entity(entity_id)
@@ -286,6 +382,10 @@ class World:
         # Set the entity's world reference
         entity._world = self
 
+        if self._dirty_entities is not None:
+            self._dirty_entities.add(entity.id)
+            self._removed_entities.discard(entity.id)
+
         # Index tags
         for tag in entity.tags:
             if tag not in self._tags_to_entities:
@@ -298,6 +398,11 @@ class World:
                 self._component_to_entities[component_type] = set()
             self._component_to_entities[component_type].add(entity.id)
 
+        # Index grid position
+        grid_pos = entity._components.get(GridPosition)
+        if grid_pos is not None:
+            grid_pos._bind_index(self.grid_index, entity.id)
+
         # Notify systems
         for system in self._systems:
             system.on_entity_added(entity)
@@ -325,9 +430,18 @@ class World:
             if component_type in self._component_to_entities:
                 self._component_to_entities[component_type].discard(entity_id)
 
+        # Remove from grid index
+        grid_pos = entity._components.get(GridPosition)
+        if grid_pos is not None:
+            grid_pos._bind_index(None)
+
         # Clear the entity's world reference
         entity._world = None
 
+        if self._dirty_entities is not None:
+            self._dirty_entities.discard(entity_id)
+            self._removed_entities.add(entity_id)
+
         del self._entities[entity_id]
         return self
 
@@ -339,6 +453,11 @@ class World:
         """Get all entities"""
         return list(self._entities.values())
 
+    @property
+    def entity_count(self) -> int:
+        """Number of entities (without building a list)"""
+        return len(self._entities)
+
     def get_entities_with_component(self, component_type: Type[Component]) -> List[Entity]:
         """Get all entities that have a specific component"""
         entity_ids = self._component_to_entities.get(component_type, set())
@@ -363,6 +482,80 @@ class World:
         entity_ids = self._tags_to_entities.get(tag, set())
         return [self._entities[eid] for eid in entity_ids if eid in self._entities]
 
+    def entities_at(self, x: int, y: int, layer: Optional[int] = None) -> List[Entity]:
+        """Get all entities whose GridPosition is on a cell (layer None = all layers)"""
+        return [
+            self._entities[eid]
+            for eid in self.grid_index.ids_at(x, y, layer)
+            if eid in self._entities
+        ]
+
+    def entities_in_rect(
+        self, x: int, y: int, width: int, height: int, layer: Optional[int] = None
+    ) -> List[Entity]:
+        """Get all entities whose GridPosition lies inside a cell rectangle"""
+        return [
+            self._entities[eid]
+            for eid in self.grid_index.ids_in_rect(x, y, width, height, layer)
+            if eid in self._entities
+        ]
+
+    def is_cell_blocked(
+        self,
+        x: int,
+        y: int,
+        layer: Optional[int] = None,
+        ignore_entity: Optional[Entity] = None,
+    ) -> bool:
+        """
+        Check if a solid entity occupies a cell.
+
+        An entity is solid when any of its components has a truthy
+        ``blocks_movement`` attribute (e.g. ``Collider2D``).
+        """
+        ignore_id = ignore_entity.id if ignore_entity is not None else None
+
+        def is_solid(entity_id: str) -> bool:
+            if entity_id == ignore_id:
+                return False
+            entity = self._entities.get(entity_id)
+            if entity is None:
+                return False
+            return any(
+                getattr(component, "blocks_movement", False)
+                for component in entity._components.values()
+            )
+
+        return self.grid_index.any_at(x, y, is_solid, layer)
+
+    def start_change_tracking(self):
+        """Start (or restart) recording entity changes for delta saves"""
+        self._dirty_entities = set()
+        self._removed_entities = set()
+
+    def stop_change_tracking(self):
+        """Stop recording entity changes"""
+        self._dirty_entities = None
+        self._removed_entities = None
+
+    @property
+    def tracking_changes(self) -> bool:
+        """True while entity changes are being recorded"""
+        return self._dirty_entities is not None
+
+    def take_changes(self) -> Tuple[Set[str], Set[str]]:
+        """
+        Get and reset the entities changed since the last call.
+
+        Returns:
+            Tuple of (ids of added or changed entities, ids of removed entities)
+        """
+        if self._dirty_entities is None:
+            raise RuntimeError("Change tracking is not enabled")
+        changes = (self._dirty_entities, self._removed_entities)
+        self.start_change_tracking()
+        return changes
+
     def add_system(self, system: System) -> "World":
         """Add a system to the world"""
         self._systems.append(system)
@@ -381,9 +574,109 @@ class World:
             if system.enabled:
                 system.update(self, delta_time)
 
+    def enable_profiling(self, profiler: Optional["SystemProfiler"] = None) -> "SystemProfiler":
+        """
+        Time every system in each update.
+
+        Swaps a timed update method onto this world; the plain loop is
+        restored once profiling and tracing are both off, so uninstrumented
+        worlds pay no timing cost.
+
+        Args:
+            profiler: Profiler to record into (default: a new SystemProfiler)
+
+        Returns:
+            The profiler recording the timings
+        """
+        if profiler is None:
+            from neonworks.utils.system_profiler import SystemProfiler
+
+            profiler = SystemProfiler()
+        self._profiler = profiler
+        self._instrument()
+        return profiler
+
+    def disable_profiling(self):
+        """Stop timing systems"""
+        self._profiler = None
+        self._instrument()
+
+    @property
+    def profiler(self) -> Optional["SystemProfiler"]:
+        """Profiler recording system timings, or None while profiling is off"""
+        return self._profiler
+
+    def enable_tracing(self, recorder: Optional["TraceRecorder"] = None) -> "TraceRecorder":
+        """
+        Record a timeline span for each update and each system.
+
+        Args:
+            recorder: Recorder to write into (default: the global trace
+                recorder, started if needed)
+
+        Returns:
+            The recorder receiving the spans
+        """
+        if recorder is None:
+            from neonworks.utils.trace_recorder import start_tracing
+
+            recorder = start_tracing()
+        self._tracer = recorder
+        self._instrument()
+        return recorder
+
+    def disable_tracing(self):
+        """Stop recording update spans"""
+        self._tracer = None
+        self._instrument()
+
+    @property
+    def tracer(self) -> Optional["TraceRecorder"]:
+        """Recorder receiving update spans, or None while tracing is off"""
+        return self._tracer
+
     def clear(self):
         """Remove all entities and systems"""
+        for entity in self._entities.values():
+            grid_pos = entity._components.get(GridPosition)
+            if grid_pos is not None:
+                grid_pos._bind_index(None)
+        self.grid_index.clear()
+
+        if self._dirty_entities is not None:
+            self._dirty_entities.clear()
+            self._removed_entities.update(self._entities)
+
         self._entities.clear()
         self._systems.clear()
         self._tags_to_entities.clear()
         self._component_to_entities.clear()
+
+    def _instrument(self):
+        """Swap between the timed and the plain update loop"""
+        if self._profiler is not None or self._tracer is not None:
+            self.update = self._update_instrumented
+        else:
+            self.__dict__.pop("update", None)
+
+    def _update_instrumented(self, delta_time: float):
+        """Update all systems, timing each one"""
+        profiler = self._profiler
+        tracer = self._tracer
+        clock = time.perf_counter_ns
+        spans = []
+        start = clock()
+        for system in self._systems:
+            if system.enabled:
+                system_start = clock()
+                system.update(self, delta_time)
+                spans.append((type(system).__name__, system_start, clock()))
+        end = clock()
+
+        if profiler is not None:
+            timings = [(name, stop - begin) for name, begin, stop in spans]
+            profiler.record_update(timings, end - start)
+        if tracer is not None:
+            tracer.record("World.update", "update", start, end)
+            for name, begin, stop in spans:
+                tracer.record(name, "system", begin, stop)
@@ -8,7 +8,7 @@ Inspired by RPG Maker's event system but adapted for NeonWorks.
 import json
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 
 class CommandType(Enum):
@@ -474,6 +474,34 @@ class EventPage:
     # Commands
     commands: List[EventCommand] = field(default_factory=list)
 
+    # Edit counter used to invalidate compiled command programs
+    version: int = field(default=0, compare=False, repr=False)
+
+    def mark_dirty(self):
+        """Signal that commands were edited so cached compiled programs are rebuilt"""
+        self.version += 1
+
+    def get_dependencies(self) -> Tuple[Tuple[str, int], ...]:
+        """
+        Get the game state values this page's conditions read.
+
+        Returns:
+            Tuple of (kind, id) pairs where kind is "switch", "variable",
+            "item" or "actor"
+        """
+        dependencies = []
+        if self.condition_switch1_valid:
+            dependencies.append(("switch", self.condition_switch1_id))
+        if self.condition_switch2_valid:
+            dependencies.append(("switch", self.condition_switch2_id))
+        if self.condition_variable_valid:
+            dependencies.append(("variable", self.condition_variable_id))
+        if self.condition_item_valid:
+            dependencies.append(("item", self.condition_item_id))
+        if self.condition_actor_valid:
+            dependencies.append(("actor", self.condition_actor_id))
+        return tuple(dependencies)
+
     def check_conditions(self, game_state: "GameState") -> bool:
         """
         Check if this page's conditions are met.
@@ -721,6 +749,33 @@ class EventContext:
 class GameState:
     """Game state interface - to be implemented in game logic"""
 
+    # Set to True by implementations whose set_switch/set_variable call
+    # notify_changed(), so listeners can rely on notifications instead of polling
+    reports_changes = False
+
+    def add_change_listener(self, listener: Callable[[str, int], None]):
+        """Register a callback receiving (kind, id) when a switch or variable changes"""
+        listeners = self.__dict__.setdefault("_change_listeners", [])
+        if listener not in listeners:
+            listeners.append(listener)
+
+    def remove_change_listener(self, listener: Callable[[str, int], None]):
+        """Unregister a change callback"""
+        listeners = self.__dict__.get("_change_listeners", [])
+        if listener in listeners:
+            listeners.remove(listener)
+
+    def notify_changed(self, kind: str, key_id: int):
+        """
+        Notify listeners that a value changed.
+
+        Args:
+            kind: "switch" or "variable"
+            key_id: Switch or variable ID
+        """
+        for listener in list(self.__dict__.get("_change_listeners", ())):
+            listener(kind, key_id)
+
     def get_switch(self, switch_id: int) -> bool:
         """Get switch value"""
         raise NotImplementedError
@@ -8,10 +8,22 @@ such as player proximity, button presses, and automatic triggers.
 import json
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Callable, Dict, List, Optional, Set, Tuple
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set, Tuple
 
 from .event_commands import EventContext, EventPage, GameEvent, GameState, TriggerType
 
+if TYPE_CHECKING:
+    from neonworks.engine.core.event_interpreter import EventInterpreter
+
+# Triggers that can only fire with the player on or next to the event tile
+POSITIONAL_TRIGGERS = (
+    TriggerType.ACTION_BUTTON,
+    TriggerType.PLAYER_TOUCH,
+    TriggerType.EVENT_TOUCH,
+)
+
+DependencyKey = Tuple[str, int]
+
 
 class TriggerResult(Enum):
     """Result of trigger check"""
@@ -274,6 +286,13 @@ class EventTriggerManager:
     Manages all event triggers in the game.
 
     Handles trigger detection, event activation, and event execution.
+
+    Active pages are cached per event and only re-evaluated when a switch,
+    variable, item or actor that one of the event's page conditions reads has
+    changed. Game states with ``reports_changes`` push switch/variable changes
+    through ``notify_changed``; everything else is detected by polling only the
+    watched values. Positional triggers are looked up through a cell index
+    around the player instead of checking every event.
     """
 
     game_state: GameState
@@ -287,9 +306,52 @@ class EventTriggerManager:
     on_event_end: Optional[Callable[[GameEvent], None]] = None
     on_command_execute: Optional[Callable[[EventContext], None]] = None
 
+    # Number of events whose active page was re-evaluated
+    page_evaluations: int = field(default=0, init=False, compare=False)
+
+    # Dependency tracking
+    _dependents: Dict[DependencyKey, Set[int]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _event_dependencies: Dict[int, Tuple[DependencyKey, ...]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _observed: Dict[DependencyKey, Any] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _dirty_events: Set[int] = field(default_factory=set, init=False, repr=False, compare=False)
+    _listening: bool = field(default=False, init=False, repr=False, compare=False)
+
+    # Trigger spatial index
+    _trigger_cells: Dict[Tuple[int, int], Set[int]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _trigger_positions: Dict[int, Tuple[int, int]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _global_triggers: Set[int] = field(default_factory=set, init=False, repr=False, compare=False)
+    _event_order: Dict[int, int] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _next_order: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        if getattr(self.game_state, "reports_changes", False):
+            self.game_state.add_change_listener(self._on_state_changed)
+            self._listening = True
+
+        for event in list(self.events.values()):
+            self.add_event(event)
+
     def add_event(self, event: GameEvent):
         """Add an event to the manager"""
+        if event.id in self._event_dependencies:
+            self._unindex_dependencies(event.id)
+
         self.events[event.id] = event
+        self._assign_order(event.id)
+        self._index_dependencies(event)
+        self._dirty_events.add(event.id)
 
     def remove_event(self, event_id: int):
         """Remove an event from the manager"""
@@ -300,30 +362,84 @@ class EventTriggerManager:
         if event_id in self.running_events:
             del self.running_events[event_id]
 
+        self._unindex_dependencies(event_id)
+        self._unindex_trigger(event_id)
+        self._dirty_events.discard(event_id)
+        self._event_order.pop(event_id, None)
+
+    def invalidate_event(self, event_id: int):
+        """
+        Force re-evaluation of an event's active page.
+
+        Call after editing the conditions or pages of an event that is
+        already registered.
+        """
+        event = self.events.get(event_id)
+        if event is not None:
+            self.add_event(event)
+
+    def invalidate_all(self):
+        """Force re-evaluation of every event's active page"""
+        for event in list(self.events.values()):
+            self.add_event(event)
+
+    def move_event(self, event_id: int, x: int, y: int):
+        """Move an event to a new tile, keeping the trigger index up to date"""
+        event = self.events.get(event_id)
+        if event is None:
+            return
+
+        event.x = x
+        event.y = y
+        if event_id in self._trigger_positions:
+            self._index_trigger(event_id)
+
     def update_event_handlers(self):
         """
         Update event handlers based on current page conditions.
 
         This should be called when game state changes (switches, variables, etc.)
+        Only events whose condition inputs changed since the last call are
+        re-evaluated.
         """
-        for event in self.events.values():
+        self._poll_dependencies()
+        if not self._dirty_events:
+            return
+
+        dirty = self._dirty_events
+        self._dirty_events = set()
+
+        for event_id in dirty:
+            event = self.events.get(event_id)
+            if event is None:
+                continue
+
             active_page = event.get_active_page(self.game_state)
+            self.page_evaluations += 1
 
             if active_page:
                 if event.id not in self.active_handlers:
                     self.active_handlers[event.id] = EventTriggerHandler(
                         event=event, page=active_page
                     )
+                    self._index_trigger(event.id)
                 else:
                     # Update page if it changed
                     handler = self.active_handlers[event.id]
                     if handler.page != active_page:
                         handler.page = active_page
                         handler.is_active = False
+                        self._index_trigger(event.id)
             else:
                 # No active page, remove handler
                 if event.id in self.active_handlers:
                     del self.active_handlers[event.id]
+                    self._unindex_trigger(event.id)
+
+    def get_dirty_events(self) -> Set[int]:
+        """Get the IDs of events waiting for re-evaluation"""
+        self._poll_dependencies()
+        return set(self._dirty_events)
 
     def check_triggers(self, context: TriggerContext) -> List[Tuple[GameEvent, EventPage]]:
         """
@@ -335,9 +451,25 @@ class EventTriggerManager:
         Returns:
             List of (event, page) tuples that were triggered
         """
+        if len(self._trigger_positions) + len(self._global_triggers) != len(self.active_handlers):
+            self._rebuild_trigger_index()
+
+        # Positional triggers only fire within one tile of the player
+        candidates = set(self._global_triggers)
+        px, py = context.player_position
+        for cy in (py - 1, py, py + 1):
+            for cx in (px - 1, px, px + 1):
+                event_ids = self._trigger_cells.get((cx, cy))
+                if event_ids:
+                    candidates.update(event_ids)
+
         triggered_events = []
 
-        for handler in self.active_handlers.values():
+        for event_id in sorted(candidates, key=self._event_order.__getitem__):
+            handler = self.active_handlers.get(event_id)
+            if handler is None:
+                continue
+
             result = handler.check_trigger(context)
 
             if result == TriggerResult.TRIGGERED:
@@ -346,6 +478,95 @@ class EventTriggerManager:
 
         return triggered_events
 
+    def _on_state_changed(self, kind: str, key_id: int):
+        """Change listener registered with the game state"""
+        event_ids = self._dependents.get((kind, key_id))
+        if event_ids:
+            self._dirty_events.update(event_ids)
+
+    def _read_dependency(self, key: DependencyKey) -> Any:
+        kind, key_id = key
+        if kind == "switch":
+            return self.game_state.get_switch(key_id)
+        elif kind == "variable":
+            return self.game_state.get_variable(key_id)
+        elif kind == "item":
+            return self.game_state.has_item(key_id)
+        elif kind == "actor":
+            return self.game_state.has_actor(key_id)
+        return None
+
+    def _is_polled(self, key: DependencyKey) -> bool:
+        # Items and actors have no change notifications
+        return not self._listening or key[0] in ("item", "actor")
+
+    def _poll_dependencies(self):
+        """Mark dependents of watched values that changed since the last poll"""
+        for key, previous in self._observed.items():
+            current = self._read_dependency(key)
+            if current != previous:
+                self._observed[key] = current
+                self._dirty_events.update(self._dependents.get(key, ()))
+
+    def _index_dependencies(self, event: GameEvent):
+        keys = tuple(dict.fromkeys(key for page in event.pages for key in page.get_dependencies()))
+        self._event_dependencies[event.id] = keys
+
+        for key in keys:
+            dependents = self._dependents.setdefault(key, set())
+            dependents.add(event.id)
+            if key not in self._observed and self._is_polled(key):
+                self._observed[key] = self._read_dependency(key)
+
+    def _unindex_dependencies(self, event_id: int):
+        for key in self._event_dependencies.pop(event_id, ()):
+            dependents = self._dependents.get(key)
+            if dependents is None:
+                continue
+            dependents.discard(event_id)
+            if not dependents:
+                del self._dependents[key]
+                self._observed.pop(key, None)
+
+    def _assign_order(self, event_id: int):
+        """Give an event a stable position for deterministic trigger order"""
+        if event_id not in self._event_order:
+            self._event_order[event_id] = self._next_order
+            self._next_order += 1
+
+    def _index_trigger(self, event_id: int):
+        """Place an active handler in the trigger index"""
+        self._unindex_trigger(event_id)
+
+        handler = self.active_handlers[event_id]
+        if handler.page is not None and handler.page.trigger in POSITIONAL_TRIGGERS:
+            position = (handler.event.x, handler.event.y)
+            self._trigger_positions[event_id] = position
+            self._trigger_cells.setdefault(position, set()).add(event_id)
+        else:
+            self._global_triggers.add(event_id)
+
+    def _unindex_trigger(self, event_id: int):
+        self._global_triggers.discard(event_id)
+
+        position = self._trigger_positions.pop(event_id, None)
+        if position is not None:
+            event_ids = self._trigger_cells.get(position)
+            if event_ids is not None:
+                event_ids.discard(event_id)
+                if not event_ids:
+                    del self._trigger_cells[position]
+
+    def _rebuild_trigger_index(self):
+        """Rebuild the trigger index from active_handlers"""
+        self._trigger_cells.clear()
+        self._trigger_positions.clear()
+        self._global_triggers.clear()
+
+        for event_id, handler in self.active_handlers.items():
+            self._assign_order(event_id)
+            self._index_trigger(event_id)
+
     def start_event(self, event: GameEvent, page: EventPage) -> EventContext:
         """
         Start executing an event.
@@ -467,14 +688,30 @@ class EventTriggerManager:
         return {"events": {event_id: event.to_dict() for event_id, event in self.events.items()}}
 
     @classmethod
-    def from_dict(cls, data: Dict[str, any], game_state: GameState) -> "EventTriggerManager":
-        """Deserialize manager state from dictionary"""
+    def from_dict(
+        cls,
+        data: Dict[str, any],
+        game_state: GameState,
+        interpreter: Optional["EventInterpreter"] = None,
+    ) -> "EventTriggerManager":
+        """
+        Deserialize manager state from dictionary.
+
+        Args:
+            data: Serialized manager state (a map's events)
+            game_state: Game state the events read and write
+            interpreter: Interpreter that will run the events; their pages and
+                scripts are compiled now so the first run doesn't pay for it
+        """
         manager = cls(game_state=game_state)
 
         for event_id, event_data in data.get("events", {}).items():
             event = GameEvent.from_dict(event_data)
             manager.add_event(event)
 
+        if interpreter is not None:
+            interpreter.precompile_events(manager.events.values())
+
         manager.update_event_handlers()
         return manager
 
@@ -483,9 +720,14 @@ class EventTriggerManager:
         return json.dumps(self.to_dict(), indent=2)
 
     @classmethod
-    def from_json(cls, json_str: str, game_state: GameState) -> "EventTriggerManager":
-        """Deserialize from JSON string"""
-        return cls.from_dict(json.loads(json_str), game_state)
+    def from_json(
+        cls,
+        json_str: str,
+        game_state: GameState,
+        interpreter: Optional["EventInterpreter"] = None,
+    ) -> "EventTriggerManager":
+        """Deserialize from JSON string, precompiling events for an interpreter if given"""
+        return cls.from_dict(json.loads(json_str), game_state, interpreter)
 
 
 def create_proximity_trigger(max_distance: int = 1) -> TriggerCondition:
@@ -5,7 +5,8 @@ Main game engine with fixed timestep update and variable rendering.
 """
 
 import time
-from typing import Optional
+from array import array
+from typing import Dict, Optional
 
 import pygame
 
@@ -14,6 +15,103 @@ from neonworks.core.ecs import World
 from neonworks.core.events import EventManager, get_event_manager
 from neonworks.core.state import StateManager
 from neonworks.input.input_manager import InputManager
+from neonworks.utils.memory_diagnostics import get_memory_diagnostics
+from neonworks.utils.trace_recorder import (
+    DEFAULT_CAPACITY,
+    TraceRecorder,
+    get_trace_recorder,
+    start_tracing,
+    stop_tracing,
+    trace_span,
+)
+
+
+class FramePacer:
+    """
+    Paces frames to a target rate using perf_counter deadlines.
+
+    Sleeps through most of the time left in a frame, then spins for the last
+    spin_threshold seconds, since sleep() tends to overshoot by a millisecond
+    or two. Deadlines advance by whole frames, so a late frame is made up in
+    the next one; after falling more than a frame behind, the schedule
+    restarts from the current time instead of rushing to catch up.
+    """
+
+    def __init__(self, target_fps: float, spin_threshold: float = 0.002, history_size: int = 240):
+        """
+        Initialize frame pacer.
+
+        Args:
+            target_fps: Frames per second to pace to (0 = unlimited)
+            spin_threshold: Seconds before a deadline to stop sleeping and spin
+            history_size: Number of frame intervals kept for jitter statistics
+        """
+        self.frame_duration = 1.0 / target_fps if target_fps > 0 else 0.0
+        self.spin_threshold = spin_threshold
+
+        self._deadline = 0.0
+        self._last_frame = 0.0
+
+        # Ring buffer of frame-to-frame intervals (seconds)
+        self._intervals = array("d", bytes(8 * history_size))
+        self._interval_count = 0
+
+    def reset(self, now: Optional[float] = None):
+        """Restart the schedule, with the next deadline one frame from now"""
+        if now is None:
+            now = time.perf_counter()
+        self._deadline = now + self.frame_duration
+        self._last_frame = now
+
+    def wait(self) -> float:
+        """
+        Wait until the next frame deadline.
+
+        Returns:
+            perf_counter() time at which the wait ended
+        """
+        clock = time.perf_counter
+        deadline = self._deadline
+        remaining = deadline - clock()
+        if remaining > self.spin_threshold:
+            time.sleep(remaining - self.spin_threshold)
+        now = clock()
+        while now < deadline:
+            now = clock()
+
+        if now - deadline > self.frame_duration:
+            self._deadline = now + self.frame_duration
+        else:
+            self._deadline = deadline + self.frame_duration
+
+        intervals = self._intervals
+        intervals[self._interval_count % len(intervals)] = now - self._last_frame
+        self._interval_count += 1
+        self._last_frame = now
+        return now
+
+    def get_stats(self) -> Dict[str, float]:
+        """
+        Get frame interval statistics (milliseconds).
+
+        Returns:
+            Dictionary with the mean, standard deviation and largest deviation
+            from the target of the recent frame intervals
+        """
+        count = min(self._interval_count, len(self._intervals))
+        if not count:
+            return {"frames": 0, "mean_ms": 0.0, "jitter_ms": 0.0, "max_error_ms": 0.0}
+
+        intervals = self._intervals[:count]
+        mean = sum(intervals) / count
+        variance = sum((x - mean) ** 2 for x in intervals) / count
+        max_error = max(abs(x - self.frame_duration) for x in intervals)
+        return {
+            "frames": count,
+            "mean_ms": mean * 1000,
+            "jitter_ms": variance**0.5 * 1000,
+            "max_error_ms": max_error * 1000,
+        }
 
 
 class GameEngine:
@@ -21,11 +119,15 @@ class GameEngine:
     Main game engine with fixed timestep update.
 
     Uses the "fix your timestep" pattern for consistent gameplay
-    regardless of frame rate.
+    regardless of frame rate. Leftover simulation time is exposed as
+    alpha (also set on the state manager) for render interpolation.
 
     Integrates input, audio, collision, and rendering systems.
     """
 
+    # Longest frame time fed to the simulation (e.g. after a debugger pause)
+    MAX_FRAME_TIME = 0.25
+
     def __init__(self, target_fps: int = 60, fixed_timestep: float = 1.0 / 60.0):
         self.target_fps = target_fps
         self.fixed_timestep = fixed_timestep
@@ -45,13 +147,20 @@ class GameEngine:
         self.input_manager = InputManager()
         self.audio_manager = AudioManager()
 
-        # Timing
+        # Timing (perf_counter seconds)
+        self.frame_pacer = FramePacer(target_fps)
+        self.max_updates = 5  # Most fixed updates per frame
+        self.alpha = 0.0  # Render interpolation factor
         self._last_time = 0.0
         self._accumulator = 0.0
+        self._update_cost = 0.0  # Running average seconds per fixed update
         self._frame_count = 0
         self._fps_timer = 0.0
         self._current_fps = 0
 
+        # Per-system update timings (None while profiling is off)
+        self.profiler = None
+
         # Performance stats
         self.stats = {
             "fps": 0,
@@ -60,12 +169,15 @@ class GameEngine:
             "render_time": 0.0,
             "entity_count": 0,
             "audio_playing": 0,
+            "updates": 0,  # Fixed updates in the last frame
+            "dropped_updates": 0,  # Fixed updates skipped to keep up
+            "dropped_time": 0.0,  # Simulation seconds skipped to keep up
         }
 
     def start(self):
         """Start the game engine"""
         self.running = True
-        self._last_time = time.time()
+        self._last_time = time.perf_counter()
         self.run()
 
     def stop(self):
@@ -74,45 +186,78 @@ class GameEngine:
 
     def run(self):
         """Main game loop"""
+        clock = time.perf_counter
+        stats = self.stats
+        fixed_timestep = self.fixed_timestep
+        if not self._last_time:
+            self._last_time = clock()
+        self.frame_pacer.reset(self._last_time)
+
         while self.running:
-            frame_start = time.time()
-            current_time = time.time()
-            frame_time = current_time - self._last_time
-            self._last_time = current_time
+            frame_start = clock()
+            tracer = get_trace_recorder()
+            frame_start_ns = time.perf_counter_ns() if tracer is not None else 0
+            frame_time = frame_start - self._last_time
+            self._last_time = frame_start
+
+            # Don't simulate through long stalls
+            if frame_time > self.MAX_FRAME_TIME:
+                self._drop_time(frame_time - self.MAX_FRAME_TIME)
+                frame_time = self.MAX_FRAME_TIME
 
             # Accumulate time
             self._accumulator += frame_time
 
             # Fixed timestep updates
-            update_start = time.time()
+            budget = self._update_budget()
             updates = 0
-            max_updates = 5  # Prevent spiral of death
-
-            while self._accumulator >= self.fixed_timestep and updates < max_updates:
-                self._fixed_update(self.fixed_timestep)
-                self._accumulator -= self.fixed_timestep
+            while self._accumulator >= fixed_timestep and updates < budget:
+                with trace_span("fixed_update", "update"):
+                    self._fixed_update(fixed_timestep)
+                self._accumulator -= fixed_timestep
                 updates += 1
+            update_end = clock()
+
+            if updates:
+                cost = (update_end - frame_start) / updates
+                if self._update_cost:
+                    cost = self._update_cost * 0.9 + cost * 0.1
+                self._update_cost = cost
 
-            self.stats["update_time"] = time.time() - update_start
+            # Drop whole steps the budget could not run instead of spiraling
+            if self._accumulator >= fixed_timestep:
+                leftover = self._accumulator % fixed_timestep
+                self._drop_time(self._accumulator - leftover)
+                self._accumulator = leftover
+
+            self.alpha = self._accumulator / fixed_timestep
+            stats["updates"] = updates
+            stats["update_time"] = update_end - frame_start
 
             # Variable timestep rendering
-            render_start = time.time()
-            self._render()
-            self.stats["render_time"] = time.time() - render_start
+            with trace_span("render", "render"):
+                self._render()
+            render_end = clock()
+            stats["render_time"] = render_end - update_end
 
             # Update FPS counter
             self._update_fps(frame_time)
 
             # Update stats
-            self.stats["frame_time"] = time.time() - frame_start
-            self.stats["entity_count"] = len(self.world.get_entities())
-            self.stats["audio_playing"] = self.audio_manager.get_cache_info()["playing_sounds"]
+            stats["frame_time"] = render_end - frame_start
+            stats["entity_count"] = self.world.entity_count
+            stats["audio_playing"] = self.audio_manager.playing_count
+
+            if tracer is not None:
+                tracer.record("frame", "frame", frame_start_ns, time.perf_counter_ns())
+
+            # Interval memory snapshots while diagnostics are on
+            memory = get_memory_diagnostics()
+            if memory is not None:
+                memory.tick(render_end)
 
             # Frame limiting
-            frame_duration = time.time() - frame_start
-            target_frame_time = 1.0 / self.target_fps
-            if frame_duration < target_frame_time:
-                time.sleep(target_frame_time - frame_duration)
+            self.frame_pacer.wait()
 
     def _fixed_update(self, delta_time: float):
         """Fixed timestep update"""
@@ -152,6 +297,7 @@ class GameEngine:
     def _render(self):
         """Variable timestep rendering"""
         # Render current state
+        self.state_manager.alpha = self.alpha
         self.state_manager.render()
 
         # Render UI overlays
@@ -171,13 +317,100 @@ class GameEngine:
             self._frame_count = 0
             self._fps_timer = 0.0
 
+    def enable_profiling(self, slow_threshold_ms: Optional[float] = None):
+        """
+        Time every world system in each fixed update.
+
+        The timings are reported by get_stats() and by the global
+        PerformanceMonitor's get_stats().
+
+        Args:
+            slow_threshold_ms: Updates slower than this are captured (default: one fixed step)
+
+        Returns:
+            The SystemProfiler recording the timings
+        """
+        from neonworks.utils.performance_monitor import get_performance_monitor
+        from neonworks.utils.system_profiler import SystemProfiler
+
+        if slow_threshold_ms is None:
+            slow_threshold_ms = self.fixed_timestep * 1000
+        self.profiler = self.world.enable_profiling(
+            SystemProfiler(slow_threshold_ms=slow_threshold_ms)
+        )
+        get_performance_monitor().attach_system_profiler(self.profiler)
+        return self.profiler
+
+    def disable_profiling(self):
+        """Stop timing world systems"""
+        from neonworks.utils.performance_monitor import get_performance_monitor
+
+        self.world.disable_profiling()
+        self.profiler = None
+        get_performance_monitor().attach_system_profiler(None)
+
+    def enable_tracing(self, capacity: int = DEFAULT_CAPACITY) -> TraceRecorder:
+        """
+        Record frame, update, system and render spans into the global trace recorder.
+
+        Args:
+            capacity: Spans kept if a new recorder is started
+
+        Returns:
+            The global TraceRecorder (dump it to get a Chrome trace)
+        """
+        recorder = start_tracing(capacity)
+        self.world.enable_tracing(recorder)
+        return recorder
+
+    def disable_tracing(self) -> Optional[TraceRecorder]:
+        """
+        Stop tracing.
+
+        Returns:
+            The recorder that was running (its spans can still be dumped), or None
+        """
+        self.world.disable_tracing()
+        return stop_tracing()
+
+    def get_frame_pacing(self) -> Dict[str, float]:
+        """Get frame interval statistics (see FramePacer.get_stats)"""
+        return self.frame_pacer.get_stats()
+
     def get_fps(self) -> int:
         """Get current FPS"""
         return self._current_fps
 
     def get_stats(self) -> dict:
         """Get performance statistics"""
-        return self.stats.copy()
+        stats = self.stats.copy()
+
+        # Systems that report their own stats (e.g. LOD tick counts)
+        for system in self.world._systems:
+            get_system_stats = getattr(system, "get_stats", None)
+            if callable(get_system_stats):
+                stats.setdefault("systems", {})[type(system).__name__] = get_system_stats()
+
+        # Per-system update timings while profiling
+        if self.profiler:
+            stats["system_times"] = {
+                name: {"p50_ms": s.p50_ms, "p95_ms": s.p95_ms, "p99_ms": s.p99_ms}
+                for name, s in self.profiler.get_stats().items()
+            }
+
+        return stats
+
+    def _update_budget(self) -> int:
+        """Fixed updates allowed this frame, fewer while updates run slower than real time"""
+        if self._update_cost <= 0.0:
+            return self.max_updates
+        frame_budget = max(self.frame_pacer.frame_duration, self.fixed_timestep)
+        return max(1, min(self.max_updates, int(frame_budget / self._update_cost)))
+
+    def _drop_time(self, seconds: float):
+        """Record simulation time skipped to keep up"""
+        self.stats["dropped_time"] += seconds
+        self.stats["dropped_updates"] += int(seconds / self.fixed_timestep + 0.5)
 
     def attach_ui_manager(self, ui_manager, camera_offset_provider=None):
         """
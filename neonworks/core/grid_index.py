@@ -0,0 +1,146 @@
+"""
+Grid Spatial Index
+
+Maps grid cells to the entities standing on them so tile queries
+("what is on this tile?") are O(1) instead of scanning every GridPosition.
+The index is owned by the World and kept up to date by the ECS whenever a
+GridPosition is added, removed or moved.
+"""
+
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+Cell = Tuple[int, int]
+
+
+class GridIndex:
+    """
+    Cell -> entity id index, partitioned by layer.
+
+    Cell contents are stored in insertion-ordered dicts so query results are
+    deterministic.
+    """
+
+    def __init__(self):
+        # layer -> (x, y) -> {entity_id: None}
+        self._layers: Dict[int, Dict[Cell, Dict[str, None]]] = {}
+        # entity_id -> (x, y, layer)
+        self._positions: Dict[str, Tuple[int, int, int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __contains__(self, entity_id: str) -> bool:
+        return entity_id in self._positions
+
+    def insert(self, entity_id: str, x: int, y: int, layer: int = 0):
+        """Index an entity at a cell (moves it if already indexed)"""
+        if entity_id in self._positions:
+            self.remove(entity_id)
+
+        cells = self._layers.setdefault(layer, {})
+        cells.setdefault((x, y), {})[entity_id] = None
+        self._positions[entity_id] = (x, y, layer)
+
+    def remove(self, entity_id: str):
+        """Remove an entity from the index"""
+        position = self._positions.pop(entity_id, None)
+        if position is None:
+            return
+
+        x, y, layer = position
+        cells = self._layers.get(layer)
+        if cells is None:
+            return
+
+        occupants = cells.get((x, y))
+        if occupants is not None:
+            occupants.pop(entity_id, None)
+            if not occupants:
+                del cells[(x, y)]
+        if not cells:
+            del self._layers[layer]
+
+    def move(self, entity_id: str, x: int, y: int, layer: int = 0):
+        """Update the cell of an indexed entity"""
+        if self._positions.get(entity_id) == (x, y, layer):
+            return
+        self.insert(entity_id, x, y, layer)
+
+    def get_position(self, entity_id: str) -> Optional[Tuple[int, int, int]]:
+        """Get the indexed (x, y, layer) of an entity"""
+        return self._positions.get(entity_id)
+
+    def ids_at(self, x: int, y: int, layer: Optional[int] = None) -> List[str]:
+        """
+        Get ids of entities on a cell.
+
+        Args:
+            x: Grid X coordinate
+            y: Grid Y coordinate
+            layer: Only return entities on this layer (None = all layers)
+        """
+        if layer is not None:
+            occupants = self._layers.get(layer, {}).get((x, y))
+            return list(occupants) if occupants else []
+
+        result: List[str] = []
+        for cells in self._layers.values():
+            occupants = cells.get((x, y))
+            if occupants:
+                result.extend(occupants)
+        return result
+
+    def ids_in_rect(
+        self, x: int, y: int, width: int, height: int, layer: Optional[int] = None
+    ) -> List[str]:
+        """Get ids of entities whose cell lies inside a rectangle"""
+        if width <= 0 or height <= 0:
+            return []
+
+        result: List[str] = []
+        for cells in self._iter_layers(layer):
+            if width * height <= len(cells):
+                # Small rect: probe each cell of the rect
+                for cy in range(y, y + height):
+                    for cx in range(x, x + width):
+                        occupants = cells.get((cx, cy))
+                        if occupants:
+                            result.extend(occupants)
+            else:
+                # Large rect: walk the occupied cells instead
+                for (cx, cy), occupants in cells.items():
+                    if x <= cx < x + width and y <= cy < y + height:
+                        result.extend(occupants)
+        return result
+
+    def occupied_cells(self, layer: Optional[int] = None) -> List[Cell]:
+        """Get the cells holding at least one entity (each cell once per layer)"""
+        result: List[Cell] = []
+        for cells in self._iter_layers(layer):
+            result.extend(cells)
+        return result
+
+    def any_at(
+        self,
+        x: int,
+        y: int,
+        predicate: Callable[[str], bool],
+        layer: Optional[int] = None,
+    ) -> bool:
+        """Check if any entity on a cell satisfies a predicate"""
+        for cells in self._iter_layers(layer):
+            occupants = cells.get((x, y))
+            if occupants and any(predicate(entity_id) for entity_id in occupants):
+                return True
+        return False
+
+    def clear(self):
+        """Remove every entity from the index"""
+        self._layers.clear()
+        self._positions.clear()
+
+    def _iter_layers(self, layer: Optional[int]) -> Iterator[Dict[Cell, Dict[str, None]]]:
+        if layer is None:
+            yield from self._layers.values()
+        elif layer in self._layers:
+            yield self._layers[layer]
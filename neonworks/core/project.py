@@ -277,9 +277,11 @@ class Project:
         if not self.saves_dir.exists():
             return []
 
-        saves = []
-        for file in self.saves_dir.glob("*.json"):
-            saves.append(file.stem)
+        # JSON and binary (.sav) saves
+        saves = set()
+        for pattern in ("*.json", "*.sav"):
+            for file in self.saves_dir.glob(pattern):
+                saves.add(file.stem)
         return sorted(saves)
 
 
@@ -2,17 +2,47 @@
 Serialization System
 
 Save and load game state with component serialization.
+
+JSON saves are human-readable; BINARY saves use the compact streaming format
+from binary_save.py and load into the same world as the JSON save would.
+Incremental saves (DeltaSaveChain) write a base save plus small delta files
+holding only the entities that changed.
 """
 
 import json
 import pickle
+import uuid
+import weakref
 from dataclasses import dataclass, field, fields, is_dataclass
 from enum import Enum
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Type
-
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+)
+
+from neonworks.core.background_save import atomic_write
+from neonworks.core.binary_save import (
+    BinarySaveReader,
+    BinarySaveWriter,
+    SaveFormatError,
+    is_binary_save,
+    read_header,
+)
 from neonworks.core.ecs import Component, Entity, World
 
+# Key under which chained saves store their chain id and sequence number
+CHAIN_KEY = "_chain"
+
 
 class SerializationFormat(Enum):
     """Serialization format types"""
@@ -48,6 +78,9 @@ class ComponentSerializer:
         self._custom_serializers: Dict[Type, Callable[[Any], Dict]] = {}
         self._custom_deserializers: Dict[Type, Callable[[Dict], Any]] = {}
 
+        # Dataclass field names per component type
+        self._field_names: Dict[Type, Tuple[str, ...]] = {}
+
     def register_component_type(self, component_class: Type[Component]):
         """
         Register a component type for serialization.
@@ -105,6 +138,36 @@ class ComponentSerializer:
         # Fallback for non-dataclass components
         return {"_type": type_name, "_data": self._serialize_value(component.__dict__)}
 
+    def component_fields(self, component: Component) -> Tuple[str, Tuple[str, ...], Sequence[Any]]:
+        """
+        Get a component's type name, field names and raw field values.
+
+        This is what the binary writer encodes; values outside the JSON domain
+        are converted by _serialize_value as they are written.
+
+        Args:
+            component: Component to read
+
+        Returns:
+            Tuple of (type name, field names, field values)
+        """
+        component_type = type(component)
+        type_name = component_type.__name__
+
+        if component_type in self._custom_serializers:
+            data = self._custom_serializers[component_type](component)
+            return type_name, tuple(data), tuple(data.values())
+
+        names = self._field_names.get(component_type)
+        if names is None and is_dataclass(component):
+            names = tuple(f.name for f in fields(component))
+            self._field_names[component_type] = names
+        if names is not None:
+            return type_name, names, [getattr(component, name) for name in names]
+
+        data = self._serialize_value(component.__dict__)
+        return type_name, tuple(data), tuple(data.values())
+
     def deserialize_component(self, data: Dict[str, Any]) -> Component:
         """
         Deserialize a component from dictionary.
@@ -241,7 +304,10 @@ class WorldSerializer:
         self.entity_serializer = EntitySerializer(component_serializer)
 
     def serialize_world(
-        self, world: World, metadata: Optional[SerializationMetadata] = None
+        self,
+        world: World,
+        metadata: Optional[SerializationMetadata] = None,
+        entities: Optional[Iterable[Entity]] = None,
     ) -> Dict[str, Any]:
         """
         Serialize a world.
@@ -249,26 +315,108 @@ class WorldSerializer:
         Args:
             world: World to serialize
             metadata: Optional metadata
+            entities: Subset of the world's entities to include (default: all)
 
         Returns:
             Dictionary representation
         """
-        entities = []
-        for entity in world._entities.values():
-            entities.append(self.entity_serializer.serialize_entity(entity))
+        if entities is None:
+            entities = world._entities.values()
+        entities = [self.entity_serializer.serialize_entity(entity) for entity in entities]
 
         data = {"entities": entities}
 
         if metadata:
-            data["_metadata"] = {
-                "version": metadata.version,
-                "timestamp": metadata.timestamp,
-                "game_version": metadata.game_version,
-                "custom_data": metadata.custom_data,
-            }
+            data["_metadata"] = _metadata_to_dict(metadata)
 
         return data
 
+    def write_world(
+        self,
+        world: World,
+        stream: BinaryIO,
+        metadata: Optional[SerializationMetadata] = None,
+        compress: bool = True,
+        entities: Optional[Sequence[Entity]] = None,
+        extra_header: Optional[Dict[str, Any]] = None,
+    ) -> int:
+        """
+        Stream a world to a binary save, one entity at a time.
+
+        Args:
+            world: World to serialize
+            stream: Binary stream to write to
+            metadata: Optional metadata, stored in the header
+            compress: Compress the body
+            entities: Subset of the world's entities to write (default: all)
+            extra_header: Additional JSON-serializable header entries
+
+        Returns:
+            Number of entities written
+        """
+        if entities is None:
+            entities = list(world._entities.values())
+        header: Dict[str, Any] = {"entity_count": len(entities)}
+        if metadata:
+            header["_metadata"] = _metadata_to_dict(metadata)
+        if extra_header:
+            header.update(extra_header)
+
+        component_fields = self.component_serializer.component_fields
+        writer = BinarySaveWriter(
+            stream, header, compress, fallback=self.component_serializer._serialize_value
+        )
+        for entity in entities:
+            writer.write_entity(
+                entity.id,
+                entity.active,
+                entity.tags,
+                [component_fields(component) for component in entity._components.values()],
+            )
+        writer.close()
+        return writer.entity_count
+
+    def read_world(self, stream: BinaryIO) -> World:
+        """
+        Load a world from a binary save.
+
+        Args:
+            stream: Binary stream positioned at the start of the save
+
+        Returns:
+            World instance
+        """
+        _, entities = self.read_entities(stream)
+        world = World()
+        for entity_data in entities:
+            self.entity_serializer.deserialize_entity(entity_data, world)
+        return world
+
+    def read_entities(self, stream: BinaryIO) -> Tuple[Dict[str, Any], Iterator[Dict[str, Any]]]:
+        """
+        Read a binary save as entity dicts in the shape serialize_entity produces.
+
+        Args:
+            stream: Binary stream positioned at the start of the save
+
+        Returns:
+            Tuple of (header, iterator over entity dicts)
+        """
+        reader = BinarySaveReader(stream)
+
+        def entities() -> Iterator[Dict[str, Any]]:
+            for entity_id, active, tags, components in reader.entities():
+                yield {
+                    "id": entity_id,
+                    "active": active,
+                    "components": [
+                        {"_type": type_name, "_data": data} for type_name, data in components
+                    ],
+                    "tags": tags,
+                }
+
+        return reader.header, entities()
+
     def deserialize_world(self, data: Dict[str, Any]) -> World:
         """
         Deserialize a world.
@@ -295,6 +443,9 @@ class GameSerializer:
         self.component_serializer = ComponentSerializer()
         self.world_serializer = WorldSerializer(self.component_serializer)
 
+        # Incremental save chains by base file path
+        self._delta_chains: Dict[Path, "DeltaSaveChain"] = {}
+
     def register_component(self, component_class: Type[Component]):
         """Register a component type"""
         self.component_serializer.register_component_type(component_class)
@@ -321,6 +472,8 @@ class GameSerializer:
         file_path: Path,
         format: SerializationFormat = SerializationFormat.JSON,
         metadata: Optional[SerializationMetadata] = None,
+        compress: bool = True,
+        incremental: bool = False,
     ):
         """
         Save game state to file.
@@ -330,15 +483,27 @@ class GameSerializer:
             file_path: Path to save file
             format: Serialization format
             metadata: Optional metadata
+            compress: Compress the body of binary saves
+            incremental: Only write the entities changed since the last
+                incremental save of this world to this path (see DeltaSaveChain)
         """
-        data = self.world_serializer.serialize_world(world, metadata)
+        if incremental:
+            self.get_delta_chain(file_path, format, compress).save(world, metadata)
+            return
+
+        # A full save replaces any chain based on this file
+        self._delta_chains.pop(Path(file_path), None)
 
         if format == SerializationFormat.JSON:
+            data = self.world_serializer.serialize_world(world, metadata)
             with open(file_path, "w") as f:
                 json.dump(data, f, indent=2)
         elif format == SerializationFormat.BINARY:
-            with open(file_path, "wb") as f:
-                pickle.dump(data, f)
+            try:
+                with open(file_path, "wb") as f:
+                    self.world_serializer.write_world(world, f, metadata, compress)
+            except SaveFormatError as e:
+                raise SerializationError(str(e))
         else:
             raise SerializationError(f"Unsupported format: {format}")
 
@@ -360,12 +525,49 @@ class GameSerializer:
                 data = json.load(f)
         elif format == SerializationFormat.BINARY:
             with open(file_path, "rb") as f:
+                if is_binary_save(f):
+                    try:
+                        header, _ = read_header(f)
+                        if CHAIN_KEY not in header:
+                            f.seek(0)
+                            return self.world_serializer.read_world(f)
+                    except SaveFormatError as e:
+                        raise SerializationError(f"Corrupt save {file_path}: {e}")
+                    return DeltaSaveChain(self, file_path, format).load()
+                # Saves written before the binary format were pickled
                 data = pickle.load(f)
         else:
             raise SerializationError(f"Unsupported format: {format}")
 
+        if CHAIN_KEY in data:
+            return DeltaSaveChain(self, file_path, format).load()
         return self.world_serializer.deserialize_world(data)
 
+    def get_delta_chain(
+        self,
+        file_path: Path,
+        format: SerializationFormat = SerializationFormat.BINARY,
+        compress: bool = True,
+    ) -> "DeltaSaveChain":
+        """
+        Get the incremental save chain that save_game(incremental=True) uses.
+
+        Args:
+            file_path: Path of the base save
+            format: Serialization format
+            compress: Compress the body of binary saves
+
+        Returns:
+            The chain for this path
+        """
+        file_path = Path(file_path)
+        chain = self._delta_chains.get(file_path)
+        if chain is None or chain.format != format:
+            chain = DeltaSaveChain(self, file_path, format, compress)
+            self._delta_chains[file_path] = chain
+        chain.compress = compress
+        return chain
+
     def save_game_to_string(
         self, world: World, metadata: Optional[SerializationMetadata] = None
     ) -> str:
@@ -413,10 +615,20 @@ class GameSerializer:
                 data = json.load(f)
         elif format == SerializationFormat.BINARY:
             with open(file_path, "rb") as f:
-                data = pickle.load(f)
+                if is_binary_save(f):
+                    # Only the header is read, not the body
+                    try:
+                        data, _ = read_header(f)
+                    except SaveFormatError as e:
+                        raise SerializationError(f"Corrupt save {file_path}: {e}")
+                else:
+                    data = pickle.load(f)
         else:
             return None
 
+        if CHAIN_KEY in data:
+            data = DeltaSaveChain(self, file_path, format).latest_header()
+
         metadata_data = data.get("_metadata")
         if metadata_data:
             return SerializationMetadata(
@@ -429,6 +641,236 @@ class GameSerializer:
         return None
 
 
+class DeltaSaveChain:
+    """
+    Incremental saves of one world: a base save plus chained delta files.
+
+    The first save writes a full base to ``file_path``. Each later save writes
+    only the entities added, changed or removed since the previous save to
+    ``<stem>.delta<N><suffix>``, using the world's change tracking (see
+    World.take_changes). A new base replaces the chain every
+    ``rebase_interval`` deltas, or when a delta would hold more than
+    ``rebase_ratio`` of the world. Loading replays the base, then each delta
+    in order.
+
+    Deltas refer to entities by the ids they had when saved. Ids are
+    reassigned on load, so a loaded world starts a new chain on its first save.
+    """
+
+    def __init__(
+        self,
+        serializer: GameSerializer,
+        file_path: Path,
+        format: SerializationFormat = SerializationFormat.BINARY,
+        compress: bool = True,
+        rebase_interval: int = 20,
+        rebase_ratio: float = 0.5,
+    ):
+        """
+        Initialize a save chain.
+
+        Args:
+            serializer: Serializer with the world's component types registered
+            file_path: Path of the base save
+            format: Serialization format of the base and the deltas
+            compress: Compress the body of binary saves
+            rebase_interval: Number of deltas after which a new base is written
+            rebase_ratio: Fraction of changed entities above which a new base
+                is written instead of a delta
+        """
+        if format not in (SerializationFormat.JSON, SerializationFormat.BINARY):
+            raise SerializationError(f"Unsupported format: {format}")
+
+        self.serializer = serializer
+        self.file_path = Path(file_path)
+        self.format = format
+        self.compress = compress
+        self.rebase_interval = rebase_interval
+        self.rebase_ratio = rebase_ratio
+
+        self.chain_id: Optional[str] = None  # None until a base has been written
+        self.sequence = 0  # Deltas written on top of the current base
+        self._world_ref: Optional[weakref.ref] = None
+
+    def delta_path(self, sequence: int) -> Path:
+        """Get the file of the delta with a sequence number (starting at 1)"""
+        return self.file_path.with_name(
+            f"{self.file_path.stem}.delta{sequence}{self.file_path.suffix}"
+        )
+
+    def save(self, world: World, metadata: Optional[SerializationMetadata] = None) -> Path:
+        """
+        Save the changes since the previous save, or a new base when due.
+
+        Args:
+            world: World to save
+            metadata: Optional metadata
+
+        Returns:
+            Path of the file written
+        """
+        current = self._world_ref is not None and self._world_ref() is world
+        if not current or not world.tracking_changes or self.sequence >= self.rebase_interval:
+            return self.rebase(world, metadata)
+
+        dirty, removed = world.take_changes()
+        if len(dirty) > self.rebase_ratio * len(world._entities):
+            return self.rebase(world, metadata)
+
+        sequence = self.sequence + 1
+        path = self.delta_path(sequence)
+        chain = {"id": self.chain_id, "sequence": sequence, "removed": sorted(removed)}
+        entities = [world._entities[entity_id] for entity_id in dirty]
+        try:
+            self._write(path, world, metadata, chain, entities)
+        except BaseException:
+            # The taken changes are lost; start over with a full base
+            self._world_ref = None
+            raise
+
+        self.sequence = sequence
+        return path
+
+    def rebase(self, world: World, metadata: Optional[SerializationMetadata] = None) -> Path:
+        """
+        Write a full base save and drop the deltas of the previous base.
+
+        Args:
+            world: World to save
+            metadata: Optional metadata
+
+        Returns:
+            Path of the base save
+        """
+        world.start_change_tracking()
+        self._world_ref = None
+
+        chain_id = uuid.uuid4().hex
+        self._write(self.file_path, world, metadata, {"id": chain_id, "sequence": 0})
+
+        # Old deltas are ignored by load() anyway, since their chain id differs
+        sequence = 1
+        while self.delta_path(sequence).exists():
+            self.delta_path(sequence).unlink()
+            sequence += 1
+
+        self.chain_id = chain_id
+        self.sequence = 0
+        self._world_ref = weakref.ref(world)
+        return self.file_path
+
+    def load(self) -> World:
+        """
+        Load the base save and replay its deltas.
+
+        Returns:
+            Loaded world
+        """
+        header, entities = self._read(self.file_path)
+        chain = header.get(CHAIN_KEY) or {}
+
+        world = World()
+        by_saved_id: Dict[Any, Entity] = {}
+        self._apply(world, by_saved_id, entities, ())
+
+        for delta_header, delta_entities in self._deltas(chain.get("id")):
+            removed = delta_header[CHAIN_KEY].get("removed", ())
+            self._apply(world, by_saved_id, delta_entities, removed)
+        return world
+
+    def latest_header(self) -> Dict[str, Any]:
+        """Get the header (metadata) of the newest save in the chain"""
+        header, _ = self._read(self.file_path, header_only=True)
+        chain_id = (header.get(CHAIN_KEY) or {}).get("id")
+        for header, _ in self._deltas(chain_id, header_only=True):
+            pass
+        return header
+
+    def _deltas(
+        self, chain_id: Optional[str], header_only: bool = False
+    ) -> Iterator[Tuple[Dict[str, Any], List[Dict[str, Any]]]]:
+        """Read the deltas that belong to a chain, stopping at the first gap"""
+        sequence = 1
+        while chain_id is not None and self.delta_path(sequence).exists():
+            header, entities = self._read(self.delta_path(sequence), header_only)
+            chain = header.get(CHAIN_KEY) or {}
+            if chain.get("id") != chain_id or chain.get("sequence") != sequence:
+                break  # Left over from an older chain
+            yield header, entities
+            sequence += 1
+
+    def _write(
+        self,
+        path: Path,
+        world: World,
+        metadata: Optional[SerializationMetadata],
+        chain: Dict[str, Any],
+        entities: Optional[List[Entity]] = None,
+    ):
+        world_serializer = self.serializer.world_serializer
+        try:
+            with atomic_write(path) as f:
+                if self.format == SerializationFormat.BINARY:
+                    world_serializer.write_world(
+                        world, f, metadata, self.compress, entities, {CHAIN_KEY: chain}
+                    )
+                else:
+                    data = world_serializer.serialize_world(world, metadata, entities)
+                    data[CHAIN_KEY] = chain
+                    f.write(json.dumps(data, indent=2).encode("utf-8"))
+        except SaveFormatError as e:
+            raise SerializationError(str(e))
+
+    def _read(
+        self, path: Path, header_only: bool = False
+    ) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        """Read a save of the chain as (header, entity dicts)"""
+        if self.format == SerializationFormat.JSON:
+            with open(path, "r") as f:
+                data = json.load(f)
+            return data, data.get("entities", [])
+
+        try:
+            with open(path, "rb") as f:
+                if header_only:
+                    return read_header(f)[0], []
+                header, entities = self.serializer.world_serializer.read_entities(f)
+                return header, list(entities)
+        except SaveFormatError as e:
+            raise SerializationError(f"Corrupt save {path}: {e}")
+
+    def _apply(
+        self,
+        world: World,
+        by_saved_id: Dict[Any, Entity],
+        entities: Iterable[Dict[str, Any]],
+        removed: Iterable[Any],
+    ):
+        """Apply one save of the chain: removals first, then added or changed entities"""
+        for saved_id in removed:
+            entity = by_saved_id.pop(saved_id, None)
+            if entity is not None:
+                world.remove_entity(entity.id)
+
+        entity_serializer = self.serializer.world_serializer.entity_serializer
+        for entity_data in entities:
+            previous = by_saved_id.get(entity_data["id"])
+            if previous is not None:
+                world.remove_entity(previous.id)
+            by_saved_id[entity_data["id"]] = entity_serializer.deserialize_entity(
+                entity_data, world
+            )
+
+
+def _metadata_to_dict(metadata: SerializationMetadata) -> Dict[str, Any]:
+    return {
+        "version": metadata.version,
+        "timestamp": metadata.timestamp,
+        "game_version": metadata.game_version,
+        "custom_data": metadata.custom_data,
+    }
+
+
 # Global game serializer instance
 _global_serializer: Optional[GameSerializer] = None
 
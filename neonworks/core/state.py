@@ -29,6 +29,11 @@ class GameState(ABC):
         """Set the state manager"""
         self._state_manager = manager
 
+    @property
+    def render_alpha(self) -> float:
+        """Interpolation factor (0-1) between the last two fixed updates"""
+        return self._state_manager.alpha if self._state_manager else 1.0
+
     @abstractmethod
     def enter(self, data: Dict[str, Any] = None):
         """Called when entering this state"""
@@ -176,6 +181,10 @@ class StateManager:
         self._state_stack: List[GameState] = []
         self._pending_transition: Optional[Tuple] = None
 
+        # Progress (0-1) from the last fixed update toward the next, set by the
+        # engine before each render so states can interpolate positions
+        self.alpha = 1.0
+
     def register_state(self, state: GameState) -> "StateManager":
         """Register a game state"""
         state.set_manager(self)
@@ -0,0 +1,196 @@
+"""
+Tile Masks
+
+Boolean cell masks for map tools. flood_mask() finds the connected region of
+matching cells around a seed with a scanline fill: each row is a byte string,
+so extending a span and finding the next seed in the neighboring rows are
+bytes.find()/rfind() calls rather than a visit per cell. TileMask wraps a
+map-sized mask as a selection supporting union, intersection and subtraction.
+"""
+
+from typing import Iterable, List, Optional, Tuple
+
+import numpy as np
+
+Cell = Tuple[int, int]
+
+
+def flood_mask(match: np.ndarray, x: int, y: int, eight_way: bool = False) -> np.ndarray:
+    """
+    Get the connected region of matching cells containing a seed cell.
+
+    Args:
+        match: Boolean array of shape (height, width), True where cells may be filled
+        x: Seed X
+        y: Seed Y
+        eight_way: Connect diagonal neighbors too
+
+    Returns:
+        Boolean array of the region (all False if the seed does not match)
+    """
+    match = np.ascontiguousarray(match, dtype=bool)
+    height, width = match.shape
+    if not (0 <= x < width and 0 <= y < height) or not match[y, x]:
+        return np.zeros_like(match)
+
+    # Unfilled matching cells, one bytearray of 0/1 per row
+    remaining = [bytearray(row.tobytes()) for row in match.view(np.uint8)]
+    reach = 1 if eight_way else 0
+    stack = [(x, y)]
+
+    while stack:
+        x, y = stack.pop()
+        row = remaining[y]
+        if not row[x]:
+            continue
+
+        # Extend to the whole run and mark it filled
+        left = row.rfind(0, 0, x) + 1
+        right = row.find(0, x)
+        if right < 0:
+            right = width
+        row[left:right] = bytes(right - left)
+
+        # Seed every unfilled run touching the span in the rows above and below
+        low = max(0, left - reach)
+        high = min(width, right + reach)
+        for ny in (y - 1, y + 1):
+            if not 0 <= ny < height:
+                continue
+            neighbor = remaining[ny]
+            start = neighbor.find(1, low, high)
+            while start >= 0:
+                stack.append((start, ny))
+                end = neighbor.find(0, start, high)
+                if end < 0:
+                    break
+                start = neighbor.find(1, end, high)
+
+    filled = np.frombuffer(b"".join(remaining), dtype=bool).reshape(height, width)
+    return match & ~filled
+
+
+def mask_bounds(mask: np.ndarray) -> Optional[Tuple[int, int, int, int]]:
+    """
+    Get the bounding box of the set cells of a mask.
+
+    Returns:
+        (min_x, min_y, max_x, max_y), inclusive, or None if no cell is set
+    """
+    columns = np.flatnonzero(mask.any(axis=0))
+    if not len(columns):
+        return None
+    rows = np.flatnonzero(mask.any(axis=1))
+    return (int(columns[0]), int(rows[0]), int(columns[-1]), int(rows[-1]))
+
+
+def crop_mask(mask: np.ndarray) -> Optional[Tuple[np.ndarray, int, int]]:
+    """
+    Crop a mask to the bounding box of its set cells.
+
+    Returns:
+        Tuple of (cropped mask, x, y of its top-left cell), or None if no cell is set
+    """
+    bounds = mask_bounds(mask)
+    if bounds is None:
+        return None
+    min_x, min_y, max_x, max_y = bounds
+    return mask[min_y : max_y + 1, min_x : max_x + 1], min_x, min_y
+
+
+class TileMask:
+    """
+    Set of cells of a width x height map, stored as a boolean array.
+
+    Masks combine with | (union), & (intersection) and - (subtraction);
+    both operands must cover the same map size.
+    """
+
+    def __init__(self, width: int, height: int, bits: Optional[np.ndarray] = None):
+        """
+        Initialize tile mask.
+
+        Args:
+            width: Map width in tiles
+            height: Map height in tiles
+            bits: Boolean array of shape (height, width) (None = empty)
+        """
+        self.width = width
+        self.height = height
+        if bits is None:
+            bits = np.zeros((height, width), dtype=bool)
+        elif bits.shape != (height, width):
+            raise ValueError(f"Mask bits {bits.shape} do not match map size {(height, width)}")
+        self.bits = bits.astype(bool, copy=False)
+
+    @classmethod
+    def from_rect(cls, width: int, height: int, x: int, y: int, w: int, h: int) -> "TileMask":
+        """Create a mask of a rectangle (clipped to the map)"""
+        mask = cls(width, height)
+        mask.bits[max(0, y) : max(0, y + h), max(0, x) : max(0, x + w)] = True
+        return mask
+
+    @classmethod
+    def from_cells(cls, width: int, height: int, cells: Iterable[Cell]) -> "TileMask":
+        """Create a mask of individual cells (cells outside the map are ignored)"""
+        mask = cls(width, height)
+        points = np.array(list(cells), dtype=np.intp).reshape(-1, 2)
+        inside = (
+            (points[:, 0] >= 0)
+            & (points[:, 0] < width)
+            & (points[:, 1] >= 0)
+            & (points[:, 1] < height)
+        )
+        points = points[inside]
+        mask.bits[points[:, 1], points[:, 0]] = True
+        return mask
+
+    def __len__(self) -> int:
+        return int(np.count_nonzero(self.bits))
+
+    def __contains__(self, cell: Cell) -> bool:
+        x, y = cell
+        return 0 <= x < self.width and 0 <= y < self.height and bool(self.bits[y, x])
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, TileMask):
+            return NotImplemented
+        return self.bits.shape == other.bits.shape and bool(np.array_equal(self.bits, other.bits))
+
+    def __or__(self, other: "TileMask") -> "TileMask":
+        return self.union(other)
+
+    def __and__(self, other: "TileMask") -> "TileMask":
+        return self.intersect(other)
+
+    def __sub__(self, other: "TileMask") -> "TileMask":
+        return self.subtract(other)
+
+    def union(self, other: "TileMask") -> "TileMask":
+        """Cells in either mask"""
+        return TileMask(self.width, self.height, self.bits | self._other_bits(other))
+
+    def intersect(self, other: "TileMask") -> "TileMask":
+        """Cells in both masks"""
+        return TileMask(self.width, self.height, self.bits & self._other_bits(other))
+
+    def subtract(self, other: "TileMask") -> "TileMask":
+        """Cells in this mask but not the other"""
+        return TileMask(self.width, self.height, self.bits & ~self._other_bits(other))
+
+    def cells(self) -> List[Cell]:
+        """Get the (x, y) cells of the mask in row-major order"""
+        ys, xs = np.nonzero(self.bits)
+        return list(zip(xs.tolist(), ys.tolist()))
+
+    def bounds(self) -> Optional[Tuple[int, int, int, int]]:
+        """Get the inclusive (min_x, min_y, max_x, max_y) bounds, or None if empty"""
+        return mask_bounds(self.bits)
+
+    def _other_bits(self, other: "TileMask") -> np.ndarray:
+        if other.bits.shape != self.bits.shape:
+            raise ValueError(
+                f"Cannot combine a {other.width}x{other.height} mask "
+                f"with a {self.width}x{self.height} mask"
+            )
+        return other.bits
@@ -2,8 +2,8 @@
 NeonWorks Core Undo/Redo System
 
 Provides a comprehensive undo/redo system using the Command pattern with:
-- Unlimited undo/redo stack
-- Memory-efficient delta compression
+- Byte-budgeted undo/redo history
+- Batched compression of old commands
 - Command history viewer support
 - Cross-session persistence
 - Integration with all map and editing tools
@@ -14,10 +14,16 @@ from __future__ import annotations
 import gzip
 import json
 import pickle
+import sys
 from abc import ABC, abstractmethod
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
+from itertools import islice
+from types import FunctionType, MethodType, ModuleType
+from typing import TYPE_CHECKING, Any, Deque, Dict, List, Optional, Set, Tuple
+
+from ..utils.memory_diagnostics import UNDO_HISTORY, CacheMemory, register_memory_reporter
 
 if TYPE_CHECKING:
     from ..rendering.tilemap import Tile, Tilemap
@@ -38,6 +44,13 @@ except ImportError:
             self.tile_id = None
 
 
+# Memory budget for undo history (bytes), counting live and compressed commands
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# Old commands are compressed together in blocks of about this many
+DEFAULT_COMPRESS_BATCH_SIZE = 16
+
+
 class Command(ABC):
     """
     Abstract base class for all undoable commands.
@@ -51,6 +64,10 @@ class Command(ABC):
     - deserialize(): Reconstruct from dict
     """
 
+    # Attributes the command only references (e.g. the tilemap it edits),
+    # which are left out of memory_size()
+    shared_attributes: Tuple[str, ...] = ()
+
     def __init__(self):
         """Initialize command with metadata."""
         self.timestamp = datetime.now()
@@ -123,6 +140,19 @@ class Command(ABC):
         """Get formatted timestamp string."""
         return self.timestamp.strftime("%H:%M:%S")
 
+    def memory_size(self) -> int:
+        """
+        Get the memory held by this command in bytes.
+
+        Counts the command and everything it owns, following containers and
+        object attributes, but not the objects named in shared_attributes.
+
+        Returns:
+            Size in bytes
+        """
+        seen = {id(self.__dict__.get(name)) for name in self.shared_attributes}
+        return _deep_sizeof(self, seen)
+
 
 class CompositeCommand(Command):
     """
@@ -175,6 +205,15 @@ class CompositeCommand(Command):
             return self.commands[0].get_description()
         return f"{self.description} ({len(self.commands)} operations)"
 
+    def memory_size(self) -> int:
+        """Get the memory held by this command and its children in bytes."""
+        return (
+            sys.getsizeof(self)
+            + sys.getsizeof(self.__dict__)
+            + sys.getsizeof(self.commands)
+            + sum(cmd.memory_size() for cmd in self.commands)
+        )
+
     def serialize(self) -> Dict[str, Any]:
         """Serialize composite command."""
         return {
@@ -222,6 +261,8 @@ class TileChangeCommand(Command):
     Uses delta compression to store only changed properties.
     """
 
+    shared_attributes = ("tilemap",)
+
     def __init__(
         self,
         tilemap: Tilemap,
@@ -400,6 +441,8 @@ class BatchTileChangeCommand(Command):
     dealing with large paint strokes or fill operations.
     """
 
+    shared_attributes = ("tilemap",)
+
     def __init__(
         self,
         tilemap: Tilemap,
@@ -484,6 +527,8 @@ class NavmeshPaintCommand(Command):
     Stores only changed cells for memory efficiency.
     """
 
+    shared_attributes = ("walkable_tiles", "unwalkable_tiles")
+
     def __init__(
         self,
         walkable_tiles: Set[Tuple[int, int]],
@@ -609,37 +654,58 @@ class DeltaCompressor:
 
 class UndoManager:
     """
-    Core undo/redo manager with unlimited history and delta compression.
+    Core undo/redo manager with a byte-budgeted history and delta compression.
 
     Features:
-    - Unlimited undo/redo stack (no hard limit)
-    - Memory-efficient delta compression
+    - Undo/redo history limited by memory use rather than command count
+    - Batched compression of old commands
     - Command history viewing
     - Cross-session persistence
     - Memory usage tracking
     """
 
-    def __init__(self, enable_compression: bool = True, auto_compress_threshold: int = 50):
+    def __init__(
+        self,
+        enable_compression: bool = True,
+        auto_compress_threshold: int = 50,
+        max_bytes: Optional[int] = DEFAULT_MAX_BYTES,
+        compress_batch_size: int = DEFAULT_COMPRESS_BATCH_SIZE,
+    ):
         """
         Initialize undo manager.
 
         Args:
             enable_compression: Enable delta compression for old commands
             auto_compress_threshold: Automatically compress commands older than this index
+            max_bytes: Memory budget for the history; the oldest compressed
+                blocks, then the oldest commands, are dropped to stay within it
+                (None for no limit)
+            compress_batch_size: Number of old commands compressed together
         """
-        self.undo_stack: List[Command] = []
-        self.redo_stack: List[Command] = []
+        self.undo_stack: Deque[Command] = deque()
+        self.redo_stack: Deque[Command] = deque()
         self.enable_compression = enable_compression
         self.auto_compress_threshold = auto_compress_threshold
+        self.max_bytes = max_bytes
+        self.compress_batch_size = compress_batch_size
         self.compressor = DeltaCompressor()
 
-        # Compressed history (for old commands)
-        self.compressed_history: List[bytes] = []
+        # Compressed history: blocks of serialized old commands, oldest first
+        self.compressed_history: Deque[bytes] = deque()
+        self._compressed_counts: Deque[int] = deque()  # Commands per block
+        self._compressed_bytes = 0
+
+        # Bytes held by commands on both stacks
+        self._history_bytes = 0
 
         # Statistics
         self.total_commands_executed = 0
         self.total_undos = 0
         self.total_redos = 0
+        self.dropped_count = 0  # Commands dropped to stay within max_bytes
+
+        # Report history size to memory diagnostics
+        register_memory_reporter(self)
 
     def execute(self, command: Command) -> bool:
         """
@@ -656,8 +722,10 @@ class UndoManager:
 
         # Add to undo stack
         self.undo_stack.append(command)
+        self._history_bytes += _command_size(command)
 
         # Clear redo stack (can't redo after new action)
+        self._history_bytes -= sum(map(_command_size, self.redo_stack))
         self.redo_stack.clear()
 
         # Update statistics
@@ -667,6 +735,9 @@ class UndoManager:
         if self.enable_compression and len(self.undo_stack) > self.auto_compress_threshold:
             self._compress_old_commands()
 
+        if self.max_bytes is not None:
+            self._enforce_budget()
+
         return True
 
     def undo(self) -> bool:
@@ -744,7 +815,7 @@ class UndoManager:
         history = []
 
         # Add undo stack (most recent last)
-        for cmd in self.undo_stack[-max_items:]:
+        for cmd in islice(self.undo_stack, max(0, len(self.undo_stack) - max_items), None):
             history.append((cmd.get_description(), cmd.get_timestamp_str(), True))
 
         return history
@@ -775,19 +846,23 @@ class UndoManager:
         self.undo_stack.clear()
         self.redo_stack.clear()
         self.compressed_history.clear()
+        self._compressed_counts.clear()
+        self._compressed_bytes = 0
+        self._history_bytes = 0
 
     def get_memory_usage(self) -> Dict[str, int]:
         """
         Get memory usage statistics.
 
+        Command sizes include everything a command owns (see
+        Command.memory_size()) and are measured once per command.
+
         Returns:
             Dictionary with memory usage in bytes
         """
-        import sys
-
-        undo_size = sum(sys.getsizeof(cmd) for cmd in self.undo_stack)
-        redo_size = sum(sys.getsizeof(cmd) for cmd in self.redo_stack)
-        compressed_size = sum(len(data) for data in self.compressed_history)
+        undo_size = sum(map(_command_size, self.undo_stack))
+        redo_size = sum(map(_command_size, self.redo_stack))
+        compressed_size = sum(map(len, self.compressed_history))
 
         return {
             "undo_stack_bytes": undo_size,
@@ -796,16 +871,60 @@ class UndoManager:
             "total_bytes": undo_size + redo_size + compressed_size,
             "undo_count": len(self.undo_stack),
             "redo_count": len(self.redo_stack),
-            "compressed_count": len(self.compressed_history),
+            "compressed_count": sum(self._compressed_counts),
         }
 
+    def report_memory(self) -> List[CacheMemory]:
+        """Report the bytes held by the undo, redo and compressed history."""
+        usage = self.get_memory_usage()
+        return [
+            CacheMemory(UNDO_HISTORY, "undo stack", usage["undo_stack_bytes"], usage["undo_count"]),
+            CacheMemory(UNDO_HISTORY, "redo stack", usage["redo_stack_bytes"], usage["redo_count"]),
+            CacheMemory(
+                UNDO_HISTORY,
+                "compressed history",
+                usage["compressed_bytes"],
+                usage["compressed_count"],
+            ),
+        ]
+
     def _compress_old_commands(self):
-        """Compress old commands to save memory."""
-        # Compress commands beyond the threshold
-        while len(self.undo_stack) > self.auto_compress_threshold:
-            old_cmd = self.undo_stack.pop(0)
-            compressed = self.compressor.compress(old_cmd.serialize())
-            self.compressed_history.append(compressed)
+        """Compress the oldest commands, a batch at a time, to save memory."""
+        # Compressing down to below the threshold lets each block hold a batch
+        keep = max(
+            self.auto_compress_threshold - self.compress_batch_size,
+            self.auto_compress_threshold // 2,
+        )
+        batch = [self.undo_stack.popleft() for _ in range(len(self.undo_stack) - keep)]
+        if not batch:
+            return
+
+        compressed = self.compressor.compress([cmd.serialize() for cmd in batch])
+        self.compressed_history.append(compressed)
+        self._compressed_counts.append(len(batch))
+        self._compressed_bytes += len(compressed)
+        self._history_bytes -= sum(map(_command_size, batch))
+
+    def _enforce_budget(self):
+        """Drop the oldest history until it fits in max_bytes."""
+        if self._history_bytes + self._compressed_bytes <= self.max_bytes:
+            return
+
+        # Resync in case commands were pushed onto the stacks directly
+        self._history_bytes = sum(map(_command_size, self.undo_stack)) + sum(
+            map(_command_size, self.redo_stack)
+        )
+
+        while self._history_bytes + self._compressed_bytes > self.max_bytes:
+            if self.compressed_history:
+                self._compressed_bytes -= len(self.compressed_history.popleft())
+                self.dropped_count += self._compressed_counts.popleft()
+            elif len(self.undo_stack) > 1:
+                # The newest command always stays undoable
+                self._history_bytes -= _command_size(self.undo_stack.popleft())
+                self.dropped_count += 1
+            else:
+                break
 
     def save_history(self, filepath: str):
         """
@@ -871,7 +990,40 @@ class UndoManager:
             "total_redos": self.total_redos,
             "current_undo_count": len(self.undo_stack),
             "current_redo_count": len(self.redo_stack),
-            "compressed_count": len(self.compressed_history),
+            "compressed_count": memory["compressed_count"],
+            "dropped_count": self.dropped_count,
             "memory_usage_kb": memory["total_bytes"] / 1024,
             "compression_enabled": self.enable_compression,
         }
+
+
+def _command_size(command: Command) -> int:
+    """Get a command's memory size, measured on first use"""
+    size = command.__dict__.get("_memory_size")
+    if size is None:
+        size = command.memory_size()
+        command._memory_size = size
+    return size
+
+
+def _deep_sizeof(obj: Any, seen: Set[int]) -> int:
+    """Size of an object plus everything reachable from it not in seen"""
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+
+    size = sys.getsizeof(obj)
+    if isinstance(obj, (str, bytes, int, float, type, ModuleType, FunctionType, MethodType)):
+        return size
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            size += _deep_sizeof(key, seen) + _deep_sizeof(value, seen)
+    elif isinstance(obj, (list, tuple, set, frozenset, deque)):
+        for item in obj:
+            size += _deep_sizeof(item, seen)
+    else:
+        if hasattr(obj, "__dict__"):
+            size += _deep_sizeof(obj.__dict__, seen)
+        for name in getattr(type(obj), "__slots__", ()):
+            size += _deep_sizeof(getattr(obj, name, None), seen)
+    return size
@@ -2,13 +2,45 @@
 Serialization System
 
 Save and load game state, entities, and world data.
+
+Saves are JSON by default. Binary saves (``.sav``) use the compact streaming
+format from core/binary_save.py and keep their metadata in a header, so save
+lists can be shown without reading the world.
+
+Auto-saves snapshot the world on the main thread and are encoded and written
+on a background thread (see core/background_save.py).
 """
 
 import json
 from datetime import datetime
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
+from neonworks.core.background_save import (
+    DEFAULT_SNAPSHOT_BUDGET,
+    BackgroundSaver,
+    SaveStatus,
+    atomic_write,
+    snapshot_value,
+)
+from neonworks.core.binary_save import (
+    BinarySaveReader,
+    BinarySaveWriter,
+    is_binary_save,
+    read_header,
+)
 from neonworks.core.ecs import (
     Building,
     Collider,
@@ -27,6 +59,29 @@ from neonworks.core.ecs import (
 )
 from neonworks.core.project import Project
 
+SAVE_VERSION = "1.0"
+BINARY_SAVE_SUFFIX = ".sav"
+
+# Component types whose serialized fields are plain attribute copies. The
+# binary writer learns their field names from the first serialize_component
+# call and then reads the attributes directly instead of building a dict.
+_PLAIN_COMPONENTS = (
+    GridPosition,
+    Transform,
+    Sprite,
+    Health,
+    Survival,
+    Building,
+    ResourceStorage,
+    TurnActor,
+    Collider,
+    RigidBody,
+)
+_binary_schemas: Dict[type, Tuple[Tuple[str, ...], Callable[[Component], Tuple]]] = {}
+
+# (id, active, tags, [(type name, field names, field values)]) per entity
+EntityRecord = Tuple[Any, bool, List[str], List[Tuple[str, Tuple[str, ...], Sequence[Any]]]]
+
 
 class GameSerializer:
     """Serialize and deserialize game state"""
@@ -289,12 +344,175 @@ class GameSerializer:
 
         return world
 
+    @staticmethod
+    def component_fields(component: Component) -> Tuple[str, Tuple[str, ...], Sequence[Any]]:
+        """Get a component's type name, field names and field values as serialized"""
+        component_type = type(component)
+        schema = _binary_schemas.get(component_type)
+        if schema is not None:
+            names, getter = schema
+            return component_type.__name__, names, getter(component)
+
+        data = GameSerializer.serialize_component(component)
+        type_name = data.pop("_type")
+        names = tuple(data)
+        if component_type in _PLAIN_COMPONENTS and len(names) > 1:
+            _binary_schemas[component_type] = (names, attrgetter(*names))
+        return type_name, names, tuple(data.values())
+
+    @staticmethod
+    def entity_records(world: World) -> Iterator[EntityRecord]:
+        """Iterate over the world's entities as records (field values are live)"""
+        component_fields = GameSerializer.component_fields
+        for entity in world.get_entities():
+            yield (
+                entity.id,
+                entity.active,
+                list(entity.tags),
+                [component_fields(component) for component in entity._components.values()],
+            )
+
+    @staticmethod
+    def snapshot_world(world: World) -> List[EntityRecord]:
+        """
+        Capture the world's entities as records that later edits don't affect.
+
+        This is much cheaper than serializing: component values are read, not
+        converted, and only containers are copied.
+        """
+        return [
+            (
+                entity_id,
+                active,
+                tags,
+                [
+                    (type_name, names, snapshot_value(tuple(values)))
+                    for type_name, names, values in components
+                ],
+            )
+            for entity_id, active, tags, components in GameSerializer.entity_records(world)
+        ]
+
+    @staticmethod
+    def records_to_dict(records: Iterable[EntityRecord]) -> Dict[str, Any]:
+        """Convert entity records to the dict serialize_world produces"""
+        entities = []
+        for entity_id, active, tags, components in records:
+            entities.append(
+                {
+                    "id": entity_id,
+                    "tags": tags,
+                    "active": active,
+                    "components": [
+                        {"_type": type_name, **dict(zip(names, values))}
+                        for type_name, names, values in components
+                    ],
+                }
+            )
+        return {"entities": entities}
+
+    @staticmethod
+    def write_world(
+        world: World, stream: BinaryIO, header: Dict[str, Any], compress: bool = True
+    ) -> int:
+        """
+        Stream a world to a binary save, one entity at a time.
+
+        Args:
+            world: World to save
+            stream: Binary stream to write to
+            header: Save metadata stored in front of the body
+            compress: Compress the body
+
+        Returns:
+            Number of entities written
+        """
+        return GameSerializer.write_records(
+            GameSerializer.entity_records(world), stream, header, compress
+        )
+
+    @staticmethod
+    def write_records(
+        records: Iterable[EntityRecord],
+        stream: BinaryIO,
+        header: Dict[str, Any],
+        compress: bool = True,
+    ) -> int:
+        """
+        Stream entity records to a binary save.
+
+        Args:
+            records: Entity records from entity_records() or snapshot_world()
+            stream: Binary stream to write to
+            header: Save metadata stored in front of the body
+            compress: Compress the body
+
+        Returns:
+            Number of entities written
+        """
+        writer = BinarySaveWriter(stream, header, compress)
+        for entity_id, active, tags, components in records:
+            writer.write_entity(entity_id, active, tags, components)
+        writer.close()
+        return writer.entity_count
+
+    @staticmethod
+    def read_world(stream: BinaryIO) -> Tuple[Dict[str, Any], World]:
+        """
+        Load a world from a binary save.
+
+        Args:
+            stream: Binary stream positioned at the start of the save
+
+        Returns:
+            Tuple of (header, world)
+        """
+        reader = BinarySaveReader(stream)
+        world = World()
+        for entity_id, active, tags, components in reader.entities():
+            entity_data = {
+                "id": entity_id,
+                "active": active,
+                "tags": tags,
+                "components": [{"_type": type_name, **data} for type_name, data in components],
+            }
+            world.add_entity(GameSerializer.deserialize_entity(entity_data))
+        return reader.header, world
+
 
 class SaveGameManager:
     """Manage save games"""
 
-    def __init__(self, project: Project):
+    def __init__(
+        self,
+        project: Project,
+        binary: bool = False,
+        compress: bool = True,
+        snapshot_budget: float = DEFAULT_SNAPSHOT_BUDGET,
+    ):
+        """
+        Args:
+            project: Project whose saves directory is used
+            binary: Write binary saves instead of JSON
+            compress: Compress the body of binary saves
+            snapshot_budget: Main-thread snapshot time (seconds) of background
+                saves above which a save is counted as over budget
+        """
         self.project = project
+        self.binary = binary
+        self.compress = compress
+
+        self._saver = BackgroundSaver(snapshot_budget)
+
+    def _binary_save_path(self, save_name: str) -> Path:
+        return self.project.get_save_path(save_name).with_suffix(BINARY_SAVE_SUFFIX)
+
+    def _find_save(self, save_name: str) -> Optional[Path]:
+        """Get the existing save file for a name, in either format"""
+        for save_path in (self._binary_save_path(save_name), self.project.get_save_path(save_name)):
+            if save_path.exists():
+                return save_path
+        return None
 
     def save_game(
         self, save_name: str, world: World, metadata: Optional[Dict[str, Any]] = None
@@ -307,32 +525,93 @@ class SaveGameManager:
             world: World to save
             metadata: Additional metadata (player name, play time, etc.)
         """
-        save_path = self.project.get_save_path(save_name)
+        # Never overlap a background save
+        self._saver.wait()
 
         try:
-            # Serialize world
-            world_data = GameSerializer.serialize_world(world)
-
-            # Add metadata
-            save_data = {
-                "version": "1.0",
-                "timestamp": datetime.now().isoformat(),
-                "project": self.project.config.metadata.name,
-                "metadata": metadata or {},
-                "world": world_data,
-            }
-
-            # Write to file
-            with open(save_path, "w") as f:
-                json.dump(save_data, f, indent=2)
-
-            print(f"✅ Game saved: {save_name}")
+            info = self._save_info(len(world.get_entities()), metadata)
+            self._write_save(save_name, info, GameSerializer.entity_records(world))
             return True
 
         except Exception as e:
             print(f"❌ Error saving game: {e}")
             return False
 
+    def save_game_async(
+        self, save_name: str, world: World, metadata: Optional[Dict[str, Any]] = None
+    ) -> SaveStatus:
+        """
+        Save the game state on a background thread.
+
+        Only a snapshot of the world is taken on the calling thread; encoding
+        and writing happen in the background. Use wait() to block until the
+        save is on disk.
+
+        Args:
+            save_name: Name of the save file
+            world: World to save
+            metadata: Additional metadata (player name, play time, etc.)
+
+        Returns:
+            STARTED if the save was started, BUSY if the previous background
+            save is still being written, or FAILED if taking the snapshot
+            raised an exception
+        """
+
+        def snapshot():
+            records = GameSerializer.snapshot_world(world)
+            return self._save_info(len(records), snapshot_value(metadata)), records
+
+        return self._saver.save(snapshot, lambda state: self._write_save(save_name, *state))
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for a background save to finish.
+
+        Args:
+            timeout: Maximum time to wait in seconds (None waits forever)
+
+        Returns:
+            True if no save is being written anymore
+        """
+        return self._saver.wait(timeout)
+
+    def get_save_stats(self) -> Dict[str, Any]:
+        """Get background save counts and main-thread hitch times"""
+        return self._saver.get_stats()
+
+    def _save_info(self, entity_count: int, metadata: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        info = {
+            "version": SAVE_VERSION,
+            "timestamp": datetime.now().isoformat(),
+            "project": self.project.config.metadata.name,
+            "metadata": metadata or {},
+        }
+        if self.binary:
+            info["entity_count"] = entity_count
+        return info
+
+    def _write_save(self, save_name: str, info: Dict[str, Any], records: Iterable[EntityRecord]):
+        """Encode and write a save file, replacing any previous one atomically"""
+        json_path = self.project.get_save_path(save_name)
+        binary_path = self._binary_save_path(save_name)
+        save_path, stale_path = (
+            (binary_path, json_path) if self.binary else (json_path, binary_path)
+        )
+
+        with atomic_write(save_path) as f:
+            if self.binary:
+                GameSerializer.write_records(records, f, info, self.compress)
+            else:
+                save_data = {**info, "world": GameSerializer.records_to_dict(records)}
+                f.write(json.dumps(save_data, indent=2).encode("utf-8"))
+
+        # Don't leave an older save of the other format to shadow this one
+        if stale_path.exists():
+            stale_path.unlink()
+
+        print(f"✅ Game saved: {save_name}")
+
     def load_game(self, save_name: str) -> Optional[World]:
         """
         Load a saved game.
@@ -343,23 +622,28 @@ class SaveGameManager:
         Returns:
             World object or None if load failed
         """
-        save_path = self.project.get_save_path(save_name)
+        save_path = self._find_save(save_name)
 
-        if not save_path.exists():
+        if save_path is None:
             print(f"❌ Save file not found: {save_name}")
             return None
 
         try:
             # Read save file
-            with open(save_path, "r") as f:
-                save_data = json.load(f)
+            with open(save_path, "rb") as f:
+                if is_binary_save(f):
+                    save_data, world = GameSerializer.read_world(f)
+                else:
+                    save_data = json.load(f)
+                    world = None
 
             # Check version
-            if save_data.get("version") != "1.0":
+            if save_data.get("version") != SAVE_VERSION:
                 print("⚠️ Save file version mismatch")
 
             # Deserialize world
-            world = GameSerializer.deserialize_world(save_data["world"])
+            if world is None:
+                world = GameSerializer.deserialize_world(save_data["world"])
 
             print(f"✅ Game loaded: {save_name}")
             print(f"   Timestamp: {save_data.get('timestamp')}")
@@ -377,13 +661,16 @@ class SaveGameManager:
 
     def delete_save(self, save_name: str) -> bool:
         """Delete a save file"""
-        save_path = self.project.get_save_path(save_name)
+        save_path = self._find_save(save_name)
 
-        if not save_path.exists():
+        if save_path is None:
             return False
 
         try:
             save_path.unlink()
+            other_path = self._find_save(save_name)
+            if other_path is not None:
+                other_path.unlink()
             print(f"🗑️  Deleted save: {save_name}")
             return True
         except Exception as e:
@@ -392,21 +679,27 @@ class SaveGameManager:
 
     def get_save_info(self, save_name: str) -> Optional[Dict[str, Any]]:
         """Get information about a save file"""
-        save_path = self.project.get_save_path(save_name)
+        save_path = self._find_save(save_name)
 
-        if not save_path.exists():
+        if save_path is None:
             return None
 
         try:
-            with open(save_path, "r") as f:
-                save_data = json.load(f)
+            with open(save_path, "rb") as f:
+                if is_binary_save(f):
+                    # Only the header is read, not the world
+                    save_data, _ = read_header(f)
+                    entity_count = save_data.get("entity_count", 0)
+                else:
+                    save_data = json.load(f)
+                    entity_count = len(save_data.get("world", {}).get("entities", []))
 
             return {
                 "name": save_name,
                 "timestamp": save_data.get("timestamp"),
                 "project": save_data.get("project"),
                 "metadata": save_data.get("metadata", {}),
-                "entity_count": len(save_data.get("world", {}).get("entities", [])),
+                "entity_count": entity_count,
             }
         except:
             return None
@@ -415,14 +708,16 @@ class SaveGameManager:
 class AutoSaveManager:
     """Automatic save management"""
 
-    def __init__(self, save_manager: SaveGameManager, interval: int = 300):
+    def __init__(self, save_manager: SaveGameManager, interval: int = 300, background: bool = True):
         """
         Args:
             save_manager: SaveGameManager instance
             interval: Auto-save interval in seconds (default: 5 minutes)
+            background: Write auto-saves on a background thread
         """
         self.save_manager = save_manager
         self.interval = interval
+        self.background = background
         self.last_save_time = 0
         self.auto_save_count = 0
         self.max_auto_saves = 3  # Keep only last 3 auto-saves
@@ -430,16 +725,29 @@ class AutoSaveManager:
     def update(self, world: World, current_time: float):
         """Update auto-save (call every frame)"""
         if current_time - self.last_save_time >= self.interval:
-            self._perform_auto_save(world)
-            self.last_save_time = current_time
+            # Retried next update if the previous auto-save is still writing; a
+            # failed save waits for the next interval
+            if self._perform_auto_save(world) is not SaveStatus.BUSY:
+                self.last_save_time = current_time
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Wait for a background auto-save to finish"""
+        return self.save_manager.wait(timeout)
 
-    def _perform_auto_save(self, world: World):
+    def _perform_auto_save(self, world: World) -> SaveStatus:
         """Perform an auto-save"""
         auto_save_name = f"autosave_{self.auto_save_count % self.max_auto_saves}"
 
         metadata = {"type": "auto_save", "auto_save_index": self.auto_save_count}
 
-        self.save_manager.save_game(auto_save_name, world, metadata)
+        if not self.background:
+            saved = self.save_manager.save_game(auto_save_name, world, metadata)
+            status = SaveStatus.STARTED if saved else SaveStatus.FAILED
+        else:
+            status = self.save_manager.save_game_async(auto_save_name, world, metadata)
+        if not status:
+            return status
         self.auto_save_count += 1
 
         print(f"💾 Auto-saved (slot {self.auto_save_count % self.max_auto_saves})")
+        return status
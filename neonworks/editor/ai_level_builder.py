@@ -390,11 +390,11 @@ class AILevelBuilder:
                 center_y = random.randint(5, self.grid_height - 5)
 
                 # Expand from center using flood fill-like pattern
-                painted = 0
+                painted = []
                 queue = [(center_x, center_y)]
                 visited = set()
 
-                while queue and painted < tiles_per_body:
+                while queue and len(painted) < tiles_per_body:
                     x, y = queue.pop(0)
                     if (x, y) in visited:
                         continue
@@ -403,17 +403,19 @@ class AILevelBuilder:
                     if not (0 <= x < self.grid_width and 0 <= y < self.grid_height):
                         continue
 
-                    # Paint with autotile
-                    autotile_manager.paint_autotile(layer, x, y, autotile_set)
-                    painted += 1
+                    painted.append((x, y))
 
                     # Randomly expand to neighbors
                     for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
                         if random.random() < 0.6:  # 60% chance to expand
                             queue.append((x + dx, y + dy))
 
+                # Paint the whole body with autotiles in one pass
+                autotile_manager.paint_cells(layer, painted, autotile_set)
+
         elif terrain_type in ["wall", "cliff"]:
             # Generate perimeter or scattered walls/cliffs
+            cells = []
             for _ in range(target_tiles):
                 # Prefer edges for walls
                 if random.random() < 0.7:
@@ -432,7 +434,9 @@ class AILevelBuilder:
                     x = random.randint(0, self.grid_width - 1)
                     y = random.randint(0, self.grid_height - 1)
 
-                autotile_manager.paint_autotile(layer, x, y, autotile_set)
+                cells.append((x, y))
+
+            autotile_manager.paint_cells(layer, cells, autotile_set)
 
         print(f"   ✅ Generated {terrain_type} terrain with autotiles!")
         print(f"   💡 Tiles auto-matched for seamless appearance")
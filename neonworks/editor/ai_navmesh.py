@@ -134,6 +134,7 @@ class AINavmeshGenerator:
 
                     # TODO: Handle multi-tile buildings based on building size
 
+        navmesh.mark_dirty()
         return blocked_cells
 
     def _analyze_terrain(self, world: World, navmesh: Navmesh, grid_width: int, grid_height: int):
@@ -154,6 +155,8 @@ class AINavmeshGenerator:
                         edge_penalty = 1.0 + (3 - edge_distance) * 0.2
                         navmesh.cost_multipliers[pos] *= edge_penalty
 
+        navmesh.mark_dirty()
+
     def _smart_expansion(
         self,
         navmesh: Navmesh,
@@ -203,6 +206,8 @@ class AINavmeshGenerator:
                 navmesh.walkable_cells.add(pos)
                 navmesh.cost_multipliers[pos] = 1.0
 
+        navmesh.mark_dirty()
+
     def _detect_chokepoints(
         self, navmesh: Navmesh, grid_width: int, grid_height: int
     ) -> Set[Tuple[int, int]]:
@@ -235,6 +240,7 @@ class AINavmeshGenerator:
                     # Slightly increase cost for chokepoints (tactical consideration)
                     navmesh.cost_multipliers[pos] *= 1.1
 
+        navmesh.mark_dirty()
         return chokepoints
 
     def _detect_cover(self, world: World, navmesh: Navmesh) -> Set[Tuple[int, int]]:
@@ -272,6 +278,7 @@ class AINavmeshGenerator:
                     # Slightly reduce cost for cover positions (desirable)
                     navmesh.cost_multipliers[cover_pos] *= 0.9
 
+        navmesh.mark_dirty()
         return cover_positions
 
     def _optimize_corridors(self, navmesh: Navmesh, grid_width: int, grid_height: int):
@@ -308,6 +315,8 @@ class AINavmeshGenerator:
                 if h_corridor or v_corridor:
                     navmesh.cost_multipliers[pos] *= 0.85
 
+        navmesh.mark_dirty()
+
     def visualize_navmesh(self, navmesh: Navmesh, grid_width: int, grid_height: int) -> str:
         """
         Generate ASCII visualization of navmesh for debugging.
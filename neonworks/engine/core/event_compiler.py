@@ -0,0 +1,181 @@
+"""
+Event Page Compiler
+
+Turns the command list of an EventPage into a flat, pre-resolved program for
+the EventInterpreter. Branch else/end indices, loop ends, label jump targets
+and skip boundaries are computed once per page instead of being rescanned
+while the event runs.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from neonworks.core.event_commands import CommandType, EventCommand, EventPage
+
+
+@dataclass
+class CompiledPage:
+    """
+    Flat instruction array for a single event page.
+
+    All per-index lists have one entry per command. Targets that do not apply
+    to a command (e.g. the loop end of a SHOW_TEXT) are None.
+    """
+
+    signature: Tuple[int, int]
+    commands: Tuple[EventCommand, ...]
+    opcodes: Tuple[CommandType, ...]
+    indents: Tuple[int, ...]
+
+    # CONDITIONAL_BRANCH: (else_index, end_index)
+    branch_targets: List[Optional[Tuple[Optional[int], Optional[int]]]]
+    # LOOP: index of the closing command
+    loop_ends: List[Optional[int]]
+    # JUMP_TO_LABEL: index of the target label (None if the label is missing)
+    jump_targets: List[Optional[int]]
+    # First index >= i whose indent is 0 (len(commands) if none)
+    next_unindented: List[int]
+
+    label_map: Dict[str, int] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.commands)
+
+
+def page_signature(page: EventPage) -> Tuple[int, int]:
+    """
+    Cheap fingerprint used to detect edits to a page since it was compiled.
+
+    Hashes what the compiled targets depend on: each command object, its type
+    and indent, and the label/else text that jumps and branches resolve
+    against. Other parameters are read from the commands when they run, so
+    in-place edits to them don't need a rebuild.
+    """
+    return (
+        page.version,
+        hash(
+            tuple(
+                (id(cmd), cmd.command_type, cmd.indent, _structural_parameter(cmd))
+                for cmd in page.commands
+            )
+        ),
+    )
+
+
+def compile_page(page: EventPage) -> CompiledPage:
+    """
+    Compile an event page into a flat program.
+
+    Args:
+        page: Event page to compile
+
+    Returns:
+        CompiledPage with all jump targets resolved
+    """
+    commands = tuple(page.commands)
+    count = len(commands)
+
+    label_map: Dict[str, int] = {}
+    for i, cmd in enumerate(commands):
+        if cmd.command_type == CommandType.LABEL:
+            label_name = cmd.parameters.get("name", "")
+            if label_name:
+                label_map[label_name] = i
+
+    branch_targets: List[Optional[Tuple[Optional[int], Optional[int]]]] = [None] * count
+    loop_ends: List[Optional[int]] = [None] * count
+    jump_targets: List[Optional[int]] = [None] * count
+
+    for i, cmd in enumerate(commands):
+        cmd_type = cmd.command_type
+        if cmd_type == CommandType.CONDITIONAL_BRANCH:
+            branch_targets[i] = find_branch_indices(commands, i, cmd.indent)
+        elif cmd_type == CommandType.LOOP:
+            loop_ends[i] = find_loop_end(commands, i, cmd.indent)
+        elif cmd_type == CommandType.JUMP_TO_LABEL:
+            jump_targets[i] = label_map.get(cmd.parameters.get("label", ""))
+
+    next_unindented = [count] * count
+    following = count
+    for i in range(count - 1, -1, -1):
+        if commands[i].indent <= 0:
+            following = i
+        next_unindented[i] = following
+
+    return CompiledPage(
+        signature=page_signature(page),
+        commands=commands,
+        opcodes=tuple(cmd.command_type for cmd in commands),
+        indents=tuple(cmd.indent for cmd in commands),
+        branch_targets=branch_targets,
+        loop_ends=loop_ends,
+        jump_targets=jump_targets,
+        next_unindented=next_unindented,
+        label_map=label_map,
+    )
+
+
+def find_branch_indices(
+    commands: Tuple[EventCommand, ...], branch_start: int, branch_indent: int
+) -> Tuple[Optional[int], Optional[int]]:
+    """
+    Find the else and end indices for a conditional branch.
+
+    Args:
+        commands: All commands of the page
+        branch_start: Index of the conditional branch command
+        branch_indent: Indent level of the branch
+
+    Returns:
+        Tuple of (else_index, end_index)
+    """
+    else_index = None
+    end_index = None
+
+    # Scan forward to find else/end at same indent level
+    for i in range(branch_start + 1, len(commands)):
+        cmd = commands[i]
+
+        # Found a command at same or lower indent level
+        if cmd.indent <= branch_indent:
+            # Check if it's an else
+            if (
+                cmd.command_type == CommandType.COMMENT
+                and cmd.parameters.get("text", "").strip().lower() == "else"
+                and cmd.indent == branch_indent + 1
+            ):
+                else_index = i
+                continue
+
+            # End of branch
+            if cmd.indent == branch_indent:
+                end_index = i - 1
+                break
+
+    return else_index, end_index
+
+
+def find_loop_end(commands: Tuple[EventCommand, ...], loop_start: int, loop_indent: int) -> int:
+    """Find the end index of a loop"""
+    depth = 1
+    for i in range(loop_start + 1, len(commands)):
+        cmd = commands[i]
+        if cmd.command_type == CommandType.LOOP and cmd.indent >= loop_indent:
+            depth += 1
+        elif cmd.indent <= loop_indent:
+            depth -= 1
+            if depth == 0:
+                return i
+    return len(commands) - 1
+
+
+def _structural_parameter(cmd: EventCommand) -> Any:
+    """Get the parameter of a command that compile_page() resolves targets from"""
+    cmd_type = cmd.command_type
+    if cmd_type == CommandType.LABEL:
+        return cmd.parameters.get("name", "")
+    if cmd_type == CommandType.JUMP_TO_LABEL:
+        return cmd.parameters.get("label", "")
+    if cmd_type == CommandType.COMMENT:
+        return cmd.parameters.get("text", "")
+    return None
@@ -6,9 +6,10 @@ conditional branching, loops, and parallel execution support.
 """
 
 import logging
+import weakref
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 from neonworks.core.event_commands import (
     CommandType,
@@ -19,6 +20,8 @@ from neonworks.core.event_commands import (
     GameState,
 )
 from neonworks.core.events import Event, EventManager, EventType
+from neonworks.engine.core.event_compiler import CompiledPage, compile_page, page_signature
+from neonworks.engine.core.script_cache import EVAL, EXEC, ScriptCache
 
 logger = logging.getLogger(__name__)
 
@@ -85,6 +88,9 @@ class InterpreterInstance:
     # Label map for jumps (built on initialization)
     label_map: Dict[str, int] = field(default_factory=dict)
 
+    # Pre-resolved program for the page (compiled on demand if not provided)
+    program: Optional[CompiledPage] = None
+
     # Error tracking
     last_error: Optional[str] = None
     error_command_index: Optional[int] = None
@@ -95,17 +101,15 @@ class InterpreterInstance:
     on_wait_complete: Optional[Callable[[], None]] = None
 
     def __post_init__(self):
-        """Initialize label map after instance creation"""
+        """Initialize program and label map after instance creation"""
+        if self.program is None:
+            self.program = compile_page(self.context.page)
         self._build_label_map()
 
     def _build_label_map(self):
         """Build map of labels to command indices"""
         self.label_map.clear()
-        for i, cmd in enumerate(self.context.page.commands):
-            if cmd.command_type == CommandType.LABEL:
-                label_name = cmd.parameters.get("name", "")
-                if label_name:
-                    self.label_map[label_name] = i
+        self.label_map.update(self.program.label_map)
 
     def is_finished(self) -> bool:
         """Check if interpreter has finished execution"""
@@ -136,8 +140,41 @@ class EventInterpreter:
     - Wait state management
     - Parallel event execution
     - Error handling and recovery
+
+    Pages are compiled once into a flat program (see event_compiler) and
+    cached until the page is edited; commands are dispatched through a table.
+    Scripts are compiled once and cached as well (see script_cache).
     """
 
+    # Command type -> handler method name
+    DISPATCH_TABLE: Dict[CommandType, str] = {
+        # Flow control
+        CommandType.CONDITIONAL_BRANCH: "_execute_conditional_branch",
+        CommandType.LOOP: "_execute_loop_start",
+        CommandType.BREAK_LOOP: "_execute_break_loop",
+        CommandType.EXIT_EVENT: "_execute_exit_event",
+        CommandType.LABEL: "_execute_label",
+        CommandType.JUMP_TO_LABEL: "_execute_jump_to_label",
+        CommandType.COMMENT: "_execute_comment",
+        # Wait
+        CommandType.WAIT: "_execute_wait",
+        # Messages
+        CommandType.SHOW_TEXT: "_execute_show_text",
+        CommandType.SHOW_CHOICES: "_execute_show_choices",
+        # Game state
+        CommandType.CONTROL_SWITCHES: "_execute_control_switches",
+        CommandType.CONTROL_VARIABLES: "_execute_control_variables",
+        CommandType.CONTROL_SELF_SWITCH: "_execute_control_self_switch",
+        # Audio
+        CommandType.PLAY_BGM: "_execute_play_bgm",
+        CommandType.PLAY_SE: "_execute_play_se",
+        CommandType.FADEOUT_BGM: "_execute_fadeout_bgm",
+        # Transfer
+        CommandType.TRANSFER_PLAYER: "_execute_transfer_player",
+        # Script
+        CommandType.SCRIPT: "_execute_script",
+    }
+
     def __init__(self, game_state: GameState, event_manager: Optional[EventManager] = None):
         """
         Initialize the event interpreter.
@@ -157,6 +194,15 @@ class EventInterpreter:
         self.total_commands_executed = 0
         self.total_events_completed = 0
 
+        # Compiled page cache (id(page) -> (page ref, program)), dropped with
+        # the page, and bound dispatch table
+        self._compiled_pages: Dict[int, Tuple[weakref.ref, CompiledPage]] = {}
+        self.pages_compiled = 0
+        self.script_cache = ScriptCache()
+        self._dispatch: Dict[CommandType, Callable[[InterpreterInstance, EventCommand], None]] = {
+            cmd_type: getattr(self, name) for cmd_type, name in self.DISPATCH_TABLE.items()
+        }
+
         # Callbacks
         self.on_event_start: Optional[Callable[[GameEvent, EventPage], None]] = None
         self.on_event_end: Optional[Callable[[GameEvent], None]] = None
@@ -179,7 +225,10 @@ class EventInterpreter:
         """
         context = EventContext(event=event, page=page)
         instance = InterpreterInstance(
-            context=context, state=InterpreterState.RUNNING, game_state=self.game_state
+            context=context,
+            state=InterpreterState.RUNNING,
+            game_state=self.game_state,
+            program=self.get_compiled_page(page),
         )
 
         if is_parallel:
@@ -194,6 +243,64 @@ class EventInterpreter:
 
         return instance
 
+    def get_compiled_page(self, page: EventPage) -> CompiledPage:
+        """
+        Get the compiled program for a page, compiling it if needed.
+
+        Programs are cached per page until the page is garbage collected, and
+        rebuilt when the page has been edited (``EventPage.mark_dirty()`` or a
+        change to the commands, their indents or their labels).
+        """
+        key = id(page)
+        signature = page_signature(page)
+        cached = self._compiled_pages.get(key)
+        if cached is not None and cached[0]() is page and cached[1].signature == signature:
+            return cached[1]
+
+        cache = self._compiled_pages
+
+        def evict(ref: weakref.ref):
+            # Only drop the entry if a newer page hasn't reused the id
+            entry = cache.get(key)
+            if entry is not None and entry[0] is ref:
+                del cache[key]
+
+        program = compile_page(page)
+        cache[key] = (weakref.ref(page, evict), program)
+        self.pages_compiled += 1
+        return program
+
+    def precompile_events(self, events: Iterable[GameEvent]) -> int:
+        """
+        Compile the pages and scripts of events ahead of time.
+
+        Call when a map's events are loaded so the first run of each page
+        doesn't pay for compilation. EventTriggerManager.from_dict() calls
+        this when given the interpreter, which ZoneSystem does when loading
+        a zone file.
+
+        Args:
+            events: Events to compile
+
+        Returns:
+            Number of scripts compiled
+        """
+        scripts = 0
+        for event in events:
+            for page in event.pages:
+                self.get_compiled_page(page)
+                scripts += self.script_cache.precompile_page(page)
+        return scripts
+
+    def invalidate_page(self, page: EventPage):
+        """Drop the cached program of a page"""
+        self._compiled_pages.pop(id(page), None)
+
+    def clear_compile_cache(self):
+        """Drop all cached page programs and compiled scripts"""
+        self._compiled_pages.clear()
+        self.script_cache.clear()
+
     def stop_event(self, event_id: int):
         """
         Stop a running event.
@@ -299,21 +406,26 @@ class EventInterpreter:
         Returns:
             True if a command was executed, False if should stop
         """
-        command = instance.context.get_current_command()
-        if not command:
+        program = instance.program
+        index = instance.context.command_index
+        if index >= len(program):
             instance.state = InterpreterState.FINISHED
             return False
 
-        # Check if we should skip this command due to branching
-        if self._should_skip_command(instance, command):
-            instance.context.advance()
-            # Check for loop jump-back even when skipping commands
-            self._check_loop_jump_back(instance)
-            return True
+        # Skip the whole run of commands in an inactive branch section at once
+        if instance.branch_stack:
+            skip_to = self._get_skip_target(instance, program, index)
+            if skip_to is not None:
+                instance.context.command_index = skip_to
+                # Check for loop jump-back even when skipping commands
+                self._check_loop_jump_back(instance)
+                return True
 
-        # Execute command based on type
+        command = program.commands[index]
+
+        # Execute command through the dispatch table
         try:
-            self._execute_command(instance, command)
+            self._dispatch.get(command.command_type, self._execute_unimplemented)(instance, command)
             self.total_commands_executed += 1
 
             if self.on_command_execute:
@@ -342,106 +454,46 @@ class EventInterpreter:
             if instance.context.command_index > current_frame.loop_end:
                 instance.context.command_index = current_frame.loop_start + 1
 
-    def _should_skip_command(self, instance: InterpreterInstance, command: EventCommand) -> bool:
+    def _get_skip_target(
+        self, instance: InterpreterInstance, program: CompiledPage, index: int
+    ) -> Optional[int]:
         """
-        Determine if a command should be skipped based on branching logic.
+        Determine where execution continues if the command at index is skipped.
+
+        Commands nested (indent > 0) inside the inactive section of the
+        innermost branch are skipped. The skipped run ends at the next
+        unindented command, at the else clause, or just past the enclosing
+        loop, whichever comes first.
 
         Args:
             instance: The interpreter instance
-            command: The command to check
+            program: Compiled page program
+            index: Index of the current command
 
         Returns:
-            True if command should be skipped
+            Index to continue at, or None if the command should execute
         """
-        if not instance.branch_stack:
-            return False
-
         current_frame = instance.branch_stack[-1]
-        current_index = instance.context.command_index
-
-        # If we're inside a branch
-        if current_frame.branch_command_index < current_index:
-            # Check if we should skip based on indent level
-            if command.indent > 0:
-                # We're in a nested section
-                # Skip if we're in the wrong branch
-                if not current_frame.branch_result and current_frame.else_index is None:
-                    return True
-                if not current_frame.branch_result and current_frame.else_index is not None:
-                    # Skip if before else
-                    if current_index < current_frame.else_index:
-                        return True
-                if current_frame.branch_result and current_frame.else_index is not None:
-                    # Skip if after else
-                    if current_index >= current_frame.else_index:
-                        return True
+        if current_frame.branch_command_index >= index or program.indents[index] <= 0:
+            return None
 
-        return False
+        else_index = current_frame.else_index
+        end = program.next_unindented[index]
 
-    def _execute_command(self, instance: InterpreterInstance, command: EventCommand):
-        """
-        Execute a single command.
+        if current_frame.branch_result:
+            # Skip only the else section
+            if else_index is None or index < else_index:
+                return None
+        elif else_index is not None:
+            # Skip only up to the else section
+            if index >= else_index:
+                return None
+            end = min(end, else_index)
 
-        Args:
-            instance: The interpreter instance
-            command: The command to execute
-        """
-        cmd_type = command.command_type
-
-        # Flow control commands
-        if cmd_type == CommandType.CONDITIONAL_BRANCH:
-            self._execute_conditional_branch(instance, command)
-        elif cmd_type == CommandType.LOOP:
-            self._execute_loop_start(instance, command)
-        elif cmd_type == CommandType.BREAK_LOOP:
-            self._execute_break_loop(instance, command)
-        elif cmd_type == CommandType.EXIT_EVENT:
-            self._execute_exit_event(instance, command)
-        elif cmd_type == CommandType.LABEL:
-            self._execute_label(instance, command)
-        elif cmd_type == CommandType.JUMP_TO_LABEL:
-            self._execute_jump_to_label(instance, command)
-        elif cmd_type == CommandType.COMMENT:
-            instance.context.advance()
+        if instance.loop_stack:
+            end = min(end, instance.loop_stack[-1].loop_end + 1)
 
-        # Wait commands
-        elif cmd_type == CommandType.WAIT:
-            self._execute_wait(instance, command)
-
-        # Message commands
-        elif cmd_type == CommandType.SHOW_TEXT:
-            self._execute_show_text(instance, command)
-        elif cmd_type == CommandType.SHOW_CHOICES:
-            self._execute_show_choices(instance, command)
-
-        # Game state commands
-        elif cmd_type == CommandType.CONTROL_SWITCHES:
-            self._execute_control_switches(instance, command)
-        elif cmd_type == CommandType.CONTROL_VARIABLES:
-            self._execute_control_variables(instance, command)
-        elif cmd_type == CommandType.CONTROL_SELF_SWITCH:
-            self._execute_control_self_switch(instance, command)
-
-        # Audio commands
-        elif cmd_type == CommandType.PLAY_BGM:
-            self._execute_play_bgm(instance, command)
-        elif cmd_type == CommandType.PLAY_SE:
-            self._execute_play_se(instance, command)
-        elif cmd_type == CommandType.FADEOUT_BGM:
-            self._execute_fadeout_bgm(instance, command)
-
-        # Transfer commands
-        elif cmd_type == CommandType.TRANSFER_PLAYER:
-            self._execute_transfer_player(instance, command)
-
-        # Script commands
-        elif cmd_type == CommandType.SCRIPT:
-            self._execute_script(instance, command)
-
-        # Default: just advance
-        else:
-            logger.warning(f"Unimplemented command type: {cmd_type.name}")
-            instance.context.advance()
+        return max(end, index + 1)
 
     # ========== Flow Control Implementation ==========
 
@@ -450,12 +502,8 @@ class EventInterpreter:
         condition_type = command.parameters.get("condition_type")
         result = self._evaluate_condition(instance, command.parameters)
 
-        # Find the else and end indices
-        else_index, end_index = self._find_branch_indices(
-            instance.context.page.commands,
-            instance.context.command_index,
-            command.indent,
-        )
+        # Else and end indices are resolved at compile time
+        else_index, end_index = instance.program.branch_targets[instance.context.command_index]
 
         # Create branch frame
         frame = BranchFrame(
@@ -518,7 +566,7 @@ class EventInterpreter:
             # Evaluate custom script
             script = params.get("script", "True")
             try:
-                return bool(eval(script, {"game_state": self.game_state}))
+                return bool(self.script_cache.get(script, EVAL).run(self.game_state))
             except Exception as e:
                 logger.error(f"Script evaluation error: {e}")
                 return False
@@ -541,53 +589,10 @@ class EventInterpreter:
             return left <= right
         return False
 
-    def _find_branch_indices(
-        self, commands: List[EventCommand], branch_start: int, branch_indent: int
-    ) -> tuple[Optional[int], Optional[int]]:
-        """
-        Find the else and end indices for a conditional branch.
-
-        Args:
-            commands: List of all commands
-            branch_start: Index of the conditional branch command
-            branch_indent: Indent level of the branch
-
-        Returns:
-            Tuple of (else_index, end_index)
-        """
-        else_index = None
-        end_index = None
-
-        # Scan forward to find else/end at same indent level
-        for i in range(branch_start + 1, len(commands)):
-            cmd = commands[i]
-
-            # Found a command at same or lower indent level
-            if cmd.indent <= branch_indent:
-                # Check if it's an else
-                if (
-                    cmd.command_type == CommandType.COMMENT
-                    and cmd.parameters.get("text", "").strip().lower() == "else"
-                    and cmd.indent == branch_indent + 1
-                ):
-                    else_index = i
-                    continue
-
-                # End of branch
-                if cmd.indent == branch_indent:
-                    end_index = i - 1
-                    break
-
-        return else_index, end_index
-
     def _execute_loop_start(self, instance: InterpreterInstance, command: EventCommand):
         """Execute loop start command"""
-        # Find loop end
-        loop_end = self._find_loop_end(
-            instance.context.page.commands,
-            instance.context.command_index,
-            command.indent,
-        )
+        # Loop end is resolved at compile time
+        loop_end = instance.program.loop_ends[instance.context.command_index]
 
         frame = LoopFrame(
             loop_start=instance.context.command_index,
@@ -597,21 +602,6 @@ class EventInterpreter:
         instance.loop_stack.append(frame)
         instance.context.advance()
 
-    def _find_loop_end(
-        self, commands: List[EventCommand], loop_start: int, loop_indent: int
-    ) -> int:
-        """Find the end index of a loop"""
-        depth = 1
-        for i in range(loop_start + 1, len(commands)):
-            cmd = commands[i]
-            if cmd.command_type == CommandType.LOOP and cmd.indent >= loop_indent:
-                depth += 1
-            elif cmd.indent <= loop_indent:
-                depth -= 1
-                if depth == 0:
-                    return i
-        return len(commands) - 1
-
     def _execute_break_loop(self, instance: InterpreterInstance, command: EventCommand):
         """Execute break loop command"""
         if not instance.loop_stack:
@@ -626,7 +616,7 @@ class EventInterpreter:
     def _execute_exit_event(self, instance: InterpreterInstance, command: EventCommand):
         """Execute exit event command"""
         instance.state = InterpreterState.FINISHED
-        instance.context.command_index = len(instance.context.page.commands)
+        instance.context.command_index = len(instance.program)
 
     def _execute_label(self, instance: InterpreterInstance, command: EventCommand):
         """Execute label command (just advance)"""
@@ -634,13 +624,22 @@ class EventInterpreter:
 
     def _execute_jump_to_label(self, instance: InterpreterInstance, command: EventCommand):
         """Execute jump to label command"""
-        label_name = command.parameters.get("label", "")
-        if label_name in instance.label_map:
-            instance.context.command_index = instance.label_map[label_name]
+        target = instance.program.jump_targets[instance.context.command_index]
+        if target is not None:
+            instance.context.command_index = target
         else:
-            logger.error(f"Label not found: {label_name}")
+            logger.error(f"Label not found: {command.parameters.get('label', '')}")
             instance.context.advance()
 
+    def _execute_comment(self, instance: InterpreterInstance, command: EventCommand):
+        """Execute comment command (just advance)"""
+        instance.context.advance()
+
+    def _execute_unimplemented(self, instance: InterpreterInstance, command: EventCommand):
+        """Fallback for command types without a handler"""
+        logger.warning(f"Unimplemented command type: {command.command_type.name}")
+        instance.context.advance()
+
     # ========== Wait Commands ==========
 
     def _execute_wait(self, instance: InterpreterInstance, command: EventCommand):
@@ -790,13 +789,9 @@ class EventInterpreter:
         """Execute custom script command"""
         script = command.parameters.get("script", "")
         try:
-            # Provide safe execution context
-            context = {
-                "game_state": self.game_state,
-                "event": instance.context.event,
-                "context": instance.context,
-            }
-            exec(script, context)
+            self.script_cache.get(script, EXEC).run(
+                self.game_state, {"event": instance.context.event, "context": instance.context}
+            )
             instance.context.advance()
         except Exception as e:
             logger.error(f"Script execution error: {e}")
@@ -881,4 +876,7 @@ class EventInterpreter:
             "parallel_events": len(self.parallel_interpreters),
             "total_commands_executed": self.total_commands_executed,
             "total_events_completed": self.total_events_completed,
+            "compiled_pages": len(self._compiled_pages),
+            "pages_compiled": self.pages_compiled,
+            "scripts": self.script_cache.get_statistics(),
         }
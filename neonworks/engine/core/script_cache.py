@@ -0,0 +1,354 @@
+"""
+Script Cache
+
+Compiled code for Script commands and script conditions. Each source is
+compiled once and cached by its source string (so lookups use the string's
+cached hash), instead of being compiled by exec()/eval() on every run.
+
+Simple scripts made only of switch/variable reads and writes, constants,
+arithmetic, comparisons and boolean operators are lowered to plain Python
+closures, which skip eval() entirely. Anything else runs its cached code
+object.
+"""
+
+import ast
+import operator
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from neonworks.core.event_commands import CommandType, EventPage, GameState
+
+# Lowered script: takes the game state, returns the expression value
+FastPath = Callable[[GameState], Any]
+
+# Modes accepted by compile()
+EVAL = "eval"
+EXEC = "exec"
+
+_CONSTANT_TYPES = (int, float, bool, str, type(None))
+
+_BINARY_OPERATORS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod,
+}
+
+_UNARY_OPERATORS = {
+    ast.Not: operator.not_,
+    ast.USub: operator.neg,
+    ast.UAdd: operator.pos,
+}
+
+_COMPARE_OPERATORS = {
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+}
+
+# game_state methods allowed in lowered scripts -> argument count
+_READ_METHODS = {"get_switch": 1, "get_variable": 1}
+_WRITE_METHODS = {"set_switch": 2, "set_variable": 2}
+
+
+class CompiledScript:
+    """A cached script with its run count and time"""
+
+    __slots__ = ("source", "mode", "code", "fast", "error", "calls", "total_time")
+
+    def __init__(self, source: str, mode: str):
+        """
+        Compile a script.
+
+        Args:
+            source: Python source
+            mode: EVAL for expressions (conditions), EXEC for statements
+        """
+        self.source = source
+        self.mode = mode
+        self.code = None
+        self.fast: Optional[FastPath] = None
+        self.error: Optional[SyntaxError] = None
+        self.calls = 0
+        self.total_time = 0.0
+
+        try:
+            tree = ast.parse(source, mode=mode)
+        except SyntaxError as e:
+            self.error = e
+            return
+        self.fast = lower_script(tree)
+        if self.fast is None:
+            self.code = compile(tree, "<event script>", mode)
+
+    def run(self, game_state: GameState, names: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Run the script.
+
+        Args:
+            game_state: Game state, available to the script as ``game_state``
+            names: Other names available to the script
+
+        Returns:
+            Value of the expression (None for statements)
+
+        Raises:
+            SyntaxError: If the script failed to compile
+        """
+        start = time.perf_counter()
+        try:
+            if self.fast is not None:
+                return self.fast(game_state)
+            if self.error is not None:
+                raise SyntaxError(*self.error.args)
+            namespace = {"game_state": game_state}
+            if names:
+                namespace.update(names)
+            return eval(self.code, namespace)
+        finally:
+            self.calls += 1
+            self.total_time += time.perf_counter() - start
+
+
+class ScriptCache:
+    """Compiled scripts keyed by mode and source"""
+
+    def __init__(self):
+        """Initialize an empty cache."""
+        self._scripts: Dict[Tuple[str, str], CompiledScript] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, source: str, mode: str = EXEC) -> CompiledScript:
+        """
+        Get the compiled script for a source, compiling it on first use.
+
+        Scripts with syntax errors are cached too and raise when run.
+
+        Args:
+            source: Python source
+            mode: EVAL or EXEC
+
+        Returns:
+            The compiled script
+        """
+        key = (mode, source)
+        script = self._scripts.get(key)
+        if script is not None:
+            self.hits += 1
+            return script
+
+        self.misses += 1
+        script = CompiledScript(source, mode)
+        self._scripts[key] = script
+        return script
+
+    def precompile_page(self, page: EventPage) -> int:
+        """
+        Compile every script of a page ahead of time.
+
+        Args:
+            page: Event page
+
+        Returns:
+            Number of scripts compiled (already cached ones aren't counted)
+        """
+        compiled = 0
+        for source, mode in page_scripts(page):
+            if (mode, source) in self._scripts:
+                continue
+            script = CompiledScript(source, mode)
+            self._scripts[(mode, source)] = script
+            compiled += 1
+        return compiled
+
+    def clear(self):
+        """Drop all compiled scripts and reset counters"""
+        self._scripts.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._scripts)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get cache hit counts and the run time of each script (seconds)"""
+        lookups = self.hits + self.misses
+        return {
+            "scripts_cached": len(self._scripts),
+            "fast_path_scripts": sum(1 for s in self._scripts.values() if s.fast is not None),
+            "cache_hits": self.hits,
+            "cache_misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "script_timings": {
+                script.source: {
+                    "mode": script.mode,
+                    "fast_path": script.fast is not None,
+                    "calls": script.calls,
+                    "total_time": script.total_time,
+                    "avg_time": script.total_time / script.calls if script.calls else 0.0,
+                }
+                for script in self._scripts.values()
+            },
+        }
+
+
+def page_scripts(page: EventPage) -> Iterable[Tuple[str, str]]:
+    """
+    Iterate the scripts of a page's commands.
+
+    Yields:
+        (source, mode) for Script commands and script conditional branches
+    """
+    for command in page.commands:
+        if command.command_type == CommandType.SCRIPT:
+            yield (command.parameters.get("script", ""), EXEC)
+        elif (
+            command.command_type == CommandType.CONDITIONAL_BRANCH
+            and command.parameters.get("condition_type") == "script"
+        ):
+            yield (command.parameters.get("script", "True"), EVAL)
+
+
+def lower_script(tree: ast.AST) -> Optional[FastPath]:
+    """
+    Lower a parsed script to a closure if it only uses supported constructs.
+
+    Args:
+        tree: Result of ast.parse() in "eval" or "exec" mode
+
+    Returns:
+        Closure taking the game state, or None if the script needs eval()
+    """
+    if isinstance(tree, ast.Expression):
+        return _lower_expression(tree.body)
+
+    if not isinstance(tree, ast.Module):
+        return None
+    statements: List[FastPath] = []
+    for statement in tree.body:
+        if isinstance(statement, ast.Pass):
+            continue
+        if not isinstance(statement, ast.Expr):
+            return None
+        lowered = _lower_expression(statement.value, allow_writes=True)
+        if lowered is None:
+            return None
+        statements.append(lowered)
+
+    def run_statements(game_state: GameState) -> None:
+        for statement in statements:
+            statement(game_state)
+
+    return run_statements
+
+
+def _lower_expression(node: ast.AST, allow_writes: bool = False) -> Optional[FastPath]:
+    """Lower one expression node, or return None if it isn't supported"""
+    if isinstance(node, ast.Constant):
+        if not isinstance(node.value, _CONSTANT_TYPES):
+            return None
+        value = node.value
+        return lambda game_state: value
+
+    if isinstance(node, ast.Call):
+        return _lower_call(node, allow_writes)
+
+    if isinstance(node, ast.BinOp):
+        op = _BINARY_OPERATORS.get(type(node.op))
+        left = _lower_expression(node.left)
+        right = _lower_expression(node.right)
+        if op is None or left is None or right is None:
+            return None
+        return lambda game_state: op(left(game_state), right(game_state))
+
+    if isinstance(node, ast.UnaryOp):
+        op = _UNARY_OPERATORS.get(type(node.op))
+        operand = _lower_expression(node.operand)
+        if op is None or operand is None:
+            return None
+        return lambda game_state: op(operand(game_state))
+
+    if isinstance(node, ast.Compare):
+        return _lower_compare(node)
+
+    if isinstance(node, ast.BoolOp):
+        values = [_lower_expression(value) for value in node.values]
+        if None in values:
+            return None
+        return _bool_op(values, isinstance(node.op, ast.And))
+
+    return None
+
+
+def _lower_call(node: ast.Call, allow_writes: bool) -> Optional[FastPath]:
+    """Lower game_state.get_*/set_* calls with positional arguments"""
+    func = node.func
+    if (
+        node.keywords
+        or not isinstance(func, ast.Attribute)
+        or not isinstance(func.value, ast.Name)
+        or func.value.id != "game_state"
+    ):
+        return None
+
+    method = func.attr
+    arg_count = _READ_METHODS.get(method)
+    if arg_count is None and allow_writes:
+        arg_count = _WRITE_METHODS.get(method)
+    if arg_count is None or len(node.args) != arg_count:
+        return None
+
+    if all(isinstance(arg, ast.Constant) for arg in node.args):
+        return operator.methodcaller(method, *(arg.value for arg in node.args))
+
+    args = [_lower_expression(arg) for arg in node.args]
+    if None in args:
+        return None
+    return lambda game_state: getattr(game_state, method)(*(arg(game_state) for arg in args))
+
+
+def _lower_compare(node: ast.Compare) -> Optional[FastPath]:
+    """Lower a comparison chain, keeping its short-circuit behaviour"""
+    ops = [_COMPARE_OPERATORS.get(type(op)) for op in node.ops]
+    operands = [_lower_expression(node.left)] + [_lower_expression(c) for c in node.comparators]
+    if None in ops or None in operands:
+        return None
+
+    if len(ops) == 1:
+        op = ops[0]
+        left, right = operands
+        return lambda game_state: op(left(game_state), right(game_state))
+
+    first = operands[0]
+    pairs = list(zip(ops, operands[1:]))
+
+    def compare_chain(game_state: GameState) -> Any:
+        left = first(game_state)
+        for op, operand in pairs:
+            right = operand(game_state)
+            result = op(left, right)
+            if not result:
+                return result
+            left = right
+        return result
+
+    return compare_chain
+
+
+def _bool_op(values: List[FastPath], is_and: bool) -> FastPath:
+    """Build an and/or closure returning the deciding operand like Python does"""
+
+    def bool_op(game_state: GameState) -> Any:
+        for value in values:
+            result = value(game_state)
+            if bool(result) != is_and:
+                return result
+        return result
+
+    return bool_op
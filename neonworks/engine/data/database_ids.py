@@ -0,0 +1,146 @@
+"""
+Database ID Allocation
+======================
+
+Per-category ID allocator for DatabaseManager.
+
+Free IDs below the high-water mark are kept in a min-heap of half-open
+ranges, so the lowest free ID is found in O(1) amortized time instead of
+scanning from 1 on every create. Ranges are cleaned lazily: an ID that was
+taken by an explicit-ID create is skipped the next time it reaches the top of
+the heap, so the allocator never hands out an ID that is in use.
+"""
+
+import heapq
+from typing import Dict, List, Optional, Tuple
+
+IdRange = Tuple[int, int]  # [start, end)
+
+
+class IdAllocator:
+    """Min-heap of freed ID ranges plus a high-water mark for one category"""
+
+    def __init__(self, storage: Dict[int, object], entry_type: type):
+        """
+        Initialize an allocator over a category's storage.
+
+        Args:
+            storage: The category's id -> entry dict (checked for IDs in use)
+            entry_type: Entry class, whose MAX_ID bounds allocation
+        """
+        self.storage = storage
+        self.entry_type = entry_type
+
+        self.high_water = 0  # Highest ID ever used or reserved
+        self.count = 0  # Number of IDs registered as in use
+        self._free: List[IdRange] = []
+
+    def peek(self) -> Optional[int]:
+        """
+        Get the lowest free ID without taking it.
+
+        Returns:
+            The ID, or None if every ID up to MAX_ID is used
+        """
+        free = self._free
+        storage = self.storage
+        while free:
+            start, end = free[0]
+            if start not in storage:
+                return start
+            # Taken by an explicit-ID create since it was freed
+            if start + 1 < end:
+                heapq.heapreplace(free, (start + 1, end))
+            else:
+                heapq.heappop(free)
+
+        candidate = self.high_water + 1
+        while candidate in storage:  # Only after direct storage edits
+            candidate += 1
+        if candidate > self.entry_type.MAX_ID:
+            return None
+        return candidate
+
+    def add(self, entry_id: int):
+        """Register an ID that was just stored"""
+        self.count += 1
+        if entry_id > self.high_water:
+            if entry_id > self.high_water + 1:
+                heapq.heappush(self._free, (self.high_water + 1, entry_id))
+            self.high_water = entry_id
+
+    def release(self, entry_id: int):
+        """Register an ID that was just deleted"""
+        self.count -= 1
+        if entry_id <= self.high_water:
+            heapq.heappush(self._free, (entry_id, entry_id + 1))
+
+    def reserve(self, count: int) -> Optional[range]:
+        """
+        Reserve a block of contiguous IDs above the high-water mark.
+
+        The IDs are not handed out by peek() afterwards. Unused ones can be
+        given back with release_unused().
+
+        Args:
+            count: Number of IDs
+
+        Returns:
+            The reserved IDs, or None if the block would exceed MAX_ID
+        """
+        start = self.high_water + 1
+        while start in self.storage:
+            start += 1
+        end = start + count
+        if count < 0 or end - 1 > self.entry_type.MAX_ID:
+            return None
+
+        if start > self.high_water + 1:
+            heapq.heappush(self._free, (self.high_water + 1, start))
+        self.high_water = max(self.high_water, end - 1)
+        return range(start, end)
+
+    def release_unused(self, ids: range):
+        """Give back reserved IDs that were not stored"""
+        for entry_id in ids:
+            if entry_id not in self.storage:
+                heapq.heappush(self._free, (entry_id, entry_id + 1))
+
+    def highest_used(self) -> int:
+        """Get the highest ID in use (0 if none)"""
+        entry_id = self.high_water
+        while entry_id > 0 and entry_id not in self.storage:
+            entry_id -= 1
+        return entry_id
+
+    def gaps(self, max_id: int) -> List[int]:
+        """Get all free IDs from 1 to max_id in ascending order"""
+        storage = self.storage
+        result: List[int] = []
+        last = 0  # Highest ID already emitted, so overlapping ranges aren't repeated
+        for start, end in sorted(self._free):
+            start = max(start, last + 1)
+            end = min(end, max_id + 1)
+            for entry_id in range(start, end):
+                if entry_id not in storage:
+                    result.append(entry_id)
+            last = max(last, end - 1)
+
+        for entry_id in range(max(last, self.high_water) + 1, max_id + 1):
+            if entry_id not in storage:
+                result.append(entry_id)
+        return result
+
+    def rebuild(self):
+        """Recompute free ranges and the high-water mark from the storage"""
+        ids = sorted(self.storage)
+        free: List[IdRange] = []
+        previous = 0
+        for entry_id in ids:
+            if entry_id > previous + 1:
+                free.append((previous + 1, entry_id))
+            previous = entry_id
+
+        self._free = free  # Sorted, so already a valid heap
+        self.high_water = previous
+        self.count = len(ids)
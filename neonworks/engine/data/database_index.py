@@ -0,0 +1,384 @@
+"""
+Database Indexes
+================
+
+Secondary indexes for DatabaseManager categories.
+
+Each category declares which fields are indexed and how:
+- hash: equality lookups on enum-like fields (item_type, element_type, ...)
+- sorted: range lookups on numeric fields (price, mp_cost, ...)
+- token: substring search on text fields (name, description)
+
+Indexes only narrow down candidates. The manager still checks every candidate
+against the live entry, so results are identical to a full scan.
+"""
+
+import re
+from bisect import bisect_left, bisect_right, insort
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+# Index declarations per category: (kind, field)
+DEFAULT_INDEXES: Dict[str, List[Tuple[str, str]]] = {
+    "items": [("hash", "item_type"), ("sorted", "price"), ("hash", "occasion")],
+    "skills": [
+        ("hash", "skill_type"),
+        ("hash", "element_type"),
+        ("hash", "damage_type"),
+        ("sorted", "mp_cost"),
+        ("sorted", "tp_cost"),
+    ],
+    "weapons": [("hash", "weapon_type"), ("sorted", "price")],
+    "armors": [("hash", "armor_type"), ("hash", "equip_type"), ("sorted", "price")],
+    "enemies": [("sorted", "exp"), ("sorted", "gold")],
+    "states": [("hash", "restriction"), ("sorted", "priority")],
+    "actors": [("hash", "class_id"), ("sorted", "initial_level")],
+    "classes": [],
+    "animations": [("hash", "position")],
+}
+
+# Text fields covered by the token index of every category
+TOKEN_FIELDS: Tuple[str, ...] = ("name", "description")
+
+_TOKEN_RE = re.compile(r"\w+")
+_MISSING = object()
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase word tokens"""
+    return _TOKEN_RE.findall(text.lower())
+
+
+class HashIndex:
+    """Value -> ids index for equality lookups"""
+
+    def __init__(self, field: str):
+        self.field = field
+        self._buckets: Dict[Any, Set[int]] = {}
+        self._values: Dict[int, Any] = {}
+        self._unhashable: Set[int] = set()
+
+    def add(self, entry_id: int, entry: Any):
+        value = getattr(entry, self.field, _MISSING)
+        if value is _MISSING:
+            return
+        try:
+            self._buckets.setdefault(value, set()).add(entry_id)
+        except TypeError:
+            self._unhashable.add(entry_id)
+            return
+        self._values[entry_id] = value
+
+    def remove(self, entry_id: int):
+        self._unhashable.discard(entry_id)
+        value = self._values.pop(entry_id, _MISSING)
+        if value is _MISSING:
+            return
+        bucket = self._buckets.get(value)
+        if bucket is not None:
+            bucket.discard(entry_id)
+            if not bucket:
+                del self._buckets[value]
+
+    def clear(self):
+        self._buckets.clear()
+        self._values.clear()
+        self._unhashable.clear()
+
+    def candidates(self, operator: str, value: Any) -> Optional[Set[int]]:
+        """Get candidate ids for a comparison (None if the index can't answer it)"""
+        if operator != "eq":
+            return None
+        try:
+            ids = self._buckets.get(value, ())
+        except TypeError:
+            return None
+        return set(ids) | self._unhashable
+
+
+class SortedIndex:
+    """Ordered (value, id) index for range lookups on numeric fields"""
+
+    # Pending inserts merged one by one below this size, re-sorted above it
+    MERGE_THRESHOLD = 64
+
+    def __init__(self, field: str):
+        self.field = field
+        self._keys: List[Tuple[Any, int]] = []
+        self._pending: List[Tuple[Any, int]] = []
+        self._values: Dict[int, Any] = {}
+        self._unsortable: Set[int] = set()
+
+    def add(self, entry_id: int, entry: Any):
+        value = getattr(entry, self.field, _MISSING)
+        if value is _MISSING:
+            return
+        if not _is_number(value):
+            self._unsortable.add(entry_id)
+            return
+        # Sorting is deferred to the next query so bulk loads stay linear
+        self._pending.append((value, entry_id))
+        self._values[entry_id] = value
+
+    def remove(self, entry_id: int):
+        self._unsortable.discard(entry_id)
+        value = self._values.pop(entry_id, _MISSING)
+        if value is _MISSING:
+            return
+        # Merge first so removal is a bisect, not a scan of the pending list
+        self._merge_pending()
+        key = (value, entry_id)
+        position = bisect_left(self._keys, key)
+        if position < len(self._keys) and self._keys[position] == key:
+            del self._keys[position]
+
+    def clear(self):
+        self._keys.clear()
+        self._pending.clear()
+        self._values.clear()
+        self._unsortable.clear()
+
+    def candidates(self, operator: str, value: Any) -> Optional[Set[int]]:
+        """Get candidate ids for a comparison (None if the index can't answer it)"""
+        if not _is_number(value):
+            return None
+
+        self._merge_pending()
+        keys = self._keys
+        low = (value,)
+        high = (value, float("inf"))
+        if operator == "eq":
+            start, end = bisect_left(keys, low), bisect_right(keys, high)
+        elif operator == "gt":
+            start, end = bisect_right(keys, high), len(keys)
+        elif operator == "ge":
+            start, end = bisect_left(keys, low), len(keys)
+        elif operator == "lt":
+            start, end = 0, bisect_left(keys, low)
+        elif operator == "le":
+            start, end = 0, bisect_right(keys, high)
+        else:
+            return None
+
+        ids = {entry_id for _, entry_id in keys[start:end]}
+        return ids | self._unsortable
+
+    def _merge_pending(self):
+        pending = self._pending
+        if not pending:
+            return
+        if len(pending) <= self.MERGE_THRESHOLD:
+            for key in pending:
+                insort(self._keys, key)
+        else:
+            self._keys.extend(pending)
+            self._keys.sort()
+        pending.clear()
+
+
+class TokenIndex:
+    """Word token -> ids index for substring search on text fields"""
+
+    def __init__(self, fields: Iterable[str]):
+        self.fields = tuple(fields)
+        self._postings: Dict[str, Set[int]] = {}
+        self._tokens: Dict[int, Tuple[str, ...]] = {}
+
+        # All distinct tokens joined by newlines, rebuilt when the vocabulary
+        # changes, so substring lookups over it run as a single C-level scan
+        self._vocabulary: Optional[str] = None
+        self._vocabulary_tokens: List[str] = []
+        self._vocabulary_offsets: List[int] = []
+
+    def add(self, entry_id: int, entry: Any):
+        tokens = set()
+        for field in self.fields:
+            value = getattr(entry, field, None)
+            if isinstance(value, str):
+                tokens.update(tokenize(value))
+
+        postings = self._postings
+        for token in tokens:
+            ids = postings.get(token)
+            if ids is None:
+                postings[token] = {entry_id}
+                self._vocabulary = None
+            else:
+                ids.add(entry_id)
+        self._tokens[entry_id] = tuple(tokens)
+
+    def remove(self, entry_id: int):
+        for token in self._tokens.pop(entry_id, ()):
+            postings = self._postings.get(token)
+            if postings is not None:
+                postings.discard(entry_id)
+                if not postings:
+                    del self._postings[token]
+                    self._vocabulary = None
+
+    def clear(self):
+        self._postings.clear()
+        self._tokens.clear()
+        self._vocabulary = None
+
+    def candidates(self, query: str) -> Optional[Set[int]]:
+        """
+        Get ids of entries whose text may contain query as a substring.
+
+        Every word run of the query must lie inside a single token of the
+        entry, so the candidates are the intersection over the query's word
+        runs of all entries owning a token that contains that run.
+
+        Returns:
+            Candidate ids, or None if the query has no word characters
+        """
+        runs = tokenize(query)
+        if not runs:
+            return None
+
+        # Estimate how many entries each run matches and start with the rarest
+        plans = []
+        for run in set(runs):
+            tokens = self._matching_tokens(run)
+            estimate = sum(len(self._postings[token]) for token in tokens)
+            plans.append((estimate, run, tokens))
+        plans.sort(key=lambda plan: plan[0])
+
+        result: Optional[Set[int]] = None
+        for estimate, _, tokens in plans:
+            if result is not None and estimate > 4 * len(result):
+                # Candidates only need to be a superset; the caller verifies
+                break
+
+            matches: Set[int] = set()
+            for token in tokens:
+                matches.update(self._postings[token])
+
+            result = matches if result is None else result & matches
+            if not result:
+                return set()
+        return result
+
+    def _matching_tokens(self, run: str) -> List[str]:
+        """Get all distinct tokens containing run"""
+        if self._vocabulary is None:
+            self._vocabulary_tokens = list(self._postings)
+            self._vocabulary_offsets = []
+            offset = 0
+            for token in self._vocabulary_tokens:
+                self._vocabulary_offsets.append(offset)
+                offset += len(token) + 1
+            self._vocabulary = "\n".join(self._vocabulary_tokens)
+
+        vocabulary = self._vocabulary
+        tokens = self._vocabulary_tokens
+        offsets = self._vocabulary_offsets
+
+        matches = []
+        position = vocabulary.find(run)
+        while position != -1:
+            token_index = bisect_right(offsets, position) - 1
+            matches.append(tokens[token_index])
+            # Continue after the matched token
+            next_index = token_index + 1
+            if next_index >= len(offsets):
+                break
+            position = vocabulary.find(run, offsets[next_index])
+        return matches
+
+
+class CategoryIndex:
+    """All secondary indexes of one category plus its insertion order"""
+
+    def __init__(self, specs: Iterable[Tuple[str, str]] = (), token_fields=TOKEN_FIELDS):
+        self.field_indexes: Dict[str, Any] = {}
+        for kind, field in specs:
+            if kind == "hash":
+                self.field_indexes[field] = HashIndex(field)
+            elif kind == "sorted":
+                self.field_indexes[field] = SortedIndex(field)
+            else:
+                raise ValueError(f"Unknown index kind: {kind}")
+
+        self.tokens = TokenIndex(token_fields)
+
+        # Storage order of ids, so indexed results match scan order
+        self._sequence: Dict[int, int] = {}
+        self._next_sequence = 0
+
+    def __len__(self) -> int:
+        return len(self._sequence)
+
+    def __contains__(self, entry_id: int) -> bool:
+        return entry_id in self._sequence
+
+    def add(self, entry: Any):
+        """Index a newly stored entry"""
+        entry_id = entry.id
+        if entry_id in self._sequence:
+            self.update(entry)
+            return
+
+        self._sequence[entry_id] = self._next_sequence
+        self._next_sequence += 1
+        self._index(entry_id, entry)
+
+    def update(self, entry: Any):
+        """Re-index an entry whose fields may have changed"""
+        entry_id = entry.id
+        self._unindex(entry_id)
+        self._index(entry_id, entry)
+
+    def remove(self, entry_id: int):
+        """Drop an entry from all indexes"""
+        if self._sequence.pop(entry_id, None) is not None:
+            self._unindex(entry_id)
+
+    def clear(self):
+        """Drop everything"""
+        for index in self.field_indexes.values():
+            index.clear()
+        self.tokens.clear()
+        self._sequence.clear()
+        self._next_sequence = 0
+
+    def rebuild(self, storage: Dict[int, Any]):
+        """Rebuild all indexes from a category's storage"""
+        self.clear()
+        for entry in storage.values():
+            self.add(entry)
+
+    def filter_candidates(self, field: str, operator: str, value: Any) -> Optional[Set[int]]:
+        """Plan a field comparison (None = not indexed, scan instead)"""
+        index = self.field_indexes.get(field)
+        if index is not None:
+            return index.candidates(operator, value)
+
+        if operator == "contains" and field in self.tokens.fields and isinstance(value, str):
+            return self.tokens.candidates(value)
+
+        return None
+
+    def search_candidates(self, query: str, fields: Iterable[str]) -> Optional[Set[int]]:
+        """Plan a text search over fields (None = not indexed, scan instead)"""
+        if not set(fields) <= set(self.tokens.fields):
+            return None
+        return self.tokens.candidates(query)
+
+    def in_storage_order(self, entry_ids: Iterable[int]) -> List[int]:
+        """Sort ids by the order their entries were stored in"""
+        sequence = self._sequence
+        return sorted((i for i in entry_ids if i in sequence), key=sequence.__getitem__)
+
+    def _index(self, entry_id: int, entry: Any):
+        for index in self.field_indexes.values():
+            index.add(entry_id, entry)
+        self.tokens.add(entry_id, entry)
+
+    def _unindex(self, entry_id: int):
+        for index in self.field_indexes.values():
+            index.remove(entry_id)
+        self.tokens.remove(entry_id)
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and value == value  # Excludes NaN
@@ -0,0 +1,213 @@
+"""
+Database Journal
+================
+
+Append-only write-ahead journal for DatabaseManager.
+
+A journaled database lives in two files: the JSON snapshot written by
+save_to_file and a ``<snapshot>.journal`` file next to it. Every edit appends
+one compact JSON line to the journal, so an edit costs a few hundred bytes
+instead of a full snapshot rewrite. Loading replays the journal on top of the
+snapshot; compaction folds the journal into a fresh snapshot.
+
+Journal format (one JSON object per line):
+- {"op": "begin", "journal_id": ...}             header, matches the snapshot
+- {"op": "put", "c": category, "e": entry}       create or update
+- {"op": "del", "c": category, "id": entry_id}   delete
+- {"op": "compact", "c": category}               compact_ids
+- {"op": "clear", "c": category or null}         clear_category / clear
+- {"op": "checkpoint", "name": ..., "time": ...} backup marker
+
+A record only counts once its terminating newline is on disk. A process killed
+mid-write leaves a torn last line, which is dropped when the journal is read.
+"""
+
+import json
+import os
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+# Key under which a journaled snapshot stores the id of its journal
+SNAPSHOT_KEY = "journal_id"
+
+
+def journal_path_for(snapshot_path: Path) -> Path:
+    """Get the journal file that belongs to a snapshot file"""
+    return snapshot_path.with_name(snapshot_path.name + ".journal")
+
+
+def new_journal_id() -> str:
+    """Create a unique id linking a snapshot to its journal"""
+    return uuid.uuid4().hex
+
+
+def read_journal(path: Path) -> Tuple[Optional[str], List[Dict[str, Any]], int]:
+    """
+    Read the intact records of a journal file.
+
+    Reading stops at the first torn or unreadable line; everything after it
+    was never acknowledged.
+
+    Args:
+        path: Journal file
+
+    Returns:
+        Tuple of (journal_id, records without the header, valid byte length).
+        journal_id is None if the file is missing or has no intact header.
+    """
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except FileNotFoundError:
+        return None, [], 0
+
+    journal_id = None
+    records: List[Dict[str, Any]] = []
+    valid_length = 0
+    position = 0
+
+    while position < len(data):
+        end = data.find(b"\n", position)
+        if end == -1:
+            break  # Torn final record
+        try:
+            record = json.loads(data[position:end])
+        except ValueError:
+            break
+        if not isinstance(record, dict):
+            break
+
+        if journal_id is None:
+            if record.get("op") != "begin":
+                break
+            journal_id = record.get("journal_id")
+        else:
+            records.append(record)
+
+        position = end + 1
+        valid_length = position
+
+    return journal_id, records, valid_length
+
+
+def write_file_atomic(path: Path, data: bytes):
+    """Write a file so readers see either the old or the new contents, never a mix"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(path.name + ".tmp")
+    with open(temp_path, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+    _fsync_directory(path.parent)
+
+
+class DatabaseJournal:
+    """
+    Open journal file that edits are appended to.
+
+    Records are flushed to the OS after every append, so they survive the
+    process being killed. ``sync()`` additionally forces them to disk; with
+    ``sync_every_write`` that happens on every append.
+    """
+
+    def __init__(self, path: Path, journal_id: str, sync_every_write: bool = False):
+        self.path = path
+        self.journal_id = journal_id
+        self.sync_every_write = sync_every_write
+
+        self.record_count = 0
+        self.checkpoint_count = 0
+        self._file = None
+
+    @classmethod
+    def create(
+        cls, path: Path, journal_id: str, sync_every_write: bool = False
+    ) -> "DatabaseJournal":
+        """Start a new, empty journal (replaces any existing file atomically)"""
+        header = _encode({"op": "begin", "journal_id": journal_id})
+        write_file_atomic(path, header)
+
+        journal = cls(path, journal_id, sync_every_write)
+        journal._file = open(path, "ab")
+        return journal
+
+    @classmethod
+    def resume(
+        cls,
+        path: Path,
+        journal_id: str,
+        records: List[Dict[str, Any]],
+        valid_length: int,
+        sync_every_write: bool = False,
+    ) -> "DatabaseJournal":
+        """
+        Continue appending to an existing journal.
+
+        Args:
+            path: Journal file
+            journal_id: Id read from the journal header
+            records: Records read from the journal
+            valid_length: Byte length of the intact part; a torn tail is cut off
+
+        Returns:
+            The reopened journal
+        """
+        with open(path, "r+b") as f:
+            if f.seek(0, os.SEEK_END) != valid_length:
+                f.truncate(valid_length)
+                f.flush()
+                os.fsync(f.fileno())
+
+        journal = cls(path, journal_id, sync_every_write)
+        journal.record_count = len(records)
+        journal.checkpoint_count = sum(1 for r in records if r.get("op") == "checkpoint")
+        journal._file = open(path, "ab")
+        return journal
+
+    @property
+    def size(self) -> int:
+        """Current size of the journal file in bytes"""
+        return self._file.tell() if self._file is not None else 0
+
+    def append(self, record: Dict[str, Any]):
+        """Append one record"""
+        self._file.write(_encode(record))
+        self._file.flush()
+        if self.sync_every_write:
+            os.fsync(self._file.fileno())
+
+        self.record_count += 1
+        if record.get("op") == "checkpoint":
+            self.checkpoint_count += 1
+
+    def sync(self):
+        """Force all appended records to disk"""
+        if self._file is not None:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def close(self):
+        """Close the journal file"""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def _encode(record: Dict[str, Any]) -> bytes:
+    return (json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+def _fsync_directory(directory: Path):
+    """Persist a rename (not supported on every platform)"""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
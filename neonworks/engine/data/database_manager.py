@@ -5,20 +5,26 @@ Database Manager
 Comprehensive database management system for game data with CRUD operations,
 ID management, search/filter, batch operations, and CSV import/export.
 
-Handles up to 2000 entries per category efficiently using dictionaries for O(1) lookups.
+Entries are stored in dictionaries for O(1) lookups by ID. Secondary indexes
+(see database_index.py) keep search and field filters interactive with 100k+
+entries per category. An optional write-ahead journal (see
+database_journal.py) turns each edit into a small append instead of a full
+snapshot rewrite.
 
 Features:
 - CRUD operations (Create, Read, Update, Delete)
-- Auto-increment ID management with gap handling
-- Search and filter functionality
+- Auto-increment ID management with O(1) gap reuse and batch reservation
+- Search and filter functionality backed by secondary indexes
 - Batch operations (duplicate, bulk edit, import/export)
 - Data validation with detailed error reporting
 - JSON serialization with proper error handling
+- Write-ahead journal with incremental saves and checkpoint backups
 - CSV import/export for easy data management
 """
 
 import csv
 import json
+import os
 import shutil
 from collections import defaultdict
 from dataclasses import dataclass
@@ -28,6 +34,16 @@ from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Type, Union
 
 try:
     # Try package import first (when installed as package)
+    from neonworks.engine.data.database_ids import IdAllocator
+    from neonworks.engine.data.database_index import DEFAULT_INDEXES, CategoryIndex
+    from neonworks.engine.data.database_journal import (
+        SNAPSHOT_KEY,
+        DatabaseJournal,
+        journal_path_for,
+        new_journal_id,
+        read_journal,
+        write_file_atomic,
+    )
     from neonworks.engine.data.database_schema import (
         Actor,
         Animation,
@@ -42,6 +58,16 @@ try:
     )
 except ModuleNotFoundError:
     # Fall back to relative import (when run as script)
+    from engine.data.database_ids import IdAllocator
+    from engine.data.database_index import DEFAULT_INDEXES, CategoryIndex
+    from engine.data.database_journal import (
+        SNAPSHOT_KEY,
+        DatabaseJournal,
+        journal_path_for,
+        new_journal_id,
+        read_journal,
+        write_file_atomic,
+    )
     from engine.data.database_schema import (
         Actor,
         Animation,
@@ -126,10 +152,19 @@ class DatabaseManager:
     """
     Comprehensive database manager with CRUD operations, search, and batch processing.
 
-    Efficiently handles up to 2000 entries per category using dictionary-based storage
-    for O(1) lookups and optimized iteration for searches.
+    Uses dictionary-based storage for O(1) lookups by ID. Searches and field
+    filters are planned against per-category secondary indexes that are kept
+    up to date by create/update/delete; edits made to an entry in place only
+    become visible to indexed queries once the entry is passed to update().
+
+    With the journal enabled, the same operations are appended to the journal
+    as they happen, and in-place edits likewise need an update() to be saved.
     """
 
+    # Compact once the journal outgrows both this size and the snapshot
+    COMPACT_MIN_BYTES = 1024 * 1024
+    COMPACT_RATIO = 1.0
+
     def __init__(self, auto_backup: bool = False, backup_dir: Optional[Path] = None):
         """
         Initialize the database manager with empty categories.
@@ -161,12 +196,30 @@ class DatabaseManager:
             "animations": self.animations,
         }
 
+        # Secondary indexes per category
+        self._indexes: Dict[str, CategoryIndex] = {
+            category: CategoryIndex(DEFAULT_INDEXES.get(category, ()))
+            for category in self._categories
+        }
+
+        # Free ID tracking per category
+        self._allocators: Dict[str, IdAllocator] = {
+            category: IdAllocator(storage, CATEGORY_TYPES[category])
+            for category, storage in self._categories.items()
+        }
+
         # Auto-backup configuration
         self.auto_backup = auto_backup
         self.backup_dir = backup_dir or Path("./backups/database")
         if self.auto_backup:
             self.backup_dir.mkdir(parents=True, exist_ok=True)
 
+        # Write-ahead journal (None = every save rewrites the whole file)
+        self._journal: Optional[DatabaseJournal] = None
+        self._snapshot_path: Optional[Path] = None
+        self._snapshot_size = 0
+        self.journal_sync_every_write = False
+
     # =========================================================================
     # Auto-Backup System
     # =========================================================================
@@ -175,14 +228,28 @@ class DatabaseManager:
         """
         Create a backup of the current database state.
 
+        With the journal enabled the backup is a checkpoint record in the
+        journal (see restore_checkpoint) rather than a full copy.
+
         Args:
             name: Backup name (default: "auto")
 
         Returns:
-            Path to the backup file, or None if backup failed
+            Path to the backup file (or journal), or None if backup failed
         """
         try:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+            if self._journal is not None:
+                self._journal.append(
+                    {
+                        "op": "checkpoint",
+                        "name": f"{name}_backup_{timestamp}",
+                        "time": datetime.now().isoformat(),
+                    }
+                )
+                return self._journal.path
+
             backup_file = self.backup_dir / f"{name}_backup_{timestamp}.json"
 
             # Ensure backup directory exists
@@ -274,7 +341,10 @@ class DatabaseManager:
             raise ValidationError(f"{category} entry with ID {entry.id} failed validation")
 
         # Add to storage
+        self._log_put(category, entry)
         storage[entry.id] = entry
+        self._indexes[category].add(entry)
+        self._allocators[category].add(entry.id)
         return entry
 
     def read(self, category: str, entry_id: int) -> DatabaseEntry:
@@ -352,7 +422,9 @@ class DatabaseManager:
         # Auto-backup before update
         self._auto_backup_if_enabled(f"update_{category}_{entry.id}")
 
+        self._log_put(category, entry)
         storage[entry.id] = entry
+        self._indexes[category].update(entry)
         return entry
 
     def delete(self, category: str, entry_id: int) -> DatabaseEntry:
@@ -381,6 +453,9 @@ class DatabaseManager:
         # Auto-backup before delete
         self._auto_backup_if_enabled(f"delete_{category}_{entry_id}")
 
+        self._log({"op": "del", "c": category, "id": entry_id})
+        self._indexes[category].remove(entry_id)
+        self._allocators[category].release(entry_id)
         return storage.pop(entry_id)
 
     def exists(self, category: str, entry_id: int) -> bool:
@@ -406,32 +481,22 @@ class DatabaseManager:
         """
         Get the next available ID in a category.
 
-        Handles gaps efficiently by first checking for gaps, then returning
-        the next sequential ID.
+        Reuses the lowest freed ID first, then continues after the highest
+        ID in use.
 
         Args:
             category: Category name
 
         Returns:
-            Next available ID (1-9999)
+            Next available ID (1 to the entry type's MAX_ID)
 
         Raises:
             DatabaseError: If all IDs are exhausted
         """
-        storage = self._categories[category]
-
-        if not storage:
-            return 1
-
-        # Get all existing IDs
-        existing_ids = set(storage.keys())
-
-        # Find first gap (efficient for sparse data)
-        for id_candidate in range(1, 10000):
-            if id_candidate not in existing_ids:
-                return id_candidate
-
-        raise DatabaseError(f"No available IDs in category {category}")
+        next_id = self._get_allocator(category).peek()
+        if next_id is None:
+            raise DatabaseError(f"No available IDs in category {category}")
+        return next_id
 
     def get_next_id(self, category: str) -> int:
         """
@@ -473,11 +538,69 @@ class DatabaseManager:
         if not storage:
             return []
 
-        existing_ids = set(storage.keys())
-        max_check = max_id or max(existing_ids)
+        allocator = self._get_allocator(category)
+        max_check = max_id or allocator.highest_used()
+        return allocator.gaps(max_check)
+
+    def reserve_ids(self, category: str, count: int) -> range:
+        """
+        Reserve a block of contiguous IDs for a bulk insert.
+
+        The block starts after the highest ID in use, and none of its IDs are
+        handed out by auto-ID creates while reserved. Create the entries with
+        their explicit IDs, then pass the block to release_ids() so IDs left
+        unused become free again.
+
+        Args:
+            category: Category name
+            count: Number of IDs to reserve
+
+        Returns:
+            The reserved IDs
+
+        Raises:
+            DatabaseError: If category is invalid or the block exceeds MAX_ID
+
+        Example:
+            ids = manager.reserve_ids("items", len(rows))
+            for entry_id, row in zip(ids, rows):
+                manager.create("items", Item(id=entry_id, name=row["name"]))
+            manager.release_ids("items", ids)
+        """
+        if category not in self._categories:
+            raise DatabaseError(f"Invalid category: {category}")
+
+        ids = self._get_allocator(category).reserve(count)
+        if ids is None:
+            raise DatabaseError(f"Cannot reserve {count} IDs in category {category}")
+        return ids
 
-        gaps = [i for i in range(1, max_check + 1) if i not in existing_ids]
-        return gaps
+    def release_ids(self, category: str, ids: range) -> None:
+        """
+        Release the unused IDs of a block returned by reserve_ids().
+
+        Args:
+            category: Category name
+            ids: The reserved block
+
+        Raises:
+            DatabaseError: If category is invalid
+        """
+        if category not in self._categories:
+            raise DatabaseError(f"Invalid category: {category}")
+
+        self._get_allocator(category).release_unused(ids)
+
+    def _get_allocator(self, category: str) -> IdAllocator:
+        """Get a category's ID allocator, resyncing it after direct storage edits"""
+        allocator = self._allocators[category]
+        if allocator.count != len(self._categories[category]):
+            allocator.rebuild()
+        return allocator
+
+    def _rebuild_allocators(self):
+        for allocator in self._allocators.values():
+            allocator.rebuild()
 
     def compact_ids(self, category: str) -> Dict[int, int]:
         """
@@ -497,22 +620,10 @@ class DatabaseManager:
 
         storage = self._categories[category]
 
-        # Get sorted entries
-        entries = sorted(storage.values(), key=lambda x: x.id)
-
-        # Create ID mapping
-        id_mapping = {}
-        new_storage = {}
-
-        for new_id, entry in enumerate(entries, start=1):
-            old_id = entry.id
-            id_mapping[old_id] = new_id
-            entry.id = new_id
-            new_storage[new_id] = entry
-
-        # Replace storage
-        storage.clear()
-        storage.update(new_storage)
+        self._log({"op": "compact", "c": category})
+        id_mapping = _renumber(storage)
+        self._indexes[category].rebuild(storage)
+        self._allocators[category].rebuild()
 
         return id_mapping
 
@@ -553,8 +664,14 @@ class DatabaseManager:
                 continue
 
             storage = self._categories[category]
-
-            for entry in storage.values():
+            index = self._get_index(category)
+            candidates = index.search_candidates(query, fields)
+            if candidates is None or len(candidates) > len(storage) // 4:
+                entries = storage.values()
+            else:
+                entries = [storage[entry_id] for entry_id in index.in_storage_order(candidates)]
+
+            for entry in entries:
                 score = 0.0
                 matches = 0
 
@@ -669,7 +786,61 @@ class DatabaseManager:
             except (TypeError, AttributeError):
                 return False
 
-        return self.filter(category, predicate)
+        storage = self._categories[category]
+        candidates = self._get_index(category).filter_candidates(field, operator, value)
+
+        # Scan when there is no usable index or it barely narrows the search
+        if candidates is None or len(candidates) > len(storage) // 4:
+            return self.filter(category, predicate)
+
+        # Indexed plan: only check the candidates against the live entries
+        filtered = []
+        for entry_id in sorted(candidates):
+            entry = storage.get(entry_id)
+            if entry is not None and predicate(entry):
+                filtered.append(entry)
+        return sorted(filtered, key=lambda x: x.id)
+
+    # =========================================================================
+    # Indexes
+    # =========================================================================
+
+    def _get_index(self, category: str) -> CategoryIndex:
+        """
+        Get the secondary indexes of a category.
+
+        Rebuilds them if the storage was modified without going through the
+        manager (entries added or removed directly on the dictionary).
+        """
+        index = self._indexes[category]
+        if len(index) != len(self._categories[category]):
+            index.rebuild(self._categories[category])
+        return index
+
+    def reindex(self, category: Optional[str] = None, entry_id: Optional[int] = None) -> None:
+        """
+        Refresh secondary indexes after entries were edited in place.
+
+        Args:
+            category: Category to reindex (None = all categories)
+            entry_id: Single entry to reindex (None = whole category)
+
+        Raises:
+            DatabaseError: If category is invalid
+            EntryNotFoundError: If entry doesn't exist
+        """
+        if category is None:
+            for name, storage in self._categories.items():
+                self._indexes[name].rebuild(storage)
+            return
+
+        if category not in self._categories:
+            raise DatabaseError(f"Invalid category: {category}")
+
+        if entry_id is None:
+            self._indexes[category].rebuild(self._categories[category])
+        else:
+            self._indexes[category].update(self.read(category, entry_id))
 
     # =========================================================================
     # Batch Operations
@@ -794,6 +965,8 @@ class DatabaseManager:
         """
         Save all database entries to a JSON file with error handling.
 
+        Saving to the journaled file compacts the journal instead (see compact).
+
         Args:
             filepath: Path to save file (Path object or string)
             pretty: If True, format with indentation (default: True)
@@ -806,6 +979,10 @@ class DatabaseManager:
             if isinstance(filepath, str):
                 filepath = Path(filepath)
 
+            if self._is_journaled_file(filepath):
+                self.compact()
+                return
+
             data = {
                 "items": [item.to_dict() for item in self.items.values()],
                 "skills": [skill.to_dict() for skill in self.skills.values()],
@@ -828,6 +1005,8 @@ class DatabaseManager:
                 else:
                     json.dump(data, f, ensure_ascii=False)
 
+        except DatabaseError:
+            raise
         except (OSError, IOError) as e:
             raise DatabaseError(f"Failed to save to {filepath}: {e}")
         except Exception as e:
@@ -837,6 +1016,9 @@ class DatabaseManager:
         """
         Load all database entries from a JSON file with error handling.
 
+        If the file is a journaled snapshot, its journal is replayed on top of
+        it and further edits keep being journaled.
+
         Args:
             filepath: Path to load from
 
@@ -844,43 +1026,24 @@ class DatabaseManager:
             DatabaseError: If load fails
         """
         try:
+            filepath = Path(filepath)
             with open(filepath, "r", encoding="utf-8") as f:
                 data = json.load(f)
 
+            # The loaded file replaces the current state, which is not an edit
+            self.disable_journal()
+
             # Clear existing data
             self.clear()
 
             # Load each category
-            self.items = {item["id"]: Item.from_dict(item) for item in data.get("items", [])}
-            self.skills = {skill["id"]: Skill.from_dict(skill) for skill in data.get("skills", [])}
-            self.weapons = {
-                weapon["id"]: Weapon.from_dict(weapon) for weapon in data.get("weapons", [])
-            }
-            self.armors = {armor["id"]: Armor.from_dict(armor) for armor in data.get("armors", [])}
-            self.enemies = {
-                enemy["id"]: Enemy.from_dict(enemy) for enemy in data.get("enemies", [])
-            }
-            self.states = {state["id"]: State.from_dict(state) for state in data.get("states", [])}
-            self.actors = {actor["id"]: Actor.from_dict(actor) for actor in data.get("actors", [])}
-            self.classes = {cls["id"]: Class.from_dict(cls) for cls in data.get("classes", [])}
-            self.animations = {
-                anim["id"]: Animation.from_dict(anim) for anim in data.get("animations", [])
-            }
+            self._load_categories(data)
 
-            # Update category mappings
-            self._categories.update(
-                {
-                    "items": self.items,
-                    "skills": self.skills,
-                    "weapons": self.weapons,
-                    "armors": self.armors,
-                    "enemies": self.enemies,
-                    "states": self.states,
-                    "actors": self.actors,
-                    "classes": self.classes,
-                    "animations": self.animations,
-                }
-            )
+            journal_id = data.get(SNAPSHOT_KEY)
+            if journal_id:
+                self._open_journal(filepath, journal_id)
+            self.reindex()
+            self._rebuild_allocators()
 
         except FileNotFoundError:
             raise DatabaseError(f"File not found: {filepath}")
@@ -923,6 +1086,284 @@ class DatabaseManager:
         except Exception as e:
             raise DatabaseError(f"Unexpected error saving {category} to {filepath}: {e}")
 
+    # =========================================================================
+    # Journal
+    # =========================================================================
+
+    @property
+    def journal_enabled(self) -> bool:
+        """Whether edits are being appended to a journal"""
+        return self._journal is not None
+
+    @property
+    def journal_path(self) -> Optional[Path]:
+        """Path of the open journal file, if any"""
+        return self._journal.path if self._journal is not None else None
+
+    def enable_journal(self, filepath: Union[Path, str], sync_every_write: bool = False) -> None:
+        """
+        Start journaling edits for a database file.
+
+        Writes a fresh snapshot of the current state to filepath, then appends
+        every following create/update/delete to ``<filepath>.journal``. Loading
+        the file later replays the journal, so edits are saved as they happen.
+
+        Args:
+            filepath: Snapshot file of the database
+            sync_every_write: If True, fsync after every record instead of
+                only on commit() (survives power loss, but each edit is slower)
+
+        Raises:
+            DatabaseError: If the snapshot cannot be written
+        """
+        filepath = Path(filepath)
+        self.journal_sync_every_write = sync_every_write
+        if self._is_journaled_file(filepath):
+            self._journal.sync_every_write = sync_every_write
+            return
+
+        self.disable_journal()
+        self._snapshot_path = filepath
+        self.compact()
+
+    def disable_journal(self) -> None:
+        """Flush and close the journal; later edits are only kept in memory"""
+        if self._journal is not None:
+            self._journal.sync()
+            self._journal.close()
+        self._journal = None
+        self._snapshot_path = None
+
+    def commit(self) -> None:
+        """
+        Incremental save: make all journaled edits durable.
+
+        Forces the journal to disk and compacts it once it has grown larger
+        than the snapshot (and COMPACT_MIN_BYTES).
+
+        Raises:
+            DatabaseError: If the journal is not enabled or the write fails
+        """
+        if self._journal is None:
+            raise DatabaseError("Journal is not enabled")
+
+        try:
+            self._journal.sync()
+        except OSError as e:
+            raise DatabaseError(f"Failed to sync journal {self._journal.path}: {e}")
+
+        threshold = max(self.COMPACT_MIN_BYTES, self._snapshot_size * self.COMPACT_RATIO)
+        if self._journal.size > threshold:
+            self.compact()
+
+    def compact(self) -> None:
+        """
+        Fold the journal into a new snapshot and start an empty journal.
+
+        The snapshot is written atomically and names its journal, so a crash at
+        any point leaves either the old snapshot plus journal or the new
+        snapshot. Journals holding checkpoints are archived in backup_dir
+        together with their snapshot so the checkpoints stay restorable.
+
+        Raises:
+            DatabaseError: If the journal is not enabled or the write fails
+        """
+        if self._snapshot_path is None:
+            raise DatabaseError("Journal is not enabled")
+
+        filepath = self._snapshot_path
+        old_journal = self._journal
+        try:
+            if old_journal is not None and old_journal.checkpoint_count:
+                self._archive_snapshot(filepath, old_journal.journal_id)
+
+            journal_id = new_journal_id()
+            data = self.to_dict()
+            data[SNAPSHOT_KEY] = journal_id
+            payload = json.dumps(data, ensure_ascii=False).encode("utf-8")
+            write_file_atomic(filepath, payload)
+            self._snapshot_size = len(payload)
+
+            if old_journal is not None:
+                old_journal.close()
+                self._journal = None
+                self._retire_journal(
+                    old_journal.path, old_journal.journal_id, old_journal.checkpoint_count
+                )
+
+            self._journal = DatabaseJournal.create(
+                journal_path_for(filepath), journal_id, self.journal_sync_every_write
+            )
+        except OSError as e:
+            raise DatabaseError(f"Failed to compact {filepath}: {e}")
+
+    def list_checkpoints(self) -> List[Dict[str, Any]]:
+        """
+        List the checkpoints of the journaled database, oldest first.
+
+        Returns:
+            List of dicts with "name", "time" and "journal" (file holding it)
+        """
+        checkpoints = []
+        for journal_path, _ in self._checkpoint_sources():
+            _, records, _ = read_journal(journal_path)
+            for record in records:
+                if record.get("op") == "checkpoint":
+                    checkpoints.append(
+                        {
+                            "name": record.get("name"),
+                            "time": record.get("time"),
+                            "journal": journal_path,
+                        }
+                    )
+        checkpoints.sort(key=lambda checkpoint: checkpoint["time"] or "")
+        return checkpoints
+
+    def restore_checkpoint(self, name: str) -> None:
+        """
+        Restore the database to the state it had at a checkpoint.
+
+        The current state is checkpointed first as "before_restore", so a
+        restore can itself be undone.
+
+        Args:
+            name: Checkpoint name as returned by list_checkpoints()
+
+        Raises:
+            DatabaseError: If the journal is not enabled or the checkpoint is unknown
+        """
+        if self._journal is None:
+            raise DatabaseError("Journal is not enabled")
+
+        found = None
+        for journal_path, snapshot_path in self._checkpoint_sources():
+            journal_id, records, _ = read_journal(journal_path)
+            for position, record in enumerate(records):
+                if record.get("op") == "checkpoint" and record.get("name") == name:
+                    if found is None or record.get("time", "") >= found[0].get("time", ""):
+                        found = (record, snapshot_path, journal_id, records[:position])
+        if found is None:
+            raise EntryNotFoundError(f"Checkpoint not found: {name}")
+
+        _, snapshot_path, journal_id, records = found
+        try:
+            with open(snapshot_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            raise DatabaseError(f"Failed to read checkpoint snapshot {snapshot_path}: {e}")
+        if data.get(SNAPSHOT_KEY) != journal_id:
+            raise DatabaseError(f"Snapshot {snapshot_path} does not match checkpoint {name}")
+
+        self.create_backup("before_restore")
+
+        for storage in self._categories.values():
+            storage.clear()
+        self._load_categories(data)
+        for record in records:
+            self._apply_record(record)
+        self.reindex()
+        self._rebuild_allocators()
+        self.compact()
+
+    def _log(self, record: Dict[str, Any]):
+        """Append an edit to the journal (before it is applied in memory)"""
+        if self._journal is not None:
+            self._journal.append(record)
+
+    def _log_put(self, category: str, entry: DatabaseEntry):
+        if self._journal is not None:
+            self._journal.append({"op": "put", "c": category, "e": entry.to_dict()})
+
+    def _apply_record(self, record: Dict[str, Any]):
+        """Replay one journal record on the storage (indexes are rebuilt afterwards)"""
+        op = record.get("op")
+        category = record.get("c")
+
+        if op == "put":
+            entry = CATEGORY_TYPES[category].from_dict(record["e"])
+            self._categories[category][entry.id] = entry
+        elif op == "del":
+            self._categories[category].pop(record["id"], None)
+        elif op == "compact":
+            _renumber(self._categories[category])
+        elif op == "clear":
+            if category is None:
+                for storage in self._categories.values():
+                    storage.clear()
+            else:
+                self._categories[category].clear()
+        # "checkpoint" records only mark restore points
+
+    def _load_categories(self, data: Dict[str, Any]):
+        """Fill the (empty) storage from snapshot data"""
+        for category, storage in self._categories.items():
+            entry_type = CATEGORY_TYPES[category]
+            for entry_dict in data.get(category, []):
+                storage[entry_dict["id"]] = entry_type.from_dict(entry_dict)
+
+    def _open_journal(self, filepath: Path, journal_id: str):
+        """Replay and reopen the journal of a loaded snapshot"""
+        journal_path = journal_path_for(filepath)
+        found_id, records, valid_length = read_journal(journal_path)
+
+        if found_id == journal_id:
+            for record in records:
+                self._apply_record(record)
+            self._journal = DatabaseJournal.resume(
+                journal_path, journal_id, records, valid_length, self.journal_sync_every_write
+            )
+        else:
+            # Left over from a compaction that was interrupted after the new
+            # snapshot was written; its edits are already in the snapshot
+            if found_id is not None:
+                checkpoints = sum(1 for r in records if r.get("op") == "checkpoint")
+                self._retire_journal(journal_path, found_id, checkpoints)
+            self._journal = DatabaseJournal.create(
+                journal_path, journal_id, self.journal_sync_every_write
+            )
+
+        self._snapshot_path = filepath
+        self._snapshot_size = filepath.stat().st_size
+
+    def _is_journaled_file(self, filepath: Path) -> bool:
+        if self._journal is None or self._snapshot_path is None:
+            return False
+        return Path(filepath).resolve() == self._snapshot_path.resolve()
+
+    def _archive_name(self, filepath: Path, journal_id: str) -> Path:
+        return self.backup_dir / f"{filepath.stem}_{journal_id[:12]}"
+
+    def _archive_snapshot(self, filepath: Path, journal_id: str):
+        """Keep the snapshot a checkpointed journal is based on"""
+        archive = self._archive_name(filepath, journal_id).with_suffix(".json")
+        if archive.exists() or not filepath.exists():
+            return
+        self.backup_dir.mkdir(parents=True, exist_ok=True)
+        try:
+            os.link(filepath, archive)  # The snapshot is replaced, never modified
+        except OSError:
+            shutil.copy2(filepath, archive)
+
+    def _retire_journal(self, journal_path: Path, journal_id: str, checkpoint_count: int):
+        """Archive a replaced journal if it holds checkpoints"""
+        if checkpoint_count and self._snapshot_path is not None:
+            archive = self._archive_name(self._snapshot_path, journal_id).with_suffix(".journal")
+            self.backup_dir.mkdir(parents=True, exist_ok=True)
+            os.replace(journal_path, archive)
+
+    def _checkpoint_sources(self) -> List[Tuple[Path, Path]]:
+        """(journal, snapshot) pairs that may hold checkpoints: archives, then current"""
+        if self._snapshot_path is None:
+            return []
+
+        sources = []
+        if self.backup_dir.exists():
+            pattern = f"{self._snapshot_path.stem}_*.journal"
+            for journal_path in sorted(self.backup_dir.glob(pattern)):
+                sources.append((journal_path, journal_path.with_suffix(".json")))
+        sources.append((journal_path_for(self._snapshot_path), self._snapshot_path))
+        return sources
+
     # =========================================================================
     # CSV Import/Export
     # =========================================================================
@@ -1132,8 +1573,13 @@ class DatabaseManager:
 
     def clear(self) -> None:
         """Clear all database entries."""
+        self._log({"op": "clear", "c": None})
         for storage in self._categories.values():
             storage.clear()
+        for index in self._indexes.values():
+            index.clear()
+        for allocator in self._allocators.values():
+            allocator.rebuild()
 
     def clear_category(self, category: str) -> None:
         """
@@ -1148,7 +1594,10 @@ class DatabaseManager:
         if category not in self._categories:
             raise DatabaseError(f"Invalid category: {category}")
 
+        self._log({"op": "clear", "c": category})
         self._categories[category].clear()
+        self._indexes[category].clear()
+        self._allocators[category].rebuild()
 
     def get_all_ids(self, category: str) -> List[int]:
         """
@@ -1259,3 +1708,23 @@ class DatabaseManager:
             List of category names
         """
         return list(self._categories.keys())
+
+
+def _renumber(storage: Dict[int, DatabaseEntry]) -> Dict[int, int]:
+    """Renumber a category's entries sequentially from 1, in ID order"""
+    entries = sorted(storage.values(), key=lambda x: x.id)
+
+    # Create ID mapping
+    id_mapping = {}
+    new_storage = {}
+
+    for new_id, entry in enumerate(entries, start=1):
+        old_id = entry.id
+        id_mapping[old_id] = new_id
+        entry.id = new_id
+        new_storage[new_id] = entry
+
+    # Replace storage
+    storage.clear()
+    storage.update(new_storage)
+    return id_mapping
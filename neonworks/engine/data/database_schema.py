@@ -9,7 +9,7 @@ All classes are JSON-serializable via to_dict() and from_dict() methods.
 
 Data Ranges and Constraints:
 ----------------------------
-- IDs: 1-9999 (positive integers)
+- IDs: 1-9999 (positive integers, see DatabaseEntry.MAX_ID)
 - Stats (HP, MP, ATK, DEF, etc.): 0-9999
 - Percentages: 0-100 (integer percent)
 - Probabilities: 0.0-1.0 (float)
@@ -27,7 +27,7 @@ import json
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, ClassVar, Dict, List, Optional, Union
 
 # =============================================================================
 # Enumerations
@@ -227,11 +227,14 @@ class DatabaseEntry:
     Provides common fields and JSON serialization interface.
 
     Constraints:
-    - id: 1-9999
+    - id: 1-MAX_ID (9999 by default)
     - name: 1-100 characters recommended
     - note: unlimited (for metadata/comments)
     """
 
+    # Highest valid ID; projects with very large databases can raise it
+    MAX_ID: ClassVar[int] = 9999
+
     id: int = 0
     name: str = ""
     icon_index: int = 0  # Icon index in iconset (0-999)
@@ -266,7 +269,7 @@ class DatabaseEntry:
         Returns:
             True if valid, False otherwise
         """
-        if not 0 <= self.id <= 9999:
+        if not 0 <= self.id <= self.MAX_ID:
             return False
         if not self.name:
             return False
@@ -0,0 +1,319 @@
+"""
+Batch Export
+
+Parallel export of character sprite sheets and face expressions. Presets are
+fanned out to a process pool whose workers run headless (SDL dummy drivers),
+load the component library once, and write their PNGs straight to disk, so
+PNG encoding, which dominates export time, runs on every core.
+
+A manifest in the output directory records a hash of each output's inputs
+(component library contents, preset and render settings); outputs whose
+inputs are unchanged are skipped on the next run.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+import pygame
+
+from neonworks.engine.tools.character_generator import (
+    CharacterGenerator,
+    CharacterPreset,
+    Direction,
+)
+from neonworks.engine.tools.face_generator import Expression, FaceGenerator, FacePreset
+
+MANIFEST_NAME = "export_manifest.json"
+
+CHARACTER = "character"
+FACE = "face"
+
+# Generator of each worker process, by kind
+_worker_generators: Dict[str, Union[CharacterGenerator, FaceGenerator]] = {}
+
+
+@dataclass
+class BatchExportStats:
+    """Progress and totals of a batch export"""
+
+    total: int = 0  # Presets in the batch
+    rendered: int = 0  # Presets rendered
+    skipped: int = 0  # Presets whose outputs were up to date
+    files: int = 0  # PNGs written
+    bytes_written: int = 0
+    elapsed: float = 0.0
+    outputs: List[str] = field(default_factory=list)  # Written file names
+
+    @property
+    def done(self) -> int:
+        """Presets finished (rendered or skipped)"""
+        return self.rendered + self.skipped
+
+    @property
+    def files_per_second(self) -> float:
+        """Throughput of written PNGs"""
+        return self.files / self.elapsed if self.elapsed > 0 else 0.0
+
+    def summary(self) -> str:
+        """One-line description of the batch"""
+        return (
+            f"{self.done}/{self.total} presets ({self.rendered} rendered, "
+            f"{self.skipped} up to date), {self.files} files, "
+            f"{self.bytes_written / 1024:.0f} KB in {self.elapsed:.2f}s "
+            f"({self.files_per_second:.1f} files/s)"
+        )
+
+
+ProgressCallback = Callable[[BatchExportStats], None]
+
+
+def export_characters(
+    presets: Sequence[CharacterPreset],
+    library_path: Union[str, Path],
+    output_dir: Union[str, Path],
+    sizes: Optional[List[int]] = None,
+    num_frames: int = 4,
+    directions: Optional[List[Direction]] = None,
+    workers: Optional[int] = None,
+    on_progress: Optional[ProgressCallback] = None,
+) -> BatchExportStats:
+    """
+    Export character sprite sheets for many presets at several sizes.
+
+    Writes {name}_{size}x{size}.png per preset and size, as export_multi_size does.
+
+    Args:
+        presets: CharacterPresets to export
+        library_path: Component library directory
+        output_dir: Output directory
+        sizes: Frame sizes to export (default: [32, 48, 64])
+        num_frames: Animation frames per direction
+        directions: Directions to render (default: 4-directional)
+        workers: Worker processes (default: one per CPU, 1 = run in this process)
+        on_progress: Called with the running totals after each preset
+
+    Returns:
+        Totals of the batch
+    """
+    settings = {
+        "sizes": sizes or [32, 48, 64],
+        "num_frames": num_frames,
+        "directions": [direction.name for direction in directions] if directions else None,
+    }
+    return _run_batch(CHARACTER, presets, library_path, output_dir, settings, workers, on_progress)
+
+
+def export_faces(
+    presets: Sequence[FacePreset],
+    library_path: Union[str, Path],
+    output_dir: Union[str, Path],
+    sizes: Optional[List[int]] = None,
+    expressions: Optional[List[Expression]] = None,
+    workers: Optional[int] = None,
+    on_progress: Optional[ProgressCallback] = None,
+) -> BatchExportStats:
+    """
+    Export face expressions for many presets at several sizes.
+
+    Writes {name}_{expression}_{size}x{size}.png per preset, expression and size.
+
+    Args:
+        presets: FacePresets to export
+        library_path: Face component library directory
+        output_dir: Output directory
+        sizes: Face sizes to export (default: [128])
+        expressions: Expressions to render (default: all)
+        workers: Worker processes (default: one per CPU, 1 = run in this process)
+        on_progress: Called with the running totals after each preset
+
+    Returns:
+        Totals of the batch
+    """
+    settings = {
+        "sizes": sizes or [128],
+        "expressions": [expression.value for expression in expressions] if expressions else None,
+    }
+    return _run_batch(FACE, presets, library_path, output_dir, settings, workers, on_progress)
+
+
+def library_digest(library_path: Union[str, Path]) -> str:
+    """
+    Hash the contents of a component library.
+
+    Args:
+        library_path: Library directory
+
+    Returns:
+        Hex SHA-256 of every file's relative path and bytes
+    """
+    library_path = Path(library_path)
+    digest = hashlib.sha256()
+    if library_path.exists():
+        for path in sorted(p for p in library_path.rglob("*") if p.is_file()):
+            digest.update(path.relative_to(library_path).as_posix().encode())
+            digest.update(hashlib.sha256(path.read_bytes()).digest())
+    return digest.hexdigest()
+
+
+def load_manifest(output_dir: Union[str, Path]) -> Dict[str, str]:
+    """Load the output name -> input hash manifest of an output directory"""
+    path = Path(output_dir) / MANIFEST_NAME
+    if not path.exists():
+        return {}
+    try:
+        with open(path, "r") as f:
+            return json.load(f).get("outputs", {})
+    except (OSError, ValueError):
+        return {}
+
+
+def _run_batch(
+    kind: str,
+    presets: Sequence[Union[CharacterPreset, FacePreset]],
+    library_path: Union[str, Path],
+    output_dir: Union[str, Path],
+    settings: Dict[str, Any],
+    workers: Optional[int],
+    on_progress: Optional[ProgressCallback],
+) -> BatchExportStats:
+    start = time.perf_counter()
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    library_path = str(library_path)
+
+    manifest = load_manifest(output_dir)
+    library = library_digest(library_path)
+    stats = BatchExportStats(total=len(presets))
+
+    # Skip presets whose outputs exist and were rendered from the same inputs
+    jobs = []
+    for preset in presets:
+        data = preset.to_dict()
+        outputs = _output_names(kind, data["name"], settings)
+        input_hash = _input_hash(kind, library, data, settings)
+        if all(
+            manifest.get(name) == input_hash and (output_dir / name).exists() for name in outputs
+        ):
+            stats.skipped += 1
+        else:
+            jobs.append((data, input_hash))
+
+    def finish(input_hash: str, written: List[Tuple[str, int]]):
+        stats.rendered += 1
+        for name, size in written:
+            manifest[name] = input_hash
+            stats.outputs.append(name)
+            stats.files += 1
+            stats.bytes_written += size
+        stats.elapsed = time.perf_counter() - start
+        if on_progress:
+            on_progress(stats)
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, len(jobs) or 1))
+    try:
+        if workers == 1:
+            generator = _create_generator(kind, library_path)
+            for data, input_hash in jobs:
+                finish(input_hash, _render(generator, kind, data, settings, output_dir))
+        else:
+            with ProcessPoolExecutor(
+                max_workers=workers, initializer=_init_worker, initargs=(kind, library_path)
+            ) as executor:
+                futures = {
+                    executor.submit(_render_in_worker, kind, data, settings, output_dir): input_hash
+                    for data, input_hash in jobs
+                }
+                for future in as_completed(futures):
+                    finish(futures[future], future.result())
+    finally:
+        _save_manifest(output_dir, manifest)
+
+    stats.elapsed = time.perf_counter() - start
+    return stats
+
+
+def _output_names(kind: str, name: str, settings: Dict[str, Any]) -> List[str]:
+    if kind == CHARACTER:
+        return [f"{name}_{size}x{size}.png" for size in settings["sizes"]]
+
+    expressions = settings["expressions"] or [expression.value for expression in Expression]
+    return [
+        f"{name}_{expression}_{size}x{size}.png"
+        for size in settings["sizes"]
+        for expression in expressions
+    ]
+
+
+def _input_hash(kind: str, library: str, data: Dict[str, Any], settings: Dict[str, Any]) -> str:
+    inputs = {"kind": kind, "library": library, "preset": data, "settings": settings}
+    return hashlib.sha256(json.dumps(inputs, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def _save_manifest(output_dir: Path, manifest: Dict[str, str]):
+    path = output_dir / MANIFEST_NAME
+    temp_path = path.with_suffix(".tmp")
+    with open(temp_path, "w") as f:
+        json.dump({"outputs": manifest}, f, indent=2, sort_keys=True)
+    os.replace(temp_path, path)
+
+
+def _create_generator(kind: str, library_path: str) -> Union[CharacterGenerator, FaceGenerator]:
+    generator = CharacterGenerator() if kind == CHARACTER else FaceGenerator()
+    generator.load_component_library(library_path)
+    return generator
+
+
+def _init_worker(kind: str, library_path: str):
+    """Set up a headless worker and load the component library once"""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    _worker_generators[kind] = _create_generator(kind, library_path)
+
+
+def _render_in_worker(
+    kind: str, data: Dict[str, Any], settings: Dict[str, Any], output_dir: Path
+) -> List[Tuple[str, int]]:
+    return _render(_worker_generators[kind], kind, data, settings, output_dir)
+
+
+def _render(
+    generator: Union[CharacterGenerator, FaceGenerator],
+    kind: str,
+    data: Dict[str, Any],
+    settings: Dict[str, Any],
+    output_dir: Path,
+) -> List[Tuple[str, int]]:
+    """Render and save the outputs of one preset, returning (file name, bytes)"""
+    written = []
+    names = iter(_output_names(kind, data["name"], settings))
+    if kind == CHARACTER:
+        preset = CharacterPreset.from_dict(data)
+        directions = settings["directions"]
+        if directions:
+            directions = [Direction[direction] for direction in directions]
+        for size in settings["sizes"]:
+            sheet = generator.render_sprite_sheet(preset, settings["num_frames"], directions, size)
+            written.append(_save_png(sheet, output_dir / next(names)))
+    else:
+        preset = FacePreset.from_dict(data)
+        expressions = settings["expressions"] or [expression.value for expression in Expression]
+        for size in settings["sizes"]:
+            for expression in expressions:
+                face = generator.compose_face(preset, Expression(expression), size)
+                written.append(_save_png(face, output_dir / next(names)))
+    return written
+
+
+def _save_png(surface, path: Path) -> Tuple[str, int]:
+    pygame.image.save(surface, str(path))
+    return path.name, path.stat().st_size
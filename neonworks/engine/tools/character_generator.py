@@ -35,10 +35,11 @@ from enum import Enum
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Union
 
-import numpy as np
 import pygame
 from PIL import Image
 
+from neonworks.engine.tools.layer_cache import LayerCompositeCache, StackLayer, multiply_tint
+
 
 class LayerType(Enum):
     """Character component layer types in render order (bottom to top)."""
@@ -290,6 +291,9 @@ class CharacterGenerator:
         # Default component metadata (maps layer type to available components)
         self.available_components: Dict[LayerType, List[str]] = {layer: [] for layer in LayerType}
 
+        # Tinted sheets, prepared frames and composited layer stacks
+        self.layer_cache = LayerCompositeCache()
+
     def load_component_library(self, library_path: Union[str, Path]):
         """
         Load all component sprites from a directory structure.
@@ -313,6 +317,8 @@ class CharacterGenerator:
             print(f"Warning: Component library not found at {library_path}")
             return
 
+        self.layer_cache.clear()
+
         # Map directory names to LayerTypes (including friendly aliases)
         layer_map = {layer.name.lower(): layer for layer in LayerType}
 
@@ -477,25 +483,7 @@ class CharacterGenerator:
         Returns:
             Tinted surface
         """
-        # Create a copy
-        tinted = surface.copy()
-
-        # Create tint overlay
-        overlay = pygame.Surface(tinted.get_size(), pygame.SRCALPHA)
-        overlay.fill(tint.to_tuple())
-
-        # Apply multiply blend (preserves transparency)
-        # Formula: result = (surface * tint) / 255
-        arr = pygame.surfarray.pixels3d(tinted)
-        overlay_arr = pygame.surfarray.pixels3d(overlay)
-
-        # Multiply and normalize
-        arr[:] = (arr.astype(np.float32) * overlay_arr.astype(np.float32) / 255).astype(np.uint8)
-
-        del arr  # Release pixel array lock
-        del overlay_arr
-
-        return tinted
+        return multiply_tint(surface, (tint.r, tint.g, tint.b))
 
     def compose_frame(
         self,
@@ -518,12 +506,9 @@ class CharacterGenerator:
         """
         size = output_size or self.default_size
 
-        # Create output surface
-        output = pygame.Surface((size, size), pygame.SRCALPHA)
-        output.fill((0, 0, 0, 0))  # Transparent
-
         # Render layers in order (bottom to top)
         sorted_layers = sorted(preset.layers, key=lambda l: l.layer_type.value)
+        stack = []
 
         for layer in sorted_layers:
             if not layer.enabled:
@@ -534,21 +519,13 @@ class CharacterGenerator:
                 print(f"Warning: Component '{layer.component_id}' not found")
                 continue
 
-            # Get frame from component
-            frame_surface = component.get_frame(frame, direction)
+            stack.append(self._stack_layer(component, layer.tint, frame, direction, size))
 
-            # Apply color tint if specified
-            if layer.tint:
-                frame_surface = self.apply_color_tint(frame_surface, layer.tint)
+        return self.layer_cache.compose((size, size), stack)
 
-            # Scale to output size if needed
-            if frame_surface.get_width() != size or frame_surface.get_height() != size:
-                frame_surface = pygame.transform.scale(frame_surface, (size, size))
-
-            # Composite onto output
-            output.blit(frame_surface, (0, 0))
-
-        return output
+    def clear_cache(self):
+        """Drop cached layers and stacks (call after changing component surfaces)."""
+        self.layer_cache.clear()
 
     def render_sprite_sheet(
         self,
@@ -817,6 +794,43 @@ class CharacterGenerator:
 
             print(f"Exported {size}x{size} sprite sheet")
 
+    def _stack_layer(
+        self,
+        component: ComponentSprite,
+        tint: Optional[ColorTint],
+        frame: int,
+        direction: Direction,
+        size: int,
+    ) -> StackLayer:
+        """Get the cache key and build function of one component frame."""
+        rgb = (tint.r, tint.g, tint.b) if tint else None
+        dir_index = direction.value if direction.value < component.num_directions else 0
+        key = (component.component_id, frame, dir_index, rgb, size)
+
+        def build() -> pygame.Surface:
+            sheet = component.surface
+            if rgb:
+                # Tint the whole sheet once for every frame and direction
+                sheet = self.layer_cache.get_layer(
+                    (component.component_id, rgb), lambda: self._tint_sheet(component, rgb)
+                )
+            width, height = component.frame_width, component.frame_height
+            frame_surface = pygame.Surface((width, height), pygame.SRCALPHA)
+            frame_surface.blit(
+                sheet, (0, 0), pygame.Rect(frame * width, dir_index * height, width, height)
+            )
+            if width != size or height != size:
+                frame_surface = pygame.transform.scale(frame_surface, (size, size))
+            return frame_surface
+
+        return key, build, (0, 0)
+
+    @staticmethod
+    def _tint_sheet(component: ComponentSprite, rgb: Tuple[int, int, int]) -> pygame.Surface:
+        sheet = pygame.Surface(component.surface.get_size(), pygame.SRCALPHA)
+        sheet.blit(component.surface, (0, 0))
+        return multiply_tint(sheet, rgb)
+
 
 # Convenience functions
 
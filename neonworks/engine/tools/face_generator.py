@@ -31,11 +31,12 @@ import random
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
-import numpy as np
 import pygame
 
+from neonworks.engine.tools.layer_cache import LayerCompositeCache, multiply_tint
+
 
 class FaceLayerType(Enum):
     """Face component layer types in render order (bottom to top)."""
@@ -277,6 +278,9 @@ class FaceGenerator:
             layer: [] for layer in FaceLayerType
         }
 
+        # Tinted, scaled expressions and composited layer stacks
+        self.layer_cache = LayerCompositeCache()
+
     def load_component_library(self, library_path: Union[str, Path]):
         """
         Load all face components from a directory structure.
@@ -301,6 +305,8 @@ class FaceGenerator:
             print(f"Warning: Face component library not found at {library_path}")
             return
 
+        self.layer_cache.clear()
+
         # Map directory names to FaceLayerTypes
         layer_map = {layer.name.lower(): layer for layer in FaceLayerType}
 
@@ -419,22 +425,7 @@ class FaceGenerator:
         Returns:
             Tinted surface
         """
-        tinted = surface.copy()
-
-        # Create tint overlay
-        overlay = pygame.Surface(tinted.get_size(), pygame.SRCALPHA)
-        overlay.fill(tint.to_tuple())
-
-        # Apply multiply blend
-        arr = pygame.surfarray.pixels3d(tinted)
-        overlay_arr = pygame.surfarray.pixels3d(overlay)
-
-        arr[:] = (arr.astype(np.float32) * overlay_arr.astype(np.float32) / 255).astype(np.uint8)
-
-        del arr
-        del overlay_arr
-
-        return tinted
+        return multiply_tint(surface, (tint.r, tint.g, tint.b))
 
     def compose_face(
         self,
@@ -455,12 +446,9 @@ class FaceGenerator:
         """
         size = output_size or self.default_size
 
-        # Create output surface
-        output = pygame.Surface((size, size), pygame.SRCALPHA)
-        output.fill((0, 0, 0, 0))
-
         # Render layers in order
         sorted_layers = sorted(preset.layers, key=lambda l: l.layer_type.value)
+        stack = []
 
         for layer in sorted_layers:
             if not layer.enabled:
@@ -476,21 +464,19 @@ class FaceGenerator:
             except ValueError:
                 continue
 
-            # Apply color tint if specified
-            if layer.tint:
-                expr_surface = self.apply_color_tint(expr_surface, layer.tint)
+            rgb = (layer.tint.r, layer.tint.g, layer.tint.b) if layer.tint else None
+            key = (component.component_id, expression, rgb, size)
 
             # Apply expression offset if specified
-            offset_x, offset_y = layer.expression_offset.get(expression, (0, 0))
+            offset = layer.expression_offset.get(expression, (0, 0))
 
-            # Scale to output size if needed
-            if expr_surface.get_width() != size or expr_surface.get_height() != size:
-                expr_surface = pygame.transform.scale(expr_surface, (size, size))
+            stack.append((key, self._layer_builder(expr_surface, rgb, size), offset))
 
-            # Composite onto output
-            output.blit(expr_surface, (offset_x, offset_y))
+        return self.layer_cache.compose((size, size), stack)
 
-        return output
+    def clear_cache(self):
+        """Drop cached layers and stacks (call after changing component surfaces)."""
+        self.layer_cache.clear()
 
     def render_all_expressions(
         self, preset: FacePreset, output_size: Optional[int] = None
@@ -987,6 +973,19 @@ class FaceGenerator:
                     layer.tint = color
                     print(f"Synced {feature_name} color to face")
 
+    def _layer_builder(
+        self, surface: pygame.Surface, rgb: Optional[Tuple[int, int, int]], size: int
+    ) -> Callable[[], pygame.Surface]:
+        """Get a function preparing an expression surface for compositing."""
+
+        def build() -> pygame.Surface:
+            prepared = multiply_tint(surface, rgb) if rgb else surface
+            if prepared.get_width() != size or prepared.get_height() != size:
+                prepared = pygame.transform.scale(prepared, (size, size))
+            return prepared
+
+        return build
+
 
 if __name__ == "__main__":
     print("Face Generator - Example\n")
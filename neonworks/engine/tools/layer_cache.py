@@ -0,0 +1,162 @@
+"""
+Layer Composite Cache
+
+Memoization for the layer stacks of the character and face generators.
+Prepared layers (tinted, scaled frames) are cached by content keys such as
+(component id, frame, direction, tint, size), and composited stacks are
+cached by the keys of their layers from the bottom up, so a stack that
+differs from a cached one in a single layer is recomposited from that layer
+upward only.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Callable, Hashable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pygame
+
+from neonworks.utils.memory_diagnostics import (
+    ASSET_CACHES,
+    CacheMemory,
+    register_memory_reporter,
+    surface_bytes,
+)
+
+# (layer key, build function, blit offset) of one layer of a stack
+StackLayer = Tuple[Hashable, Callable[[], pygame.Surface], Tuple[int, int]]
+
+
+def multiply_tint(surface: pygame.Surface, rgb: Tuple[int, int, int]) -> pygame.Surface:
+    """
+    Multiply the RGB channels of a surface by a color.
+
+    Uses integer math, (channel * tint) // 255, which gives the same result as
+    the float multiply it replaces. Alpha is left unchanged.
+
+    Args:
+        surface: Surface to tint (not modified)
+        rgb: Tint color (0-255 per channel)
+
+    Returns:
+        Tinted copy of the surface
+    """
+    tinted = surface.copy()
+    pixels = pygame.surfarray.pixels3d(tinted)
+    pixels[:] = pixels.astype(np.uint16) * np.array(rgb, dtype=np.uint16) // 255
+    del pixels  # Release pixel array lock
+    return tinted
+
+
+class LayerCompositeCache:
+    """
+    LRU caches of prepared layers and of composited layer stacks.
+
+    Keys must identify content: entries are never checked against their
+    sources, so call clear() when the source images change.
+    """
+
+    def __init__(self, max_layers: int = 512, max_stacks: int = 128):
+        """
+        Initialize layer composite cache.
+
+        Args:
+            max_layers: Maximum number of cached layer surfaces
+            max_stacks: Maximum number of cached stack composites
+        """
+        self.max_layers = max_layers
+        self.max_stacks = max_stacks
+        self._layers: "OrderedDict[Hashable, pygame.Surface]" = OrderedDict()
+        self._stacks: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+        register_memory_reporter(self)
+
+    def get_layer(self, key: Hashable, build: Callable[[], pygame.Surface]) -> pygame.Surface:
+        """
+        Get a cached layer surface, building it on a miss.
+
+        Args:
+            key: Content key of the layer
+            build: Function creating the surface
+
+        Returns:
+            Cached surface (shared; do not modify)
+        """
+        surface = self._layers.get(key)
+        if surface is not None:
+            self._layers.move_to_end(key)
+            return surface
+
+        surface = build()
+        self._put(self._layers, key, surface, self.max_layers)
+        return surface
+
+    def compose(self, size: Tuple[int, int], layers: Sequence[StackLayer]) -> pygame.Surface:
+        """
+        Composite layers bottom to top onto a transparent surface.
+
+        Starts from the longest cached stack sharing the bottom layers and
+        caches each new partial stack on the way up.
+
+        Args:
+            size: Output (width, height)
+            layers: (key, build, offset) of each layer, bottom first
+
+        Returns:
+            New composited surface (owned by the caller)
+        """
+        stack = [(key, offset) for key, _, offset in layers]
+
+        # Longest cached prefix of the stack
+        cached = 0
+        base: Optional[pygame.Surface] = None
+        for count in range(len(stack), 0, -1):
+            base = self._stacks.get((size, *stack[:count]))
+            if base is not None:
+                self._stacks.move_to_end((size, *stack[:count]))
+                cached = count
+                break
+
+        if base is not None:
+            output = base.copy()
+        else:
+            output = pygame.Surface(size, pygame.SRCALPHA)
+            output.fill((0, 0, 0, 0))
+
+        for count in range(cached + 1, len(stack) + 1):
+            key, build, offset = layers[count - 1]
+            output.blit(self.get_layer(key, build), offset)
+            self._put(self._stacks, (size, *stack[:count]), output.copy(), self.max_stacks)
+
+        return output
+
+    def clear(self):
+        """Drop every cached layer and stack."""
+        self._layers.clear()
+        self._stacks.clear()
+
+    def __len__(self) -> int:
+        return len(self._layers) + len(self._stacks)
+
+    def report_memory(self) -> List[CacheMemory]:
+        """Report the pixel bytes held by the layer and stack caches."""
+        return [
+            CacheMemory(
+                ASSET_CACHES,
+                "generator layers",
+                sum(map(surface_bytes, self._layers.values())),
+                len(self._layers),
+            ),
+            CacheMemory(
+                ASSET_CACHES,
+                "generator stacks",
+                sum(map(surface_bytes, self._stacks.values())),
+                len(self._stacks),
+            ),
+        ]
+
+    @staticmethod
+    def _put(cache: OrderedDict, key: Hashable, surface: pygame.Surface, limit: int):
+        cache[key] = surface
+        if len(cache) > limit:
+            cache.popitem(last=False)
@@ -33,6 +33,7 @@ from neonworks.data.map_layers import (
 )
 from neonworks.data.map_manager import MapData, MapDimensions, MapMetadata
 from neonworks.data.tileset_manager import TileMetadata, TilesetInfo, TilesetManager
+from neonworks.rendering.autotiles import AutotileManager
 
 
 class PNGExporter:
@@ -205,16 +206,24 @@ class TiledTMXImporter:
     - Layer properties
     """
 
-    def __init__(self, project_root: Path, tileset_manager: Optional[TilesetManager] = None):
+    def __init__(
+        self,
+        project_root: Path,
+        tileset_manager: Optional[TilesetManager] = None,
+        autotile_manager: Optional[AutotileManager] = None,
+    ):
         """
         Initialize TMX importer.
 
         Args:
             project_root: Root directory of the project
             tileset_manager: TilesetManager instance
+            autotile_manager: AutotileManager used to resolve autotiles in
+                imported layers (None = keep tile IDs as they are)
         """
         self.project_root = Path(project_root)
         self.tileset_manager = tileset_manager
+        self.autotile_manager = autotile_manager
 
     def import_tmx(self, tmx_path: str) -> Optional[MapData]:
         """
@@ -267,6 +276,8 @@ class TiledTMXImporter:
             for layer_elem in root.findall("layer"):
                 layer = self._parse_layer(layer_elem, width, height, tileset_mapping)
                 if layer:
+                    if self.autotile_manager:
+                        self.autotile_manager.update_region(layer, 0, 0, width, height)
                     layer_manager.layers[layer.properties.layer_id] = layer
                     layer_manager.root_ids.append(layer.properties.layer_id)
 
@@ -739,7 +750,3 @@ class TilesetImageImporter:
         except Exception as e:
             print(f"Error auto-detecting grid: {e}")
             return None
-
-
-
-
@@ -1619,40 +1619,13 @@ class CharacterGeneratorUI:
                 self.preview_surface.fill((0, 0, 0, 0))
                 return
 
-            # Compose layers
-            preview_size = 256  # Large preview
-            self.preview_surface = pygame.Surface((preview_size, preview_size), pygame.SRCALPHA)
-            self.preview_surface.fill((0, 0, 0, 0))
-
-            for layer in self.current_preset.layers:
-                if not layer.enabled:
-                    continue
-
-                # Get component
-                comp_id = layer.component_id
-                comp_sprite = self.generator.component_library.get(comp_id)
-
-                if not comp_sprite:
-                    continue
-
-                # Get frame
-                frame = comp_sprite.get_frame(self.preview_frame, self.preview_direction)
-
-                # Apply tint if needed
-                if layer.tint:
-                    # Create tinted version
-                    tinted = frame.copy()
-                    # Simple multiply blend (could be enhanced)
-                    tint_surface = pygame.Surface(frame.get_size(), pygame.SRCALPHA)
-                    tint_surface.fill((layer.tint.r, layer.tint.g, layer.tint.b, layer.tint.a))
-                    tinted.blit(tint_surface, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
-                    frame = tinted
-
-                # Scale up for preview
-                scaled = pygame.transform.scale(frame, (preview_size, preview_size))
-
-                # Composite
-                self.preview_surface.blit(scaled, (0, 0))
+            # Compose layers (unchanged layers come from the generator's stack cache)
+            self.preview_surface = self.generator.compose_frame(
+                self.current_preset,
+                self.preview_frame,
+                self.preview_direction,
+                output_size=256,  # Large preview
+            )
 
         except Exception as e:
             print(f"⚠ Preview generation failed: {e}")
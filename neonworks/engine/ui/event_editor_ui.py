@@ -744,6 +744,8 @@ class EventEditorUI:
             current_page.commands.append(new_command)
             self.selected_command_index = len(current_page.commands) - 1
 
+        current_page.mark_dirty()
+
     def _get_default_parameters(self, command_type: CommandType) -> Dict[str, Any]:
         """Get default parameters for a command type."""
         defaults = {
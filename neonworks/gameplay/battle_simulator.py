@@ -0,0 +1,1053 @@
+"""
+Battle Simulator
+
+Headless batch simulation of JRPG battles for balancing. Parties and troops
+are built from database actors, enemies and skills, and each battle runs
+without a World or EventManager using its own random.Random, so a battle's
+outcome depends only on its seed. Damage uses the same JRPGStats and
+ElementalResistances rules as JRPGBattleSystem.
+
+Batches are split across a process pool and merged into a SimulationReport
+with win rates, turn counts, damage distributions and skill impact, which can
+be written as JSON or CSV. Merging is order independent, so a batch gives the
+same report for any number of workers.
+"""
+
+import copy
+import csv
+import json
+import os
+import random
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from neonworks.engine.data.database_schema import DamageType, EffectType
+from neonworks.engine.data.database_schema import ElementType as DatabaseElement
+from neonworks.gameplay.jrpg_combat import (
+    BattleCommand,
+    ElementalResistances,
+    ElementType,
+    JRPGStats,
+    TargetType,
+)
+
+# Sides of a battle (and the winner of a drawn battle)
+PARTY = "party"
+TROOP = "troop"
+DRAW = "draw"
+
+# Actor stats when the actor's class has no parameter curves:
+# [HP, MP, ATK, DEF, MAT, MDF, AGI, LUK]
+DEFAULT_ACTOR_PARAMS = [100, 30, 10, 10, 10, 10, 10, 10]
+
+# Rounds before a battle is called a draw
+DEFAULT_MAX_TURNS = 100
+
+# Allies below this share of max HP are healed by the "ai" policy
+HEAL_THRESHOLD = 0.4
+
+# Skill scope (Skill.scope) -> targets
+SCOPE_TARGETS = {
+    1: TargetType.SINGLE_ENEMY,
+    2: TargetType.ALL_ENEMIES,
+    3: TargetType.SINGLE_ALLY,
+    4: TargetType.ALL_ALLIES,
+    5: TargetType.SELF,
+}
+
+# Database elements -> combat elements (None = no resistance applies)
+_ELEMENTS = {
+    DatabaseElement.NORMAL: None,
+    DatabaseElement.FIRE: ElementType.FIRE,
+    DatabaseElement.ICE: ElementType.ICE,
+    DatabaseElement.THUNDER: ElementType.LIGHTNING,
+    DatabaseElement.WATER: ElementType.WATER,
+    DatabaseElement.EARTH: ElementType.EARTH,
+    DatabaseElement.WIND: ElementType.WIND,
+    DatabaseElement.LIGHT: ElementType.HOLY,
+    DatabaseElement.DARK: ElementType.DARK,
+    DatabaseElement.POISON: None,
+}
+
+_OFFENSIVE_TARGETS = (TargetType.SINGLE_ENEMY, TargetType.ALL_ENEMIES)
+_SINGLE_TARGETS = (TargetType.SINGLE_ENEMY, TargetType.SINGLE_ALLY, TargetType.SELF)
+_DAMAGE_TYPES = (
+    DamageType.HP_DAMAGE,
+    DamageType.HP_DRAIN,
+    DamageType.MP_DAMAGE,
+    DamageType.MP_DRAIN,
+)
+
+
+@dataclass(frozen=True)
+class SkillProfile:
+    """What the simulator needs to know about a skill"""
+
+    skill_id: int
+    name: str
+    mp_cost: int = 0
+    target_type: TargetType = TargetType.SINGLE_ENEMY
+    damage_type: DamageType = DamageType.HP_DAMAGE
+    physical: bool = True
+    element: Optional[ElementType] = None
+    power: int = 0  # Added to damage, or the amount recovered
+    variance: int = 0  # Damage variance (percent)
+    success_rate: int = 100
+
+    @property
+    def offensive(self) -> bool:
+        """True if the skill targets the other side"""
+        return self.target_type in _OFFENSIVE_TARGETS
+
+    @classmethod
+    def from_skill(cls, skill: Any) -> "SkillProfile":
+        """
+        Build a profile from a database Skill.
+
+        Damage skills add their DAMAGE_HP/DAMAGE_MP effect values to the
+        damage (value2 is the variance in percent); recovery skills restore
+        the sum of their RECOVER_HP/RECOVER_MP effect values.
+        """
+        damage_effects = (EffectType.DAMAGE_HP, EffectType.DAMAGE_MP)
+        recover_effects = (EffectType.RECOVER_HP, EffectType.RECOVER_MP)
+        if skill.damage_type in _DAMAGE_TYPES:
+            effects = [e for e in skill.effects if e.effect_type in damage_effects]
+        else:
+            effects = [e for e in skill.effects if e.effect_type in recover_effects]
+
+        return cls(
+            skill_id=skill.id,
+            name=skill.name,
+            mp_cost=skill.mp_cost,
+            target_type=SCOPE_TARGETS.get(skill.scope, TargetType.SINGLE_ENEMY),
+            damage_type=skill.damage_type,
+            physical=skill.hit_type == 1,
+            element=_ELEMENTS.get(skill.element_type),
+            power=int(sum(e.value1 for e in effects)),
+            variance=int(max((e.value2 for e in effects), default=0)),
+            success_rate=skill.success_rate,
+        )
+
+
+# Basic attack, always available and free
+ATTACK = SkillProfile(0, "Attack")
+# Name defending is reported under
+DEFEND_NAME = "Defend"
+
+
+@dataclass
+class Combatant:
+    """
+    One fighter. The stats and resistances are shared between battles; the
+    HP, MP and per-battle state are reset for every battle.
+    """
+
+    name: str
+    side: str
+    max_hp: int
+    max_mp: int
+    stats: JRPGStats
+    resistances: ElementalResistances = field(default_factory=ElementalResistances)
+    skill_ids: List[int] = field(default_factory=list)
+    # (skill_id, rating) pairs used by the "weighted" policy (0 = attack)
+    action_weights: List[Tuple[int, int]] = field(default_factory=list)
+
+    # Battle state
+    index: int = 0
+    hp: int = 0
+    mp: int = 0
+    defending: bool = False
+    actions_taken: int = 0
+
+    @property
+    def alive(self) -> bool:
+        return self.hp > 0
+
+    def fresh(self, index: int) -> "Combatant":
+        """Return a copy at full HP and MP for a new battle"""
+        combatant = copy.copy(self)
+        combatant.index = index
+        combatant.hp = self.max_hp
+        combatant.mp = self.max_mp
+        combatant.defending = False
+        combatant.actions_taken = 0
+        return combatant
+
+
+@dataclass
+class BattleSetup:
+    """A party, a troop and the skills they can use"""
+
+    party: List[Combatant]
+    troop: List[Combatant]
+    skills: Dict[int, SkillProfile] = field(default_factory=dict)
+
+    @classmethod
+    def from_database(
+        cls,
+        database: Any,
+        actor_ids: Sequence[int],
+        enemy_ids: Sequence[int],
+        level: Optional[int] = None,
+    ) -> "BattleSetup":
+        """
+        Build a setup from database actors and enemies.
+
+        Args:
+            database: DatabaseManager (either the schema or the full manager)
+            actor_ids: Party actor IDs
+            enemy_ids: Troop enemy IDs (repeat an ID for several of one enemy)
+            level: Party level (default: each actor's initial level)
+
+        Returns:
+            The battle setup
+
+        Raises:
+            KeyError: If an actor, enemy or class doesn't exist
+        """
+        party = [combatant_from_actor(database, actor_id, level) for actor_id in actor_ids]
+        troop = [combatant_from_enemy(database, enemy_id) for enemy_id in enemy_ids]
+        _number_duplicates(troop)
+
+        skills = {}
+        for combatant in party + troop:
+            for skill_id in combatant.skill_ids:
+                skill = database.skills.get(skill_id)
+                if skill is not None:
+                    skills[skill_id] = SkillProfile.from_skill(skill)
+        return cls(party, troop, skills)
+
+
+@dataclass
+class Action:
+    """A chosen command. MAGIC covers every database skill."""
+
+    command: BattleCommand
+    targets: List[Combatant] = field(default_factory=list)
+    skill: Optional[SkillProfile] = None
+
+
+# Picks the action of a combatant whose turn it is
+Policy = Callable[["Battle", Combatant], Action]
+
+
+@dataclass
+class SkillRecord:
+    """How a skill was used in one battle"""
+
+    uses: int = 0
+    damage: int = 0
+    healing: int = 0
+    kills: int = 0
+    hits: List[int] = field(default_factory=list)
+
+
+@dataclass
+class BattleResult:
+    """Outcome of one battle"""
+
+    seed: int
+    winner: str
+    turns: int
+    damage: Dict[str, int]
+    party_alive: int
+    skills: Dict[Tuple[str, str], SkillRecord]
+
+
+class Battle:
+    """A single battle, played to the end with one seeded generator"""
+
+    def __init__(
+        self,
+        setup: BattleSetup,
+        seed: int,
+        party_policy: Policy,
+        troop_policy: Policy,
+        max_turns: int = DEFAULT_MAX_TURNS,
+    ):
+        """
+        Prepare a battle.
+
+        Args:
+            setup: Party, troop and skills
+            seed: Seed of the battle's random generator
+            party_policy: Chooses party actions
+            troop_policy: Chooses troop actions
+            max_turns: Rounds before the battle is a draw
+        """
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.skills = setup.skills
+        self.max_turns = max_turns
+        self.combatants = [
+            combatant.fresh(index) for index, combatant in enumerate(setup.party + setup.troop)
+        ]
+        self._policies = {PARTY: party_policy, TROOP: troop_policy}
+        self._damage = {PARTY: 0, TROOP: 0}
+        self._records: Dict[Tuple[str, str], SkillRecord] = {}
+
+    def allies(self, combatant: Combatant) -> List[Combatant]:
+        """Living combatants on the same side"""
+        return [c for c in self.combatants if c.side == combatant.side and c.hp > 0]
+
+    def opponents(self, combatant: Combatant) -> List[Combatant]:
+        """Living combatants on the other side"""
+        return [c for c in self.combatants if c.side != combatant.side and c.hp > 0]
+
+    def usable_skills(self, combatant: Combatant) -> List[SkillProfile]:
+        """Skills the combatant knows and has the MP for"""
+        skills = []
+        for skill_id in combatant.skill_ids:
+            skill = self.skills.get(skill_id)
+            if skill is not None and skill.mp_cost <= combatant.mp:
+                skills.append(skill)
+        return skills
+
+    def action_for(
+        self, combatant: Combatant, skill: SkillProfile, target: Optional[Combatant] = None
+    ) -> Action:
+        """
+        Build the action of using a skill, expanding its targets.
+
+        Args:
+            combatant: User of the skill
+            skill: Skill (ATTACK for a basic attack)
+            target: Chosen target for single-target skills (default: random)
+
+        Returns:
+            The action
+        """
+        command = BattleCommand.ATTACK if skill is ATTACK else BattleCommand.MAGIC
+        side = self.opponents(combatant) if skill.offensive else self.allies(combatant)
+        if skill.target_type == TargetType.SELF:
+            targets = [combatant]
+        elif skill.target_type in _SINGLE_TARGETS:
+            targets = [target if target is not None else self.rng.choice(side)] if side else []
+        else:
+            targets = side
+        return Action(command, targets, skill)
+
+    def estimate_damage(self, attacker: Combatant, skill: SkillProfile, target: Combatant) -> int:
+        """Damage a hit would do before variance and defending"""
+        if skill.physical:
+            damage = attacker.stats.calculate_physical_damage(target.stats) + skill.power
+        else:
+            damage = attacker.stats.calculate_magic_damage(skill.power, target.stats)
+        if skill.element is not None:
+            damage = int(damage * target.resistances.get_multiplier(skill.element))
+        return damage
+
+    def run(self) -> BattleResult:
+        """
+        Play the battle.
+
+        Each round every living combatant acts once, in order of speed plus a
+        random 0-10 initiative roll, like JRPGBattleSystem.
+
+        Returns:
+            The result
+        """
+        for turn in range(1, self.max_turns + 1):
+            for actor in self._turn_order():
+                if actor.hp <= 0:
+                    continue
+                actor.defending = False
+                self._execute(actor, self._policies[actor.side](self, actor))
+                winner = self._winner()
+                if winner is not None:
+                    return self._result(winner, turn)
+        return self._result(DRAW, self.max_turns)
+
+    def _turn_order(self) -> List[Combatant]:
+        initiative = [
+            (-(c.stats.speed + self.rng.randint(0, 10)), c.index, c)
+            for c in self.combatants
+            if c.hp > 0
+        ]
+        initiative.sort(key=lambda entry: entry[:2])
+        return [entry[2] for entry in initiative]
+
+    def _winner(self) -> Optional[str]:
+        party_alive = troop_alive = False
+        for combatant in self.combatants:
+            if combatant.hp > 0:
+                if combatant.side == PARTY:
+                    party_alive = True
+                else:
+                    troop_alive = True
+        if not troop_alive:
+            return PARTY
+        if not party_alive:
+            return TROOP
+        return None
+
+    def _execute(self, actor: Combatant, action: Action):
+        actor.actions_taken += 1
+        if action.command == BattleCommand.DEFEND:
+            actor.defending = True
+            self._record(actor, DEFEND_NAME)
+            return
+
+        skill = action.skill or ATTACK
+        if skill.mp_cost > actor.mp:
+            skill = ATTACK
+            action = self.action_for(actor, ATTACK)
+        actor.mp -= skill.mp_cost
+        record = self._record(actor, skill.name)
+
+        targets = [target for target in action.targets if target.hp > 0]
+        if not targets and action.targets and skill.target_type in _SINGLE_TARGETS:
+            # The chosen target fell earlier this round: pick another
+            targets = self.action_for(actor, skill).targets
+        for target in targets:
+            self._apply(actor, skill, target, record)
+
+    def _apply(self, actor: Combatant, skill: SkillProfile, target: Combatant, record):
+        if skill.success_rate < 100 and self.rng.random() * 100 >= skill.success_rate:
+            record.hits.append(0)
+            return
+
+        damage_type = skill.damage_type
+        if damage_type == DamageType.HP_RECOVER:
+            record.healing += _restore_hp(target, skill.power)
+            return
+        if damage_type == DamageType.MP_RECOVER:
+            target.mp = min(target.max_mp, target.mp + skill.power)
+            return
+        if damage_type not in _DAMAGE_TYPES:
+            return
+
+        if skill.physical:
+            damage = actor.stats.calculate_physical_damage(target.stats) + skill.power
+        else:
+            damage = actor.stats.calculate_magic_damage(skill.power, target.stats)
+        if skill.variance:
+            damage *= 1.0 + self.rng.uniform(-skill.variance, skill.variance) / 100.0
+        if skill.element is not None:
+            multiplier = target.resistances.get_multiplier(skill.element)
+            if multiplier < 0:
+                # Absorbed: heals the target instead
+                _restore_hp(target, int(damage * -multiplier))
+                record.hits.append(0)
+                return
+            damage *= multiplier
+        if skill.physical and target.defending:
+            damage *= 0.5
+        damage = max(0, int(damage))
+
+        if damage_type in (DamageType.MP_DAMAGE, DamageType.MP_DRAIN):
+            damage = min(damage, target.mp)
+            target.mp -= damage
+            if damage_type == DamageType.MP_DRAIN:
+                actor.mp = min(actor.max_mp, actor.mp + damage)
+            record.hits.append(damage)
+            return
+
+        damage = min(damage, target.hp)
+        target.hp -= damage
+        record.damage += damage
+        record.hits.append(damage)
+        self._damage[actor.side] += damage
+        if target.hp <= 0:
+            record.kills += 1
+        if damage_type == DamageType.HP_DRAIN:
+            record.healing += _restore_hp(actor, damage)
+
+    def _record(self, actor: Combatant, name: str) -> SkillRecord:
+        key = (actor.side, name)
+        record = self._records.get(key)
+        if record is None:
+            record = self._records[key] = SkillRecord()
+        record.uses += 1
+        return record
+
+    def _result(self, winner: str, turns: int) -> BattleResult:
+        party_alive = sum(1 for c in self.combatants if c.side == PARTY and c.hp > 0)
+        return BattleResult(
+            self.seed, winner, turns, dict(self._damage), party_alive, self._records
+        )
+
+
+# =============================================================================
+# Policies
+# =============================================================================
+
+
+def attack_policy(battle: Battle, actor: Combatant) -> Action:
+    """Attack a random opponent"""
+    return battle.action_for(actor, ATTACK)
+
+
+def random_policy(battle: Battle, actor: Combatant) -> Action:
+    """Attack or use a random usable skill on random targets"""
+    return battle.action_for(actor, battle.rng.choice([ATTACK] + battle.usable_skills(actor)))
+
+
+def weighted_policy(battle: Battle, actor: Combatant) -> Action:
+    """Pick from the combatant's (skill_id, rating) actions, like enemy action lists"""
+    choices = []
+    weights = []
+    for skill_id, rating in actor.action_weights:
+        skill = ATTACK if skill_id == 0 else battle.skills.get(skill_id)
+        if skill is not None and skill.mp_cost <= actor.mp and rating > 0:
+            choices.append(skill)
+            weights.append(rating)
+    if not choices:
+        return attack_policy(battle, actor)
+    return battle.action_for(actor, battle.rng.choices(choices, weights)[0])
+
+
+def ai_policy(battle: Battle, actor: Combatant) -> Action:
+    """
+    Heal an ally in danger if possible, otherwise use whatever deals the most
+    damage to the weakest opponent (or to all opponents for group skills).
+    """
+    skills = battle.usable_skills(actor)
+
+    hurt = min(battle.allies(actor), key=lambda c: c.hp / max(1, c.max_hp))
+    if hurt.hp < hurt.max_hp * HEAL_THRESHOLD:
+        heals = [s for s in skills if s.damage_type == DamageType.HP_RECOVER and s.power > 0]
+        if heals:
+            return battle.action_for(actor, max(heals, key=lambda s: s.power), hurt)
+
+    opponents = battle.opponents(actor)
+    weakest = min(opponents, key=lambda c: (c.hp, c.index))
+    best, best_score = ATTACK, _expected_damage(battle, actor, ATTACK, [weakest])
+    for skill in skills:
+        if not skill.offensive or skill.damage_type not in (
+            DamageType.HP_DAMAGE,
+            DamageType.HP_DRAIN,
+        ):
+            continue
+        targets = [weakest] if skill.target_type == TargetType.SINGLE_ENEMY else opponents
+        score = _expected_damage(battle, actor, skill, targets)
+        if score > best_score:
+            best, best_score = skill, score
+    return battle.action_for(actor, best, weakest)
+
+
+class ScriptedPolicy:
+    """
+    Cycle through a fixed sequence of skill IDs per combatant name.
+
+    Skill ID 0 is a basic attack and -1 defends. Offensive skills target the
+    weakest opponent and ally skills the most hurt ally; combatants without a
+    script (or without the MP for their next skill) attack.
+    """
+
+    def __init__(self, script: Dict[str, Sequence[int]]):
+        """
+        Args:
+            script: Combatant name -> skill IDs to use in turn
+        """
+        self.script = {name: list(sequence) for name, sequence in script.items() if sequence}
+
+    def __call__(self, battle: Battle, actor: Combatant) -> Action:
+        sequence = self.script.get(actor.name)
+        if not sequence:
+            return attack_policy(battle, actor)
+
+        skill_id = sequence[actor.actions_taken % len(sequence)]
+        if skill_id == -1:
+            return Action(BattleCommand.DEFEND)
+        skill = ATTACK if skill_id == 0 else battle.skills.get(skill_id)
+        if skill is None or skill.mp_cost > actor.mp:
+            skill = ATTACK
+
+        if skill.offensive:
+            target = min(battle.opponents(actor), key=lambda c: (c.hp, c.index))
+        else:
+            target = min(battle.allies(actor), key=lambda c: (c.hp / max(1, c.max_hp), c.index))
+        return battle.action_for(actor, skill, target)
+
+
+POLICIES: Dict[str, Policy] = {
+    "attack": attack_policy,
+    "random": random_policy,
+    "weighted": weighted_policy,
+    "ai": ai_policy,
+}
+
+
+def resolve_policy(policy: Union[str, Policy]) -> Policy:
+    """
+    Look up a policy by name.
+
+    Args:
+        policy: Name in POLICIES, or a policy callable (returned as is)
+
+    Returns:
+        The policy
+
+    Raises:
+        ValueError: If the name isn't registered
+    """
+    if callable(policy):
+        return policy
+    try:
+        return POLICIES[policy]
+    except KeyError:
+        raise ValueError(f"Unknown policy '{policy}' (expected one of {sorted(POLICIES)})")
+
+
+# =============================================================================
+# Building combatants
+# =============================================================================
+
+
+def combatant_from_actor(database: Any, actor_id: int, level: Optional[int] = None) -> Combatant:
+    """
+    Build a party combatant from a database actor.
+
+    Stats come from the class parameter curves at the actor's level plus the
+    equipped weapon (slot 0) and armors; skills are the class learnings up to
+    that level.
+
+    Raises:
+        KeyError: If the actor or its class doesn't exist
+    """
+    actor = database.actors[actor_id]
+    actor_class = database.classes[actor.class_id]
+    level = level or actor.initial_level
+
+    params = list(DEFAULT_ACTOR_PARAMS)
+    for i, curve in enumerate(actor_class.params[:8]):
+        if curve:
+            params[i] = curve[min(level, len(curve)) - 1]
+
+    for slot, equip_id in enumerate(actor.equips):
+        equipment = (database.weapons if slot == 0 else database.armors).get(equip_id)
+        if equipment is not None:
+            # Equipment params: [ATK, DEF, MAT, MDF, AGI, LUK]
+            for i, bonus in enumerate(equipment.params[:6]):
+                params[i + 2] += bonus
+
+    skill_ids = [
+        learning["skill_id"]
+        for learning in actor_class.learnings
+        if learning.get("level", 1) <= level and "skill_id" in learning
+    ]
+    return _combatant(actor.name, PARTY, params, level, actor.traits, skill_ids)
+
+
+def combatant_from_enemy(database: Any, enemy_id: int) -> Combatant:
+    """
+    Build a troop combatant from a database enemy.
+
+    Enemy actions are {"skill_id": ..., "rating": ...} entries (skill 0 is a
+    basic attack); the rating weighs them for the "weighted" policy.
+
+    Raises:
+        KeyError: If the enemy doesn't exist
+    """
+    enemy = database.enemies[enemy_id]
+    action_weights = [
+        (int(action.get("skill_id", 0)), int(action.get("rating", 5))) for action in enemy.actions
+    ]
+    skill_ids = sorted({skill_id for skill_id, _ in action_weights if skill_id > 0})
+    combatant = _combatant(enemy.name, TROOP, enemy.params, 1, enemy.traits, skill_ids)
+    combatant.action_weights = action_weights
+    return combatant
+
+
+def resistances_from_traits(traits: Iterable[Dict[str, Any]]) -> ElementalResistances:
+    """
+    Build resistances from {"code": "element_rate", "element": ..., "value": ...}
+    traits, where value is a percentage (200 = weak, 50 = resists, 0 = immune,
+    negative = absorbs) and element is a database element name.
+    """
+    resistances = ElementalResistances()
+    for trait in traits:
+        if trait.get("code") != "element_rate":
+            continue
+        try:
+            element = _ELEMENTS.get(DatabaseElement(trait.get("element")))
+        except ValueError:
+            continue
+        if element is not None:
+            resistances.resistances[element] = float(trait.get("value", 100)) / 100.0
+    return resistances
+
+
+# =============================================================================
+# Running battles
+# =============================================================================
+
+
+def simulate_battle(
+    setup: BattleSetup,
+    seed: int,
+    party_policy: Union[str, Policy] = "ai",
+    troop_policy: Union[str, Policy] = "weighted",
+    max_turns: int = DEFAULT_MAX_TURNS,
+) -> BattleResult:
+    """
+    Play one battle. The same seed always gives the same result.
+
+    Args:
+        setup: Party, troop and skills
+        seed: Battle seed
+        party_policy: Policy name or callable for the party
+        troop_policy: Policy name or callable for the troop
+        max_turns: Rounds before the battle is a draw
+
+    Returns:
+        The battle result
+    """
+    battle = Battle(
+        setup, seed, resolve_policy(party_policy), resolve_policy(troop_policy), max_turns
+    )
+    return battle.run()
+
+
+def run_simulation(
+    setup: BattleSetup,
+    battles: int,
+    seed: int = 0,
+    party_policy: Union[str, Policy] = "ai",
+    troop_policy: Union[str, Policy] = "weighted",
+    max_turns: int = DEFAULT_MAX_TURNS,
+    workers: Optional[int] = None,
+) -> "SimulationReport":
+    """
+    Play a batch of battles, seeded seed, seed + 1, ..., seed + battles - 1.
+
+    Policies must be names or picklable callables (such as ScriptedPolicy)
+    when more than one worker is used.
+
+    Args:
+        setup: Party, troop and skills
+        battles: Number of battles
+        seed: Seed of the first battle
+        party_policy: Policy name or callable for the party
+        troop_policy: Policy name or callable for the troop
+        max_turns: Rounds before a battle is a draw
+        workers: Worker processes (default: one per CPU, 1 = run in this process)
+
+    Returns:
+        Report merged from all battles
+    """
+    resolve_policy(party_policy)
+    resolve_policy(troop_policy)
+    report = SimulationReport(seed=seed)
+    if battles <= 0:
+        return report
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, battles))
+    if workers == 1:
+        return report.merge(
+            _run_chunk(setup, seed, seed + battles, party_policy, troop_policy, max_turns)
+        )
+
+    # A few chunks per worker keeps the pool busy when battle lengths vary
+    chunk_count = min(battles, workers * 4)
+    bounds = [seed + battles * i // chunk_count for i in range(chunk_count + 1)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(_run_chunk, setup, start, stop, party_policy, troop_policy, max_turns)
+            for start, stop in zip(bounds, bounds[1:])
+        ]
+        for future in futures:
+            report.merge(future.result())
+    return report
+
+
+# =============================================================================
+# Reporting
+# =============================================================================
+
+
+@dataclass
+class SkillTally:
+    """Totals of a skill over many battles"""
+
+    uses: int = 0
+    battles: int = 0
+    wins: int = 0
+    damage: int = 0
+    healing: int = 0
+    kills: int = 0
+    hits: Counter = field(default_factory=Counter)
+
+    def merge(self, other: "SkillTally"):
+        self.uses += other.uses
+        self.battles += other.battles
+        self.wins += other.wins
+        self.damage += other.damage
+        self.healing += other.healing
+        self.kills += other.kills
+        self.hits.update(other.hits)
+
+
+@dataclass
+class SimulationReport:
+    """
+    Aggregated results of a batch of battles.
+
+    Distributions are kept as value -> count histograms, so reports from
+    different workers merge exactly.
+    """
+
+    seed: int = 0
+    battles: int = 0
+    outcomes: Counter = field(default_factory=Counter)
+    turns: Counter = field(default_factory=Counter)
+    damage: Dict[str, Counter] = field(default_factory=lambda: {PARTY: Counter(), TROOP: Counter()})
+    party_alive: Counter = field(default_factory=Counter)
+    skills: Dict[Tuple[str, str], SkillTally] = field(default_factory=dict)
+
+    @property
+    def win_rate(self) -> float:
+        """Share of battles the party won"""
+        return self.outcomes[PARTY] / self.battles if self.battles else 0.0
+
+    def add(self, result: BattleResult) -> "SimulationReport":
+        """Add one battle result"""
+        self.battles += 1
+        self.outcomes[result.winner] += 1
+        self.turns[result.turns] += 1
+        for side, amount in result.damage.items():
+            self.damage[side][amount] += 1
+        self.party_alive[result.party_alive] += 1
+
+        for key, record in result.skills.items():
+            tally = self.skills.get(key)
+            if tally is None:
+                tally = self.skills[key] = SkillTally()
+            tally.uses += record.uses
+            tally.battles += 1
+            tally.wins += result.winner == key[0]
+            tally.damage += record.damage
+            tally.healing += record.healing
+            tally.kills += record.kills
+            tally.hits.update(record.hits)
+        return self
+
+    def merge(self, other: "SimulationReport") -> "SimulationReport":
+        """Add all battles of another report"""
+        self.battles += other.battles
+        self.outcomes.update(other.outcomes)
+        self.turns.update(other.turns)
+        for side, counts in other.damage.items():
+            self.damage.setdefault(side, Counter()).update(counts)
+        self.party_alive.update(other.party_alive)
+        for key, tally in other.skills.items():
+            self.skills.setdefault(key, SkillTally()).merge(tally)
+        return self
+
+    def skill_impact(self) -> List[Dict[str, Any]]:
+        """
+        Skills ranked by impact: damage plus healing per battle.
+
+        Returns:
+            One dict per (side, skill), most impactful first
+        """
+        rows = []
+        for (side, name), tally in self.skills.items():
+            rows.append(
+                {
+                    "side": side,
+                    "skill": name,
+                    "impact": (tally.damage + tally.healing) / self.battles,
+                    "uses": tally.uses,
+                    "battles_used": tally.battles,
+                    "win_rate_when_used": tally.wins / tally.battles,
+                    "damage": tally.damage,
+                    "healing": tally.healing,
+                    "kills": tally.kills,
+                    "hit_damage": _distribution(tally.hits),
+                }
+            )
+        rows.sort(key=lambda row: (-row["impact"], row["side"], row["skill"]))
+        return rows
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dict"""
+        battles = self.battles or 1
+        return {
+            "seed": self.seed,
+            "battles": self.battles,
+            "win_rate": self.win_rate,
+            "outcomes": {side: self.outcomes[side] for side in (PARTY, TROOP, DRAW)},
+            "outcome_rates": {side: self.outcomes[side] / battles for side in (PARTY, TROOP, DRAW)},
+            "turns": _distribution(self.turns),
+            "turns_histogram": {str(k): v for k, v in sorted(self.turns.items())},
+            "damage": {side: _distribution(counts) for side, counts in self.damage.items()},
+            "party_alive": {str(k): v for k, v in sorted(self.party_alive.items())},
+            "skills": self.skill_impact(),
+        }
+
+    def to_csv_rows(self) -> List[Dict[str, Any]]:
+        """
+        Flatten the report into section/key/metric/value rows.
+
+        Returns:
+            Rows for csv.DictWriter with CSV_FIELDS
+        """
+        data = self.to_dict()
+        rows = [
+            {"section": "summary", "key": "", "metric": metric, "value": data[metric]}
+            for metric in ("seed", "battles", "win_rate")
+        ]
+        for side, count in data["outcomes"].items():
+            rows.append({"section": "outcomes", "key": side, "metric": "count", "value": count})
+        for metric, value in data["turns"].items():
+            rows.append({"section": "turns", "key": "", "metric": metric, "value": value})
+        for side, distribution in data["damage"].items():
+            for metric, value in distribution.items():
+                rows.append({"section": "damage", "key": side, "metric": metric, "value": value})
+        for skill in data["skills"]:
+            key = f"{skill['side']}:{skill['skill']}"
+            for metric, value in skill.items():
+                if metric in ("side", "skill"):
+                    continue
+                if metric == "hit_damage":
+                    for hit_metric, hit_value in value.items():
+                        rows.append(
+                            {
+                                "section": "skill",
+                                "key": key,
+                                "metric": f"hit_{hit_metric}",
+                                "value": hit_value,
+                            }
+                        )
+                else:
+                    rows.append({"section": "skill", "key": key, "metric": metric, "value": value})
+        return rows
+
+    def write(self, filepath: Union[Path, str], fmt: Optional[str] = None) -> Path:
+        """
+        Write the report as JSON or CSV.
+
+        Args:
+            filepath: Output path
+            fmt: "json" or "csv" (default: from the file extension, else JSON)
+
+        Returns:
+            The path written
+
+        Raises:
+            ValueError: If the format is unknown
+        """
+        filepath = Path(filepath)
+        fmt = (fmt or filepath.suffix.lstrip(".") or "json").lower()
+        if fmt not in ("json", "csv"):
+            raise ValueError(f"Unknown report format '{fmt}' (expected json or csv)")
+
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        with open(filepath, "w", encoding="utf-8", newline="") as f:
+            if fmt == "json":
+                json.dump(self.to_dict(), f, indent=2)
+            else:
+                writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
+                writer.writeheader()
+                writer.writerows(self.to_csv_rows())
+        return filepath
+
+
+CSV_FIELDS = ["section", "key", "metric", "value"]
+
+
+def _combatant(
+    name: str,
+    side: str,
+    params: Sequence[int],
+    level: int,
+    traits: Iterable[Dict[str, Any]],
+    skill_ids: List[int],
+) -> Combatant:
+    """Build a combatant from [HP, MP, ATK, DEF, MAT, MDF, AGI, LUK]"""
+    hp, mp, attack, defense, magic_attack, magic_defense, speed, luck = params
+    stats = JRPGStats(
+        level=level,
+        attack=attack,
+        defense=defense,
+        magic_attack=magic_attack,
+        magic_defense=magic_defense,
+        speed=speed,
+        luck=luck,
+    )
+    return Combatant(
+        name=name,
+        side=side,
+        max_hp=max(1, hp),
+        max_mp=mp,
+        stats=stats,
+        resistances=resistances_from_traits(traits),
+        skill_ids=skill_ids,
+    )
+
+
+def _number_duplicates(combatants: List[Combatant]):
+    """Name repeated enemies "Slime A", "Slime B", ..."""
+    counts = Counter(c.name for c in combatants)
+    seen: Counter = Counter()
+    for combatant in combatants:
+        if counts[combatant.name] > 1:
+            suffix = chr(ord("A") + seen[combatant.name] % 26)
+            seen[combatant.name] += 1
+            combatant.name = f"{combatant.name} {suffix}"
+
+
+def _restore_hp(combatant: Combatant, amount: int) -> int:
+    """Heal a living combatant, returning the HP actually restored"""
+    if combatant.hp <= 0 or amount <= 0:
+        return 0
+    restored = min(amount, combatant.max_hp - combatant.hp)
+    combatant.hp += restored
+    return restored
+
+
+def _expected_damage(
+    battle: Battle, actor: Combatant, skill: SkillProfile, targets: List[Combatant]
+) -> int:
+    """Damage a skill would deal to targets, capped at their HP"""
+    return sum(
+        min(target.hp, max(0, battle.estimate_damage(actor, skill, target))) for target in targets
+    )
+
+
+def _distribution(counts: Counter) -> Dict[str, float]:
+    """Count, mean, min, max and percentiles of a value -> count histogram"""
+    total = sum(counts.values())
+    if not total:
+        return {"count": 0, "mean": 0.0, "min": 0, "max": 0, "p10": 0, "p50": 0, "p90": 0}
+
+    values = sorted(counts.items())
+    summary: Dict[str, float] = {
+        "count": total,
+        "mean": sum(value * count for value, count in values) / total,
+        "min": values[0][0],
+        "max": values[-1][0],
+    }
+    for name, share in (("p10", 0.1), ("p50", 0.5), ("p90", 0.9)):
+        rank = share * total
+        seen = 0
+        for value, count in values:
+            seen += count
+            if seen >= rank:
+                summary[name] = value
+                break
+    return summary
+
+
+def _run_chunk(
+    setup: BattleSetup,
+    start: int,
+    stop: int,
+    party_policy: Union[str, Policy],
+    troop_policy: Union[str, Policy],
+    max_turns: int,
+) -> SimulationReport:
+    """Play the battles seeded start..stop - 1 (runs in a worker process)"""
+    party = resolve_policy(party_policy)
+    troop = resolve_policy(troop_policy)
+    report = SimulationReport()
+    for seed in range(start, stop):
+        report.add(Battle(setup, seed, party, troop, max_turns).run())
+    return report
@@ -391,6 +391,9 @@ class AIControllerSystem(System):
         super().__init__()
         self.priority = 4  # Run before character controller
 
+        # Optional level-of-detail scheduler for off-screen AI
+        self.lod_system = None
+
     def update(self, world: World, delta_time: float):
         """Update all AI controllers"""
         for entity in world.get_entities_with_component(AIController):
@@ -401,20 +404,31 @@ class AIControllerSystem(System):
             if not ai or not controller or not transform:
                 continue
 
+            if self.lod_system is not None:
+                entity_delta = self.lod_system.get_delta(entity)
+                if entity_delta is None:
+                    continue  # Off-screen AI not scheduled this update
+            else:
+                entity_delta = delta_time
+
             # AI shouldn't be player-controlled
             controller.is_player_controlled = False
 
             # Update AI behavior
             if ai.behavior == "wander":
-                self._update_wander(ai, controller, transform, delta_time)
+                self._update_wander(ai, controller, transform, entity_delta)
             elif ai.behavior == "patrol":
-                self._update_patrol(ai, controller, transform, delta_time)
+                self._update_patrol(ai, controller, transform, entity_delta)
             elif ai.behavior == "chase":
-                self._update_chase(ai, controller, transform, delta_time)
+                self._update_chase(ai, controller, transform, entity_delta)
             elif ai.behavior == "flee":
-                self._update_flee(ai, controller, transform, delta_time)
+                self._update_flee(ai, controller, transform, entity_delta)
             # idle behavior = do nothing
 
+    def set_lod_system(self, lod_system):
+        """Schedule off-screen AI updates through a LODSystem"""
+        self.lod_system = lod_system
+
     def _update_wander(
         self,
         ai: AIController,
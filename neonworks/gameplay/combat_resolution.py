@@ -0,0 +1,304 @@
+"""
+Batched Combat Resolution
+
+Resolves one action against many targets at once. The targets' Health,
+JRPGStats, BattleState and ElementalResistances are gathered into NumPy
+arrays, then damage, elemental multipliers, critical and dodge rolls and the
+resulting HP are computed in one vectorized pass using a seeded
+numpy.random.Generator, and finally written back to the components.
+
+The formulas match JRPGStats.calculate_physical_damage and
+calculate_magic_damage. Critical hits and dodges are off unless a rate is
+given, so default results are the same as resolving targets one at a time.
+Emitting events is left to the calling system.
+"""
+
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from neonworks.core.ecs import Entity
+from neonworks.gameplay.combat import Health
+from neonworks.gameplay.jrpg_combat import (
+    BattleState,
+    ElementalResistances,
+    ElementType,
+    JRPGStats,
+    Spell,
+)
+
+# Damage of a physical attack when attacker or target has no JRPGStats
+DEFAULT_PHYSICAL_DAMAGE = 10
+
+# Damage multiplier of a critical hit
+CRITICAL_MULTIPLIER = 1.5
+
+# Damage multiplier against a defending target (physical attacks only)
+DEFEND_MULTIPLIER = 0.5
+
+
+@dataclass
+class TargetBatch:
+    """Components and stats of a list of targets, as parallel arrays"""
+
+    entities: List[Entity]
+    healths: List[Optional[Health]]
+    stats: List[Optional[JRPGStats]]
+    has_health: np.ndarray
+    alive: np.ndarray
+    hp: np.ndarray
+    max_hp: np.ndarray
+    has_stats: np.ndarray
+    defense: np.ndarray
+    magic_defense: np.ndarray
+    speed: np.ndarray
+    luck: np.ndarray
+    defending: np.ndarray
+    has_resistances: np.ndarray
+    multiplier: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.entities)
+
+    @classmethod
+    def from_entities(
+        cls, entities: Sequence[Entity], element: Optional[ElementType] = None
+    ) -> "TargetBatch":
+        """
+        Gather the components of each target.
+
+        Args:
+            entities: Targets
+            element: Element whose resistance multiplier to gather (None = 1.0)
+
+        Returns:
+            The batch
+        """
+        entities = list(entities)
+        healths = []
+        stats = []
+        rows = []
+        for entity in entities:
+            health = entity.get_component(Health)
+            target_stats = entity.get_component(JRPGStats)
+            battle_state = entity.get_component(BattleState)
+            resistances = entity.get_component(ElementalResistances)
+            healths.append(health)
+            stats.append(target_stats)
+            rows.append(
+                (
+                    health is not None,
+                    health is not None and health.is_alive,
+                    health.hp if health else 0.0,
+                    health.max_hp if health else 0.0,
+                    target_stats is not None,
+                    target_stats.defense if target_stats else 0,
+                    target_stats.magic_defense if target_stats else 0,
+                    target_stats.speed if target_stats else 0,
+                    target_stats.luck if target_stats else 0,
+                    battle_state is not None and battle_state.is_defending,
+                    resistances is not None,
+                    (
+                        resistances.get_multiplier(element)
+                        if resistances is not None and element is not None
+                        else 1.0
+                    ),
+                )
+            )
+
+        columns = list(zip(*rows)) if rows else [()] * 12
+        return cls(
+            entities=entities,
+            healths=healths,
+            stats=stats,
+            has_health=np.array(columns[0], dtype=bool),
+            alive=np.array(columns[1], dtype=bool),
+            hp=np.array(columns[2], dtype=np.float64),
+            max_hp=np.array(columns[3], dtype=np.float64),
+            has_stats=np.array(columns[4], dtype=bool),
+            defense=np.array(columns[5], dtype=np.int64),
+            magic_defense=np.array(columns[6], dtype=np.int64),
+            speed=np.array(columns[7], dtype=np.int64),
+            luck=np.array(columns[8], dtype=np.int64),
+            defending=np.array(columns[9], dtype=bool),
+            has_resistances=np.array(columns[10], dtype=bool),
+            multiplier=np.array(columns[11], dtype=np.float64),
+        )
+
+
+@dataclass
+class Resolution:
+    """
+    Outcome of an action for every target of a batch.
+
+    ``affected`` marks the targets the action applied to; the other arrays
+    are only meaningful where it is set.
+    """
+
+    batch: TargetBatch
+    affected: np.ndarray
+    damage: np.ndarray
+    hp: np.ndarray
+    critical: np.ndarray
+    dodged: np.ndarray
+    absorbed: np.ndarray
+    healing: np.ndarray
+    status: np.ndarray
+    status_effect: Optional[str] = None
+
+    @property
+    def killed(self) -> np.ndarray:
+        """Targets whose HP the action brought to 0"""
+        return self.affected & self.batch.has_health & (self.hp <= 0)
+
+    def write_back(self):
+        """Store the resulting HP, deaths and statuses on the components"""
+        batch = self.batch
+        changed = self.affected & batch.has_health & ((self.hp != batch.hp) | (self.hp <= 0))
+        for i in np.flatnonzero(changed).tolist():
+            health = batch.healths[i]
+            health.hp = float(self.hp[i])
+            if health.hp <= 0:
+                health.is_alive = False
+
+        if self.status_effect:
+            for i in np.flatnonzero(self.status).tolist():
+                batch.stats[i].add_status(self.status_effect)
+
+
+def resolve_attack(
+    attacker: Optional[JRPGStats],
+    batch: TargetBatch,
+    rng: np.random.Generator,
+    critical_rate: float = 0.0,
+    dodge_rate: float = 0.0,
+) -> Resolution:
+    """
+    Resolve a physical attack against every living target with Health.
+
+    Critical chance is critical_rate scaled by attacker luck over target
+    luck; dodge chance is dodge_rate scaled by target speed over attacker
+    speed. Rolls are only drawn for non-zero rates.
+
+    Args:
+        attacker: Attacker stats (None = DEFAULT_PHYSICAL_DAMAGE)
+        batch: Targets
+        rng: Generator for the rolls
+        critical_rate: Base critical chance (0.0-1.0)
+        dodge_rate: Base dodge chance (0.0-1.0)
+
+    Returns:
+        The resolution (not yet written back)
+    """
+    n = len(batch)
+    affected = batch.has_health & batch.alive
+
+    if attacker is not None:
+        damage = np.maximum(1, attacker.attack - batch.defense // 2)
+        damage = np.where(batch.has_stats, damage, DEFAULT_PHYSICAL_DAMAGE)
+    else:
+        damage = np.full(n, DEFAULT_PHYSICAL_DAMAGE, dtype=np.int64)
+
+    critical = np.zeros(n, dtype=bool)
+    if critical_rate > 0:
+        chance = np.full(n, critical_rate)
+        if attacker is not None:
+            chance = np.where(
+                batch.has_stats, critical_rate * attacker.luck / np.maximum(1, batch.luck), chance
+            )
+        critical = affected & (rng.random(n) < chance)
+        damage = np.where(critical, (damage * CRITICAL_MULTIPLIER).astype(np.int64), damage)
+
+    dodged = np.zeros(n, dtype=bool)
+    if dodge_rate > 0:
+        chance = np.full(n, dodge_rate)
+        if attacker is not None:
+            chance = np.where(
+                batch.has_stats, dodge_rate * batch.speed / max(1, attacker.speed), chance
+            )
+        dodged = affected & (rng.random(n) < chance)
+
+    damage = np.where(
+        batch.defending, (damage * DEFEND_MULTIPLIER).astype(np.int64), damage
+    ).astype(np.int64)
+    damage[dodged] = 0
+
+    hp = np.where(affected, np.maximum(0.0, batch.hp - damage), batch.hp)
+    return Resolution(
+        batch=batch,
+        affected=affected,
+        damage=damage,
+        hp=hp,
+        critical=critical,
+        dodged=dodged,
+        absorbed=np.zeros(n, dtype=bool),
+        healing=np.zeros(n, dtype=np.float64),
+        status=np.zeros(n, dtype=bool),
+    )
+
+
+def resolve_spell(
+    spell: Spell,
+    caster: Optional[JRPGStats],
+    batch: TargetBatch,
+    rng: np.random.Generator,
+) -> Resolution:
+    """
+    Resolve a spell's damage, healing and status effect on every target.
+
+    Like MagicSystem, spells apply to every target with Health whether or
+    not it is alive. A target absorbing the spell's element is healed by
+    the unscaled damage and gets neither the healing nor the status effect.
+
+    Args:
+        spell: Spell cast (batch multipliers must be for its element)
+        caster: Caster stats (None = the spell's base damage)
+        batch: Targets
+        rng: Generator for status rolls
+
+    Returns:
+        The resolution (not yet written back)
+    """
+    n = len(batch)
+    has_health = batch.has_health
+    hp = batch.hp.copy()
+    damage = np.zeros(n, dtype=np.int64)
+    absorbed = np.zeros(n, dtype=bool)
+
+    if spell.damage > 0:
+        if caster is not None:
+            base = np.maximum(1, (caster.magic_attack + spell.power) - batch.magic_defense // 2)
+        else:
+            base = np.full(n, spell.damage, dtype=np.int64)
+        absorbed = has_health & batch.has_resistances & (batch.multiplier < 0)
+        scaled = np.where(batch.has_resistances, (base * batch.multiplier).astype(np.int64), base)
+        damage = np.where(absorbed, np.abs(base), scaled).astype(np.int64)
+        hit = has_health & ~absorbed
+        hp = np.where(hit, np.maximum(0.0, hp - damage), hp)
+        hp = np.where(absorbed, np.minimum(batch.max_hp, hp + damage), hp)
+
+    healing = np.zeros(n, dtype=np.float64)
+    if spell.healing > 0:
+        healed = has_health & ~absorbed
+        new_hp = np.where(healed, np.minimum(batch.max_hp, hp + spell.healing), hp)
+        healing = new_hp - hp
+        hp = new_hp
+
+    status = np.zeros(n, dtype=bool)
+    if spell.status_effect:
+        eligible = batch.has_stats & ~absorbed
+        status = eligible & (rng.random(n) * 100 < spell.status_chance)
+
+    return Resolution(
+        batch=batch,
+        affected=has_health | batch.has_stats,
+        damage=damage,
+        hp=hp,
+        critical=np.zeros(n, dtype=bool),
+        dodged=np.zeros(n, dtype=bool),
+        absorbed=absorbed,
+        healing=healing,
+        status=status,
+        status_effect=spell.status_effect,
+    )
@@ -311,6 +311,7 @@ class BattleState(Component):
     # Current action (if any)
     pending_action: Optional[str] = None
     pending_targets: List[str] = field(default_factory=list)  # Entity IDs
+    pending_spell: Optional[str] = None  # Spell ID for the magic command
 
     # Battle stats
     damage_dealt: int = 0
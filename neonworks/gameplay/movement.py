@@ -88,6 +88,11 @@ class Collider2D(Component):
     on_trigger_enter: Optional[Callable[["Entity"], None]] = None
     on_trigger_exit: Optional[Callable[["Entity"], None]] = None
 
+    @property
+    def blocks_movement(self) -> bool:
+        """Whether this collider occupies its tile (used by World.is_cell_blocked)"""
+        return self.is_solid and not self.is_trigger
+
 
 @dataclass
 class Interactable(Component):
@@ -253,6 +258,28 @@ class TileCollisionMap(Component):
             return True
         return self.collision_data[y][x]
 
+    def is_passable(
+        self,
+        world: "World",
+        x: int,
+        y: int,
+        layer: Optional[int] = None,
+        ignore_entity: Optional["Entity"] = None,
+    ) -> bool:
+        """
+        Check tile walkability and dynamic solid entities in one query.
+
+        Args:
+            world: World whose grid index holds the dynamic entities
+            x: Tile X coordinate
+            y: Tile Y coordinate
+            layer: Only consider entities on this layer (None = all layers)
+            ignore_entity: Entity to ignore (e.g. the one that is moving)
+        """
+        if not self.is_walkable(x, y):
+            return False
+        return not world.is_cell_blocked(x, y, layer, ignore_entity)
+
     def set_walkable(self, x: int, y: int, walkable: bool):
         """Set tile walkability"""
         if 0 <= x < self.width and 0 <= y < self.height:
@@ -281,4 +308,4 @@ class TileCollisionMap(Component):
 
 
 # Entity reference import (circular dependency workaround)
-from neonworks.core.ecs import Entity
+from neonworks.core.ecs import Entity, World
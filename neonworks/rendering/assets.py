@@ -12,6 +12,16 @@ from typing import Any, Dict, List, Optional, Tuple
 
 import pygame
 
+from neonworks.utils.memory_diagnostics import (
+    ASSET_CACHES,
+    THUMBNAILS,
+    CacheMemory,
+    register_memory_reporter,
+    sound_bytes,
+    surface_bytes,
+)
+from neonworks.utils.trace_recorder import trace_span
+
 
 @dataclass
 class SpriteSheet:
@@ -123,9 +133,6 @@ class AssetManager:
         self._sprite_sheets: Dict[str, SpriteSheet] = {}
         self._sounds: Dict[str, pygame.mixer.Sound] = {}
 
-        # Asset info (legacy)
-        self._asset_sizes: Dict[str, int] = {}  # Track memory usage
-
         # Asset library (new manifest-based system)
         self._manifest: Dict[str, Any] = {}
         self._asset_metadata: Dict[str, AssetMetadata] = {}  # id -> metadata
@@ -141,6 +148,9 @@ class AssetManager:
         # Load manifest if it exists
         self._load_manifest()
 
+        # Report cache sizes to memory diagnostics
+        register_memory_reporter(self)
+
     def _create_placeholders(self):
         """Create placeholder graphics for missing assets"""
         # Missing texture placeholder (subtle gray checkerboard with border)
@@ -228,10 +238,11 @@ class AssetManager:
 
         try:
             # Load the image
-            if alpha:
-                sprite = pygame.image.load(str(full_path)).convert_alpha()
-            else:
-                sprite = pygame.image.load(str(full_path)).convert()
+            with trace_span("load_sprite", "asset", {"path": path}):
+                if alpha:
+                    sprite = pygame.image.load(str(full_path)).convert_alpha()
+                else:
+                    sprite = pygame.image.load(str(full_path)).convert()
 
             # Apply color key if specified
             if color_key:
@@ -239,9 +250,6 @@ class AssetManager:
 
             # Cache the sprite
             self._sprites[cache_key] = sprite
-            self._asset_sizes[cache_key] = (
-                sprite.get_width() * sprite.get_height() * 4
-            )  # Rough size estimate
 
             print(f"✓ Loaded sprite: {path}")
             return sprite
@@ -252,7 +260,6 @@ class AssetManager:
             # Cache the placeholder to avoid repeated load attempts
             placeholder = self._missing_texture.copy()
             self._sprites[cache_key] = placeholder
-            self._asset_sizes[cache_key] = 32 * 32 * 4
             return placeholder
 
     def load_sprite_sheet(
@@ -283,7 +290,8 @@ class AssetManager:
 
         try:
             # Load the sheet
-            surface = pygame.image.load(str(full_path)).convert_alpha()
+            with trace_span("load_sprite_sheet", "asset", {"path": path}):
+                surface = pygame.image.load(str(full_path)).convert_alpha()
 
             # Apply color key if specified
             if color_key:
@@ -294,7 +302,6 @@ class AssetManager:
 
             # Cache it
             self._sprite_sheets[cache_key] = sheet
-            self._asset_sizes[cache_key] = surface.get_width() * surface.get_height() * 4
 
             print(f"✓ Loaded sprite sheet: {path} ({tile_width}x{tile_height})")
             return sheet
@@ -371,12 +378,50 @@ class AssetManager:
         self._sprites.clear()
         self._sprite_sheets.clear()
         self._sounds.clear()
-        self._asset_sizes.clear()
         print("Asset cache cleared")
 
     def get_memory_usage(self) -> int:
-        """Get approximate memory usage of cached assets in bytes"""
-        return sum(self._asset_sizes.values())
+        """Get the memory held by cached assets and thumbnails in bytes"""
+        return sum(cache.bytes for cache in self.report_memory())
+
+    def report_memory(self) -> List[CacheMemory]:
+        """
+        Report the exact pixel and sample bytes held by each cache.
+
+        Surfaces shared between caches (e.g. a tileset that is also a cached
+        sprite sheet, or a loaded asset's thumbnail) are counted once.
+
+        Returns:
+            Sizes of the sprite, sprite sheet, sound, loaded asset and thumbnail caches
+        """
+        seen = set()
+
+        def measure(subsystem: str, name: str, resources) -> CacheMemory:
+            cache = CacheMemory(subsystem, name, 0)
+            for resource in resources:
+                if isinstance(resource, SpriteSheet):
+                    resource = resource.surface
+                if id(resource) in seen:
+                    continue
+                seen.add(id(resource))
+                cache.entries += 1
+                if isinstance(resource, pygame.Surface):
+                    cache.bytes += surface_bytes(resource)
+                elif isinstance(resource, pygame.mixer.Sound):
+                    cache.bytes += sound_bytes(resource)
+            return cache
+
+        return [
+            measure(ASSET_CACHES, "sprites", self._sprites.values()),
+            measure(ASSET_CACHES, "sprite sheets", self._sprite_sheets.values()),
+            measure(ASSET_CACHES, "sounds", self._sounds.values()),
+            measure(
+                ASSET_CACHES,
+                "loaded assets",
+                (loaded.resource for loaded in self._loaded_assets.values()),
+            ),
+            measure(THUMBNAILS, "asset thumbnails", self._thumbnails.values()),
+        ]
 
     def get_cache_info(self) -> Dict[str, int]:
         """Get cache statistics"""
@@ -399,8 +444,6 @@ class AssetManager:
         to_remove = [key for key in self._sprites.keys() if path in key]
         for key in to_remove:
             del self._sprites[key]
-            if key in self._asset_sizes:
-                del self._asset_sizes[key]
 
     # ========== Asset Library (Manifest-Based) ==========
 
@@ -439,7 +482,8 @@ class AssetManager:
             return None
 
         # Load the asset based on category
-        resource = self._load_asset_by_category(metadata)
+        with trace_span("load_asset", "asset", {"asset_id": asset_id}):
+            resource = self._load_asset_by_category(metadata)
         if resource is None:
             return None
 
@@ -3,14 +3,19 @@ Autotile System for NeonWorks Engine
 
 Provides intelligent tile matching for creating seamless terrain transitions.
 Supports both 47-tile and 16-tile autotile formats with 8-neighbor checking.
+Region edits (fills, imports, generated terrain) are resolved in one pass:
+neighbor bitmasks for the whole rectangle come from shifted NumPy match masks
+and are mapped to tile IDs through a 256-entry lookup table.
 """
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
+import numpy as np
 import pygame
 
+from neonworks.core.tile_mask import flood_mask, mask_bounds
 from neonworks.data.map_layers import EnhancedTileLayer
 from neonworks.rendering.tilemap import Tilemap
 
@@ -32,6 +37,9 @@ NEIGHBOR_BOTTOM_LEFT = 1 << 5  # 32
 NEIGHBOR_LEFT = 1 << 6  # 64
 NEIGHBOR_TOP_LEFT = 1 << 7  # 128
 
+# (dx, dy) of each neighbor bit, in bit order
+NEIGHBOR_OFFSETS = [(0, -1), (1, -1), (1, 0), (1, 1), (0, 1), (-1, 1), (-1, 0), (-1, -1)]
+
 # Export diagonal neighbor constants
 __all__ = [
     "AutotileFormat",
@@ -39,6 +47,7 @@ __all__ = [
     "AutotileManager",
     "get_autotile_manager",
     "reset_autotile_manager",
+    "neighbor_bitmasks",
     "NEIGHBOR_TOP",
     "NEIGHBOR_TOP_RIGHT",
     "NEIGHBOR_RIGHT",
@@ -203,6 +212,15 @@ class AutotileSet:
         """Check if a tile ID belongs to this autotile set."""
         return tile_id in self.tile_ids
 
+    def bitmask_lut(self) -> np.ndarray:
+        """
+        Get the tile ID for every 8-neighbor bitmask as a lookup table.
+
+        Returns:
+            Int64 array of 256 tile IDs, indexed by bitmask
+        """
+        return np.array([self.get_tile_for_bitmask(bitmask) for bitmask in range(256)], np.int64)
+
 
 class AutotileManager:
     """
@@ -410,6 +428,93 @@ class AutotileManager:
                         # Update neighbor tile
                         self.update_tile(layer, nx, ny, neighbor_autotile)
 
+    def update_region(
+        self,
+        layer: EnhancedTileLayer,
+        x: int,
+        y: int,
+        width: int,
+        height: int,
+    ) -> int:
+        """
+        Update every autotile in a rectangle and its 1-tile border.
+
+        Equivalent to calling update_adjacent_tiles() for each cell of the
+        rectangle, but each bitmask is computed once for the whole region.
+
+        Args:
+            layer: Tile layer to update
+            x: Left tile of the edited rectangle
+            y: Top tile of the edited rectangle
+            width: Rectangle width in tiles
+            height: Rectangle height in tiles
+
+        Returns:
+            Number of tiles changed
+        """
+        # Tiles to update, and the tiles their bitmasks look at
+        x0, y0 = max(0, x - 1), max(0, y - 1)
+        x1, y1 = min(layer.width, x + width + 1), min(layer.height, y + height + 1)
+        if x0 >= x1 or y0 >= y1:
+            return 0
+        wx0, wy0 = max(0, x0 - 1), max(0, y0 - 1)
+        wx1, wy1 = min(layer.width, x1 + 1), min(layer.height, y1 + 1)
+
+        window = np.array([row[wx0:wx1] for row in layer.tiles[wy0:wy1]], dtype=np.int64)
+        inner = (slice(y0 - wy0, y1 - wy0), slice(x0 - wx0, x1 - wx0))
+        current = window[inner]
+
+        # Group the autotile IDs present in the region by autotile set
+        owned: Dict[str, List[int]] = {}
+        for tile_id in np.unique(current).tolist():
+            name = self.tile_to_autotile.get(tile_id) if tile_id else None
+            if name in self.autotile_sets:
+                owned.setdefault(name, []).append(tile_id)
+
+        resolved = current.copy()
+        for name, tile_ids in owned.items():
+            autotile_set = self.autotile_sets[name]
+            matching = list(autotile_set.tile_ids | autotile_set.match_tile_ids)
+            match = np.isin(window, matching) & (window != 0)
+            bitmasks = neighbor_bitmasks(match)[inner]
+            cells = np.isin(current, tile_ids)
+            resolved[cells] = autotile_set.bitmask_lut()[bitmasks[cells]]
+
+        # Write back only the rows that changed
+        changed = resolved != current
+        for row in np.flatnonzero(changed.any(axis=1)).tolist():
+            layer.tiles[y0 + row][x0:x1] = resolved[row].tolist()
+        return int(np.count_nonzero(changed))
+
+    def paint_cells(
+        self,
+        layer: EnhancedTileLayer,
+        cells: Iterable[Tuple[int, int]],
+        autotile_set: AutotileSet,
+    ) -> int:
+        """
+        Paint an autotile on many cells and update them in one region pass.
+
+        Args:
+            layer: Tile layer to paint on
+            cells: (x, y) cells to paint (cells outside the layer are ignored)
+            autotile_set: Autotile set to paint with
+
+        Returns:
+            Number of cells painted
+        """
+        painted = [(x, y) for x, y in cells if 0 <= x < layer.width and 0 <= y < layer.height]
+        if not painted:
+            return 0
+
+        for x, y in painted:
+            layer.tiles[y][x] = autotile_set.base_tile_id
+        xs = [x for x, _ in painted]
+        ys = [y for _, y in painted]
+        min_x, min_y = min(xs), min(ys)
+        self.update_region(layer, min_x, min_y, max(xs) - min_x + 1, max(ys) - min_y + 1)
+        return len(painted)
+
     def paint_autotile(
         self,
         layer: EnhancedTileLayer,
@@ -520,44 +625,43 @@ class AutotileManager:
             start_y: Starting Y coordinate
             autotile_set: Autotile set to fill with
         """
-        # Get the tile to replace
-        start_tile_id = layer.get_tile(start_x, start_y)
-        if start_tile_id is None:
+        if not (0 <= start_x < layer.width and 0 <= start_y < layer.height):
             return
 
-        target_tile_id = start_tile_id
-
         # Don't fill if already this autotile
+        target_tile_id = layer.tiles[start_y][start_x]
         if autotile_set.contains_tile(target_tile_id):
             return
 
-        # Flood fill algorithm
-        filled_positions = set()
-        queue = [(start_x, start_y)]
+        tiles = np.array(layer.tiles, dtype=np.int64)
+        region = flood_mask(tiles == target_tile_id, start_x, start_y)
+        min_x, min_y, max_x, max_y = mask_bounds(region)
 
-        while queue:
-            x, y = queue.pop(0)
+        # Fill the region, then resolve it and its border in one pass
+        tiles[region] = autotile_set.base_tile_id
+        for y in range(min_y, max_y + 1):
+            layer.tiles[y][min_x : max_x + 1] = tiles[y, min_x : max_x + 1].tolist()
+        self.update_region(layer, min_x, min_y, max_x - min_x + 1, max_y - min_y + 1)
 
-            if (x, y) in filled_positions:
-                continue
 
-            if not (0 <= x < layer.width and 0 <= y < layer.height):
-                continue
-
-            tile_id = layer.get_tile(x, y)
-            if tile_id is None or tile_id != target_tile_id:
-                continue
-
-            # Fill this position
-            layer.set_tile(x, y, autotile_set.base_tile_id)
-            filled_positions.add((x, y))
+def neighbor_bitmasks(match: np.ndarray) -> np.ndarray:
+    """
+    Compute the 8-neighbor bitmask of every cell of a match mask.
 
-            # Add neighbors to queue
-            queue.extend([(x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)])
+    Args:
+        match: Boolean array of shape (height, width), True where a tile connects;
+            cells outside the array never connect
 
-        # Update all filled tiles and their neighbors
-        for x, y in filled_positions:
-            self.update_adjacent_tiles(layer, x, y)
+    Returns:
+        Uint8 array of shape (height, width) with NEIGHBOR_* bits set
+    """
+    height, width = match.shape
+    padded = np.pad(match, 1)
+    bitmasks = np.zeros((height, width), dtype=np.uint8)
+    for bit, (dx, dy) in enumerate(NEIGHBOR_OFFSETS):
+        neighbor = padded[1 + dy : 1 + dy + height, 1 + dx : 1 + dx + width]
+        bitmasks |= neighbor.astype(np.uint8) << np.uint8(bit)
+    return bitmasks
 
 
 # Global autotile manager instance
@@ -11,6 +11,7 @@ import pygame
 from neonworks.core.ecs import Entity, GridPosition, Sprite, System, Transform, World
 from neonworks.rendering.assets import AssetManager, get_asset_manager
 from neonworks.rendering.camera import Camera
+from neonworks.utils.trace_recorder import traced
 
 
 class Color:
@@ -72,6 +73,7 @@ class Renderer:
         """Clear the screen"""
         self.screen.fill(color)
 
+    @traced("render_world", "render")
     def render_world(self, world: World):
         """Render all entities in the world"""
         # Get all entities with sprite components
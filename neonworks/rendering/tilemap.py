@@ -6,8 +6,10 @@ Grid-based level rendering with multiple enhanced layers, tilesets, and efficien
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, List, Optional, Set, Tuple
+from itertools import repeat
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
 
+import numpy as np
 import pygame
 
 from neonworks.core.ecs import Component
@@ -20,6 +22,16 @@ from neonworks.data.map_layers import (
 )
 from neonworks.rendering.assets import AssetManager
 from neonworks.rendering.camera import Camera
+from neonworks.utils.memory_diagnostics import (
+    CHUNK_CACHE,
+    CacheMemory,
+    register_memory_reporter,
+    surface_bytes,
+)
+from neonworks.utils.trace_recorder import traced
+
+# Distinct fill tiles kept per layer before unused ones are dropped
+MAX_FILL_PALETTE = 1024
 
 
 @dataclass
@@ -95,6 +107,21 @@ class Tileset:
             self.tiles[tile_id] = tile_surface
 
 
+@dataclass
+class MaskedTileMetadata:
+    """Tile metadata of the cells of a mask, read with Tilemap.read_masked()"""
+
+    # Tiles placed with set_tile(), by (x, y)
+    tiles: Dict[Tuple[int, int], Tile] = field(default_factory=dict)
+    # Filled tiles: palette index per set mask cell in row-major order (0 = none)
+    codes: Optional[np.ndarray] = None
+    palette: List[Optional[Tile]] = field(default_factory=lambda: [None])
+
+    def __len__(self) -> int:
+        """Number of cells holding a Tile"""
+        filled = int(np.count_nonzero(self.codes)) if self.codes is not None else 0
+        return len(self.tiles) + filled
+
 
 class Tilemap(Component):
     """
@@ -128,6 +155,10 @@ class Tilemap(Component):
         self.tile_width = tile_width or 32
         self.tile_height = tile_height or 32
         self._tile_metadata: Dict[Tuple[str, int, int], Tile] = {}
+        # Tiles placed by masked fills: per layer, a palette index per cell
+        # (0 = none) and the palette, so a fill costs one entry, not one per cell
+        self._fill_index: Dict[str, np.ndarray] = {}
+        self._fill_tiles: Dict[str, List[Optional[Tile]]] = {}
 
         # Enhanced layer system only (legacy layer mode removed)
         self.use_enhanced_layers = True
@@ -181,6 +212,12 @@ class Tilemap(Component):
         if meta_tile is not None:
             return meta_tile
 
+        index = self._fill_index.get(layer_id)
+        if index is not None and 0 <= x < self.width and 0 <= y < self.height:
+            fill_tile = self._fill_tiles[layer_id][index[y, x]]
+            if fill_tile is not None:
+                return fill_tile
+
         tile_id = enhanced_layer.get_tile(x, y)
         if tile_id == 0:
             return None
@@ -201,6 +238,10 @@ class Tilemap(Component):
         if not enhanced_layer or layer_id is None:
             return
 
+        index = self._fill_index.get(layer_id)
+        if index is not None and 0 <= x < self.width and 0 <= y < self.height:
+            index[y, x] = 0
+
         if tile is None:
             enhanced_layer.set_tile(x, y, 0)
             self._tile_metadata.pop((layer_id, x, y), None)
@@ -210,6 +251,377 @@ class Tilemap(Component):
             self._tile_metadata[(layer_id, x, y)] = tile
 
         self._render_cache_dirty = True
+        self.notify_changed(layer, x, y, 1, 1)
+
+    def get_layer_tiles(self, layer: int) -> Optional[List[List[int]]]:
+        """
+        Get the tile ID rows of a layer.
+
+        The rows are the layer's live storage; copy them to keep a snapshot.
+
+        Args:
+            layer: Layer index
+        """
+        enhanced_layer, _ = self._get_layer_by_index(layer)
+        if not enhanced_layer:
+            return None
+        return enhanced_layer.tiles
+
+    def get_tile_metadata(
+        self, layer: int, x: int, y: int, width: int, height: int
+    ) -> Dict[Tuple[int, int], Tile]:
+        """
+        Get the Tile objects stored by set_tile() and masked fills inside a
+        rectangle of a layer.
+
+        Cells without metadata hold plain tile IDs in the layer rows. Large
+        filled rectangles are cheaper to read with get_tile_metadata_grid().
+
+        Args:
+            layer: Layer index
+            x: Left tile X
+            y: Top tile Y
+            width: Width in tiles
+            height: Height in tiles
+
+        Returns:
+            Dict of (x, y) -> Tile
+        """
+        _, layer_id = self._get_layer_by_index(layer)
+        if layer_id is None:
+            return {}
+
+        result = {}
+        index = self._fill_index.get(layer_id)
+        if index is not None:
+            x0, y0 = max(x, 0), max(y, 0)
+            codes = index[y0 : y + height, x0 : x + width]
+            palette = self._fill_tiles[layer_id]
+            ys, xs = np.nonzero(codes)
+            cells = zip((xs + x0).tolist(), (ys + y0).tolist(), codes[ys, xs].tolist())
+            for cx, cy, code in cells:
+                result[(cx, cy)] = palette[code]
+
+        result.update(self._placed_tiles(layer_id, x, y, width, height))
+        return result
+
+    def get_tile_metadata_grid(
+        self, layer: int, x: int, y: int, width: int, height: int
+    ) -> Tuple[np.ndarray, List[Optional[Tile]]]:
+        """
+        Get the Tile objects inside a rectangle of a layer as palette indices.
+
+        Args:
+            layer: Layer index
+            x: Left tile X
+            y: Top tile Y
+            width: Width in tiles (the rectangle must lie inside the map)
+            height: Height in tiles
+
+        Returns:
+            Tuple of (palette index per cell of shape (height, width), palette);
+            palette index 0 is None and marks cells without metadata
+        """
+        codes = np.zeros((height, width), dtype=np.int32)
+        _, layer_id = self._get_layer_by_index(layer)
+        if layer_id is None:
+            return codes, [None]
+
+        palette: List[Optional[Tile]] = [None]
+        index = self._fill_index.get(layer_id)
+        if index is not None:
+            codes[:] = index[y : y + height, x : x + width]
+            palette = list(self._fill_tiles[layer_id])
+
+        for (cx, cy), tile in self._placed_tiles(layer_id, x, y, width, height).items():
+            codes[cy - y, cx - x] = len(palette)
+            palette.append(tile)
+        return codes, palette
+
+    def tile_type_mask(self, layer: int, tile_type: Optional[str]) -> np.ndarray:
+        """
+        Get the cells of a layer whose tile has a legacy tile type.
+
+        Cells without a Tile from set_tile() count as having no type.
+
+        Args:
+            layer: Layer index
+            tile_type: Tile type to match (None = untyped and empty cells)
+
+        Returns:
+            Boolean array of shape (height, width)
+        """
+        mask = np.full((self.height, self.width), tile_type is None, dtype=bool)
+        _, layer_id = self._get_layer_by_index(layer)
+        if layer_id is None:
+            return mask
+
+        index = self._fill_index.get(layer_id)
+        if index is not None:
+            matches = [tile_type is None] + [
+                tile.tile_type == tile_type for tile in self._fill_tiles[layer_id][1:]
+            ]
+            mask = np.array(matches, dtype=bool)[index]
+
+        xs, ys, matches = [], [], []
+        for (tile_layer, cx, cy), tile in self._tile_metadata.items():
+            if tile_layer == layer_id:
+                xs.append(cx)
+                ys.append(cy)
+                matches.append(tile.tile_type == tile_type)
+        if xs:
+            mask[ys, xs] = matches
+        return mask
+
+    def read_masked(
+        self, layer: int, mask: np.ndarray, x: int = 0, y: int = 0
+    ) -> Tuple[np.ndarray, MaskedTileMetadata]:
+        """
+        Read the tile IDs and Tile metadata of the cells of a mask.
+
+        Filled tiles are returned as palette indices and the tile IDs in the
+        smallest integer type that holds them, so reading a large fill costs a
+        few small arrays rather than an entry per cell.
+
+        Args:
+            layer: Layer index
+            mask: Boolean array placed with its top-left cell at (x, y), inside the map
+            x: Tile X of the mask's left edge
+            y: Tile Y of the mask's top edge
+
+        Returns:
+            Tuple of (tile IDs of the set cells in row-major order, their metadata)
+        """
+        height, width = mask.shape
+        rows = self.get_layer_tiles(layer)
+        if rows is None:
+            return np.zeros(int(np.count_nonzero(mask)), dtype=np.int64), MaskedTileMetadata()
+
+        grid = np.array([row[x : x + width] for row in rows[y : y + height]], dtype=np.int64)
+        _, layer_id = self._get_layer_by_index(layer)
+        metadata = MaskedTileMetadata()
+        get = self._tile_metadata.get
+        for key in self._masked_metadata_keys(layer_id, mask, x, y):
+            tile = get(key)
+            if tile is not None:
+                metadata.tiles[key[1:]] = tile
+
+        index = self._fill_index.get(layer_id)
+        if index is not None:
+            codes = index[y : y + height, x : x + width][mask]
+            if codes.any():
+                # Keep only the palette entries used inside the mask
+                palette = self._fill_tiles[layer_id]
+                used = np.flatnonzero(np.bincount(codes, minlength=len(palette)))
+                if used[0] != 0:
+                    used = np.concatenate(([0], used))
+                remap = np.zeros(len(palette), dtype=np.min_scalar_type(len(used) - 1))
+                remap[used] = np.arange(len(used))
+                metadata.codes = remap[codes]
+                metadata.palette = [palette[code] for code in used.tolist()]
+
+        # Store the old IDs in the smallest type that holds them
+        tile_ids = grid.reshape(height, width)[mask]
+        if tile_ids.size:
+            dtype = np.promote_types(
+                np.min_scalar_type(tile_ids.min()), np.min_scalar_type(tile_ids.max())
+            )
+            tile_ids = tile_ids.astype(dtype)
+        return tile_ids, metadata
+
+    def fill_masked(
+        self, layer: int, mask: np.ndarray, tile: Optional[Tile], x: int = 0, y: int = 0
+    ):
+        """
+        Set every cell of a mask to one tile, like set_tile() on each cell.
+
+        The Tile object is shared by all the cells. Creates the layer if missing.
+
+        Args:
+            layer: Layer index
+            mask: Boolean array placed with its top-left cell at (x, y), inside the map
+            tile: Tile to place (None clears)
+            x: Tile X of the mask's left edge
+            y: Tile Y of the mask's top edge
+        """
+        tile_id = (getattr(tile, "tile_id", 0) or 0) if tile is not None else 0
+        layer_id = self._write_masked(layer, mask, tile_id, x, y)
+        if layer_id is None:
+            return
+
+        if tile is not None:
+            code = self._add_fill_tiles(layer_id, [tile])[0]
+            index = self._fill_index[layer_id]
+            index[y : y + mask.shape[0], x : x + mask.shape[1]][mask] = code
+        self.notify_changed(layer, x, y, mask.shape[1], mask.shape[0])
+
+    def restore_masked(
+        self,
+        layer: int,
+        mask: np.ndarray,
+        tile_ids: np.ndarray,
+        metadata: MaskedTileMetadata,
+        x: int = 0,
+        y: int = 0,
+    ):
+        """
+        Write back tile IDs and metadata read with read_masked().
+
+        Args:
+            layer: Layer index
+            mask: Boolean array placed with its top-left cell at (x, y), inside the map
+            tile_ids: Tile IDs of the set cells in row-major order
+            metadata: Metadata of the set cells
+            x: Tile X of the mask's left edge
+            y: Tile Y of the mask's top edge
+        """
+        layer_id = self._write_masked(layer, mask, tile_ids, x, y)
+        if layer_id is None:
+            return
+
+        self._tile_metadata.update(
+            ((layer_id, cx, cy), tile) for (cx, cy), tile in metadata.tiles.items()
+        )
+        if metadata.codes is not None:
+            codes = self._add_fill_tiles(layer_id, metadata.palette)
+            index = self._fill_index[layer_id]
+            index[y : y + mask.shape[0], x : x + mask.shape[1]][mask] = codes[metadata.codes]
+        self.notify_changed(layer, x, y, mask.shape[1], mask.shape[0])
+
+    def _write_masked(
+        self, layer: int, mask: np.ndarray, tile_ids, x: int, y: int
+    ) -> Optional[str]:
+        """Write tile IDs to the cells of a mask and drop their metadata; returns the layer ID."""
+        enhanced_layer, layer_id = self._get_layer_by_index(layer, create=True)
+        if not enhanced_layer or layer_id is None:
+            return None
+
+        height, width = mask.shape
+        rows = enhanced_layer.tiles
+        grid = np.array([row[x : x + width] for row in rows[y : y + height]], dtype=np.int64)
+        grid = grid.reshape(height, width)
+        grid[mask] = tile_ids
+        for dy in np.flatnonzero(mask.any(axis=1)).tolist():
+            rows[y + dy][x : x + width] = grid[dy].tolist()
+
+        pop = self._tile_metadata.pop
+        for key in self._masked_metadata_keys(layer_id, mask, x, y):
+            pop(key, None)
+        index = self._fill_index.get(layer_id)
+        if index is not None:
+            index[y : y + height, x : x + width][mask] = 0
+
+        self._render_cache_dirty = True
+        return layer_id
+
+    def _masked_metadata_keys(
+        self, layer_id: Optional[str], mask: np.ndarray, x: int, y: int
+    ) -> Iterable[Tuple[str, int, int]]:
+        """Get metadata keys covering the cells of a mask that hold a Tile (may include others)."""
+        metadata = self._tile_metadata
+        if not metadata or layer_id is None:
+            return ()
+
+        height, width = mask.shape
+        ys, xs = np.nonzero(mask)
+        if len(xs) <= len(metadata):
+            # Every masked cell
+            return zip(repeat(layer_id), (xs + x).tolist(), (ys + y).tolist())
+
+        # Walk the stored tiles instead
+        return [
+            key
+            for key in metadata
+            if key[0] == layer_id
+            and x <= key[1] < x + width
+            and y <= key[2] < y + height
+            and mask[key[2] - y, key[1] - x]
+        ]
+
+    def _placed_tiles(
+        self, layer_id: str, x: int, y: int, width: int, height: int
+    ) -> Dict[Tuple[int, int], Tile]:
+        """Get the Tiles stored by set_tile() inside a rectangle of a layer."""
+        metadata = self._tile_metadata
+        if width * height <= len(metadata):
+            result = {}
+            for cy in range(y, y + height):
+                for cx in range(x, x + width):
+                    tile = metadata.get((layer_id, cx, cy))
+                    if tile is not None:
+                        result[(cx, cy)] = tile
+            return result
+
+        return {
+            (cx, cy): tile
+            for (tile_layer, cx, cy), tile in metadata.items()
+            if tile_layer == layer_id and x <= cx < x + width and y <= cy < y + height
+        }
+
+    def _add_fill_tiles(self, layer_id: str, tiles: List[Optional[Tile]]) -> np.ndarray:
+        """Add Tiles to a layer's fill palette; returns their palette indices (None -> 0)."""
+        palette = self._fill_tiles.get(layer_id)
+        if palette is None:
+            palette = self._fill_tiles[layer_id] = [None]
+            self._fill_index[layer_id] = np.zeros((self.height, self.width), dtype=np.int32)
+        elif len(palette) + len(tiles) > MAX_FILL_PALETTE:
+            self._compact_fill_tiles(layer_id)
+
+        # Tiles are matched by identity, as one fill shares its Tile object
+        positions = {id(tile): code for code, tile in enumerate(palette)}
+        codes = np.zeros(len(tiles), dtype=np.int32)
+        for i, tile in enumerate(tiles):
+            if tile is None:
+                continue
+            code = positions.get(id(tile))
+            if code is None:
+                code = positions[id(tile)] = len(palette)
+                palette.append(tile)
+            codes[i] = code
+        return codes
+
+    def _compact_fill_tiles(self, layer_id: str):
+        """Drop the fill palette entries of a layer that no cell uses anymore."""
+        palette = self._fill_tiles[layer_id]
+        index = self._fill_index[layer_id]
+        used = np.flatnonzero(np.bincount(index.ravel(), minlength=len(palette)))
+        if not used.size or used[0] != 0:
+            used = np.concatenate(([0], used))
+        remap = np.zeros(len(palette), dtype=np.int32)
+        remap[used] = np.arange(len(used))
+        np.take(remap, index, out=index)
+        palette[:] = [palette[code] for code in used.tolist()]
+
+    def add_change_listener(self, listener: Callable[[int, int, int, int, int], None]):
+        """
+        Register a callback receiving (layer, x, y, width, height) when tiles change.
+
+        set_tile() and the masked fill methods report their edits; code writing to
+        layer rows directly should call notify_changed() itself.
+        """
+        listeners = self.__dict__.setdefault("_change_listeners", [])
+        if listener not in listeners:
+            listeners.append(listener)
+
+    def remove_change_listener(self, listener: Callable[[int, int, int, int, int], None]):
+        """Unregister a change callback"""
+        listeners = self.__dict__.get("_change_listeners", [])
+        if listener in listeners:
+            listeners.remove(listener)
+
+    def notify_changed(self, layer: int, x: int, y: int, width: int, height: int):
+        """
+        Notify listeners that tiles inside a rectangle changed.
+
+        Args:
+            layer: Layer index
+            x: Left tile X
+            y: Top tile Y
+            width: Width in tiles
+            height: Height in tiles
+        """
+        for listener in list(self.__dict__.get("_change_listeners", ())):
+            listener(layer, x, y, width, height)
 
     # ===================================================================
     # Enhanced Layer System API (NEW)
@@ -303,6 +715,8 @@ class Tilemap(Component):
         """
         result = self.layer_manager.remove_layer(layer_id)
         if result:
+            self._fill_index.pop(layer_id, None)
+            self._fill_tiles.pop(layer_id, None)
             self._render_cache_dirty = True
         return result
 
@@ -427,6 +841,7 @@ class TilemapRenderer:
         self.asset_manager = asset_manager
         self._stats = {"tiles_rendered": 0, "tiles_culled": 0, "layers_rendered": 0}
 
+    @traced("render_tilemap", "render")
     def render(self, screen: pygame.Surface, tilemap: Tilemap, camera: Camera):
         """
         Render a tilemap to the screen.
@@ -620,6 +1035,9 @@ class OptimizedTilemapRenderer(TilemapRenderer):
             }
         )
 
+        # Report cache sizes to memory diagnostics
+        register_memory_reporter(self)
+
     def invalidate_chunk(self, layer_id: str, chunk_x: int, chunk_y: int):
         """
         Mark a chunk as dirty (needs re-rendering).
@@ -668,6 +1086,24 @@ class OptimizedTilemapRenderer(TilemapRenderer):
         self._dirty_chunks.clear()
         self._atlas_cache.clear()
 
+    def report_memory(self) -> List[CacheMemory]:
+        """Report the pixel bytes held by the chunk and atlas caches."""
+        return [
+            CacheMemory(
+                CHUNK_CACHE,
+                "chunks",
+                sum(map(surface_bytes, self._chunk_cache.values())),
+                len(self._chunk_cache),
+            ),
+            CacheMemory(
+                CHUNK_CACHE,
+                "tileset atlases",
+                sum(map(surface_bytes, self._atlas_cache.values())),
+                len(self._atlas_cache),
+            ),
+        ]
+
+    @traced("render_tilemap", "render")
     def render(self, screen: pygame.Surface, tilemap: Tilemap, camera: Camera):
         """
         Render tilemap with optimizations.
@@ -967,6 +1403,7 @@ class OptimizedTilemapRenderer(TilemapRenderer):
 
         return chunk_surface
 
+
 class TilemapBuilder:
     """Helper class for building tilemaps"""
 
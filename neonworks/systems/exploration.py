@@ -51,6 +51,9 @@ class ExplorationSystem(System):
         # Step counter for random encounters
         self.step_count = 0
 
+        # Optional level-of-detail scheduler for off-screen NPCs
+        self.lod_system = None
+
     def update(self, world: World, delta_time: float):
         """Update exploration system"""
         # Update player movement
@@ -147,8 +150,12 @@ class ExplorationSystem(System):
             if not movement.is_moving:
                 continue
 
+            entity_delta = self._get_entity_delta(entity, delta_time)
+            if entity_delta is None:
+                continue
+
             # Update move progress
-            movement.move_progress += delta_time * movement.speed
+            movement.move_progress += entity_delta * movement.speed
 
             if movement.move_progress >= 1.0:
                 # Movement complete
@@ -194,8 +201,12 @@ class ExplorationSystem(System):
         for entity in entities:
             anim_state = entity.get_component(AnimationState)
 
+            entity_delta = self._get_entity_delta(entity, delta_time)
+            if entity_delta is None:
+                continue
+
             # Update frame timer
-            anim_state.frame_timer += delta_time
+            anim_state.frame_timer += entity_delta
 
             # Advance frame if enough time has passed
             if anim_state.frame_timer >= anim_state.frame_duration:
@@ -218,12 +229,16 @@ class ExplorationSystem(System):
             if movement.is_moving:
                 continue
 
+            npc_delta = self._get_entity_delta(npc, delta_time)
+            if npc_delta is None:
+                continue  # Off-screen NPC not scheduled this update
+
             # Handle different behavior types
             if behavior.behavior_type == "static":
                 continue  # Static NPCs don't move
 
             elif behavior.behavior_type == "wander":
-                self._update_wander_behavior(npc, behavior, grid_pos, movement, delta_time, world)
+                self._update_wander_behavior(npc, behavior, grid_pos, movement, npc_delta, world)
 
             elif behavior.behavior_type == "patrol":
                 self._update_patrol_behavior(npc, behavior, grid_pos, movement, world)
@@ -336,35 +351,30 @@ class ExplorationSystem(System):
         interact_y = player_grid.grid_y + dy
 
         # Find interactable entities at that position
-        interactables = world.get_entities_with_components(Interactable, GridPosition)
-
-        for entity in interactables:
+        for entity in world.entities_at(interact_x, interact_y):
             interactable = entity.get_component(Interactable)
-            grid_pos = entity.get_component(GridPosition)
 
-            if not interactable.can_interact:
+            if not interactable or not interactable.can_interact:
                 continue
 
-            # Check if at interact position
-            if grid_pos.grid_x == interact_x and grid_pos.grid_y == interact_y:
-                # Trigger interaction
-                if interactable.on_interact:
-                    interactable.on_interact(self.player_entity)
-
-                # Emit interaction event
-                self.event_manager.emit(
-                    Event(
-                        EventType.CUSTOM,
-                        {
-                            "type": "interaction",
-                            "player_id": self.player_entity.id,
-                            "target_id": entity.id,
-                            "interaction_type": interactable.interaction_type,
-                            "dialogue_id": interactable.dialogue_id,
-                        },
-                    )
+            # Trigger interaction
+            if interactable.on_interact:
+                interactable.on_interact(self.player_entity)
+
+            # Emit interaction event
+            self.event_manager.emit(
+                Event(
+                    EventType.CUSTOM,
+                    {
+                        "type": "interaction",
+                        "player_id": self.player_entity.id,
+                        "target_id": entity.id,
+                        "interaction_type": interactable.interaction_type,
+                        "dialogue_id": interactable.dialogue_id,
+                    },
                 )
-                return
+            )
+            return
 
     def _get_movement_direction(self) -> Optional[Direction]:
         """Get movement direction from input"""
@@ -380,21 +390,25 @@ class ExplorationSystem(System):
 
     def _is_tile_walkable(self, world: World, x: int, y: int) -> bool:
         """Check if tile is walkable"""
-        # Check collision map
-        if self.collision_map and not self.collision_map.is_walkable(x, y):
-            return False
-
-        # Check for solid entities at position
-        entities = world.get_entities_with_components(GridPosition, Collider2D)
-        for entity in entities:
-            grid_pos = entity.get_component(GridPosition)
-            collider = entity.get_component(Collider2D)
-
-            if grid_pos.grid_x == x and grid_pos.grid_y == y:
-                if collider.is_solid and not collider.is_trigger:
-                    return False
-
-        return True
+        # Collision map and solid entities in a single grid-index lookup
+        if self.collision_map:
+            return self.collision_map.is_passable(world, x, y)
+
+        return not world.is_cell_blocked(x, y)
+
+    def _get_entity_delta(self, entity: Entity, delta_time: float) -> Optional[float]:
+        """Get the LOD-scheduled delta for an entity (None = skip this update)"""
+        if self.lod_system is None:
+            return delta_time
+        return self.lod_system.get_delta(entity)
+
+    def set_lod_system(self, lod_system):
+        """Schedule off-screen NPC updates through a LODSystem"""
+        if self.lod_system is not None:
+            self.lod_system.remove_catchup_handler(self._catch_up_entity)
+        self.lod_system = lod_system
+        if lod_system is not None:
+            lod_system.add_catchup_handler(self._catch_up_entity)
 
     def set_collision_map(self, collision_map: TileCollisionMap):
         """Set the collision map for the current zone"""
@@ -403,3 +417,20 @@ class ExplorationSystem(System):
     def reset_step_counter(self):
         """Reset step counter (e.g., when entering safe zone)"""
         self.step_count = 0
+
+    def _catch_up_entity(self, entity: Entity, elapsed: float):
+        """Advance animation and movement over time a fast-forwarded entity spent away"""
+        anim_state = entity.get_component(AnimationState)
+        if anim_state is not None and anim_state.frame_duration > 0:
+            anim_state.frame_timer += elapsed
+            steps = int(anim_state.frame_timer // anim_state.frame_duration)
+            anim_state.frame_timer -= steps * anim_state.frame_duration
+
+            frames = anim_state.get_current_frames()
+            if frames:
+                anim_state.frame_index = (anim_state.frame_index + steps) % len(frames)
+
+        # An in-progress move completes on the next interpolation update
+        movement = entity.get_component(Movement)
+        if movement is not None and movement.is_moving:
+            movement.move_progress = min(movement.move_progress + elapsed * movement.speed, 1.0)
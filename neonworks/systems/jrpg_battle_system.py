@@ -8,11 +8,13 @@ import random
 from enum import Enum
 from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 import pygame
 
 from neonworks.core.ecs import Entity, System, World
 from neonworks.core.events import Event, EventManager, EventType
 from neonworks.gameplay.combat import Health, Team
+from neonworks.gameplay.combat_resolution import TargetBatch, resolve_attack
 from neonworks.gameplay.jrpg_combat import (
     BattleAI,
     BattleCommand,
@@ -27,6 +29,7 @@ from neonworks.gameplay.jrpg_combat import (
     SpellList,
     TargetType,
 )
+from neonworks.systems.magic_system import MagicSystem
 
 
 class BattlePhase(Enum):
@@ -55,11 +58,24 @@ class JRPGBattleSystem(System):
     - Victory rewards (XP, gold, items)
     """
 
-    def __init__(self, event_manager: EventManager):
+    def __init__(
+        self,
+        event_manager: EventManager,
+        magic_system: Optional[MagicSystem] = None,
+        seed: Optional[int] = None,
+    ):
         super().__init__()
         self.priority = 30
         self.event_manager = event_manager
 
+        # Casts the spells chosen with the MAGIC command
+        self.magic_system = magic_system
+
+        # Critical/dodge rolls (seed for reproducible battles); rates of 0 disable them
+        self.rng = np.random.default_rng(seed)
+        self.critical_rate = 0.0
+        self.dodge_rate = 0.0
+
         # Battle state
         self.in_battle = False
         self.battle_phase = BattlePhase.INTRO
@@ -214,9 +230,7 @@ class JRPGBattleSystem(System):
         battle_state.pending_targets = [t.id for t in targets]
 
         # Store additional data (spell_id, item_id, etc.)
-        if data:
-            # Would store in battle state or temporary storage
-            pass
+        battle_state.pending_spell = data.get("spell_id") if data else None
 
         # Mark as acted
         battle_state.has_acted = True
@@ -355,53 +369,46 @@ class JRPGBattleSystem(System):
 
         # Clear pending action
         battle_state.pending_action = None
+        battle_state.pending_spell = None
         battle_state.pending_targets.clear()
 
     def _execute_attack(self, attacker: Entity, targets: List[Entity]):
-        """Execute physical attack"""
-        attacker_stats = attacker.get_component(JRPGStats)
-
-        for target in targets:
-            target_health = target.get_component(Health)
-            target_stats = target.get_component(JRPGStats)
-            target_battle_state = target.get_component(BattleState)
-
-            if not target_health or not target_health.is_alive:
-                continue
-
-            # Calculate damage
-            damage = 10  # Base damage
-            if attacker_stats and target_stats:
-                damage = attacker_stats.calculate_physical_damage(target_stats)
-
-            # Apply defense modifier if defending
-            if target_battle_state and target_battle_state.is_defending:
-                damage = int(damage * 0.5)
+        """Execute physical attack on all targets in one batch"""
+        if not targets:
+            return
 
-            # Apply damage
-            target_health.hp -= damage
-            if target_health.hp <= 0:
-                target_health.hp = 0
-                target_health.is_alive = False
+        batch = TargetBatch.from_entities(targets)
+        result = resolve_attack(
+            attacker.get_component(JRPGStats),
+            batch,
+            self.rng,
+            critical_rate=self.critical_rate,
+            dodge_rate=self.dodge_rate,
+        )
+        result.write_back()
 
-            # Emit damage event
+        # Emit damage events
+        for i in np.flatnonzero(result.affected).tolist():
             self.event_manager.emit(
                 Event(
                     EventType.CUSTOM,
                     {
                         "type": "battle_damage",
                         "attacker_id": attacker.id,
-                        "target_id": target.id,
-                        "damage": damage,
-                        "is_critical": False,
+                        "target_id": targets[i].id,
+                        "damage": int(result.damage[i]),
+                        "is_critical": bool(result.critical[i]),
+                        "is_dodged": bool(result.dodged[i]),
                     },
                 )
             )
 
     def _execute_magic(self, world: World, caster: Entity, targets: List[Entity]):
         """Execute magic spell"""
-        # Would integrate with MagicSystem here
-        pass
+        battle_state = caster.get_component(BattleState)
+        spell_id = battle_state.pending_spell if battle_state else None
+        if self.magic_system and spell_id:
+            self.magic_system.cast_spell(world, caster, spell_id, targets)
 
     def _attempt_escape(self, world: World, escaper: Entity) -> bool:
         """Attempt to escape from battle"""
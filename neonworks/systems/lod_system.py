@@ -0,0 +1,356 @@
+"""
+Simulation Level-of-Detail System
+
+Schedules how often off-screen entities are simulated. Entities inside the
+camera view (plus a margin) tick every fixed update, entities further away
+tick at a reduced frequency with the skipped time aggregated into one delta,
+and far entities are frozen or fast-forwarded when they come back into range.
+Entities of unloaded zones are serialized into a compressed dormant blob
+outside the World so no system iterates them at all.
+"""
+
+import pickle
+import zlib
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from neonworks.core.ecs import Entity, GridPosition, System, Transform, World
+
+
+class LODLevel(Enum):
+    """Simulation detail levels"""
+
+    NEAR = "near"  # In view (plus margin): full rate
+    MID = "mid"  # Off-screen: reduced rate, aggregated delta
+    FAR = "far"  # Far away: frozen or fast-forwarded on return
+
+
+class FarMode(Enum):
+    """What happens to time spent in the FAR level"""
+
+    FREEZE = "freeze"  # Elapsed time is dropped
+    # Elapsed time goes to catch-up handlers on return, or is delivered in one
+    # step capped at max_catchup when no handler is registered
+    FAST_FORWARD = "fast_forward"
+
+
+class _LODState:
+    """Per-entity scheduling state"""
+
+    __slots__ = ("level", "last_time", "frame", "result", "stagger")
+
+    def __init__(self, level: LODLevel, last_time: float, stagger: int):
+        self.level = level
+        self.last_time = last_time
+        self.frame = -1
+        self.result: Optional[float] = None
+        self.stagger = stagger
+
+
+@dataclass
+class DormantBatch:
+    """Entities parked by one make_dormant() call, pickled and zlib-compressed"""
+
+    entity_count: int
+    data: bytes
+
+
+class LODSystem(System):
+    """
+    Level-of-detail scheduler for NPC and AI simulation.
+
+    Add it to the World (it runs first to advance its clock and refresh the
+    camera view) and hand it to systems that tick per-entity logic. Those
+    systems call ``get_delta(entity)`` and skip the entity when it returns None.
+    """
+
+    # Entities with this tag (or "player") are always simulated at full rate
+    EXEMPT_TAG = "lod_exempt"
+
+    def __init__(
+        self,
+        camera=None,
+        tile_size: int = 32,
+        margin: float = 128.0,
+        far_distance: float = 1024.0,
+        mid_interval: int = 4,
+        far_mode: FarMode = FarMode.FREEZE,
+        max_catchup: float = 5.0,
+    ):
+        """
+        Initialize the LOD scheduler.
+
+        Args:
+            camera: Camera whose view defines the NEAR region (None = everything NEAR)
+            tile_size: Tile size used to place entities that only have a GridPosition
+            margin: World units around the view that still count as NEAR
+            far_distance: World units beyond the NEAR region where FAR begins
+            mid_interval: MID entities tick once every this many fixed updates
+            far_mode: Whether FAR entities are frozen or fast-forwarded on return
+            max_catchup: Maximum seconds a fast-forward step delivers through
+                get_delta() when no catch-up handler is registered; the rest
+                is dropped and counted in dropped_time
+        """
+        super().__init__()
+        self.priority = -100  # Must run before the systems that query it
+
+        self.camera = camera
+        self.tile_size = tile_size
+        self.margin = margin
+        self.far_distance = far_distance
+        self.mid_interval = max(1, mid_interval)
+        self.far_mode = far_mode
+        self.max_catchup = max_catchup
+
+        # Scheduler clock
+        self.frame = 0
+        self.time = 0.0
+        self._delta_time = 0.0
+
+        # NEAR region in world coordinates (min_x, min_y, max_x, max_y)
+        self._near_rect: Optional[Tuple[float, float, float, float]] = None
+
+        self._states: Dict[str, _LODState] = {}
+        self._dormant: Dict[str, List[DormantBatch]] = {}
+        self._catchup_handlers: List[Callable[[Entity, float], None]] = []
+
+        # Fast-forwarded seconds cut off by max_catchup
+        self.dropped_time = 0.0
+
+        # Per-level counters
+        self.tick_counts: Dict[LODLevel, int] = {level: 0 for level in LODLevel}
+        self.skip_counts: Dict[LODLevel, int] = {level: 0 for level in LODLevel}
+
+    def update(self, world: World, delta_time: float):
+        """Advance the scheduler clock and refresh the camera view"""
+        self.frame += 1
+        self.time += delta_time
+        self._delta_time = delta_time
+        self._near_rect = self._compute_near_rect()
+
+        # Drop state of entities that left the world
+        if len(self._states) > len(world._entities):
+            for entity_id in [eid for eid in self._states if eid not in world._entities]:
+                del self._states[entity_id]
+
+    def set_camera(self, camera):
+        """Set the camera that defines the NEAR region"""
+        self.camera = camera
+        self._near_rect = self._compute_near_rect()
+
+    def add_catchup_handler(self, handler: Callable[[Entity, float], None]):
+        """
+        Register an analytic catch-up for fast-forwarded entities.
+
+        When an entity returns from FAR in FAST_FORWARD mode, each handler is
+        called with the entity and the full time it spent away (up to the
+        current update), and get_delta() returns only this update's delta.
+
+        Args:
+            handler: Called as handler(entity, elapsed_seconds)
+        """
+        self._catchup_handlers.append(handler)
+
+    def remove_catchup_handler(self, handler: Callable[[Entity, float], None]):
+        """Unregister a catch-up handler"""
+        if handler in self._catchup_handlers:
+            self._catchup_handlers.remove(handler)
+
+    def get_delta(self, entity: Entity) -> Optional[float]:
+        """
+        Get the delta time an entity should be simulated with this update.
+
+        Returns:
+            Seconds to simulate (possibly aggregated over skipped updates),
+            or None if the entity should be skipped this update
+        """
+        if not self.enabled:
+            return self._delta_time
+
+        state = self._states.get(entity.id)
+        if state is not None and state.frame == self.frame:
+            return state.result  # Already scheduled this update
+
+        level = self.classify(entity)
+        if state is None:
+            stagger = zlib.crc32(entity.id.encode()) % self.mid_interval
+            state = _LODState(level, self.time - self._delta_time, stagger)
+            self._states[entity.id] = state
+
+        previous = state.level
+        state.level = level
+        state.frame = self.frame
+
+        if level == LODLevel.FAR:
+            if self.far_mode == FarMode.FREEZE:
+                state.last_time = self.time
+            result = None
+        else:
+            fast_forward = previous == LODLevel.FAR and self.far_mode == FarMode.FAST_FORWARD
+            if level == LODLevel.MID and not fast_forward:
+                due = (self.frame + state.stagger) % self.mid_interval == 0
+            else:
+                due = True
+
+            if not due:
+                result = None
+            elif fast_forward and self._catchup_handlers:
+                # Hand the time spent away to the analytic catch-ups
+                away = max(self.time - self._delta_time - state.last_time, 0.0)
+                for handler in self._catchup_handlers:
+                    handler(entity, away)
+                result = self._delta_time
+                state.last_time = self.time
+            else:
+                elapsed = self.time - state.last_time
+                result = min(elapsed, self.max_catchup)
+                self.dropped_time += elapsed - result
+                state.last_time = self.time
+
+        state.result = result
+        if result is None:
+            self.skip_counts[level] += 1
+        else:
+            self.tick_counts[level] += 1
+        return result
+
+    def classify(self, entity: Entity) -> LODLevel:
+        """Determine the LOD level of an entity from its position"""
+        if self._near_rect is None or entity.has_tag("player") or entity.has_tag(self.EXEMPT_TAG):
+            return LODLevel.NEAR
+
+        position = self._get_world_position(entity)
+        if position is None:
+            return LODLevel.NEAR
+
+        x, y = position
+        min_x, min_y, max_x, max_y = self._near_rect
+        dx = max(min_x - x, 0.0, x - max_x)
+        dy = max(min_y - y, 0.0, y - max_y)
+
+        if dx == 0.0 and dy == 0.0:
+            return LODLevel.NEAR
+        if dx <= self.far_distance and dy <= self.far_distance:
+            return LODLevel.MID
+        return LODLevel.FAR
+
+    def get_level(self, entity_id: str) -> Optional[LODLevel]:
+        """Get the last scheduled LOD level of an entity"""
+        state = self._states.get(entity_id)
+        return state.level if state else None
+
+    # Dormant zones
+
+    def make_dormant(self, world: World, zone_id: str, entities: List[Entity]):
+        """
+        Detach entities from the World into a serialized dormant form.
+
+        The entities are pickled and zlib-compressed into one blob, so a parked
+        zone holds a byte string rather than live component objects. Entities
+        whose components can't be pickled are removed without being parked.
+
+        Args:
+            world: World the entities belong to
+            zone_id: Zone the entities are parked under
+            entities: Entities to park
+        """
+        records = []
+        for entity in entities:
+            record = (
+                entity.id,
+                entity.active,
+                tuple(entity.tags),
+                list(entity._components.values()),
+            )
+            try:
+                records.append(pickle.dumps(record, pickle.HIGHEST_PROTOCOL))
+            except (pickle.PicklingError, TypeError, AttributeError) as e:
+                print(f"Warning: entity {entity.id} can't be parked and is removed: {e}")
+            world.remove_entity(entity.id)
+            self._states.pop(entity.id, None)
+
+        if records:
+            data = zlib.compress(pickle.dumps(records, pickle.HIGHEST_PROTOCOL))
+            self._dormant.setdefault(zone_id, []).append(DormantBatch(len(records), data))
+
+    def restore_dormant(self, world: World, zone_id: str) -> List[Entity]:
+        """
+        Recreate the dormant entities of a zone in the World.
+
+        Returns:
+            The restored entities
+        """
+        restored = []
+        for batch in self._dormant.pop(zone_id, []):
+            for record in pickle.loads(zlib.decompress(batch.data)):
+                entity_id, active, tags, components = pickle.loads(record)
+                entity = Entity(entity_id)
+                entity.active = active
+                for tag in tags:
+                    entity.add_tag(tag)
+                for component in components:
+                    entity.add_component(component)
+                world.add_entity(entity)
+                restored.append(entity)
+        return restored
+
+    def has_dormant(self, zone_id: str) -> bool:
+        """Check if a zone has parked entities"""
+        return bool(self._dormant.get(zone_id))
+
+    def get_dormant_count(self) -> int:
+        """Get the number of parked entities across all zones"""
+        return sum(batch.entity_count for batches in self._dormant.values() for batch in batches)
+
+    def get_dormant_bytes(self) -> int:
+        """Get the size of the serialized parked entities across all zones"""
+        return sum(len(batch.data) for batches in self._dormant.values() for batch in batches)
+
+    # Stats
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get per-level tick and skip counts"""
+        stats: Dict[str, Any] = {
+            level.value: {
+                "ticks": self.tick_counts[level],
+                "skipped": self.skip_counts[level],
+                "entities": sum(1 for s in self._states.values() if s.level == level),
+            }
+            for level in LODLevel
+        }
+        stats["dormant"] = self.get_dormant_count()
+        stats["dormant_bytes"] = self.get_dormant_bytes()
+        stats["dropped_time"] = self.dropped_time
+        return stats
+
+    def reset_stats(self):
+        """Reset per-level counters"""
+        for level in LODLevel:
+            self.tick_counts[level] = 0
+            self.skip_counts[level] = 0
+
+    def _compute_near_rect(self) -> Optional[Tuple[float, float, float, float]]:
+        if self.camera is None:
+            return None
+        min_x, min_y = self.camera.screen_to_world(0, 0)
+        max_x, max_y = self.camera.screen_to_world(
+            self.camera.screen_width, self.camera.screen_height
+        )
+        return (
+            min_x - self.margin,
+            min_y - self.margin,
+            max_x + self.margin,
+            max_y + self.margin,
+        )
+
+    def _get_world_position(self, entity: Entity) -> Optional[Tuple[float, float]]:
+        transform = entity.get_component(Transform)
+        if transform is not None:
+            return transform.x, transform.y
+
+        grid_pos = entity.get_component(GridPosition)
+        if grid_pos is not None:
+            return grid_pos.grid_x * self.tile_size, grid_pos.grid_y * self.tile_size
+
+        return None
@@ -6,11 +6,12 @@ Handles spell casting, MP management, and magical effects.
 
 from typing import Dict, List, Optional
 
+import numpy as np
+
 from neonworks.core.ecs import Entity, System, World
 from neonworks.core.events import Event, EventManager, EventType
-from neonworks.gameplay.combat import Health
+from neonworks.gameplay.combat_resolution import TargetBatch, resolve_spell
 from neonworks.gameplay.jrpg_combat import (
-    ElementalResistances,
     ElementType,
     JRPGStats,
     MagicPoints,
@@ -239,14 +240,20 @@ class MagicSystem(System):
     - Healing spells
     - Status effect spells
     - MP regeneration
+
+    Multi-target spells are resolved for all targets at once (see
+    gameplay.combat_resolution).
     """
 
-    def __init__(self, event_manager: EventManager):
+    def __init__(self, event_manager: EventManager, seed: Optional[int] = None):
         super().__init__()
         self.priority = 15
         self.event_manager = event_manager
         self.spell_db = SpellDatabase()
 
+        # Status effect rolls (seed for reproducible battles)
+        self.rng = np.random.default_rng(seed)
+
         # Subscribe to combat events
         self.event_manager.subscribe(EventType.CUSTOM, self._handle_custom_event)
 
@@ -309,8 +316,7 @@ class MagicSystem(System):
             return False
 
         # Apply spell effects to targets
-        for target in targets:
-            self._apply_spell_effect(caster, target, spell, caster_stats)
+        self._apply_spell_effects(targets, spell, caster_stats)
 
         # Emit spell cast event
         self.event_manager.emit(
@@ -337,89 +343,63 @@ class MagicSystem(System):
         caster_stats: Optional[JRPGStats],
     ):
         """Apply spell effect to a single target"""
-        target_health = target.get_component(Health)
-        target_stats = target.get_component(JRPGStats)
-        target_resist = target.get_component(ElementalResistances)
-
-        # Damage spell
-        if spell.damage > 0 and target_health:
-            damage = spell.damage
-
-            # Add caster's magic attack if available
-            if caster_stats:
-                damage = caster_stats.calculate_magic_damage(spell.power, target_stats)
-
-            # Apply elemental resistance
-            if target_resist:
-                multiplier = target_resist.get_multiplier(spell.element)
-
-                # Check for absorption
-                if target_resist.absorbs(spell.element):
-                    # Heal instead of damage
-                    target_health.hp = min(target_health.max_hp, target_health.hp + abs(damage))
+        self._apply_spell_effects([target], spell, caster_stats)
+
+    def _apply_spell_effects(
+        self, targets: List[Entity], spell: Spell, caster_stats: Optional[JRPGStats]
+    ):
+        """Apply spell effects to all targets in one batch"""
+        if not targets:
+            return
+
+        batch = TargetBatch.from_entities(targets, spell.element)
+        result = resolve_spell(spell, caster_stats, batch, self.rng)
+        result.write_back()
+
+        for i, target in enumerate(targets):
+            if batch.has_health[i]:
+                if result.absorbed[i]:
                     self.event_manager.emit(
                         Event(
                             EventType.CUSTOM,
                             {
                                 "type": "spell_absorbed",
                                 "target_id": target.id,
-                                "healing": abs(damage),
+                                "healing": int(result.damage[i]),
                                 "element": spell.element.value,
                             },
                         )
                     )
-                    return
-
-                damage = int(damage * multiplier)
-
-            # Apply damage
-            target_health.hp -= damage
-
-            # Check for death
-            if target_health.hp <= 0:
-                target_health.hp = 0
-                target_health.is_alive = False
-
-            # Emit damage event
-            self.event_manager.emit(
-                Event(
-                    EventType.CUSTOM,
-                    {
-                        "type": "spell_damage",
-                        "target_id": target.id,
-                        "damage": damage,
-                        "element": spell.element.value,
-                        "spell_name": spell.name,
-                    },
-                )
-            )
-
-        # Healing spell
-        if spell.healing > 0 and target_health:
-            healing = spell.healing
-            old_hp = target_health.hp
-            target_health.hp = min(target_health.max_hp, target_health.hp + healing)
-            actual_healing = target_health.hp - old_hp
+                    continue
 
-            self.event_manager.emit(
-                Event(
-                    EventType.CUSTOM,
-                    {
-                        "type": "spell_heal",
-                        "target_id": target.id,
-                        "healing": actual_healing,
-                        "spell_name": spell.name,
-                    },
-                )
-            )
-
-        # Status effect spell
-        if spell.status_effect and target_stats:
-            import random
+                if spell.damage > 0:
+                    self.event_manager.emit(
+                        Event(
+                            EventType.CUSTOM,
+                            {
+                                "type": "spell_damage",
+                                "target_id": target.id,
+                                "damage": int(result.damage[i]),
+                                "element": spell.element.value,
+                                "spell_name": spell.name,
+                            },
+                        )
+                    )
 
-            if random.random() * 100 < spell.status_chance:
-                target_stats.add_status(spell.status_effect)
+                if spell.healing > 0:
+                    self.event_manager.emit(
+                        Event(
+                            EventType.CUSTOM,
+                            {
+                                "type": "spell_heal",
+                                "target_id": target.id,
+                                "healing": result.healing[i].item(),
+                                "spell_name": spell.name,
+                            },
+                        )
+                    )
 
+            if result.status[i]:
                 self.event_manager.emit(
                     Event(
                         EventType.CUSTOM,
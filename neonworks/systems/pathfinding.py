@@ -5,9 +5,14 @@ A* pathfinding with navmesh support and intelligent path planning.
 """
 
 import heapq
-from typing import List, Optional, Set, Tuple
+import weakref
+from collections import OrderedDict
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
 
 from neonworks.core.ecs import Entity, GridPosition, Navmesh, System, World
+from neonworks.utils.trace_recorder import traced
 
 
 class PathNode:
@@ -38,9 +43,136 @@ class PathNode:
         return hash((self.x, self.y))
 
 
+class NavmeshGrid:
+    """Dense NumPy view of a navmesh over its bounding box"""
+
+    def __init__(self, navmesh: Navmesh):
+        if navmesh.walkable_cells:
+            xs = [x for x, _ in navmesh.walkable_cells]
+            ys = [y for _, y in navmesh.walkable_cells]
+            self.min_x, self.min_y = min(xs), min(ys)
+            self.width = max(xs) - self.min_x + 1
+            self.height = max(ys) - self.min_y + 1
+        else:
+            self.min_x = self.min_y = 0
+            self.width = self.height = 0
+
+        self.walkable = np.zeros((self.height, self.width), dtype=bool)
+        self.costs = np.ones((self.height, self.width), dtype=np.float64)
+
+        if navmesh.walkable_cells:
+            cells = np.array(list(navmesh.walkable_cells), dtype=np.int64)
+            self.walkable[cells[:, 1] - self.min_y, cells[:, 0] - self.min_x] = True
+
+        for (x, y), cost in navmesh.cost_multipliers.items():
+            if self.contains(x, y):
+                self.costs[y - self.min_y, x - self.min_x] = cost
+
+        # Flat copies for the scalar inner loop of Dijkstra (list indexing is
+        # much cheaper than NumPy scalar indexing)
+        self._walkable_flat: List[bool] = self.walkable.ravel().tolist()
+        self._costs_flat: List[float] = self.costs.ravel().tolist()
+
+    def contains(self, x: int, y: int) -> bool:
+        """Check if a cell lies inside the grid bounds"""
+        return 0 <= x - self.min_x < self.width and 0 <= y - self.min_y < self.height
+
+    def to_index(self, x: int, y: int) -> int:
+        """Convert world cell coordinates to a flat grid index"""
+        return (y - self.min_y) * self.width + (x - self.min_x)
+
+    def to_cell(self, index: int) -> Tuple[int, int]:
+        """Convert a flat grid index back to world cell coordinates"""
+        row, col = divmod(index, self.width)
+        return col + self.min_x, row + self.min_y
+
+
+class ReachabilityMap:
+    """
+    Result of a bounded Dijkstra search from a single origin.
+
+    Stores the accumulated cost and the predecessor of every cell in the
+    navmesh grid, so both the movement highlight and the path preview to any
+    highlighted cell can be read without another search.
+    """
+
+    def __init__(
+        self,
+        grid: NavmeshGrid,
+        origin: Tuple[int, int],
+        movement_points: float,
+        costs: np.ndarray,
+        predecessors: np.ndarray,
+    ):
+        self.grid = grid
+        self.origin = origin
+        self.movement_points = movement_points
+        self.costs = costs  # (height, width) float64, inf where unreachable
+        self.predecessors = predecessors  # (height, width) int64 flat index, -1 for none
+        self._cells: Optional[Set[Tuple[int, int]]] = None
+
+    @property
+    def reachable_mask(self) -> np.ndarray:
+        """Boolean (height, width) mask of reachable cells"""
+        return np.isfinite(self.costs)
+
+    @property
+    def cells(self) -> Set[Tuple[int, int]]:
+        """All reachable cells as (x, y) tuples"""
+        if self._cells is None:
+            ys, xs = np.nonzero(self.reachable_mask)
+            xs = xs + self.grid.min_x
+            ys = ys + self.grid.min_y
+            self._cells = set(zip(xs.tolist(), ys.tolist()))
+            self._cells.add(self.origin)  # The unit can always stay where it is
+        return self._cells
+
+    def __contains__(self, cell: Tuple[int, int]) -> bool:
+        return self.is_reachable(*cell)
+
+    def __len__(self) -> int:
+        return len(self.cells)
+
+    def is_reachable(self, x: int, y: int) -> bool:
+        """Check if a cell can be reached within the movement budget"""
+        if (x, y) == self.origin:
+            return True
+        if not self.grid.contains(x, y):
+            return False
+        return bool(np.isfinite(self.costs[y - self.grid.min_y, x - self.grid.min_x]))
+
+    def get_cost(self, x: int, y: int) -> Optional[float]:
+        """Get the accumulated movement cost to a cell, or None if unreachable"""
+        if not self.is_reachable(x, y):
+            return None
+        if (x, y) == self.origin:
+            return 0.0
+        return float(self.costs[y - self.grid.min_y, x - self.grid.min_x])
+
+    def get_path(self, x: int, y: int) -> Optional[List[Tuple[int, int]]]:
+        """Get the cheapest path from the origin to a reachable cell"""
+        if not self.is_reachable(x, y):
+            return None
+        if (x, y) == self.origin:
+            return [self.origin]
+
+        predecessors = self.predecessors.ravel()
+        index = self.grid.to_index(x, y)
+        path = []
+        while index != -1:
+            path.append(self.grid.to_cell(index))
+            index = int(predecessors[index])
+
+        path.reverse()
+        return path
+
+
 class PathfindingSystem(System):
     """A* pathfinding system"""
 
+    # Maximum number of cached reachability maps
+    REACHABILITY_CACHE_SIZE = 128
+
     def __init__(self):
         super().__init__()
         self.priority = -40
@@ -49,6 +181,13 @@ class PathfindingSystem(System):
         self.navmesh_entity: Optional[Entity] = None
         self.navmesh: Optional[Navmesh] = None
 
+        # Dense grids by navmesh identity (dropped when the navmesh is collected),
+        # and reachability maps by the grid they were computed on
+        self._grid_cache: Dict[int, Tuple[weakref.ref, int, NavmeshGrid]] = {}
+        self._reachability_cache: "OrderedDict[tuple, Tuple[NavmeshGrid, ReachabilityMap]]" = (
+            OrderedDict()
+        )
+
     def update(self, world: World, delta_time: float):
         """Update pathfinding (cache navmesh)"""
         # Cache navmesh entity
@@ -58,6 +197,7 @@ class PathfindingSystem(System):
                 self.navmesh_entity = navmesh_entities[0]
                 self.navmesh = self.navmesh_entity.get_component(Navmesh)
 
+    @traced("find_path", "path")
     def find_path(
         self,
         start_x: int,
@@ -235,26 +375,99 @@ class PathfindingSystem(System):
         self, start_x: int, start_y: int, movement_points: int, navmesh: Navmesh
     ) -> Set[Tuple[int, int]]:
         """Get all reachable positions within movement range"""
-        reachable = set()
-        open_set = [(start_x, start_y, 0)]  # (x, y, cost)
-        visited = {(start_x, start_y)}
+        return set(self.get_reachability_map(start_x, start_y, movement_points, navmesh).cells)
 
-        while open_set:
-            x, y, cost = open_set.pop(0)
-            reachable.add((x, y))
-
-            # Check neighbors
-            for nx, ny in self._get_neighbors(x, y):
-                if (nx, ny) in visited:
-                    continue
-                if not navmesh.is_walkable(nx, ny):
-                    continue
-
-                move_cost = navmesh.get_cost(nx, ny)
-                new_cost = cost + move_cost
-
-                if new_cost <= movement_points:
-                    open_set.append((nx, ny, new_cost))
-                    visited.add((nx, ny))
+    def get_reachability_map(
+        self, start_x: int, start_y: int, movement_points: float, navmesh: Navmesh
+    ) -> ReachabilityMap:
+        """
+        Get costs and predecessors for every cell reachable within movement range.
 
-        return reachable
+        Runs a bounded Dijkstra search (entering a cell costs its navmesh cost
+        multiplier). Results are cached per (position, movement points,
+        navmesh version), so repeated highlight queries for the same unit are free.
+        The navmesh version is the only invalidation: call Navmesh.mark_dirty()
+        after editing walkable_cells or cost_multipliers directly.
+        """
+        grid = self._get_grid(navmesh)
+        # The cached entry holds the grid, so its id can't be reused meanwhile
+        key = (start_x, start_y, movement_points, id(grid))
+        cached = self._reachability_cache.get(key)
+        if cached is not None:
+            self._reachability_cache.move_to_end(key)
+            return cached[1]
+
+        reach_map = self._compute_reachability(start_x, start_y, movement_points, grid)
+
+        self._reachability_cache[key] = (grid, reach_map)
+        if len(self._reachability_cache) > self.REACHABILITY_CACHE_SIZE:
+            self._reachability_cache.popitem(last=False)
+
+        return reach_map
+
+    def clear_cache(self):
+        """Drop all cached navmesh grids and reachability maps"""
+        self._grid_cache.clear()
+        self._reachability_cache.clear()
+
+    def _get_grid(self, navmesh: Navmesh) -> NavmeshGrid:
+        """Get (or rebuild) the dense grid for the current version of a navmesh"""
+        key = id(navmesh)
+        cached = self._grid_cache.get(key)
+        if cached is not None and cached[0]() is navmesh and cached[1] == navmesh.version:
+            return cached[2]
+
+        cache = self._grid_cache
+
+        def evict(ref: weakref.ref):
+            # Only drop the entry if a newer navmesh hasn't reused the id
+            entry = cache.get(key)
+            if entry is not None and entry[0] is ref:
+                del cache[key]
+
+        grid = NavmeshGrid(navmesh)
+        cache[key] = (weakref.ref(navmesh, evict), navmesh.version, grid)
+        return grid
+
+    @traced("compute_reachability", "path")
+    def _compute_reachability(
+        self, start_x: int, start_y: int, movement_points: float, grid: NavmeshGrid
+    ) -> ReachabilityMap:
+        """Bounded Dijkstra over the dense navmesh grid"""
+        size = grid.width * grid.height
+        dist = [float("inf")] * size
+        pred = [-1] * size
+
+        if grid.contains(start_x, start_y):
+            width, height = grid.width, grid.height
+            walkable = grid._walkable_flat
+            cell_costs = grid._costs_flat
+
+            start = grid.to_index(start_x, start_y)
+            dist[start] = 0.0
+            open_set = [(0.0, start)]
+
+            while open_set:
+                cost, index = heapq.heappop(open_set)
+                if cost > dist[index]:
+                    continue  # Stale heap entry
+
+                row, col = divmod(index, width)
+                for neighbor, in_bounds in (
+                    (index - width, row > 0),  # North
+                    (index + 1, col < width - 1),  # East
+                    (index + width, row < height - 1),  # South
+                    (index - 1, col > 0),  # West
+                ):
+                    if not in_bounds or not walkable[neighbor]:
+                        continue
+
+                    new_cost = cost + cell_costs[neighbor]
+                    if new_cost <= movement_points and new_cost < dist[neighbor]:
+                        dist[neighbor] = new_cost
+                        pred[neighbor] = index
+                        heapq.heappush(open_set, (new_cost, neighbor))
+
+        costs = np.array(dist, dtype=np.float64).reshape(grid.height, grid.width)
+        predecessors = np.array(pred, dtype=np.int64).reshape(grid.height, grid.width)
+        return ReachabilityMap(grid, (start_x, start_y), movement_points, costs, predecessors)
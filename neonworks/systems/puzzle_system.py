@@ -440,26 +440,17 @@ class PuzzleSystem(System):
         self, world: World, x: int, y: int, ignore_entity: Optional[Entity] = None
     ) -> List[Entity]:
         """Get all entities at a grid position"""
-        entities_here = []
-        all_entities = world.get_entities_with_component(GridPosition)
+        entities_here = world.entities_at(x, y)
 
-        for entity in all_entities:
-            if ignore_entity and entity.id == ignore_entity.id:
-                continue
-
-            grid_pos = entity.get_component(GridPosition)
-            if grid_pos.grid_x == x and grid_pos.grid_y == y:
-                entities_here.append(entity)
+        if ignore_entity:
+            entities_here = [e for e in entities_here if e.id != ignore_entity.id]
 
         return entities_here
 
     def _check_pressure_plate_at_position(self, world: World, x: int, y: int, entity: Entity):
         """Check if there's a pressure plate at position"""
-        plates = world.get_entities_with_components(PressurePlate, GridPosition)
-
-        for plate_entity in plates:
-            grid_pos = plate_entity.get_component(GridPosition)
-            if grid_pos.grid_x == x and grid_pos.grid_y == y:
+        for plate_entity in world.entities_at(x, y):
+            if plate_entity.has_component(PressurePlate):
                 # Pressure plate found, it will be updated in next update cycle
                 pass
 
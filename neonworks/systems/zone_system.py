@@ -9,6 +9,7 @@ from pathlib import Path
 from typing import Any, Callable, Dict, Optional
 
 from neonworks.core.ecs import Entity, GridPosition, Sprite, System, Transform, World
+from neonworks.core.event_triggers import EventTriggerManager
 from neonworks.core.events import Event, EventManager, EventType
 from neonworks.gameplay.movement import Direction, TileCollisionMap, ZoneTrigger
 from neonworks.data.map_layers import LayerType
@@ -43,6 +44,9 @@ class ZoneData:
         self.objects: list = []
         self.triggers: list = []
 
+        # Map events (built when the zone system has an event interpreter)
+        self.events: Optional[EventTriggerManager] = None
+
 
 class ZoneSystem(System):
     """
@@ -75,6 +79,14 @@ class ZoneSystem(System):
         # Player entity reference
         self.player_entity: Optional[Entity] = None
 
+        # Optional LOD system; when set, unloaded zones are kept dormant
+        # instead of being destroyed and respawned from zone data
+        self.lod_system = None
+
+        # Optional event interpreter; when set, zone events are loaded and
+        # compiled for it as the zone file is read
+        self.event_interpreter = None
+
     def update(self, world: World, delta_time: float):
         """Update zone system"""
         # Check for zone triggers
@@ -110,8 +122,12 @@ class ZoneSystem(System):
         self.current_zone = zone_data
         self.current_zone_id = zone_id
 
-        # Spawn zone entities (NPCs, objects, triggers)
-        self._spawn_zone_entities(world, zone_data)
+        # Spawn zone entities (NPCs, objects, triggers), or wake them if the
+        # zone was parked in dormant form
+        if self.lod_system is not None and self.lod_system.has_dormant(zone_id):
+            self.lod_system.restore_dormant(world, zone_id)
+        else:
+            self._spawn_zone_entities(world, zone_data)
 
         # Position player at spawn point
         self._position_player_at_spawn(world, spawn_point)
@@ -237,6 +253,14 @@ class ZoneSystem(System):
             # Load triggers
             zone.triggers = data.get("triggers", [])
 
+            # Load map events, compiling them for the interpreter that runs them
+            if self.event_interpreter is not None and "events" in data:
+                zone.events = EventTriggerManager.from_dict(
+                    {"events": data["events"]},
+                    self.event_interpreter.game_state,
+                    self.event_interpreter,
+                )
+
             zone.properties = data.get("properties", {})
 
             return zone
@@ -437,6 +461,17 @@ class ZoneSystem(System):
 
     def _unload_current_zone(self, world: World):
         """Unload current zone entities"""
+        if self.lod_system is not None and self.current_zone_id:
+            # Park zone entities so their state survives the round trip; an
+            # entity with several of the tags is parked once
+            zone_entities = {
+                entity.id: entity
+                for tag in ("npc", "object", "zone_trigger")
+                for entity in world.get_entities_with_tag(tag)
+            }
+            self.lod_system.make_dormant(world, self.current_zone_id, list(zone_entities.values()))
+            return
+
         # Remove NPCs
         for npc in world.get_entities_with_tag("npc"):
             world.remove_entity(npc.id)
@@ -525,6 +560,14 @@ class ZoneSystem(System):
                 )
                 return
 
+    def set_lod_system(self, lod_system):
+        """Keep unloaded zones dormant through a LODSystem"""
+        self.lod_system = lod_system
+
+    def set_event_interpreter(self, interpreter):
+        """Load zone events for an EventInterpreter, precompiling them on load"""
+        self.event_interpreter = interpreter
+
     def get_current_zone_data(self) -> Optional[ZoneData]:
         """Get current zone data"""
         return self.current_zone
@@ -3,12 +3,20 @@ NeonWorks Debug Console UI - Visual Debugging Interface
 Provides complete visual interface for debugging, console commands, and entity inspection.
 """
 
+import time
 from typing import Any, Dict, List, Optional, Tuple
 
 import pygame
 
 from ..core.ecs import GridPosition, Health, Sprite, Survival, Transform, World
 from ..rendering.ui import UI
+from ..utils.memory_diagnostics import (
+    get_memory_diagnostics,
+    start_memory_diagnostics,
+    stop_memory_diagnostics,
+)
+from ..utils.performance_monitor import get_performance_monitor
+from ..utils.trace_recorder import get_trace_recorder, start_tracing, stop_tracing
 
 
 class DebugConsoleUI:
@@ -59,6 +67,9 @@ class DebugConsoleUI:
             "toggle": self._cmd_toggle,
             "save": self._cmd_save,
             "load": self._cmd_load,
+            "perf": self._cmd_perf,
+            "trace": self._cmd_trace,
+            "mem": self._cmd_mem,
         }
 
     def toggle(self):
@@ -554,3 +565,101 @@ class DebugConsoleUI:
         self.add_log("Loading game...", (200, 200, 255))
         # This would call the load system
         self.add_log("Game loaded", (0, 255, 100))
+
+    def _cmd_perf(self, args: List[str]):
+        """Show or control per-system update timings."""
+        option = args[0].lower() if args else "show"
+        profiler = self.world.profiler
+
+        if option == "on":
+            profiler = self.world.enable_profiling(profiler)
+            get_performance_monitor().attach_system_profiler(profiler)
+            self.add_log("System profiling: ON", (200, 200, 200))
+        elif option == "off":
+            self.world.disable_profiling()
+            get_performance_monitor().attach_system_profiler(None)
+            self.add_log("System profiling: OFF", (200, 200, 200))
+        elif profiler is None:
+            self.add_log("System profiling is off. Use 'perf on'.", (255, 200, 0))
+        elif option == "reset":
+            profiler.reset()
+            self.add_log("System timings reset", (200, 200, 200))
+        elif option == "slow":
+            if not profiler.slow_updates:
+                self.add_log(f"No updates over {profiler.slow_threshold_ms:.1f}ms", (200, 200, 200))
+            for slow in list(profiler.slow_updates)[-5:]:
+                self.add_log(f"Update {slow.update_number}: {slow.total_ms:.2f}ms", (255, 200, 0))
+                for name, ms in list(slow.systems.items())[:3]:
+                    self.add_log(f"  {name}: {ms:.2f}ms", (200, 200, 200))
+        elif option == "show":
+            for line in profiler.format_report():
+                self.add_log(line, (200, 200, 200))
+        else:
+            self.add_log("Usage: perf [on|off|reset|slow]", (255, 200, 0))
+
+    def _cmd_trace(self, args: List[str]):
+        """Control the flight recorder and dump Chrome traces."""
+        option = args[0].lower() if args else "status"
+        recorder = get_trace_recorder()
+
+        if option == "start":
+            recorder = self.world.enable_tracing(start_tracing())
+            self.add_log(f"Tracing: ON ({recorder.capacity} spans)", (200, 200, 200))
+        elif option == "stop":
+            self.world.disable_tracing()
+            stop_tracing()
+            self.add_log("Tracing: OFF", (200, 200, 200))
+        elif recorder is None:
+            self.add_log("Tracing is off. Use 'trace start'.", (255, 200, 0))
+        elif option == "dump":
+            try:
+                seconds = float(args[1]) if len(args) > 1 else None
+            except ValueError:
+                self.add_log("Usage: trace dump [seconds] [path]", (255, 200, 0))
+                return
+            path = args[2] if len(args) > 2 else f"trace_{time.strftime('%Y%m%d_%H%M%S')}.json"
+            path = recorder.dump(path, last_seconds=seconds)
+            self.add_log(f"Trace written to {path}", (0, 255, 100))
+        elif option == "status":
+            self.add_log(
+                f"Tracing: {len(recorder)}/{recorder.capacity} spans, {recorder.dropped} dropped",
+                (200, 200, 200),
+            )
+        else:
+            self.add_log("Usage: trace [start|stop|dump [seconds] [path]]", (255, 200, 0))
+
+    def _cmd_mem(self, args: List[str]):
+        """Control memory diagnostics and show allocations by subsystem."""
+        option = args[0].lower() if args else "show"
+        diagnostics = get_memory_diagnostics()
+
+        if option == "start":
+            try:
+                minutes = float(args[1]) if len(args) > 1 else None
+            except ValueError:
+                self.add_log("Usage: mem start [minutes]", (255, 200, 0))
+                return
+            diagnostics = start_memory_diagnostics(interval_minutes=minutes)
+            interval = diagnostics.interval
+            every = f", snapshot every {interval / 60:g} min" if interval else ""
+            self.add_log(f"Memory diagnostics: ON{every}", (200, 200, 200))
+        elif option == "stop":
+            stop_memory_diagnostics()
+            self.add_log("Memory diagnostics: OFF", (200, 200, 200))
+        elif diagnostics is None:
+            self.add_log("Memory diagnostics are off. Use 'mem start'.", (255, 200, 0))
+        elif option == "snap":
+            diagnostics.take_snapshot()
+            for line in diagnostics.format_summary():
+                self.add_log(line, (200, 200, 200))
+        elif option == "show":
+            for line in diagnostics.format_summary():
+                self.add_log(line, (200, 200, 200))
+        elif option == "dump":
+            path = args[1] if len(args) > 1 else f"memory_{time.strftime('%Y%m%d_%H%M%S')}.json"
+            if not diagnostics.reports:
+                diagnostics.take_snapshot()
+            path = diagnostics.dump(path)
+            self.add_log(f"Memory report written to {path}", (0, 255, 100))
+        else:
+            self.add_log("Usage: mem [start [minutes]|stop|snap|show|dump [path]]", (255, 200, 0))
@@ -8,15 +8,34 @@ Provides a bird's-eye view of the entire map with:
 - Zoom controls
 - Toggle visibility
 - Entity and event markers
+
+The map is colored with NumPy: each layer's tile IDs go through a tile ID ->
+color lookup table and the top non-empty layer wins. The composed map is kept
+at one pixel per tile and scaled to the minimap with a precomputed index
+gather, so zooming only rescales it. Tile edits reported by the tilemap
+recompose just the changed rectangles, and entity markers are drawn each
+frame from the world's grid index rather than baked into the surface.
 """
 
-from typing import Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 import pygame
 
 from neonworks.core.ecs import World
 from neonworks.rendering.tilemap import Tilemap
 
+# Tile colors by walkability
+WALKABLE_COLOR = (100, 200, 100)
+BLOCKED_COLOR = (100, 100, 150)
+DEFAULT_COLOR = (128, 128, 128)
+
+# Opacity of layers above the first, blended over the background
+UPPER_LAYER_ALPHA = 180
+
+# Pending dirty rectangles beyond which one bounding rectangle is redrawn
+MAX_DIRTY_RECTS = 256
+
 
 class MinimapUI:
     """
@@ -87,10 +106,24 @@ class MinimapUI:
         # Fonts
         self.font = pygame.font.Font(None, 14)
 
+        # Colors of tile IDs (IDs without an entry use the walkability colors)
+        self.tile_colors: Dict[int, Tuple[int, int, int]] = {}
+
         # Surface cache
         self.minimap_surface: Optional[pygame.Surface] = None
         self.needs_redraw = True
 
+        # Composed map at one pixel per tile, (height, width, 3)
+        self._map_pixels: Optional[np.ndarray] = None
+        self._layer_order: Tuple[str, ...] = ()
+        # Tile ID -> RGB lookup tables, keyed by layer alpha
+        self._color_luts: Dict[int, np.ndarray] = {}
+        # Source tile column/row of each minimap pixel column/row
+        self._source_x = np.zeros(0, dtype=np.intp)
+        self._source_y = np.zeros(0, dtype=np.intp)
+        # Tile rectangles (x, y, width, height) changed since the last render
+        self._dirty_rects: List[Tuple[int, int, int, int]] = []
+
     def set_tilemap(self, tilemap: Tilemap):
         """
         Set the tilemap to display.
@@ -98,8 +131,15 @@ class MinimapUI:
         Args:
             tilemap: Tilemap instance to render
         """
+        if tilemap is self.tilemap:
+            return
+
+        if self.tilemap is not None:
+            self.tilemap.remove_change_listener(self.invalidate_region)
         self.tilemap = tilemap
-        self.needs_redraw = True
+        if tilemap is not None:
+            tilemap.add_change_listener(self.invalidate_region)
+        self.invalidate()
 
     def set_world(self, world: World):
         """
@@ -109,7 +149,6 @@ class MinimapUI:
             world: World instance containing entities
         """
         self.world = world
-        self.needs_redraw = True
 
     def set_viewport(self, x: int, y: int, width: int, height: int):
         """
@@ -126,6 +165,40 @@ class MinimapUI:
         self.viewport_width = width
         self.viewport_height = height
 
+    def set_tile_colors(self, colors: Dict[int, Tuple[int, int, int]]):
+        """
+        Set the minimap colors of tile IDs.
+
+        Args:
+            colors: Dict of tile ID -> RGB color
+        """
+        self.tile_colors = dict(colors)
+        self.invalidate()
+
+    def invalidate(self):
+        """Recompose the whole map on the next render."""
+        self._map_pixels = None
+        self._color_luts = {}
+        self._dirty_rects = []
+        self.needs_redraw = True
+
+    def invalidate_region(self, layer: int, x: int, y: int, width: int, height: int):
+        """
+        Recompose a rectangle of tiles on the next render.
+
+        Registered as the tilemap's change listener; call it directly after
+        writing to layer rows without going through the tilemap.
+
+        Args:
+            layer: Layer index of the change (all layers are recomposed)
+            x: Left tile X
+            y: Top tile Y
+            width: Width in tiles
+            height: Height in tiles
+        """
+        if self._map_pixels is not None:
+            self._dirty_rects.append((x, y, width, height))
+
     def toggle_visibility(self):
         """Toggle minimap visibility."""
         self.visible = not self.visible
@@ -138,12 +211,10 @@ class MinimapUI:
     def toggle_entities(self):
         """Toggle entity markers."""
         self.show_entities = not self.show_entities
-        self.needs_redraw = True
 
     def toggle_events(self):
         """Toggle event markers."""
         self.show_events = not self.show_events
-        self.needs_redraw = True
 
     def zoom_in(self):
         """Increase zoom level."""
@@ -183,9 +254,13 @@ class MinimapUI:
             return
 
         # Redraw minimap if needed
+        if tuple(self.tilemap.layer_manager.get_render_order()) != self._layer_order:
+            self.invalidate()
         if self.needs_redraw:
             self._redraw_minimap()
             self.needs_redraw = False
+        elif self._dirty_rects:
+            self._redraw_dirty_rects()
 
         # Draw background
         pygame.draw.rect(screen, self.bg_color, (self.x, self.y, self.width, self.height))
@@ -194,6 +269,10 @@ class MinimapUI:
         if self.minimap_surface:
             screen.blit(self.minimap_surface, (self.x, self.y))
 
+        # Draw entities
+        if self.show_entities and self.world:
+            self._draw_entities(screen)
+
         # Draw viewport indicator
         self._draw_viewport(screen)
 
@@ -212,51 +291,128 @@ class MinimapUI:
         if not self.tilemap:
             return
 
+        if self._map_pixels is None:
+            self._layer_order = tuple(self.tilemap.layer_manager.get_render_order())
+            self._map_pixels = self._compose(0, 0, self.tilemap.width, self.tilemap.height)
+            self._dirty_rects = []
+
+        # Map each minimap pixel to the tile under it
+        scale = self._get_scale()
+        columns = min(self.width, int(np.ceil(self.tilemap.width * scale)))
+        rows = min(self.height, int(np.ceil(self.tilemap.height * scale)))
+        self._source_x = np.minimum(
+            (np.arange(columns) / scale).astype(np.intp), self.tilemap.width - 1
+        )
+        self._source_y = np.minimum(
+            (np.arange(rows) / scale).astype(np.intp), self.tilemap.height - 1
+        )
+
         # Create surface
-        self.minimap_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+        self.minimap_surface = pygame.Surface((self.width, self.height))
         self.minimap_surface.fill(self.bg_color)
-
-        # Calculate scale
-        scale_x = self.width / (self.tilemap.width * self.zoom_level)
-        scale_y = self.height / (self.tilemap.height * self.zoom_level)
-        scale = min(scale_x, scale_y)
-
-        # Draw tiles
-        if hasattr(self.tilemap, "get_layer_count"):
-            layer_count = self.tilemap.get_layer_count()  # type: ignore[attr-defined]
-        else:
-            layer_count = 0
-
-        for layer in range(layer_count):
-            alpha = 255 if layer == 0 else 180
-            for y in range(self.tilemap.height):
-                for x in range(self.tilemap.width):
-                    tile = self.tilemap.get_tile(x, y, layer)
-                    if tile:
-                        # Calculate pixel position
-                        px = int(x * scale)
-                        py = int(y * scale)
-                        pw = max(1, int(scale))
-                        ph = max(1, int(scale))
-
-                        # Get tile color (simplified)
-                        color = self._get_tile_color(tile)
-                        color_with_alpha = (*color, alpha)
-
-                        # Draw tile pixel
-                        pygame.draw.rect(
-                            self.minimap_surface,
-                            color_with_alpha,
-                            (px, py, pw, ph),
-                        )
+        self._blit_map_rect(0, 0, self.tilemap.width, self.tilemap.height)
 
         # Draw grid if enabled
         if self.show_grid:
             self._draw_grid_on_surface(self.minimap_surface, scale)
 
-        # Draw entities
-        if self.show_entities and self.world:
-            self._draw_entities_on_surface(self.minimap_surface, scale)
+    def _redraw_dirty_rects(self):
+        """Recompose and rescale only the tiles changed since the last render."""
+        if not self.tilemap or self._map_pixels is None:
+            return
+
+        rects, self._dirty_rects = self._dirty_rects, []
+        if len(rects) > MAX_DIRTY_RECTS:
+            left = min(r[0] for r in rects)
+            top = min(r[1] for r in rects)
+            right = max(r[0] + r[2] for r in rects)
+            bottom = max(r[1] + r[3] for r in rects)
+            rects = [(left, top, right - left, bottom - top)]
+
+        for x, y, width, height in rects:
+            x0, y0 = max(0, x), max(0, y)
+            x1 = min(self.tilemap.width, x + width)
+            y1 = min(self.tilemap.height, y + height)
+            if x0 >= x1 or y0 >= y1:
+                continue
+            self._map_pixels[y0:y1, x0:x1] = self._compose(x0, y0, x1, y1)
+            self._blit_map_rect(x0, y0, x1, y1)
+
+        if self.show_grid:
+            self._draw_grid_on_surface(self.minimap_surface, self._get_scale())
+
+    def _compose(self, x0: int, y0: int, x1: int, y1: int) -> np.ndarray:
+        """
+        Color a rectangle of tiles.
+
+        Args:
+            x0: Left tile X
+            y0: Top tile Y
+            x1: Right tile X (exclusive)
+            y1: Bottom tile Y (exclusive)
+
+        Returns:
+            RGB array of shape (y1 - y0, x1 - x0, 3)
+        """
+        pixels = np.empty((y1 - y0, x1 - x0, 3), dtype=np.uint8)
+        pixels[:] = self.bg_color
+
+        for layer in range(len(self._layer_order)):
+            rows = self.tilemap.get_layer_tiles(layer)
+            if rows is None:
+                continue
+            alpha = 255 if layer == 0 else UPPER_LAYER_ALPHA
+
+            tile_ids = np.array([row[x0:x1] for row in rows[y0:y1]], dtype=np.int64)
+            tile_ids = tile_ids.reshape(y1 - y0, x1 - x0)
+            lut = self._get_color_lut(alpha, int(tile_ids.max(initial=0)))
+            filled = tile_ids > 0
+            pixels[filled] = lut[tile_ids[filled]]
+
+            # Tiles placed with set_tile() or fills keep their own walkability
+            codes, palette = self.tilemap.get_tile_metadata_grid(layer, x0, y0, x1 - x0, y1 - y0)
+            if len(palette) > 1:
+                colors = np.array(
+                    [self._blend(self._get_tile_color(tile), alpha) for tile in palette[1:]],
+                    dtype=np.uint8,
+                )
+                placed = codes > 0
+                pixels[placed] = colors[codes[placed] - 1]
+
+        return pixels
+
+    def _get_color_lut(self, alpha: int, max_tile_id: int) -> np.ndarray:
+        """Get the tile ID -> RGB table for a layer alpha covering max_tile_id."""
+        lut = self._color_luts.get(alpha)
+        if lut is not None and len(lut) > max_tile_id:
+            return lut
+
+        size = 1 << max(8, max_tile_id.bit_length())
+        lut = np.empty((size, 3), dtype=np.uint8)
+        lut[:] = self._blend(WALKABLE_COLOR, alpha)  # Plain tile IDs are walkable
+        for tile_id, color in self.tile_colors.items():
+            if 0 <= tile_id < size:
+                lut[tile_id] = self._blend(color, alpha)
+        self._color_luts[alpha] = lut
+        return lut
+
+    def _blend(self, color: Tuple[int, int, int], alpha: int) -> Tuple[int, int, int]:
+        """Blend a color over the background color."""
+        if alpha >= 255:
+            return color
+        return tuple((c * alpha + b * (255 - alpha)) // 255 for c, b in zip(color, self.bg_color))
+
+    def _blit_map_rect(self, x0: int, y0: int, x1: int, y1: int):
+        """Scale a rectangle of the composed map onto the minimap surface."""
+        columns = slice(np.searchsorted(self._source_x, x0), np.searchsorted(self._source_x, x1))
+        rows = slice(np.searchsorted(self._source_y, y0), np.searchsorted(self._source_y, y1))
+        if columns.start >= columns.stop or rows.start >= rows.stop:
+            return
+
+        block = self._map_pixels[np.ix_(self._source_y[rows], self._source_x[columns])]
+        surface_pixels = pygame.surfarray.pixels3d(self.minimap_surface)
+        surface_pixels[columns, rows] = block.transpose(1, 0, 2)
+        del surface_pixels  # Unlock the surface
 
     def _get_tile_color(self, tile) -> Tuple[int, int, int]:
         """
@@ -268,15 +424,19 @@ class MinimapUI:
         Returns:
             RGB color tuple
         """
+        color = self.tile_colors.get(getattr(tile, "tile_id", 0))
+        if color is not None:
+            return color
+
         # Default color based on walkability
         if hasattr(tile, "walkable"):
             if tile.walkable:
-                return (100, 200, 100)  # Green for walkable
+                return WALKABLE_COLOR  # Green for walkable
             else:
-                return (100, 100, 150)  # Blue for non-walkable
+                return BLOCKED_COLOR  # Blue for non-walkable
 
         # Default gray
-        return (128, 128, 128)
+        return DEFAULT_COLOR
 
     def _draw_grid_on_surface(self, surface: pygame.Surface, scale: float):
         """Draw grid lines on the minimap surface."""
@@ -295,30 +455,35 @@ class MinimapUI:
             py = int(y * scale)
             pygame.draw.line(surface, grid_color, (0, py), (self.width, py), 1)
 
-    def _draw_entities_on_surface(self, surface: pygame.Surface, scale: float):
-        """Draw entity markers on the minimap surface."""
-        if not self.world:
+    def _draw_entities(self, screen: pygame.Surface):
+        """Draw a marker on every cell holding an entity."""
+        if not self.world or not self.tilemap:
             return
 
-        from neonworks.core.ecs import GridPosition
+        cells = self.world.grid_index.occupied_cells()
+        if not cells:
+            return
 
-        for entity in self.world.entities:
-            if entity.has_component(GridPosition):
-                grid_pos = entity.get_component(GridPosition)
-                px = int(grid_pos.x * scale)
-                py = int(grid_pos.y * scale)
+        scale = self._get_scale()
+        points = (np.array(cells, dtype=np.float64) * scale).astype(np.int64)
+        inside = (
+            (points[:, 0] >= 0)
+            & (points[:, 0] < self.width)
+            & (points[:, 1] >= 0)
+            & (points[:, 1] < self.height)
+        )
+        # Entities sharing a minimap pixel get one marker
+        points = np.unique(points[inside], axis=0) + (self.x, self.y)
 
-                # Draw entity dot
-                pygame.draw.circle(surface, self.entity_color, (px, py), 2)
+        for px, py in points.tolist():
+            screen.fill(self.entity_color, (px - 1, py - 1, 3, 3))
 
     def _draw_viewport(self, screen: pygame.Surface):
         """Draw the viewport indicator rectangle."""
         if not self.tilemap:
             return
 
-        scale_x = self.width / (self.tilemap.width * self.zoom_level)
-        scale_y = self.height / (self.tilemap.height * self.zoom_level)
-        scale = min(scale_x, scale_y)
+        scale = self._get_scale()
 
         vp_x = self.x + int(self.viewport_x * scale)
         vp_y = self.y + int(self.viewport_y * scale)
@@ -338,9 +503,7 @@ class MinimapUI:
         if not self.hover_pos or not self.tilemap:
             return
 
-        scale_x = self.width / (self.tilemap.width * self.zoom_level)
-        scale_y = self.height / (self.tilemap.height * self.zoom_level)
-        scale = min(scale_x, scale_y)
+        scale = self._get_scale()
 
         hx = self.x + int(self.hover_pos[0] * scale)
         hy = self.y + int(self.hover_pos[1] * scale)
@@ -439,6 +602,12 @@ class MinimapUI:
 
         return False
 
+    def _get_scale(self) -> float:
+        """Minimap pixels per tile at the current zoom level."""
+        scale_x = self.width / (self.tilemap.width * self.zoom_level)
+        scale_y = self.height / (self.tilemap.height * self.zoom_level)
+        return min(scale_x, scale_y)
+
     def _is_point_inside(self, x: int, y: int) -> bool:
         """Check if a point is inside the minimap bounds."""
         return self.x <= x <= self.x + self.width and self.y <= y <= self.y + self.height
@@ -462,9 +631,7 @@ class MinimapUI:
         local_y = screen_y - self.y
 
         # Calculate scale
-        scale_x = self.width / (self.tilemap.width * self.zoom_level)
-        scale_y = self.height / (self.tilemap.height * self.zoom_level)
-        scale = min(scale_x, scale_y)
+        scale = self._get_scale()
 
         # Convert to grid coordinates
         grid_x = int(local_x / scale)
@@ -9,15 +9,15 @@ Supports:
 - Undo/redo
 """
 
-from collections import deque
-from typing import Optional, Set, Tuple
+from typing import Tuple
 
 import pygame
 
+from ...core.tile_mask import crop_mask, flood_mask
 from ...rendering.tilemap import Tile
 from .base import MapTool, ToolContext
-from .settings import ConnectivityModes, RenderSettings, ToolColors, ToolLimits, get_tool_color
-from .undo_manager import BatchTileChangeAction
+from .settings import RenderSettings, ToolColors, get_tool_color
+from .undo_manager import MaskedTileChangeAction
 
 
 class FillTool(MapTool):
@@ -33,7 +33,6 @@ class FillTool(MapTool):
         super().__init__("Fill", 3, get_tool_color("fill"))
         self.cursor_type = "fill"
         self.use_8way = False  # Toggle between 4-way and 8-way connectivity
-        self.max_fill_cells = ToolLimits.MAX_FILL_CELLS  # Safety limit to prevent infinite fills
 
     def on_mouse_down(self, grid_x: int, grid_y: int, button: int, context: ToolContext) -> bool:
         if button == 0:  # Left click - flood fill
@@ -56,7 +55,9 @@ class FillTool(MapTool):
         """
         Perform flood fill starting from the given position.
 
-        Uses BFS (Breadth-First Search) for efficient filling.
+        Finds the region with a scanline fill over a mask of the cells with
+        the original tile type, writes the new tile to the whole mask at once
+        and records the mask and old tiles for undo.
         Supports both 4-way and 8-way connectivity.
 
         Args:
@@ -90,58 +91,27 @@ class FillTool(MapTool):
         if not tile_data:
             return False
 
-        # Perform flood fill using BFS
-        changes = []
-        visited: Set[Tuple[int, int]] = set()
-        queue: deque = deque([(start_x, start_y)])
-        visited.add((start_x, start_y))
-
-        # Define neighbor offsets based on connectivity mode
-        neighbors = ConnectivityModes.EIGHT_WAY if self.use_8way else ConnectivityModes.FOUR_WAY
-
-        while queue and len(changes) < self.max_fill_cells:
-            x, y = queue.popleft()
-
-            # Check if this position has the original tile type
-            current_tile = context.tilemap.get_tile(x, y, context.current_layer)
-            current_type = current_tile.tile_type if current_tile else None
-
-            if current_type != original_type:
-                continue
-
-            # Create new tile
-            new_tile = Tile(tile_type=new_tile_type, walkable=tile_data["walkable"])
-
-            # Record change for undo
-            changes.append((x, y, context.current_layer, current_tile, new_tile))
-
-            # Fill this position
-            context.tilemap.set_tile(x, y, context.current_layer, new_tile)
-
-            # Add neighbors to queue
-            for dx, dy in neighbors:
-                nx, ny = x + dx, y + dy
+        # Find the contiguous region of the original type
+        match = context.tilemap.tile_type_mask(context.current_layer, original_type)
+        match = match[: context.grid_height, : context.grid_width]
+        cropped = crop_mask(flood_mask(match, start_x, start_y, self.use_8way))
+        if cropped is None:
+            return False
+        mask, x, y = cropped
 
-                if (
-                    0 <= nx < context.grid_width
-                    and 0 <= ny < context.grid_height
-                    and (nx, ny) not in visited
-                ):
-                    visited.add((nx, ny))
-                    queue.append((nx, ny))
+        # Record the old tiles, then fill the whole region at once
+        new_tile = Tile(tile_type=new_tile_type, walkable=tile_data["walkable"])
+        action = MaskedTileChangeAction(
+            context.tilemap, context.current_layer, mask, x, y, new_tile
+        )
+        action.redo()
 
-        # Record undo action if changes were made
-        if changes and context.undo_manager:
-            action = BatchTileChangeAction(context.tilemap, changes)
+        if context.undo_manager:
             context.undo_manager.record_action(action)
 
-        if len(changes) >= self.max_fill_cells:
-            print(f"Warning: Fill limited to {self.max_fill_cells} tiles (safety limit)")
-        else:
-            mode = "8-way" if self.use_8way else "4-way"
-            print(f"Filled {len(changes)} tiles with {new_tile_type} ({mode} mode)")
-
-        return len(changes) > 0
+        mode = "8-way" if self.use_8way else "4-way"
+        print(f"Filled {action.cell_count} tiles with {new_tile_type} ({mode} mode)")
+        return True
 
     def render_cursor(
         self,
@@ -4,18 +4,24 @@ Selection tool with rectangle and magic wand selection.
 Supports:
 - Rectangle selection (drag to select)
 - Magic wand selection (select contiguous same-type tiles)
+- Combining selections (replace, add, intersect, subtract)
 - Copy/paste/cut operations
 - All layers
+
+Selections are TileMask bitmasks over the map.
 """
 
-from collections import deque
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, Optional, Set, Tuple
 
 import pygame
 
-from ...rendering.tilemap import Tile
+from ...core.tile_mask import TileMask, crop_mask, flood_mask
 from .base import MapTool, ToolContext
-from .settings import ConnectivityModes, RenderSettings, ToolColors, get_tool_color
+from .settings import RenderSettings, ToolColors, get_tool_color
+from .undo_manager import MaskedTileChangeAction
+
+# How a new rectangle or magic wand selection combines with the current one
+COMBINE_MODES = ("replace", "add", "intersect", "subtract")
 
 
 class SelectTool(MapTool):
@@ -36,13 +42,13 @@ class SelectTool(MapTool):
         self.selection_end: Optional[Tuple[int, int]] = None
         self.is_selecting = False
         self.selection_mode = "rectangle"  # "rectangle" or "magic_wand"
-        self.magic_wand_selection: Set[Tuple[int, int]] = set()
+        self.combine_mode = "replace"  # One of COMBINE_MODES
+        self.selection: Optional[TileMask] = None
         self.clipboard: Optional[Dict] = None  # Stores copied tiles
 
     def on_mouse_down(self, grid_x: int, grid_y: int, button: int, context: ToolContext) -> bool:
         if button == 0:  # Left click - Rectangle selection
             self.selection_mode = "rectangle"
-            self.magic_wand_selection.clear()
             self.selection_start = (grid_x, grid_y)
             self.selection_end = (grid_x, grid_y)
             self.is_selecting = True
@@ -80,8 +86,44 @@ class SelectTool(MapTool):
             height = max_y - min_y + 1
             print(f"Selected region: ({min_x}, {min_y}) to ({max_x}, {max_y}) [{width}x{height}]")
 
+            self._combine_selection(
+                TileMask.from_rect(
+                    context.grid_width, context.grid_height, min_x, min_y, width, height
+                )
+            )
+
         return True
 
+    def set_combine_mode(self, mode: str):
+        """
+        Set how new selections combine with the current one.
+
+        Args:
+            mode: "replace", "add", "intersect" or "subtract"
+
+        Raises:
+            ValueError: If the mode is unknown
+        """
+        if mode not in COMBINE_MODES:
+            raise ValueError(f"Unknown selection combine mode: {mode}")
+        self.combine_mode = mode
+
+    def _combine_selection(self, mask: TileMask):
+        """Combine a new selection with the current one according to combine_mode."""
+        current = self.selection
+        if (
+            current is None
+            or self.combine_mode == "replace"
+            or (current.width, current.height) != (mask.width, mask.height)
+        ):
+            self.selection = mask
+        elif self.combine_mode == "add":
+            self.selection = current | mask
+        elif self.combine_mode == "intersect":
+            self.selection = current & mask
+        else:
+            self.selection = current - mask
+
     def _magic_wand_select(self, start_x: int, start_y: int, context: ToolContext) -> bool:
         """
         Perform magic wand selection (select contiguous same-type tiles).
@@ -105,41 +147,14 @@ class SelectTool(MapTool):
         target_tile = context.tilemap.get_tile(start_x, start_y, context.current_layer)
         target_type = target_tile.tile_type if target_tile else None
 
-        # Clear previous magic wand selection
-        self.magic_wand_selection.clear()
-
-        # Perform BFS to find contiguous tiles
-        visited: Set[Tuple[int, int]] = set()
-        queue: deque = deque([(start_x, start_y)])
-        visited.add((start_x, start_y))
-
-        while queue:
-            x, y = queue.popleft()
+        # Scanline fill over the cells of that type (4-way connectivity)
+        match = context.tilemap.tile_type_mask(context.current_layer, target_type)
+        match = match[: context.grid_height, : context.grid_width]
+        region = TileMask(match.shape[1], match.shape[0], flood_mask(match, start_x, start_y))
+        self._combine_selection(region)
 
-            # Check if this position has the target tile type
-            current_tile = context.tilemap.get_tile(x, y, context.current_layer)
-            current_type = current_tile.tile_type if current_tile else None
-
-            if current_type != target_type:
-                continue
-
-            # Add to selection
-            self.magic_wand_selection.add((x, y))
-
-            # Add neighbors to queue (using 4-way connectivity)
-            for dx, dy in ConnectivityModes.FOUR_WAY:
-                nx, ny = x + dx, y + dy
-
-                if (
-                    0 <= nx < context.grid_width
-                    and 0 <= ny < context.grid_height
-                    and (nx, ny) not in visited
-                ):
-                    visited.add((nx, ny))
-                    queue.append((nx, ny))
-
-        print(f"Magic wand selected {len(self.magic_wand_selection)} tiles")
-        return len(self.magic_wand_selection) > 0
+        print(f"Magic wand selected {len(region)} tiles")
+        return len(region) > 0
 
     def get_selection_bounds(self) -> Optional[Tuple[int, int, int, int]]:
         """
@@ -148,19 +163,8 @@ class SelectTool(MapTool):
         Returns:
             Tuple of (min_x, min_y, max_x, max_y) or None if no selection
         """
-        if self.selection_mode == "rectangle" and self.selection_start and self.selection_end:
-            min_x = min(self.selection_start[0], self.selection_end[0])
-            max_x = max(self.selection_start[0], self.selection_end[0])
-            min_y = min(self.selection_start[1], self.selection_end[1])
-            max_y = max(self.selection_start[1], self.selection_end[1])
-            return (min_x, min_y, max_x, max_y)
-        elif self.selection_mode == "magic_wand" and self.magic_wand_selection:
-            coords = list(self.magic_wand_selection)
-            min_x = min(x for x, y in coords)
-            max_x = max(x for x, y in coords)
-            min_y = min(y for x, y in coords)
-            max_y = max(y for x, y in coords)
-            return (min_x, min_y, max_x, max_y)
+        if self.selection is not None:
+            return self.selection.bounds()
         return None
 
     def get_selected_tiles(self) -> Set[Tuple[int, int]]:
@@ -170,15 +174,8 @@ class SelectTool(MapTool):
         Returns:
             Set of (x, y) tuples
         """
-        if self.selection_mode == "rectangle" and self.selection_start and self.selection_end:
-            min_x = min(self.selection_start[0], self.selection_end[0])
-            max_x = max(self.selection_start[0], self.selection_end[0])
-            min_y = min(self.selection_start[1], self.selection_end[1])
-            max_y = max(self.selection_start[1], self.selection_end[1])
-
-            return {(x, y) for x in range(min_x, max_x + 1) for y in range(min_y, max_y + 1)}
-        elif self.selection_mode == "magic_wand":
-            return self.magic_wand_selection.copy()
+        if self.selection is not None:
+            return set(self.selection.cells())
         return set()
 
     def copy_selection(self, context: ToolContext):
@@ -209,12 +206,19 @@ class SelectTool(MapTool):
         # Copy first
         self.copy_selection(context)
 
-        # Then delete
-        selected_tiles = self.get_selected_tiles()
-        for x, y in selected_tiles:
-            context.tilemap.set_tile(x, y, context.current_layer, None)
+        # Then delete, as one undoable change
+        if self.selection is None:
+            return
+        cropped = crop_mask(self.selection.bits)
+        if cropped is None:
+            return
+        mask, x, y = cropped
+        action = MaskedTileChangeAction(context.tilemap, context.current_layer, mask, x, y, None)
+        action.redo()
+        if context.undo_manager:
+            context.undo_manager.record_action(action)
 
-        print(f"Cut {len(selected_tiles)} tiles to clipboard")
+        print(f"Cut {action.cell_count} tiles to clipboard")
 
     def paste_selection(self, grid_x: int, grid_y: int, context: ToolContext):
         """Paste clipboard at the given position."""
@@ -249,7 +253,7 @@ class SelectTool(MapTool):
         self.selection_start = None
         self.selection_end = None
         self.is_selecting = False
-        self.magic_wand_selection.clear()
+        self.selection = None
 
     def render_cursor(
         self,
@@ -260,8 +264,12 @@ class SelectTool(MapTool):
         camera_offset: Tuple[int, int],
     ):
         """Render selection cursor and selection box."""
-        # Render rectangle selection box if selecting
-        if self.selection_mode == "rectangle" and self.selection_start and self.selection_end:
+        # Render the current selection
+        if self.selection is not None:
+            self._render_selection(screen, tile_size, camera_offset)
+
+        # Render rectangle selection box while dragging
+        if self.is_selecting and self.selection_start and self.selection_end:
             min_x = min(self.selection_start[0], self.selection_end[0])
             max_x = max(self.selection_start[0], self.selection_end[0])
             min_y = min(self.selection_start[1], self.selection_end[1])
@@ -285,27 +293,6 @@ class SelectTool(MapTool):
             overlay.fill((*ToolColors.CURSOR_SELECT_RECT, RenderSettings.SELECTION_OVERLAY_ALPHA))
             screen.blit(overlay, (screen_x, screen_y))
 
-        # Render magic wand selection
-        elif self.selection_mode == "magic_wand" and self.magic_wand_selection:
-            for sel_x, sel_y in self.magic_wand_selection:
-                screen_x = sel_x * tile_size + camera_offset[0]
-                screen_y = sel_y * tile_size + camera_offset[1]
-
-                # Draw selection box for each tile
-                pygame.draw.rect(
-                    screen,
-                    ToolColors.CURSOR_SELECT_WAND,
-                    (screen_x, screen_y, tile_size, tile_size),
-                    RenderSettings.CURSOR_OUTLINE_WIDTH,
-                )
-
-                # Draw semi-transparent overlay
-                overlay = pygame.Surface((tile_size, tile_size), pygame.SRCALPHA)
-                overlay.fill(
-                    (*ToolColors.CURSOR_SELECT_WAND, RenderSettings.SELECTION_OVERLAY_ALPHA)
-                )
-                screen.blit(overlay, (screen_x, screen_y))
-
         # Draw cursor
         screen_x = grid_x * tile_size + camera_offset[0]
         screen_y = grid_y * tile_size + camera_offset[1]
@@ -321,3 +308,36 @@ class SelectTool(MapTool):
             (screen_x, screen_y, tile_size, tile_size),
             RenderSettings.CURSOR_OUTLINE_WIDTH,
         )
+
+    def _render_selection(
+        self, screen: pygame.Surface, tile_size: int, camera_offset: Tuple[int, int]
+    ):
+        """Draw the selected cells that are on screen."""
+        color = (
+            ToolColors.CURSOR_SELECT_RECT
+            if self.selection_mode == "rectangle"
+            else ToolColors.CURSOR_SELECT_WAND
+        )
+        bits = self.selection.bits
+
+        # Only visit the cells inside the screen
+        min_x = max(0, -camera_offset[0] // tile_size)
+        min_y = max(0, -camera_offset[1] // tile_size)
+        max_x = min(bits.shape[1], (screen.get_width() - camera_offset[0]) // tile_size + 1)
+        max_y = min(bits.shape[0], (screen.get_height() - camera_offset[1]) // tile_size + 1)
+        if min_x >= max_x or min_y >= max_y:
+            return
+        ys, xs = bits[min_y:max_y, min_x:max_x].nonzero()
+
+        overlay = pygame.Surface((tile_size, tile_size), pygame.SRCALPHA)
+        overlay.fill((*color, RenderSettings.SELECTION_OVERLAY_ALPHA))
+        for sel_x, sel_y in zip((xs + min_x).tolist(), (ys + min_y).tolist()):
+            screen_x = sel_x * tile_size + camera_offset[0]
+            screen_y = sel_y * tile_size + camera_offset[1]
+            screen.blit(overlay, (screen_x, screen_y))
+            pygame.draw.rect(
+                screen,
+                color,
+                (screen_x, screen_y, tile_size, tile_size),
+                RenderSettings.CURSOR_OUTLINE_WIDTH,
+            )
@@ -73,7 +73,8 @@ class ToolLimits:
     """Limits and thresholds for tool operations."""
 
     # Fill tool
-    MAX_FILL_CELLS = 10000  # Maximum tiles to fill (safety limit)
+    # Fills are no longer capped; kept so saved preferences still load
+    MAX_FILL_CELLS = 10000
 
     # Undo/redo
     MAX_UNDO_HISTORY = 100  # Maximum number of actions to keep in undo stack
@@ -308,6 +309,7 @@ def get_default_stamps() -> Dict:
     Returns:
         Dict mapping stamp names to stamp definitions
     """
+
     def _augment(stamp: Dict) -> Dict:
         """Add legacy-friendly fields to stamp definitions."""
         data = dict(stamp)
@@ -7,6 +7,8 @@ Provides a comprehensive undo/redo system that supports all layer operations.
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
+
 from ...rendering.tilemap import Tile, Tilemap
 from .settings import ToolLimits
 
@@ -109,6 +111,64 @@ class BatchTileChangeAction(UndoableAction):
         return f"Changed {len(self.changes)} tiles"
 
 
+class MaskedTileChangeAction(UndoableAction):
+    """
+    Action for setting a masked region of one layer to a single tile.
+
+    Stores the mask (best cropped to its bounds) and the old tile IDs and
+    Tile metadata of its cells, instead of a change record per cell.
+    """
+
+    def __init__(
+        self,
+        tilemap: Tilemap,
+        layer: int,
+        mask: np.ndarray,
+        x: int,
+        y: int,
+        new_tile: Optional[Tile],
+    ):
+        """
+        Initialize masked tile change action and read the old tiles.
+
+        Call before applying the change.
+
+        Args:
+            tilemap: Tilemap to modify
+            layer: Layer index
+            mask: Boolean array of changed cells, top-left cell at (x, y)
+            x: Grid X of the mask's left edge
+            y: Grid Y of the mask's top edge
+            new_tile: Tile placed on every cell (or None to clear)
+        """
+        self.tilemap = tilemap
+        self.layer = layer
+        self.mask = mask
+        self.x = x
+        self.y = y
+        self.new_tile = new_tile
+        self.old_ids, self.old_metadata = tilemap.read_masked(layer, mask, x, y)
+
+    @property
+    def cell_count(self) -> int:
+        """Number of changed cells"""
+        return len(self.old_ids)
+
+    def undo(self):
+        """Restore the old tiles."""
+        self.tilemap.restore_masked(
+            self.layer, self.mask, self.old_ids, self.old_metadata, self.x, self.y
+        )
+
+    def redo(self):
+        """Set the region to the new tile again."""
+        self.tilemap.fill_masked(self.layer, self.mask, self.new_tile, self.x, self.y)
+
+    def get_description(self) -> str:
+        """Get description of this action."""
+        return f"Changed {self.cell_count} tiles"
+
+
 class EntityChangeAction(UndoableAction):
     """Action for entity creation/deletion."""
 
@@ -2,6 +2,24 @@
 Utility modules for NeonWorks engine
 """
 
+from .benchmark_suite import (
+    BENCHMARKS,
+    BenchmarkComparison,
+    BenchmarkReport,
+    BenchmarkResult,
+    run_benchmarks,
+)
+from .memory_diagnostics import (
+    CacheMemory,
+    MemoryDiagnostics,
+    MemoryReport,
+    MemoryReporter,
+    SubsystemMemory,
+    get_memory_diagnostics,
+    register_memory_reporter,
+    start_memory_diagnostics,
+    stop_memory_diagnostics,
+)
 from .performance_monitor import (
     FrameMetrics,
     PerformanceMonitor,
@@ -21,6 +39,15 @@ from .profiler import (
     profile_function,
     save_profile_stats,
 )
+from .system_profiler import SlowUpdate, SystemProfiler, SystemTimingStats
+from .trace_recorder import (
+    TraceRecorder,
+    get_trace_recorder,
+    start_tracing,
+    stop_tracing,
+    trace_span,
+    traced,
+)
 
 __all__ = [
     # Profiler
@@ -40,4 +67,31 @@ __all__ = [
     "get_performance_monitor",
     "enable_performance_monitoring",
     "disable_performance_monitoring",
+    # System Profiler
+    "SystemProfiler",
+    "SystemTimingStats",
+    "SlowUpdate",
+    # Trace Recorder
+    "TraceRecorder",
+    "get_trace_recorder",
+    "start_tracing",
+    "stop_tracing",
+    "trace_span",
+    "traced",
+    # Benchmark Suite
+    "BENCHMARKS",
+    "BenchmarkResult",
+    "BenchmarkReport",
+    "BenchmarkComparison",
+    "run_benchmarks",
+    # Memory Diagnostics
+    "MemoryDiagnostics",
+    "MemoryReport",
+    "MemoryReporter",
+    "SubsystemMemory",
+    "CacheMemory",
+    "register_memory_reporter",
+    "get_memory_diagnostics",
+    "start_memory_diagnostics",
+    "stop_memory_diagnostics",
 ]
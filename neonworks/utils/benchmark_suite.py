@@ -0,0 +1,546 @@
+"""
+Benchmark Suite
+
+Reproducible headless benchmarks of the engine's hot paths: ECS queries,
+collision, pathfinding, particle updates, tilemap rendering, event dispatch,
+database search, save/load and package reads. Every benchmark builds its
+workload from a seed and a scale factor, so two runs with the same arguments
+time the same work.
+
+Results are written as JSON together with machine information and can be
+compared against a stored baseline; benchmarks whose median time grew by more
+than a tolerance are reported as regressions.
+
+Usage:
+    report = run_benchmarks(scale=1.0, seed=0)
+    report.write("bench.json")
+
+    baseline = BenchmarkReport.load("baseline.json")
+    for comparison in report.compare(baseline, tolerance=0.1):
+        if comparison.regressed:
+            print(comparison.describe())
+"""
+
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+
+# A benchmark setup builds its workload and returns the callable that is timed
+BenchmarkSetup = Callable[[random.Random, float, Path], Callable[[], Any]]
+
+BENCHMARKS: Dict[str, BenchmarkSetup] = {}
+
+DEFAULT_TOLERANCE = 0.10
+
+
+def benchmark(name: str) -> Callable[[BenchmarkSetup], BenchmarkSetup]:
+    """
+    Decorator registering a benchmark setup under a name.
+
+    The setup receives a seeded random.Random, the scale factor and a scratch
+    directory, and returns the callable that is timed.
+    """
+
+    def decorator(setup: BenchmarkSetup) -> BenchmarkSetup:
+        BENCHMARKS[name] = setup
+        return setup
+
+    return decorator
+
+
+@dataclass
+class BenchmarkResult:
+    """Timings of one benchmark (milliseconds)"""
+
+    name: str
+    samples_ms: List[float] = field(default_factory=list)
+    setup_ms: float = 0.0
+
+    @property
+    def median_ms(self) -> float:
+        return statistics.median(self.samples_ms)
+
+    @property
+    def min_ms(self) -> float:
+        return min(self.samples_ms)
+
+    @property
+    def stdev_ms(self) -> float:
+        return statistics.stdev(self.samples_ms) if len(self.samples_ms) > 1 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "median_ms": self.median_ms,
+            "min_ms": self.min_ms,
+            "max_ms": max(self.samples_ms),
+            "stdev_ms": self.stdev_ms,
+            "setup_ms": self.setup_ms,
+            "samples_ms": self.samples_ms,
+        }
+
+
+@dataclass
+class BenchmarkComparison:
+    """Median time of a benchmark against its baseline"""
+
+    name: str
+    median_ms: float
+    baseline_ms: float
+    tolerance: float
+
+    @property
+    def ratio(self) -> float:
+        return self.median_ms / self.baseline_ms if self.baseline_ms > 0 else float("inf")
+
+    @property
+    def regressed(self) -> bool:
+        return self.ratio > 1.0 + self.tolerance
+
+    @property
+    def improved(self) -> bool:
+        return self.ratio < 1.0 - self.tolerance
+
+    def describe(self) -> str:
+        """Format the comparison as one report line"""
+        status = "REGRESSED" if self.regressed else "improved" if self.improved else "ok"
+        return (
+            f"{self.name:<20} {self.median_ms:>10.3f}ms vs {self.baseline_ms:>10.3f}ms "
+            f"({self.ratio - 1.0:+.1%}) {status}"
+        )
+
+
+@dataclass
+class BenchmarkReport:
+    """Results of a benchmark run with the settings and machine that produced them"""
+
+    results: Dict[str, BenchmarkResult]
+    scale: float
+    seed: int
+    repeat: int
+    machine: Dict[str, Any] = field(default_factory=dict)
+    timestamp: str = ""
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "timestamp": self.timestamp,
+            "scale": self.scale,
+            "seed": self.seed,
+            "repeat": self.repeat,
+            "machine": self.machine,
+            "results": {name: result.to_dict() for name, result in self.results.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "BenchmarkReport":
+        results = {
+            name: BenchmarkResult(name, list(values["samples_ms"]), values.get("setup_ms", 0.0))
+            for name, values in data.get("results", {}).items()
+        }
+        return cls(
+            results=results,
+            scale=data.get("scale", 1.0),
+            seed=data.get("seed", 0),
+            repeat=data.get("repeat", 0),
+            machine=data.get("machine", {}),
+            timestamp=data.get("timestamp", ""),
+        )
+
+    def write(self, path: Union[str, Path]) -> Path:
+        """Write the report as JSON"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_suffix(path.suffix + ".tmp")
+        with open(temp_path, "w") as f:
+            json.dump(self.to_dict(), f, indent=2)
+        os.replace(temp_path, path)
+        return path
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "BenchmarkReport":
+        """Load a report written by write()"""
+        with open(path, "r") as f:
+            return cls.from_dict(json.load(f))
+
+    def compare(
+        self, baseline: "BenchmarkReport", tolerance: float = DEFAULT_TOLERANCE
+    ) -> List[BenchmarkComparison]:
+        """
+        Compare median times against a baseline report.
+
+        Args:
+            baseline: Report of an earlier run
+            tolerance: Allowed relative slowdown (0.1 = 10%) before a
+                benchmark counts as regressed
+
+        Returns:
+            One comparison per benchmark present in both reports
+
+        Raises:
+            ValueError: If the reports were run at different scales or seeds,
+                so their timings are not comparable
+        """
+        if (baseline.scale, baseline.seed) != (self.scale, self.seed):
+            raise ValueError(
+                f"Baseline was run with scale {baseline.scale} and seed {baseline.seed}, "
+                f"not scale {self.scale} and seed {self.seed}"
+            )
+        return [
+            BenchmarkComparison(name, result.median_ms, baseline.results[name].median_ms, tolerance)
+            for name, result in self.results.items()
+            if name in baseline.results
+        ]
+
+
+def machine_info() -> Dict[str, Any]:
+    """Describe the machine and library versions a benchmark ran on"""
+    info: Dict[str, Any] = {
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+    }
+    for module_name in ("numpy", "pygame"):
+        module = sys.modules.get(module_name)
+        if module is None:
+            try:
+                module = __import__(module_name)
+            except ImportError:
+                continue
+        info[module_name] = getattr(module, "__version__", "unknown")
+    return info
+
+
+def run_benchmarks(
+    names: Optional[Sequence[str]] = None,
+    scale: float = 1.0,
+    seed: int = 0,
+    repeat: int = 5,
+    on_result: Optional[Callable[[BenchmarkResult], None]] = None,
+) -> BenchmarkReport:
+    """
+    Run benchmarks and collect their timings.
+
+    Each benchmark is set up once from the seed, warmed up with one untimed
+    call, then timed `repeat` times.
+
+    Args:
+        names: Benchmarks to run (default: all of BENCHMARKS)
+        scale: Workload size factor (1.0 = default sizes)
+        seed: Seed of every benchmark's workload
+        repeat: Timed calls per benchmark
+        on_result: Called with each result as it finishes
+
+    Returns:
+        Benchmark report
+
+    Raises:
+        ValueError: If a name is not a registered benchmark
+    """
+    if scale <= 0 or repeat <= 0:
+        raise ValueError("Scale and repeat must be positive")
+    names = list(names) if names else list(BENCHMARKS)
+    unknown = [name for name in names if name not in BENCHMARKS]
+    if unknown:
+        raise ValueError(f"Unknown benchmark(s): {', '.join(unknown)}")
+
+    # Pygame must not open a window while benchmarking
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+    results: Dict[str, BenchmarkResult] = {}
+    for name in names:
+        # Seed the global generators too, for code that draws from them directly
+        random.seed(seed)
+        _seed_numpy(seed)
+        with tempfile.TemporaryDirectory(prefix=f"neonworks-bench-{name}-") as workdir:
+            start = time.perf_counter()
+            run = BENCHMARKS[name](random.Random(seed), scale, Path(workdir))
+            result = BenchmarkResult(name, setup_ms=(time.perf_counter() - start) * 1000)
+
+            run()
+            for _ in range(repeat):
+                start = time.perf_counter()
+                run()
+                result.samples_ms.append((time.perf_counter() - start) * 1000)
+
+        results[name] = result
+        if on_result:
+            on_result(result)
+
+    return BenchmarkReport(
+        results=results,
+        scale=scale,
+        seed=seed,
+        repeat=repeat,
+        machine=machine_info(),
+        timestamp=datetime.now().isoformat(timespec="seconds"),
+    )
+
+
+def _seed_numpy(seed: int):
+    try:
+        import numpy as np
+    except ImportError:
+        return
+    np.random.seed(seed)
+
+
+def _scaled(count: int, scale: float) -> int:
+    return max(1, int(count * scale))
+
+
+@benchmark("ecs_query")
+def _bench_ecs_query(rng: random.Random, scale: float, workdir: Path) -> Callable[[], Any]:
+    from neonworks.core.ecs import GridPosition, Health, Transform, World
+
+    world = World()
+    for index in range(_scaled(5000, scale)):
+        entity = world.create_entity()
+        entity.add_component(Transform(x=rng.uniform(0, 1000), y=rng.uniform(0, 1000)))
+        if rng.random() < 0.5:
+            entity.add_component(Health(current=100, maximum=100))
+        if rng.random() < 0.3:
+            entity.add_component(GridPosition(grid_x=index % 100, grid_y=index // 100))
+        if rng.random() < 0.2:
+            entity.add_tag("enemy")
+
+    def run():
+        for _ in range(20):
+            world.get_entities_with_component(Transform)
+            world.get_entities_with_components(Transform, Health)
+            world.get_entities_with_components(Health, GridPosition)
+            world.get_entities_with_tag("enemy")
+
+    return run
+
+
+@benchmark("collision")
+def _bench_collision(rng: random.Random, scale: float, workdir: Path) -> Callable[[], Any]:
+    from neonworks.core.ecs import Transform, World
+    from neonworks.physics.collision import Collider, ColliderType, CollisionSystem
+
+    world = World()
+    for _ in range(_scaled(1000, scale)):
+        entity = world.create_entity()
+        entity.add_component(Transform(x=rng.uniform(0, 2000), y=rng.uniform(0, 2000)))
+        if rng.random() < 0.5:
+            entity.add_component(Collider(ColliderType.AABB, width=16, height=16))
+        else:
+            entity.add_component(Collider(ColliderType.CIRCLE, radius=8))
+    system = CollisionSystem(world_bounds=(0, 0, 2000, 2000))
+
+    return lambda: system.update(world)
+
+
+@benchmark("pathfinding")
+def _bench_pathfinding(rng: random.Random, scale: float, workdir: Path) -> Callable[[], Any]:
+    from neonworks.core.ecs import Navmesh
+    from neonworks.systems.pathfinding import PathfindingSystem
+
+    size = _scaled(128, scale**0.5)
+    navmesh = Navmesh()
+    for y in range(size):
+        for x in range(size):
+            if rng.random() < 0.8:
+                navmesh.walkable_cells.add((x, y))
+            if rng.random() < 0.1:
+                navmesh.cost_multipliers[(x, y)] = 2.0
+    cells = sorted(navmesh.walkable_cells)
+    requests = [(rng.choice(cells), rng.choice(cells)) for _ in range(20)]
+
+    def run():
+        system = PathfindingSystem()  # Fresh caches, so every call searches
+        for (start_x, start_y), (goal_x, goal_y) in requests:
+            system.find_path(start_x, start_y, goal_x, goal_y, navmesh)
+
+    return run
+
+
+@benchmark("particles")
+def _bench_particles(rng: random.Random, scale: float, workdir: Path) -> Callable[[], Any]:
+    from neonworks.rendering.particles import ParticleEmitter, ParticleSystem
+
+    system = ParticleSystem()
+    for _ in range(_scaled(10, scale)):
+        emitter = ParticleEmitter(
+            x=rng.uniform(0, 1000),
+            y=rng.uniform(0, 1000),
+            emit_rate=200.0,
+            max_particles=200,
+            end_color=(255, 0, 0, 0),
+            end_size=0.5,
+            drag=0.1,
+        )
+        emitter.burst(emitter.max_particles)
+        system.add_emitter(emitter)
+
+    def run():
+        for _ in range(30):
+            system.update(1 / 60)
+
+    return run
+
+
+@benchmark("tilemap_render")
+def _bench_tilemap_render(rng: random.Random, scale: float, workdir: Path) -> Callable[[], Any]:
+    import pygame
+
+    from neonworks.rendering.assets import AssetManager
+    from neonworks.rendering.camera import Camera
+    from neonworks.rendering.tilemap import OptimizedTilemapRenderer, Tilemap, Tileset
+
+    pygame.init()
+    screen = pygame.Surface((1280, 720))
+    size = _scaled(200, scale**0.5)
+    tilemap = Tilemap(size, size, 32, 32)
+    tileset = Tileset(
+        name="bench",
+        texture_path="bench.png",
+        tile_width=32,
+        tile_height=32,
+        columns=16,
+        tile_count=256,
+    )
+    for tile_id in range(256):
+        surface = pygame.Surface((32, 32))
+        surface.fill(((tile_id * 7) % 256, (tile_id * 13) % 256, (tile_id * 19) % 256))
+        tileset.tiles[tile_id] = surface
+    tilemap.add_tileset(tileset)
+    for layer_name, density in (("Ground", 1.0), ("Objects", 0.2)):
+        layer = tilemap.get_enhanced_layer(tilemap.create_enhanced_layer(layer_name))
+        for y in range(size):
+            for x in range(size):
+                if rng.random() < density:
+                    layer.set_tile(x, y, rng.randint(1, 255))
+
+    renderer = OptimizedTilemapRenderer(AssetManager(workdir), enable_caching=True)
+    camera = Camera(1280, 720, tile_size=32)
+    span = max(1, size * 32 - 1280)
+    positions = [(rng.uniform(0, span), rng.uniform(0, span)) for _ in range(60)]
+
+    def run():
+        for camera.x, camera.y in positions:
+            screen.fill((0, 0, 0))
+            renderer.render(screen, tilemap, camera)
+
+    return run
+
+
+@benchmark("event_dispatch")
+def _bench_event_dispatch(rng: random.Random, scale: float, workdir: Path) -> Callable[[], Any]:
+    from neonworks.core.events import Event, EventManager, EventType
+
+    manager = EventManager()
+    event_types = list(EventType)
+    received = [0]
+
+    def handler(event):
+        received[0] += 1
+
+    for _ in range(_scaled(200, scale)):
+        manager.subscribe(rng.choice(event_types), handler)
+    events = [
+        Event(rng.choice(event_types), {"value": rng.random()}) for _ in range(_scaled(5000, scale))
+    ]
+
+    def run():
+        for event in events:
+            manager.emit(event)
+        manager.process_events()
+
+    return run
+
+
+@benchmark("database_search")
+def _bench_database_search(rng: random.Random, scale: float, workdir: Path) -> Callable[[], Any]:
+    from neonworks.engine.data.database_manager import DatabaseManager
+    from neonworks.engine.data.database_schema import Item, ItemType
+
+    adjectives = ["Rusty", "Shiny", "Ancient", "Cursed", "Blessed", "Heavy", "Crimson"]
+    nouns = ["Potion", "Sword", "Shield", "Ring", "Amulet", "Herb", "Scroll"]
+    item_types = list(ItemType)
+    manager = DatabaseManager()
+    count = min(_scaled(5000, scale), Item.MAX_ID)
+    for item_id in range(1, count + 1):
+        manager.create(
+            "items",
+            Item(
+                id=item_id,
+                name=f"{rng.choice(adjectives)} {rng.choice(nouns)} {item_id}",
+                description=f"Found in zone {rng.randint(0, 500)}",
+                price=rng.randint(0, 100000),
+                item_type=rng.choice(item_types),
+            ),
+        )
+    queries = [f"{rng.choice(adjectives)} {rng.choice(nouns)[:3]}" for _ in range(5)]
+    queries += [str(rng.randint(1, count)) for _ in range(5)]
+
+    def run():
+        for query in queries:
+            manager.search(query)
+        manager.filter_by_field("items", "price", 90000, operator="ge")
+
+    return run
+
+
+@benchmark("save_load")
+def _bench_save_load(rng: random.Random, scale: float, workdir: Path) -> Callable[[], Any]:
+    from neonworks.core.ecs import GridPosition, Health, Transform, World
+    from neonworks.core.serialization import GameSerializer, SerializationFormat
+
+    serializer = GameSerializer()
+    serializer.register_components([Transform, Health, GridPosition])
+    world = World()
+    for _ in range(_scaled(2000, scale)):
+        entity = world.create_entity()
+        entity.add_component(Transform(x=rng.uniform(0, 1000), y=rng.uniform(0, 1000)))
+        entity.add_component(Health(current=rng.randint(1, 100), maximum=100))
+        entity.add_component(GridPosition(grid_x=rng.randint(0, 99), grid_y=rng.randint(0, 99)))
+
+    def run():
+        for format in (SerializationFormat.JSON, SerializationFormat.BINARY):
+            path = workdir / f"save.{format.value}"
+            serializer.save_game(world, path, format)
+            serializer.load_game(path, format)
+
+    return run
+
+
+@benchmark("package_read")
+def _bench_package_read(rng: random.Random, scale: float, workdir: Path) -> Callable[[], Any]:
+    from neonworks.export.package_builder import PackageBuilder, PackageConfig
+    from neonworks.export.package_loader import PackageLoader
+
+    source = workdir / "project"
+    source.mkdir()
+    for index in range(_scaled(200, scale)):
+        # Half compressible text, half random bytes
+        if index % 2:
+            data = rng.randbytes(rng.randint(1024, 16384))
+        else:
+            data = (f"line {index} " * rng.randint(100, 1600)).encode()
+        (source / f"file_{index:04d}.bin").write_bytes(data)
+
+    builder = PackageBuilder(PackageConfig(compress=True))
+    builder.add_directory(source)
+    package_path = workdir / "bench.nwdata"
+    builder.build(package_path)
+
+    def run():
+        loader = PackageLoader(package_path)
+        loader.load_index()
+        for filename in loader.list_files():
+            loader.load_file(filename)
+
+    return run
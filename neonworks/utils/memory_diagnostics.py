@@ -0,0 +1,530 @@
+"""
+Memory Diagnostics
+
+Attributes memory growth in long sessions to engine subsystems. Python
+allocations are traced with tracemalloc: each snapshot is diffed against the
+previous one and grouped by the NeonWorks module (or, for modules listed in
+SUBSYSTEM_CLASSES, the class) that made the allocation: asset caches, chunk
+cache, tilemaps, undo history, ECS, ... Pixel and sample buffers of pygame
+surfaces and sounds live outside the Python allocator, so classes that own
+caches of them implement MemoryReporter and report their exact byte counts
+alongside.
+
+Snapshots are taken on demand or every N minutes from the game loop, and the
+reports can be dumped as JSON.
+
+Usage:
+    diagnostics = start_memory_diagnostics(interval_minutes=5)
+
+    report = diagnostics.take_snapshot()
+    for line in diagnostics.format_summary(report):
+        print(line)
+
+    diagnostics.dump("memory.json")
+"""
+
+import ast
+import json
+import os
+import time
+import tracemalloc
+import weakref
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Protocol, Tuple, Union, runtime_checkable
+
+# Subsystems
+ASSET_CACHES = "asset caches"
+CHUNK_CACHE = "chunk cache"
+TILEMAP = "tilemap"
+UNDO_HISTORY = "undo history"
+ECS = "ecs"
+THUMBNAILS = "thumbnails"
+OTHER = "other"
+
+# Modules (relative to the neonworks package) whose allocations belong to a
+# subsystem; allocations in other NeonWorks modules are grouped by package
+SUBSYSTEM_MODULES = {
+    "rendering/assets.py": ASSET_CACHES,
+    "rendering/asset_pipeline.py": ASSET_CACHES,
+    "engine/tools/layer_cache.py": ASSET_CACHES,
+    "rendering/tilemap.py": TILEMAP,
+    "core/undo_manager.py": UNDO_HISTORY,
+    "ui/map_tools/undo_manager.py": UNDO_HISTORY,
+    "core/ecs.py": ECS,
+}
+
+# Classes whose allocations belong to a different subsystem than the rest of
+# their module, by module
+SUBSYSTEM_CLASSES = {
+    "rendering/tilemap.py": {"OptimizedTilemapRenderer": CHUNK_CACHE},
+}
+
+DEFAULT_FRAMES = 16
+
+_PACKAGE_DIR = Path(__file__).resolve().parent.parent
+
+# Allocations made by the diagnostics themselves
+_IGNORED_FILES = {tracemalloc.__file__, __file__}
+
+
+@dataclass
+class CacheMemory:
+    """Exact size of one cache"""
+
+    subsystem: str
+    name: str
+    bytes: int
+    entries: int = 0
+
+
+@runtime_checkable
+class MemoryReporter(Protocol):
+    """
+    Object that reports the exact size of the caches it owns.
+
+    Implementers call register_memory_reporter(self) when created; the
+    registry holds them weakly.
+    """
+
+    def report_memory(self) -> List[CacheMemory]:
+        """Report the size of each cache"""
+        ...
+
+
+@dataclass
+class SubsystemMemory:
+    """Memory attributed to one subsystem"""
+
+    name: str
+    traced_bytes: int = 0  # Live Python allocations made by the subsystem
+    traced_blocks: int = 0
+    change_bytes: int = 0  # Since the previous snapshot
+    growth_bytes: int = 0  # Since diagnostics started
+    reported_bytes: int = 0  # Exact cache sizes from MemoryReporters
+    caches: List[CacheMemory] = field(default_factory=list)
+
+    @property
+    def total_bytes(self) -> int:
+        return self.traced_bytes + self.reported_bytes
+
+
+@dataclass
+class AllocationSite:
+    """Live allocations made at one source line"""
+
+    site: str  # module:line
+    subsystem: str
+    size_bytes: int
+    change_bytes: int
+    blocks: int
+
+
+@dataclass
+class MemoryReport:
+    """Memory attribution at one snapshot"""
+
+    snapshot: int
+    timestamp: float
+    elapsed: float  # Seconds since diagnostics started
+    traced_bytes: int
+    traced_peak_bytes: int
+    rss_bytes: int
+    subsystems: Dict[str, SubsystemMemory] = field(default_factory=dict)  # Largest first
+    top_growth: List[AllocationSite] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["subsystems"] = [
+            dict(asdict(subsystem), total_bytes=subsystem.total_bytes)
+            for subsystem in self.subsystems.values()
+        ]
+        return data
+
+
+# Registered reporters (held weakly so caches can still be freed)
+_reporters: "weakref.WeakSet[MemoryReporter]" = weakref.WeakSet()
+
+
+def register_memory_reporter(reporter: MemoryReporter):
+    """
+    Register an object whose caches are included in memory reports.
+
+    Args:
+        reporter: Object implementing MemoryReporter
+    """
+    _reporters.add(reporter)
+
+
+def collect_cache_memory() -> List[CacheMemory]:
+    """
+    Collect the cache sizes of every live registered reporter.
+
+    Returns:
+        One entry per (subsystem, cache name), summed over reporters, largest first
+    """
+    totals: Dict[Tuple[str, str], CacheMemory] = {}
+    for reporter in list(_reporters):
+        for cache in reporter.report_memory():
+            key = (cache.subsystem, cache.name)
+            total = totals.get(key)
+            if total is None:
+                totals[key] = CacheMemory(cache.subsystem, cache.name, cache.bytes, cache.entries)
+            else:
+                total.bytes += cache.bytes
+                total.entries += cache.entries
+    return sorted(totals.values(), key=lambda cache: -cache.bytes)
+
+
+def surface_bytes(surface) -> int:
+    """
+    Get the size of a pygame surface's pixel buffer.
+
+    Subsurfaces share their parent's pixels and count as zero.
+    """
+    if surface.get_parent() is not None:
+        return 0
+    return surface.get_pitch() * surface.get_height()
+
+
+def sound_bytes(sound) -> int:
+    """Get the size of a pygame sound's sample buffer"""
+    import pygame
+
+    mixer = pygame.mixer.get_init()
+    if not mixer:
+        return 0
+    frequency, sample_format, channels = mixer
+    return round(sound.get_length() * frequency) * channels * (abs(sample_format) // 8)
+
+
+class MemoryDiagnostics:
+    """
+    tracemalloc snapshots grouped by subsystem.
+
+    Tracing slows allocation-heavy code down noticeably, so diagnostics are
+    meant to be switched on for the session being investigated.
+    """
+
+    def __init__(
+        self,
+        frames: int = DEFAULT_FRAMES,
+        interval_minutes: Optional[float] = None,
+        top_n: int = 10,
+        max_reports: int = 64,
+    ):
+        """
+        Initialize memory diagnostics.
+
+        Args:
+            frames: Stack frames kept per allocation (more frames attribute
+                allocations made in library code to their NeonWorks caller)
+            interval_minutes: Take a snapshot this often from tick() (None = on demand only)
+            top_n: Allocation sites listed per report
+            max_reports: Number of reports kept
+        """
+        self.frames = frames
+        self.interval = interval_minutes * 60 if interval_minutes else None
+        self.top_n = top_n
+        self.reports: Deque[MemoryReport] = deque(maxlen=max_reports)
+
+        self._started_tracing = False
+        self._previous: Optional[tracemalloc.Snapshot] = None
+        self._start_sizes: Dict[str, int] = {}  # Subsystem totals when diagnostics started
+        self._snapshot_count = 0
+        self._start_time = 0.0
+        self._next_snapshot = 0.0
+        self._modules: Dict[str, Optional[Tuple[str, str]]] = {}
+        self._spans: Dict[str, List[Tuple[int, int, str]]] = {}
+        self._process = None
+
+    @property
+    def running(self) -> bool:
+        return self._previous is not None
+
+    def start(self):
+        """Start tracing allocations and take the snapshot later ones are diffed against"""
+        if self.running:
+            return
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+            self._started_tracing = True
+        self._previous = tracemalloc.take_snapshot()
+        self._start_sizes = {}
+        for statistic in self._previous.statistics("traceback"):
+            attribution = self._attribute(statistic.traceback)
+            if attribution is not None:
+                subsystem = attribution[0]
+                self._start_sizes[subsystem] = self._start_sizes.get(subsystem, 0) + statistic.size
+        for cache in collect_cache_memory():
+            self._start_sizes[cache.subsystem] = (
+                self._start_sizes.get(cache.subsystem, 0) + cache.bytes
+            )
+        self._start_time = time.perf_counter()
+        if self.interval:
+            self._next_snapshot = self._start_time + self.interval
+
+    def stop(self):
+        """Stop tracing (if started here) and drop the held snapshot"""
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+        self._previous = None
+
+    def tick(self, now: Optional[float] = None) -> Optional[MemoryReport]:
+        """
+        Take a snapshot if the interval has elapsed. Call once per frame.
+
+        Args:
+            now: Current time from time.perf_counter()
+
+        Returns:
+            The new report, or None
+        """
+        if not self.interval or not self.running:
+            return None
+        if now is None:
+            now = time.perf_counter()
+        if now < self._next_snapshot:
+            return None
+        self._next_snapshot = now + self.interval
+        return self.take_snapshot()
+
+    def take_snapshot(self) -> MemoryReport:
+        """
+        Snapshot traced allocations and cache sizes, diffed against the previous snapshot.
+
+        Returns:
+            The new report (also appended to reports)
+
+        Raises:
+            RuntimeError: If diagnostics are not running
+        """
+        if not self.running:
+            raise RuntimeError("Memory diagnostics are not running")
+
+        snapshot = tracemalloc.take_snapshot()
+        traced, peak = tracemalloc.get_traced_memory()
+
+        subsystems: Dict[str, SubsystemMemory] = {}
+        sites: Dict[str, AllocationSite] = {}
+        for diff in snapshot.compare_to(self._previous, "traceback"):
+            attribution = self._attribute(diff.traceback)
+            if attribution is None or not (diff.size or diff.size_diff):
+                continue
+            subsystem, site = attribution
+            memory = subsystems.get(subsystem)
+            if memory is None:
+                memory = subsystems[subsystem] = SubsystemMemory(subsystem)
+            memory.traced_bytes += diff.size
+            memory.traced_blocks += diff.count
+            memory.change_bytes += diff.size_diff
+
+            entry = sites.get(site)
+            if entry is None:
+                entry = sites[site] = AllocationSite(site, subsystem, 0, 0, 0)
+            entry.size_bytes += diff.size
+            entry.change_bytes += diff.size_diff
+            entry.blocks += diff.count
+
+        for cache in collect_cache_memory():
+            memory = subsystems.get(cache.subsystem)
+            if memory is None:
+                memory = subsystems[cache.subsystem] = SubsystemMemory(cache.subsystem)
+            memory.reported_bytes += cache.bytes
+            memory.caches.append(cache)
+
+        for name, memory in subsystems.items():
+            memory.growth_bytes = memory.total_bytes - self._start_sizes.get(name, 0)
+
+        growth = sorted(
+            (site for site in sites.values() if site.change_bytes > 0),
+            key=lambda site: -site.change_bytes,
+        )
+        report = MemoryReport(
+            snapshot=self._snapshot_count,
+            timestamp=time.time(),
+            elapsed=time.perf_counter() - self._start_time,
+            traced_bytes=traced,
+            traced_peak_bytes=peak,
+            rss_bytes=self._rss_bytes(),
+            subsystems=dict(sorted(subsystems.items(), key=lambda item: -item[1].total_bytes)),
+            top_growth=growth[: self.top_n],
+        )
+        self._previous = snapshot
+        self._snapshot_count += 1
+        self.reports.append(report)
+        return report
+
+    def format_summary(self, report: Optional[MemoryReport] = None) -> List[str]:
+        """
+        Format a report as summary lines.
+
+        Args:
+            report: Report to format (default: the latest)
+
+        Returns:
+            Lines of a per-subsystem table followed by the largest growth sites
+        """
+        report = report or (self.reports[-1] if self.reports else None)
+        if report is None:
+            return ["No memory snapshots yet"]
+
+        lines = [
+            f"Snapshot {report.snapshot}: traced {_format_bytes(report.traced_bytes)} "
+            f"(peak {_format_bytes(report.traced_peak_bytes)}), "
+            f"RSS {_format_bytes(report.rss_bytes)}",
+            f"{'Subsystem':<16} {'traced':>9} {'caches':>9} {'change':>9} {'growth':>9}",
+        ]
+        for memory in list(report.subsystems.values())[: self.top_n]:
+            lines.append(
+                f"{memory.name[:16]:<16} {_format_bytes(memory.traced_bytes):>9} "
+                f"{_format_bytes(memory.reported_bytes):>9} "
+                f"{_format_bytes(memory.change_bytes, True):>9} "
+                f"{_format_bytes(memory.growth_bytes, True):>9}"
+            )
+        for site in report.top_growth[:3]:
+            lines.append(f"  {_format_bytes(site.change_bytes, True)} at {site.site}")
+        return lines
+
+    def dump(self, path: Union[str, Path]) -> Path:
+        """
+        Write the kept reports as JSON.
+
+        Args:
+            path: Output file
+
+        Returns:
+            Path of the written file
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "frames": self.frames,
+            "interval_seconds": self.interval,
+            "reports": [report.to_dict() for report in self.reports],
+        }
+
+        temp_path = path.with_suffix(path.suffix + ".tmp")
+        with open(temp_path, "w") as f:
+            json.dump(data, f, indent=2)
+        os.replace(temp_path, path)
+        return path
+
+    def _attribute(self, traceback: tracemalloc.Traceback) -> Optional[Tuple[str, str]]:
+        """
+        Find the subsystem and site of an allocation from its most recent NeonWorks frame.
+
+        Returns None for allocations made by tracemalloc and these diagnostics.
+        """
+        if traceback[-1].filename in _IGNORED_FILES:
+            return None
+        for frame in reversed(traceback):
+            module = self._module(frame.filename)
+            if module is not None:
+                subsystem = module[0]
+                for start, end, class_subsystem in self._class_spans(frame.filename, module[1]):
+                    if start <= frame.lineno <= end:
+                        subsystem = class_subsystem
+                        break
+                return subsystem, f"{module[1]}:{frame.lineno}"
+        frame = traceback[-1]
+        return OTHER, f"{Path(frame.filename).name}:{frame.lineno}"
+
+    def _module(self, filename: str) -> Optional[Tuple[str, str]]:
+        """(subsystem, module path) of a NeonWorks file, or None for files outside the package"""
+        if filename in self._modules:
+            return self._modules[filename]
+
+        try:
+            module = Path(filename).resolve().relative_to(_PACKAGE_DIR).as_posix()
+        except ValueError:
+            result = None
+        else:
+            package = module.split("/")[0] if "/" in module else "neonworks"
+            result = (SUBSYSTEM_MODULES.get(module, package), module)
+        self._modules[filename] = result
+        return result
+
+    def _class_spans(self, filename: str, module: str) -> List[Tuple[int, int, str]]:
+        """(first line, last line, subsystem) of the SUBSYSTEM_CLASSES classes in a file"""
+        spans = self._spans.get(filename)
+        if spans is not None:
+            return spans
+
+        spans = []
+        classes = SUBSYSTEM_CLASSES.get(module)
+        if classes:
+            try:
+                tree = ast.parse(Path(filename).read_text(encoding="utf-8"))
+            except (OSError, SyntaxError, ValueError):
+                tree = None
+            for node in tree.body if tree is not None else []:
+                if isinstance(node, ast.ClassDef) and node.name in classes:
+                    spans.append((node.lineno, node.end_lineno, classes[node.name]))
+        self._spans[filename] = spans
+        return spans
+
+    def _rss_bytes(self) -> int:
+        if self._process is None:
+            from .performance_monitor import create_process_monitor
+
+            self._process = create_process_monitor()
+        return self._process.memory_info().rss
+
+
+def _format_bytes(size: int, signed: bool = False) -> str:
+    sign = ("+" if size >= 0 else "-") if signed else ""
+    size = abs(size)
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{sign}{size:.0f}{unit}" if unit == "B" else f"{sign}{size:.1f}{unit}"
+        size /= 1024
+    return f"{sign}{size:.2f}GB"
+
+
+# Global memory diagnostics (None while diagnostics are off)
+_diagnostics: Optional[MemoryDiagnostics] = None
+
+
+def get_memory_diagnostics() -> Optional[MemoryDiagnostics]:
+    """Get the global memory diagnostics, or None while they are off"""
+    return _diagnostics
+
+
+def start_memory_diagnostics(
+    frames: int = DEFAULT_FRAMES, interval_minutes: Optional[float] = None
+) -> MemoryDiagnostics:
+    """
+    Start global memory diagnostics, or return the diagnostics already running.
+
+    The game loop ticks the global diagnostics, so interval snapshots are
+    taken while a GameEngine runs.
+
+    Args:
+        frames: Stack frames kept per allocation
+        interval_minutes: Take a snapshot this often (None = on demand only)
+
+    Returns:
+        The global memory diagnostics
+    """
+    global _diagnostics
+    if _diagnostics is None:
+        _diagnostics = MemoryDiagnostics(frames, interval_minutes)
+        _diagnostics.start()
+    return _diagnostics
+
+
+def stop_memory_diagnostics() -> Optional[MemoryDiagnostics]:
+    """
+    Stop global memory diagnostics.
+
+    Returns:
+        The diagnostics that were running (their reports can still be dumped), or None
+    """
+    global _diagnostics
+    diagnostics, _diagnostics = _diagnostics, None
+    if diagnostics is not None:
+        diagnostics.stop()
+    return diagnostics
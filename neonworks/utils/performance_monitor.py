@@ -2,7 +2,8 @@
 Performance Monitoring System
 
 Real-time performance tracking and reporting for production use.
-Tracks FPS, frame times, memory usage, and system health.
+Tracks FPS, frame times, memory usage, and system health, plus per-system
+update timings when a SystemProfiler is attached.
 """
 
 import time
@@ -19,6 +20,8 @@ try:
 except ImportError:  # pragma: no cover - fallback when psutil isn't available
     psutil = None
 
+from .system_profiler import SlowUpdate, SystemProfiler, SystemTimingStats
+
 
 class _FallbackMemoryInfo(NamedTuple):
     """Minimal memory info structure when psutil isn't installed."""
@@ -83,6 +86,10 @@ class PerformanceStats:
     entity_count: int = 0
     event_count: int = 0
 
+    # Per-system update timings, when a SystemProfiler is attached
+    system_times: Dict[str, SystemTimingStats] = field(default_factory=dict)
+    slow_updates: List[SlowUpdate] = field(default_factory=list)
+
 
 class PerformanceMonitor:
     """
@@ -159,6 +166,9 @@ class PerformanceMonitor:
         self._consecutive_slow_frames = 0
         self._max_consecutive_slow_frames = 5
 
+        # Per-system update timings (see World.enable_profiling)
+        self.system_profiler: Optional[SystemProfiler] = None
+
     def begin_frame(self):
         """Mark the beginning of a frame"""
         self._frame_start_time = time.perf_counter()
@@ -220,6 +230,15 @@ class PerformanceMonitor:
         """Update event count metric"""
         self._event_count = count
 
+    def attach_system_profiler(self, profiler: Optional[SystemProfiler]):
+        """
+        Include per-system update timings in the statistics.
+
+        Args:
+            profiler: Profiler of a world (from World.enable_profiling), or None to detach
+        """
+        self.system_profiler = profiler
+
     def get_stats(self) -> PerformanceStats:
         """
         Calculate and return current performance statistics.
@@ -228,7 +247,7 @@ class PerformanceMonitor:
             PerformanceStats object with aggregated metrics
         """
         if not self.frame_history:
-            return PerformanceStats()
+            return self._add_system_times(PerformanceStats())
 
         frame_times = [m.frame_time for m in self.frame_history]
         update_times = [m.update_time for m in self.frame_history]
@@ -272,7 +291,7 @@ class PerformanceMonitor:
             memory_used_mb = 0.0
             memory_percent = 0.0
 
-        return PerformanceStats(
+        stats = PerformanceStats(
             avg_fps=avg_fps,
             min_fps=min_fps,
             max_fps=max_fps,
@@ -289,6 +308,7 @@ class PerformanceMonitor:
             entity_count=self._entity_count,
             event_count=self._event_count,
         )
+        return self._add_system_times(stats)
 
     def _check_performance(self, metrics: FrameMetrics):
         """Check for performance issues and print warnings"""
@@ -355,6 +375,11 @@ class PerformanceMonitor:
         print(f"Memory:           {stats.memory_used_mb:.1f} MB " f"({stats.memory_percent:.1f}%)")
         print(f"Entities:         {stats.entity_count}")
         print(f"Events/Frame:     {stats.event_count}")
+        if self.system_profiler and stats.system_times:
+            print("-" * 60)
+            for line in self.system_profiler.format_report():
+                print(line)
+            print(f"Slow Updates:     {len(stats.slow_updates)}")
         print("=" * 60)
 
     def save_log(self, filepath: Path):
@@ -387,6 +412,19 @@ class PerformanceMonitor:
             f.write(f"Entity Count:     {stats.entity_count}\n")
             f.write(f"Event Count:      {stats.event_count}\n\n")
 
+            if self.system_profiler and stats.system_times:
+                f.write("System Update Times:\n")
+                for line in self.system_profiler.format_report(top_n=len(stats.system_times)):
+                    f.write(line + "\n")
+                f.write("\n")
+                for slow in stats.slow_updates:
+                    breakdown = ", ".join(f"{n} {ms:.2f}ms" for n, ms in slow.systems.items())
+                    f.write(
+                        f"Slow Update {slow.update_number}: {slow.total_ms:.2f}ms ({breakdown})\n"
+                    )
+                if stats.slow_updates:
+                    f.write("\n")
+
             f.write("Recent Frame Times (ms):\n")
             frame_times = self.get_recent_frame_times(60)
             for i, ft in enumerate(frame_times):
@@ -398,13 +436,24 @@ class PerformanceMonitor:
         self.frame_history.clear()
         self._consecutive_slow_frames = 0
 
+    def _add_system_times(self, stats: PerformanceStats) -> PerformanceStats:
+        if self.system_profiler:
+            stats.system_times = self.system_profiler.get_stats()
+            stats.slow_updates = list(self.system_profiler.slow_updates)
+        return stats
+
     def _create_process(self):
-        if psutil:
-            try:
-                return psutil.Process()
-            except Exception:
-                pass
-        return _FallbackProcess()
+        return create_process_monitor()
+
+
+def create_process_monitor():
+    """Create a psutil Process for this process, or a fallback with memory_info().rss"""
+    if psutil:
+        try:
+            return psutil.Process()
+        except Exception:
+            pass
+    return _FallbackProcess()
 
 
 # Global performance monitor instance
@@ -0,0 +1,171 @@
+"""
+System Profiler
+
+Per-system timing of World.update. While profiling is enabled on a world,
+every fixed update times each system with perf_counter_ns; the profiler keeps
+a rolling window of samples per system for p50/p95/p99 statistics and
+snapshots the per-system breakdown of updates slower than a threshold.
+
+Profiling is opt-in: World.enable_profiling() swaps in a timed update method
+and World.disable_profiling() restores the plain one, so a world that is not
+being profiled pays nothing.
+"""
+
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict, List, Optional, Sequence, Tuple
+
+
+@dataclass
+class SystemTimingStats:
+    """Rolling timing statistics of one system (milliseconds)"""
+
+    name: str
+    samples: int = 0
+    mean_ms: float = 0.0
+    p50_ms: float = 0.0
+    p95_ms: float = 0.0
+    p99_ms: float = 0.0
+    max_ms: float = 0.0
+
+
+@dataclass
+class SlowUpdate:
+    """Per-system breakdown of an update that exceeded the slow threshold"""
+
+    update_number: int
+    total_ms: float
+    systems: Dict[str, float] = field(default_factory=dict)  # Slowest first
+    timestamp: float = 0.0
+
+
+class SystemProfiler:
+    """
+    Rolling per-system timings of World updates.
+
+    Usage:
+        profiler = world.enable_profiling()
+
+        # ... run the game ...
+
+        for stats in profiler.get_stats().values():
+            print(f"{stats.name}: p95 {stats.p95_ms:.2f}ms")
+    """
+
+    TOTAL = "total"  # Name of the whole-update timing
+
+    def __init__(
+        self,
+        window_size: int = 300,
+        slow_threshold_ms: float = 1000.0 / 60.0,
+        max_slow_updates: int = 32,
+    ):
+        """
+        Initialize system profiler.
+
+        Args:
+            window_size: Number of updates kept per system (default: 300)
+            slow_threshold_ms: Updates slower than this are captured (default: one 60 FPS frame)
+            max_slow_updates: Number of slow update captures kept
+        """
+        self.window_size = window_size
+        self.slow_threshold_ms = slow_threshold_ms
+        self.update_count = 0
+
+        self._samples: Dict[str, Deque[int]] = {}
+        self._slow_threshold_ns = int(slow_threshold_ms * 1_000_000)
+        self.slow_updates: Deque[SlowUpdate] = deque(maxlen=max_slow_updates)
+
+    def record_update(self, timings: Sequence[Tuple[str, int]], total_ns: int):
+        """
+        Record the system timings of one update.
+
+        Args:
+            timings: (system name, nanoseconds) of each system that ran
+            total_ns: Nanoseconds spent in the whole update
+        """
+        self._sample(self.TOTAL, total_ns)
+        for name, elapsed in timings:
+            self._sample(name, elapsed)
+
+        if total_ns > self._slow_threshold_ns:
+            breakdown: Dict[str, float] = {}
+            for name, elapsed in timings:
+                breakdown[name] = breakdown.get(name, 0.0) + elapsed / 1_000_000
+            self.slow_updates.append(
+                SlowUpdate(
+                    update_number=self.update_count,
+                    total_ms=total_ns / 1_000_000,
+                    systems=dict(sorted(breakdown.items(), key=lambda item: -item[1])),
+                    timestamp=time.time(),
+                )
+            )
+        self.update_count += 1
+
+    def get_stats(self) -> Dict[str, SystemTimingStats]:
+        """
+        Calculate timing statistics of every system.
+
+        Returns:
+            System name -> statistics, slowest p95 first, with the whole
+            update under SystemProfiler.TOTAL
+        """
+        stats = [self._summarize(name, samples) for name, samples in self._samples.items()]
+        stats.sort(key=lambda s: (s.name != self.TOTAL, -s.p95_ms))
+        return {s.name: s for s in stats}
+
+    def get_system_stats(self, name: str) -> Optional[SystemTimingStats]:
+        """Get the timing statistics of one system"""
+        samples = self._samples.get(name)
+        return self._summarize(name, samples) if samples else None
+
+    def format_report(self, top_n: int = 10) -> List[str]:
+        """
+        Format the slowest systems as report lines.
+
+        Args:
+            top_n: Number of systems to include
+
+        Returns:
+            Lines of a p50/p95/p99/max table
+        """
+        stats = list(self.get_stats().values())
+        lines = [f"{'System':<24} {'p50':>7} {'p95':>7} {'p99':>7} {'max':>7} (ms)"]
+        for s in stats[: top_n + 1]:
+            lines.append(
+                f"{s.name[:24]:<24} {s.p50_ms:>7.2f} {s.p95_ms:>7.2f} "
+                f"{s.p99_ms:>7.2f} {s.max_ms:>7.2f}"
+            )
+        return lines
+
+    def reset(self):
+        """Drop all samples and slow update captures"""
+        self.update_count = 0
+        self._samples.clear()
+        self.slow_updates.clear()
+
+    def _sample(self, name: str, elapsed: int):
+        samples = self._samples.get(name)
+        if samples is None:
+            samples = self._samples[name] = deque(maxlen=self.window_size)
+        samples.append(elapsed)
+
+    @staticmethod
+    def _summarize(name: str, samples: Deque[int]) -> SystemTimingStats:
+        values = sorted(samples)
+        count = len(values)
+
+        def percentile(percent: int) -> float:
+            rank = max(1, -(-percent * count // 100))  # Nearest rank
+            return values[rank - 1] / 1_000_000
+
+        return SystemTimingStats(
+            name=name,
+            samples=count,
+            mean_ms=sum(values) / count / 1_000_000,
+            p50_ms=percentile(50),
+            p95_ms=percentile(95),
+            p99_ms=percentile(99),
+            max_ms=values[-1] / 1_000_000,
+        )
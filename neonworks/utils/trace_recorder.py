@@ -0,0 +1,329 @@
+"""
+Trace Recorder
+
+Timeline tracing of frames, fixed updates, systems, render passes, asset
+loads, saves and path requests. Spans are written into a preallocated ring
+buffer, so a recorder can run for a whole session as a flight recorder and
+dump the last N seconds on demand as Chrome Trace Event JSON, which loads in
+Perfetto (ui.perfetto.dev) and chrome://tracing.
+
+Spans can be recorded from any thread; each is tagged with the native id of
+the thread that recorded it.
+
+Usage:
+    recorder = start_tracing()
+
+    with trace_span("load_level", "asset", {"level": "town"}):
+        ...
+
+    recorder.dump("trace.json", last_seconds=5)
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+from array import array
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Union
+
+DEFAULT_CAPACITY = 65536
+
+_NULL_SPAN = nullcontext()
+
+
+class TraceSpan:
+    """Context manager recording one span"""
+
+    __slots__ = ("recorder", "name", "category", "args", "start")
+
+    def __init__(
+        self,
+        recorder: "TraceRecorder",
+        name: str,
+        category: str,
+        args: Optional[Dict[str, Any]] = None,
+    ):
+        self.recorder = recorder
+        self.name = name
+        self.category = category
+        self.args = args
+        self.start = 0
+
+    def __enter__(self) -> "TraceSpan":
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self.recorder.record(
+            self.name, self.category, self.start, time.perf_counter_ns(), self.args
+        )
+        return False
+
+
+class TraceRecorder:
+    """
+    Ring buffer of timed spans, exported as Chrome Trace Event JSON.
+
+    Once the buffer is full, each new span overwrites the oldest one.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        """
+        Initialize trace recorder.
+
+        Args:
+            capacity: Maximum number of spans kept (default: 65536)
+        """
+        if capacity <= 0:
+            raise ValueError("Trace capacity must be positive")
+        self.capacity = capacity
+
+        # Preallocated span slots
+        self._names: List[Optional[str]] = [None] * capacity
+        self._categories: List[Optional[str]] = [None] * capacity
+        self._args: List[Optional[Dict[str, Any]]] = [None] * capacity
+        self._starts = array("q", bytes(8 * capacity))
+        self._ends = array("q", bytes(8 * capacity))
+        self._threads = array("q", bytes(8 * capacity))
+
+        self._written = 0  # Spans recorded since the last clear
+        self._thread_names: Dict[int, str] = {}
+        self._lock = threading.Lock()
+        self._origin_ns = time.perf_counter_ns()
+        self._pid = os.getpid()
+
+    def span(
+        self, name: str, category: str = "engine", args: Optional[Dict[str, Any]] = None
+    ) -> TraceSpan:
+        """
+        Create a context manager that records a span around its block.
+
+        Args:
+            name: Span name
+            category: Span category (e.g. "frame", "system", "render", "asset")
+            args: Extra values shown with the span
+
+        Returns:
+            Span context manager
+        """
+        return TraceSpan(self, name, category, args)
+
+    def record(
+        self,
+        name: str,
+        category: str,
+        start_ns: int,
+        end_ns: int,
+        args: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        Record a finished span on the calling thread.
+
+        Args:
+            name: Span name
+            category: Span category
+            start_ns: Start time from time.perf_counter_ns()
+            end_ns: End time from time.perf_counter_ns()
+            args: Extra values shown with the span
+        """
+        thread_id = threading.get_native_id()
+        with self._lock:
+            if thread_id not in self._thread_names:
+                self._thread_names[thread_id] = threading.current_thread().name
+            slot = self._written % self.capacity
+            self._names[slot] = name
+            self._categories[slot] = category
+            self._args[slot] = args
+            self._starts[slot] = start_ns
+            self._ends[slot] = end_ns
+            self._threads[slot] = thread_id
+            self._written += 1
+
+    @property
+    def dropped(self) -> int:
+        """Spans overwritten since the last clear"""
+        return max(0, self._written - self.capacity)
+
+    def __len__(self) -> int:
+        return min(self._written, self.capacity)
+
+    def to_chrome_trace(self, last_seconds: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Build a Chrome Trace Event document of the recorded spans.
+
+        Args:
+            last_seconds: Only include spans that ended in the last N seconds
+
+        Returns:
+            {"traceEvents": [...], "displayTimeUnit": "ms"} with one complete
+            ("X") event per span and thread name metadata events
+        """
+        with self._lock:
+            count = len(self)
+            first = self._written - count
+            slots = [index % self.capacity for index in range(first, self._written)]
+            spans = [
+                (
+                    self._names[slot],
+                    self._categories[slot],
+                    self._args[slot],
+                    self._starts[slot],
+                    self._ends[slot],
+                    self._threads[slot],
+                )
+                for slot in slots
+            ]
+            thread_names = dict(self._thread_names)
+
+        if last_seconds is not None:
+            cutoff = time.perf_counter_ns() - int(last_seconds * 1_000_000_000)
+            spans = [span for span in spans if span[4] >= cutoff]
+
+        events: List[Dict[str, Any]] = [
+            {
+                "name": "process_name",
+                "ph": "M",
+                "pid": self._pid,
+                "tid": 0,
+                "args": {"name": "neonworks"},
+            }
+        ]
+        for thread_id in sorted({span[5] for span in spans}):
+            events.append(
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": self._pid,
+                    "tid": thread_id,
+                    "args": {"name": thread_names.get(thread_id, str(thread_id))},
+                }
+            )
+
+        for name, category, args, start, end, thread_id in sorted(spans, key=lambda s: s[3]):
+            event = {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": (start - self._origin_ns) / 1000,
+                "dur": (end - start) / 1000,
+                "pid": self._pid,
+                "tid": thread_id,
+            }
+            if args:
+                event["args"] = args
+            events.append(event)
+
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def dump(self, path: Union[str, Path], last_seconds: Optional[float] = None) -> Path:
+        """
+        Write the recorded spans as a Chrome Trace Event JSON file.
+
+        Args:
+            path: Output file
+            last_seconds: Only include spans that ended in the last N seconds
+
+        Returns:
+            Path of the written file
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        trace = self.to_chrome_trace(last_seconds)
+
+        temp_path = path.with_suffix(path.suffix + ".tmp")
+        with open(temp_path, "w") as f:
+            json.dump(trace, f, default=str)
+        os.replace(temp_path, path)
+        return path
+
+    def clear(self):
+        """Drop all recorded spans"""
+        with self._lock:
+            self._written = 0
+            self._names[:] = [None] * self.capacity
+            self._args[:] = [None] * self.capacity
+
+
+# Global trace recorder (None while tracing is off)
+_recorder: Optional[TraceRecorder] = None
+
+
+def get_trace_recorder() -> Optional[TraceRecorder]:
+    """Get the global trace recorder, or None while tracing is off"""
+    return _recorder
+
+
+def start_tracing(capacity: int = DEFAULT_CAPACITY) -> TraceRecorder:
+    """
+    Start global tracing, or return the recorder already running.
+
+    Args:
+        capacity: Maximum number of spans kept by a new recorder
+
+    Returns:
+        The global trace recorder
+    """
+    global _recorder
+    if _recorder is None:
+        _recorder = TraceRecorder(capacity)
+    return _recorder
+
+
+def stop_tracing() -> Optional[TraceRecorder]:
+    """
+    Stop global tracing.
+
+    Returns:
+        The recorder that was running (its spans can still be dumped), or None
+    """
+    global _recorder
+    recorder, _recorder = _recorder, None
+    return recorder
+
+
+def trace_span(name: str, category: str = "engine", args: Optional[Dict[str, Any]] = None):
+    """
+    Record a span on the global recorder around a block.
+
+    Returns a shared no-op context manager while tracing is off.
+
+    Args:
+        name: Span name
+        category: Span category
+        args: Extra values shown with the span
+    """
+    recorder = _recorder
+    if recorder is None:
+        return _NULL_SPAN
+    return TraceSpan(recorder, name, category, args)
+
+
+def traced(name: Optional[str] = None, category: str = "engine") -> Callable:
+    """
+    Decorator recording each call of a function as a span on the global recorder.
+
+    Args:
+        name: Span name (default: the function's qualified name)
+        category: Span category
+    """
+
+    def decorator(func: Callable) -> Callable:
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            recorder = _recorder
+            if recorder is None:
+                return func(*args, **kwargs)
+            start = time.perf_counter_ns()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                recorder.record(span_name, category, start, time.perf_counter_ns())
+
+        return wrapper
+
+    return decorator
@@ -4,6 +4,9 @@ Tests for the Autotile System
 Tests autotile set creation, tile matching, neighbor updates, and the autotile manager.
 """
 
+import random
+
+import numpy as np
 import pytest
 
 from neonworks.rendering.autotiles import (
@@ -23,6 +26,7 @@ from neonworks.rendering.autotiles import (
     AutotileManager,
     AutotileSet,
     get_autotile_manager,
+    neighbor_bitmasks,
     reset_autotile_manager,
 )
 from neonworks.data.map_layers import EnhancedTileLayer
@@ -418,5 +422,77 @@ class TestAutotileEdgeCases:
         assert wall_tile in wall_autotile.tile_ids
 
 
+class TestRegionUpdates:
+    """Test batched region autotile resolution."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.manager = AutotileManager()
+        self.water_autotile = AutotileSet(
+            name="Water", tileset_name="terrain", format=AutotileFormat.TILE_16, base_tile_id=1
+        )
+        self.wall_autotile = AutotileSet(
+            name="Wall", tileset_name="terrain", format=AutotileFormat.TILE_47, base_tile_id=40
+        )
+        self.manager.register_autotile_set(self.water_autotile)
+        self.manager.register_autotile_set(self.wall_autotile)
+
+    def test_neighbor_bitmasks(self):
+        """Bitmasks set one bit per connecting neighbor; outside cells never connect."""
+        match = np.array([[1, 1, 0], [0, 1, 0], [0, 0, 1]], dtype=bool)
+        bitmasks = neighbor_bitmasks(match)
+
+        assert bitmasks[1, 1] == NEIGHBOR_TOP | NEIGHBOR_TOP_LEFT | NEIGHBOR_BOTTOM_RIGHT
+        assert bitmasks[0, 0] == NEIGHBOR_RIGHT | NEIGHBOR_BOTTOM_RIGHT
+        assert bitmasks[2, 2] == NEIGHBOR_TOP_LEFT
+
+    @pytest.mark.parametrize("seed", [0, 1, 2])
+    def test_paint_cells_matches_per_cell_painting(self, seed):
+        """One region pass gives the same tiles as painting cell by cell."""
+        rng = random.Random(seed)
+        cells = [(rng.randrange(20), rng.randrange(15)) for _ in range(120)]
+        walls = [(rng.randrange(20), rng.randrange(15)) for _ in range(40)]
+        expected = EnhancedTileLayer(width=20, height=15)
+        actual = EnhancedTileLayer(width=20, height=15)
+
+        for x, y in cells:
+            self.manager.paint_autotile(expected, x, y, self.water_autotile)
+        for x, y in walls:
+            self.manager.paint_autotile(expected, x, y, self.wall_autotile)
+        self.manager.paint_cells(actual, cells, self.water_autotile)
+        self.manager.paint_cells(actual, walls, self.wall_autotile)
+
+        assert actual.tiles == expected.tiles
+
+    def test_fill_matches_per_cell_updates(self):
+        """Region fills resolve the fill and its border like per-cell updates."""
+        expected = EnhancedTileLayer(width=12, height=12)
+        for y in range(2, 9):
+            for x in range(3, 10):
+                expected.set_tile(x, y, 50)
+        self.manager.paint_autotile(expected, 1, 5, self.water_autotile)
+        actual = EnhancedTileLayer(width=12, height=12, tiles=[list(r) for r in expected.tiles])
+
+        self.manager.fill_with_autotile(actual, 5, 5, self.water_autotile)
+        for y in range(2, 9):
+            for x in range(3, 10):
+                self.manager.paint_autotile(expected, x, y, self.water_autotile)
+
+        assert actual.tiles == expected.tiles
+        assert actual.get_tile(0, 0) == 0
+
+    def test_update_region_counts_changes(self):
+        """Resolved tiles are written back and counted once."""
+        layer = EnhancedTileLayer(width=6, height=6)
+        for x in range(1, 4):
+            layer.set_tile(x, 2, self.water_autotile.base_tile_id)
+
+        assert self.manager.update_region(layer, 0, 0, 6, 6) == 3
+        assert layer.get_tile(2, 2) == self.water_autotile.get_tile_for_bitmask(
+            NEIGHBOR_LEFT | NEIGHBOR_RIGHT
+        )
+        assert self.manager.update_region(layer, 0, 0, 6, 6) == 0
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,182 @@
+"""
+Tests for batch export
+
+Tests that batch exports write the same PNGs as the generators, in process
+and across a worker pool, that the manifest skips presets whose inputs are
+unchanged, and that progress is reported per preset.
+"""
+
+import json
+import sys
+
+import numpy as np
+import pygame
+import pytest
+
+from neonworks.engine.tools.batch_export import (
+    MANIFEST_NAME,
+    export_characters,
+    export_faces,
+    load_manifest,
+)
+from neonworks.engine.tools.character_generator import (
+    CharacterGenerator,
+    CharacterPreset,
+    ColorTint,
+    ComponentLayer,
+    LayerType,
+)
+from neonworks.engine.tools.face_generator import (
+    Expression,
+    FaceLayer,
+    FaceLayerType,
+    FacePreset,
+)
+
+
+def _save_random_png(rng, path, size=(16, 16)):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    surface = pygame.Surface(size, pygame.SRCALPHA)
+    pygame.surfarray.pixels3d(surface)[:] = rng.integers(0, 256, (*size, 3), dtype=np.uint8)
+    pygame.surfarray.pixels_alpha(surface)[:] = rng.integers(0, 256, size, dtype=np.uint8)
+    pygame.image.save(surface, str(path))
+
+
+@pytest.fixture
+def character_library(tmp_path):
+    rng = np.random.default_rng(1)
+    library = tmp_path / "characters"
+    for name in ("body/human.png", "torso/armor.png", "torso/robe.png"):
+        _save_random_png(rng, library / name)
+    return library
+
+
+@pytest.fixture
+def characters():
+    presets = []
+    for index, outfit in enumerate(["torso_armor", "torso_robe", "torso_armor"]):
+        preset = CharacterPreset(name=f"npc{index}")
+        preset.add_layer(ComponentLayer(LayerType.BODY, "body_human"))
+        preset.add_layer(ComponentLayer(LayerType.TORSO, outfit, ColorTint(40 * index, 90, 200)))
+        presets.append(preset)
+    return presets
+
+
+def _image(path):
+    return pygame.image.tobytes(pygame.image.load(str(path)), "RGBA")
+
+
+class TestCharacterExport:
+    """Test batch character export"""
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_outputs_match_generator(self, character_library, characters, tmp_path, workers):
+        """Batch exports match sheets rendered by the generator"""
+        output_dir = tmp_path / f"out{workers}"
+        stats = export_characters(
+            characters, character_library, output_dir, sizes=[16, 32], workers=workers
+        )
+
+        assert (stats.rendered, stats.skipped, stats.files) == (3, 0, 6)
+        generator = CharacterGenerator()
+        generator.load_component_library(character_library)
+        expected = generator.render_sprite_sheet(characters[1], 4, None, 32)
+        assert _image(output_dir / "npc1_32x32.png") == pygame.image.tobytes(expected, "RGBA")
+        assert sorted(load_manifest(output_dir)) == sorted(stats.outputs)
+
+    def test_manifest_skips_unchanged_presets(self, character_library, characters, tmp_path):
+        """Re-exports render only presets whose inputs changed"""
+        export_characters(characters, character_library, tmp_path, sizes=[16], workers=1)
+        characters[2].get_layer(LayerType.TORSO).tint = ColorTint(1, 2, 3)
+        progress = []
+
+        stats = export_characters(
+            characters,
+            character_library,
+            tmp_path,
+            sizes=[16],
+            workers=1,
+            on_progress=lambda s: progress.append((s.done, s.files)),
+        )
+
+        assert (stats.rendered, stats.skipped) == (1, 2)
+        assert stats.outputs == ["npc2_16x16.png"]
+        assert progress == [(3, 1)]
+        assert "1 rendered, 2 up to date" in stats.summary()
+
+    def test_library_and_missing_outputs_invalidate(self, character_library, characters, tmp_path):
+        """Changed component files or deleted outputs are re-rendered"""
+        export_characters(characters, character_library, tmp_path, sizes=[16], workers=1)
+        (tmp_path / "npc0_16x16.png").unlink()
+        stats = export_characters(characters, character_library, tmp_path, sizes=[16], workers=1)
+        assert stats.outputs == ["npc0_16x16.png"]
+
+        _save_random_png(np.random.default_rng(9), character_library / "torso" / "robe.png")
+        stats = export_characters(characters, character_library, tmp_path, sizes=[16], workers=1)
+        assert stats.rendered == 3
+
+    def test_corrupt_manifest_is_ignored(self, character_library, characters, tmp_path):
+        """An unreadable manifest re-renders everything"""
+        (tmp_path / MANIFEST_NAME).write_text("{not json")
+
+        stats = export_characters(characters, character_library, tmp_path, sizes=[16], workers=1)
+
+        assert stats.rendered == 3
+        assert len(load_manifest(tmp_path)) == 3
+
+
+def test_face_export(tmp_path):
+    """Faces are exported per expression and size"""
+    rng = np.random.default_rng(2)
+    library = tmp_path / "faces"
+    _save_random_png(rng, library / "base" / "light.png", (32, 32))
+    for expression in ("neutral", "happy"):
+        _save_random_png(rng, library / "eyes" / "round" / f"{expression}.png", (32, 32))
+    preset = FacePreset(name="hero")
+    preset.add_layer(FaceLayer(FaceLayerType.BASE, "base_light", ColorTint(230, 190, 160)))
+    preset.add_layer(FaceLayer(FaceLayerType.EYES, "eyes_round"))
+
+    stats = export_faces(
+        [preset],
+        library,
+        tmp_path / "out",
+        sizes=[32, 64],
+        expressions=[Expression.NEUTRAL, Expression.HAPPY],
+        workers=1,
+    )
+
+    assert stats.files == 4
+    assert (tmp_path / "out" / "hero_happy_64x64.png").exists()
+    again = export_faces(
+        [preset],
+        library,
+        tmp_path / "out",
+        sizes=[32, 64],
+        expressions=[Expression.NEUTRAL, Expression.HAPPY],
+        workers=1,
+    )
+    assert again.skipped == 1
+
+
+def test_export_sprites_command(character_library, characters, monkeypatch, tmp_path, capsys):
+    """The export-sprites command exports a directory of preset files"""
+    from neonworks import cli
+
+    preset_dir = tmp_path / "presets"
+    preset_dir.mkdir()
+    for preset in characters:
+        (preset_dir / f"{preset.name}.json").write_text(json.dumps(preset.to_dict()))
+    output = tmp_path / "out"
+    # The CLI caches its lazily loaded modules in globals; restore them afterwards
+    monkeypatch.setattr(cli, "ProjectManager", None)
+    monkeypatch.setattr(cli, "validate_project_config", None)
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        ["neonworks", "export-sprites", "character", str(preset_dir)]
+        + ["--library", str(character_library), "-o", str(output), "--sizes", "16", "-j", "1"],
+    )
+
+    assert cli.main() == 0
+    assert sorted(load_manifest(output)) == ["npc0_16x16.png", "npc1_16x16.png", "npc2_16x16.png"]
+    assert "[3/3]" in capsys.readouterr().out
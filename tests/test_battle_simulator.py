@@ -0,0 +1,296 @@
+"""
+Tests for the headless battle simulator
+
+Tests building combatants from the database, battle rules, policies,
+determinism per seed, report merging and output, and the simulate command.
+"""
+
+import csv
+import json
+import sys
+
+import pytest
+
+from neonworks.engine.data.database_schema import (
+    Actor,
+    Armor,
+    Class,
+    DamageType,
+    DatabaseManager,
+    Effect,
+    EffectType,
+    ElementType,
+    Enemy,
+    Skill,
+    Weapon,
+)
+from neonworks.gameplay.battle_simulator import (
+    ATTACK,
+    DRAW,
+    PARTY,
+    TROOP,
+    Battle,
+    BattleSetup,
+    ScriptedPolicy,
+    SimulationReport,
+    attack_policy,
+    resolve_policy,
+    run_simulation,
+    simulate_battle,
+)
+from neonworks.gameplay.jrpg_combat import ElementType as CombatElement
+
+
+def _database() -> DatabaseManager:
+    db = DatabaseManager()
+    db.skills[1] = Skill(
+        id=1,
+        name="Heal",
+        mp_cost=5,
+        scope=3,
+        damage_type=DamageType.HP_RECOVER,
+        effects=[Effect(effect_type=EffectType.RECOVER_HP, value1=40.0)],
+    )
+    db.skills[2] = Skill(
+        id=2,
+        name="Fire",
+        mp_cost=8,
+        scope=1,
+        hit_type=2,
+        damage_type=DamageType.HP_DAMAGE,
+        element_type=ElementType.FIRE,
+        effects=[Effect(effect_type=EffectType.DAMAGE_HP, value1=20.0, value2=10.0)],
+    )
+    db.skills[3] = Skill(
+        id=3, name="Quake", mp_cost=12, scope=2, hit_type=2, damage_type=DamageType.HP_DAMAGE
+    )
+    db.classes[1] = Class(
+        id=1,
+        name="Knight",
+        params=[[100 + 10 * lv for lv in range(99)], [20] * 99, [18] * 99, [12] * 99]
+        + [[10] * 99] * 4,
+        learnings=[{"level": 1, "skill_id": 1}],
+    )
+    db.classes[2] = Class(
+        id=2,
+        name="Wizard",
+        learnings=[{"level": 1, "skill_id": 2}, {"level": 5, "skill_id": 3}],
+    )
+    db.weapons[1] = Weapon(id=1, name="Sword", params=[7, 0, 0, 0, 0, 0])
+    db.armors[1] = Armor(id=1, name="Shield", params=[0, 4, 0, 0, 0, 0])
+    db.actors[1] = Actor(id=1, name="Knight", class_id=1, equips=[1, 1, 0, 0, 0])
+    db.actors[2] = Actor(id=2, name="Wizard", class_id=2)
+    db.enemies[1] = Enemy(
+        id=1,
+        name="Imp",
+        params=[60, 20, 14, 6, 12, 6, 12, 5],
+        actions=[{"skill_id": 0, "rating": 5}, {"skill_id": 2, "rating": 5}],
+        traits=[{"code": "element_rate", "element": "fire", "value": 50}],
+    )
+    db.enemies[2] = Enemy(id=2, name="Golem", params=[400, 0, 30, 40, 5, 5, 2, 5])
+    return db
+
+
+@pytest.fixture
+def setup():
+    return BattleSetup.from_database(_database(), [1, 2], [1, 1], level=5)
+
+
+class TestBuildingCombatants:
+    """Test turning database entries into combatants"""
+
+    def test_actor_stats_from_class_curves_and_equipment(self, setup):
+        """Actors use their class curve at the level plus equipment bonuses"""
+        knight = setup.party[0]
+
+        assert knight.max_hp == 140
+        assert knight.max_mp == 20
+        assert knight.stats.attack == 25
+        assert knight.stats.defense == 16
+        assert knight.stats.level == 5
+
+    def test_learnings_up_to_level(self):
+        """Skills learned above the party level are left out"""
+        low = BattleSetup.from_database(_database(), [2], [1], level=1)
+        high = BattleSetup.from_database(_database(), [2], [1], level=5)
+
+        assert low.party[0].skill_ids == [2]
+        assert high.party[0].skill_ids == [2, 3]
+        assert set(high.skills) == {2, 3}
+
+    def test_enemies_get_actions_resistances_and_names(self, setup):
+        """Enemy action ratings and element traits carry over, duplicates are lettered"""
+        imp = setup.troop[0]
+
+        assert [c.name for c in setup.troop] == ["Imp A", "Imp B"]
+        assert imp.action_weights == [(0, 5), (2, 5)]
+        assert imp.resistances.get_multiplier(CombatElement.FIRE) == 0.5
+
+    def test_unknown_ids_raise(self):
+        """Missing actors and enemies are reported"""
+        with pytest.raises(KeyError):
+            BattleSetup.from_database(_database(), [9], [1])
+        with pytest.raises(KeyError):
+            BattleSetup.from_database(_database(), [1], [9])
+
+
+class TestBattleRules:
+    """Test damage and healing rules"""
+
+    def test_attack_uses_physical_damage(self, setup):
+        """Attacks deal JRPGStats physical damage, halved against a defender"""
+        battle = Battle(setup, 0, attack_policy, attack_policy)
+        knight, imp = battle.combatants[0], battle.combatants[2]
+        expected = knight.stats.calculate_physical_damage(imp.stats)
+
+        battle._execute(knight, battle.action_for(knight, ATTACK, imp))
+        assert imp.hp == imp.max_hp - expected
+
+        imp.defending = True
+        battle._execute(knight, battle.action_for(knight, ATTACK, imp))
+        assert imp.hp == imp.max_hp - expected - expected // 2
+
+    def test_elemental_resistance_and_mp_cost(self, setup):
+        """Spells spend MP and are scaled by the target's resistance"""
+        battle = Battle(setup, 0, attack_policy, attack_policy)
+        wizard, imp = battle.combatants[1], battle.combatants[2]
+        fire = battle.skills[2]
+        full = wizard.stats.calculate_magic_damage(fire.power, imp.stats)
+
+        battle._execute(wizard, battle.action_for(wizard, fire, imp))
+        assert wizard.mp == wizard.max_mp - fire.mp_cost
+        damage = imp.max_hp - imp.hp
+        assert full * 0.9 * 0.5 - 1 <= damage <= full * 1.1 * 0.5
+
+    def test_healing_is_capped(self, setup):
+        """Heals restore up to max HP and are recorded"""
+        battle = Battle(setup, 0, attack_policy, attack_policy)
+        knight = battle.combatants[0]
+        knight.hp -= 10
+
+        battle._execute(knight, battle.action_for(knight, battle.skills[1], knight))
+        assert knight.hp == knight.max_hp
+        assert battle._records[(PARTY, "Heal")].healing == 10
+
+    def test_battle_ends_with_a_winner_or_draw(self):
+        """Hopeless fights are lost, unwinnable stalemates are draws"""
+        db = _database()
+        lost = simulate_battle(BattleSetup.from_database(db, [2], [2], level=1), seed=3)
+        assert lost.winner == TROOP
+        assert lost.party_alive == 0
+
+        db.enemies[3] = Enemy(id=3, name="Wall", params=[9999, 0, 0, 9999, 0, 9999, 0, 0])
+        drawn = simulate_battle(
+            BattleSetup.from_database(db, [1], [3]), seed=3, troop_policy="attack", max_turns=5
+        )
+        assert drawn.winner == DRAW
+        assert drawn.turns == 5
+
+
+class TestPolicies:
+    """Test the built-in policies"""
+
+    def test_resolve_policy(self):
+        """Policies are looked up by name, callables pass through"""
+        assert resolve_policy("attack") is attack_policy
+        assert resolve_policy(attack_policy) is attack_policy
+        with pytest.raises(ValueError):
+            resolve_policy("berserk")
+
+    def test_ai_heals_allies_in_danger(self, setup):
+        """The ai policy heals a badly hurt ally"""
+        battle = Battle(setup, 0, attack_policy, attack_policy)
+        knight, wizard = battle.combatants[0], battle.combatants[1]
+        wizard.hp = 5
+
+        action = resolve_policy("ai")(battle, knight)
+        assert action.skill.name == "Heal"
+        assert action.targets == [wizard]
+
+    def test_scripted_policy_cycles(self, setup):
+        """Scripted combatants follow their sequence, defending on -1"""
+        policy = ScriptedPolicy({"Wizard": [2, -1, 0]})
+        battle = Battle(setup, 0, policy, attack_policy)
+        wizard = battle.combatants[1]
+
+        commands = []
+        for _ in range(4):
+            action = policy(battle, wizard)
+            commands.append(action.skill.name if action.skill else "Defend")
+            battle._execute(wizard, action)
+        assert commands == ["Fire", "Defend", "Attack", "Fire"]
+
+
+class TestSimulation:
+    """Test batches and reports"""
+
+    def test_same_seed_same_battle(self, setup):
+        """A battle depends only on its seed"""
+        first = simulate_battle(setup, 42, party_policy="random")
+        second = simulate_battle(setup, 42, party_policy="random")
+
+        assert first == second
+
+    def test_report_independent_of_workers(self, setup):
+        """Pooled batches report exactly what a single process reports"""
+        single = run_simulation(setup, 40, seed=7, workers=1)
+        pooled = run_simulation(setup, 40, seed=7, workers=2)
+
+        assert single.to_dict() == pooled.to_dict()
+        assert single.battles == 40
+        assert sum(single.outcomes.values()) == 40
+
+    def test_skill_impact_ranking(self, setup):
+        """Skills are ranked by damage plus healing per battle"""
+        report = run_simulation(setup, 30, workers=1)
+        skills = report.skill_impact()
+
+        impacts = [skill["impact"] for skill in skills]
+        assert impacts == sorted(impacts, reverse=True)
+        for skill in skills:
+            assert skill["impact"] == pytest.approx(
+                (skill["damage"] + skill["healing"]) / report.battles
+            )
+
+    def test_write_json_and_csv(self, setup, tmp_path):
+        """Reports are written in the format of the file extension"""
+        report = run_simulation(setup, 10, workers=1)
+
+        data = json.loads(report.write(tmp_path / "report.json").read_text())
+        assert data["battles"] == 10
+        assert data["turns"]["count"] == 10
+
+        with open(report.write(tmp_path / "report.csv"), newline="") as f:
+            rows = list(csv.DictReader(f))
+        assert {"section": "summary", "key": "", "metric": "battles", "value": "10"} in rows
+
+        with pytest.raises(ValueError):
+            report.write(tmp_path / "report.xml")
+
+    def test_empty_report(self):
+        """An empty batch reports zeros"""
+        data = SimulationReport().to_dict()
+
+        assert data["win_rate"] == 0.0
+        assert data["turns"]["count"] == 0
+
+
+def test_simulate_command(monkeypatch, tmp_path):
+    """The simulate command runs a batch and writes the report"""
+    from neonworks import cli
+
+    db_path = tmp_path / "db.json"
+    _database().save_to_file(db_path)
+    output = tmp_path / "report.json"
+    # The CLI caches its lazily loaded modules in globals; restore them afterwards
+    monkeypatch.setattr(cli, "ProjectManager", None)
+    monkeypatch.setattr(cli, "validate_project_config", None)
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        ["neonworks", "simulate", str(db_path), "--party", "1", "2", "--troop", "1", "1"]
+        + ["-n", "20", "-j", "1", "-o", str(output)],
+    )
+
+    assert cli.main() == 0
+    assert json.loads(output.read_text())["battles"] == 20
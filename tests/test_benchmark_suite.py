@@ -0,0 +1,125 @@
+"""
+Tests for the benchmark suite
+
+Tests that every benchmark runs headless at a small scale, that reports
+round-trip through JSON with machine information, that comparisons against a
+baseline flag regressions beyond the tolerance, and the bench command.
+"""
+
+import json
+import sys
+
+import pytest
+
+from neonworks.utils.benchmark_suite import (
+    BENCHMARKS,
+    BenchmarkReport,
+    BenchmarkResult,
+    run_benchmarks,
+)
+
+
+def _report(medians, scale=1.0, seed=0):
+    results = {name: BenchmarkResult(name, [median]) for name, median in medians.items()}
+    return BenchmarkReport(results=results, scale=scale, seed=seed, repeat=1)
+
+
+def test_all_benchmarks_run_headless():
+    """Every registered benchmark runs at a small scale"""
+    finished = []
+    report = run_benchmarks(scale=0.05, repeat=2, on_result=lambda r: finished.append(r.name))
+
+    assert finished == list(BENCHMARKS)
+    assert set(BENCHMARKS) >= {
+        "ecs_query",
+        "collision",
+        "pathfinding",
+        "particles",
+        "tilemap_render",
+        "event_dispatch",
+        "database_search",
+        "save_load",
+        "package_read",
+    }
+    for result in report.results.values():
+        assert len(result.samples_ms) == 2 and result.min_ms > 0
+    assert report.machine["cpu_count"] and report.machine["python"]
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        run_benchmarks(["missing"])
+    with pytest.raises(ValueError):
+        run_benchmarks(["event_dispatch"], scale=0)
+
+
+def test_report_round_trip(tmp_path):
+    """Reports are written as JSON and loaded back"""
+    report = run_benchmarks(["event_dispatch"], scale=0.05, seed=7, repeat=3)
+
+    path = report.write(tmp_path / "results" / "bench.json")
+    data = json.loads(path.read_text())
+    loaded = BenchmarkReport.load(path)
+
+    assert (
+        data["results"]["event_dispatch"]["median_ms"] == report.results["event_dispatch"].median_ms
+    )
+    assert (loaded.scale, loaded.seed, loaded.repeat) == (0.05, 7, 3)
+    assert (
+        loaded.results["event_dispatch"].samples_ms == report.results["event_dispatch"].samples_ms
+    )
+    assert loaded.machine == report.machine
+
+
+class TestBaselineComparison:
+    """Test comparisons against a stored baseline"""
+
+    def test_flags_changes_beyond_tolerance(self):
+        """Medians slower than the tolerance regress; faster ones improve"""
+        baseline = _report({"a": 10.0, "b": 10.0, "c": 10.0, "old": 1.0})
+        current = _report({"a": 10.5, "b": 12.0, "c": 8.0, "new": 1.0})
+
+        comparisons = {c.name: c for c in current.compare(baseline, tolerance=0.1)}
+
+        assert set(comparisons) == {"a", "b", "c"}
+        assert not comparisons["a"].regressed and not comparisons["a"].improved
+        assert comparisons["b"].regressed and "REGRESSED" in comparisons["b"].describe()
+        assert comparisons["c"].improved
+        assert comparisons["b"].ratio == pytest.approx(1.2)
+
+    def test_different_settings_are_not_comparable(self):
+        with pytest.raises(ValueError):
+            _report({"a": 1.0}, scale=0.5).compare(_report({"a": 1.0}))
+        with pytest.raises(ValueError):
+            _report({"a": 1.0}, seed=1).compare(_report({"a": 1.0}))
+
+
+def test_bench_command(monkeypatch, tmp_path, capsys):
+    """The bench command writes results and fails on regressions"""
+    from neonworks import cli
+
+    output = tmp_path / "bench.json"
+
+    def bench(*args):
+        # The CLI caches its lazily loaded modules in globals; reset them for each run
+        monkeypatch.setattr(cli, "ProjectManager", None)
+        monkeypatch.setattr(cli, "validate_project_config", None)
+        argv = ["neonworks", "bench", "event_dispatch", "--scale", "0.05", "-r", "1", *args]
+        monkeypatch.setattr(sys, "argv", argv)
+        return cli.main()
+
+    assert bench("-o", str(output)) == 0
+    assert "event_dispatch" in json.loads(output.read_text())["results"]
+
+    baseline = BenchmarkReport.load(output)
+    baseline.results["event_dispatch"].samples_ms = [1e-6]
+    baseline.write(tmp_path / "fast.json")
+    assert bench("--baseline", str(tmp_path / "fast.json")) == 1
+    assert "1 regression(s): event_dispatch" in capsys.readouterr().out
+
+    baseline.results["event_dispatch"].samples_ms = [1e6]
+    baseline.write(tmp_path / "slow.json")
+    assert bench("--baseline", str(tmp_path / "slow.json")) == 0
+    assert "No regressions" in capsys.readouterr().out
+
+    assert bench("--baseline", str(output), "--seed", "3") == 1
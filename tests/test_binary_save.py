@@ -0,0 +1,160 @@
+"""
+Tests for the binary save format
+
+Tests value round-trips, string interning, compression, header-only reads and
+rejection of truncated or corrupt files.
+"""
+
+import io
+from enum import Enum
+
+import pytest
+
+from neonworks.core.binary_save import (
+    FLAG_COMPRESSED,
+    BinarySaveReader,
+    BinarySaveWriter,
+    SaveFormatError,
+    is_binary_save,
+    read_header,
+)
+
+
+class Color(Enum):
+    RED = "red"
+
+
+def _write(entities, header=None, compress=True, fallback=None):
+    stream = io.BytesIO()
+    with BinarySaveWriter(stream, header or {}, compress, fallback) as writer:
+        for entity in entities:
+            writer.write_entity(*entity)
+    return stream.getvalue()
+
+
+def _read(data):
+    return list(BinarySaveReader(io.BytesIO(data)).entities())
+
+
+class TestRoundTrip:
+    """Test that written values read back as their JSON equivalents"""
+
+    @pytest.mark.parametrize("compress", [True, False])
+    def test_values(self, compress):
+        """Scalars, big ints, nested containers and non-string keys survive"""
+        values = (
+            None,
+            True,
+            -7,
+            2**70,
+            1.5,
+            "héllo",
+            (1, "a"),
+            {"nested": [1, {"x": None}]},
+            {1: "one", 2.5: "two", None: "none"},
+        )
+        names = tuple(f"f{i}" for i in range(len(values)))
+        data = _write([("e1", False, {"enemy"}, [("Thing", names, values)])], compress=compress)
+
+        [(entity_id, active, tags, components)] = _read(data)
+        assert (entity_id, active, tags) == ("e1", False, ["enemy"])
+        [(type_name, fields)] = components
+        assert type_name == "Thing"
+        assert list(fields.values()) == [
+            None,
+            True,
+            -7,
+            2**70,
+            1.5,
+            "héllo",
+            [1, "a"],
+            {"nested": [1, {"x": None}]},
+            {"1": "one", "2.5": "two", "null": "none"},
+        ]
+
+    def test_layout_changes_with_value_types(self):
+        """The same component type can hold differently typed values"""
+        entities = [
+            (1, True, [], [("Health", ("current", "maximum"), (10, 10))]),
+            (2, True, [], [("Health", ("current", "maximum"), (2.5, None))]),
+            (3, True, [], [("Health", ("current", "maximum"), (True, 2**64))]),
+        ]
+        fields = [components[0][1] for _, _, _, components in _read(_write(entities))]
+        assert fields == [
+            {"current": 10, "maximum": 10},
+            {"current": 2.5, "maximum": None},
+            {"current": True, "maximum": 2**64},
+        ]
+
+    def test_fallback_converts_unknown_values(self):
+        """Values outside the JSON domain go through the fallback"""
+        entity = (1, True, [], [("Paint", ("color",), (Color.RED,))])
+        with pytest.raises(SaveFormatError):
+            _write([entity])
+
+        data = _write([entity], fallback=lambda value: value.value)
+        assert _read(data)[0][3] == [("Paint", {"color": "red"})]
+
+    def test_strings_are_interned(self):
+        """Repeated strings are stored once"""
+        names = ("texture",)
+        entities = [(i, True, ["tile"], [("Sprite", names, ("grass.png",))]) for i in range(500)]
+        data = _write(entities, compress=False)
+
+        assert data.count(b"grass.png") == 1
+        assert data.count(b"tile") == 1
+        assert len(_read(data)) == 500
+
+
+class TestHeader:
+    """Test the metadata header"""
+
+    def test_header_is_read_without_body(self):
+        """read_header only consumes the header"""
+        data = _write([(1, True, [], [])], header={"entity_count": 1, "name": "Slot 1"})
+        stream = io.BytesIO(data)
+
+        assert is_binary_save(stream)
+        assert stream.tell() == 0
+        header, flags = read_header(stream)
+        assert header == {"entity_count": 1, "name": "Slot 1"}
+        assert flags & FLAG_COMPRESSED
+        assert stream.tell() < len(data)
+
+    def test_not_a_binary_save(self):
+        """Other files are rejected"""
+        assert not is_binary_save(io.BytesIO(b'{"entities": []}'))
+        with pytest.raises(SaveFormatError):
+            read_header(io.BytesIO(b'{"entities": []}'))
+
+
+class TestCorruption:
+    """Test that damaged saves are rejected instead of half-loaded"""
+
+    @pytest.mark.parametrize("compress", [True, False])
+    def test_truncated_file(self, compress):
+        """A save cut off anywhere raises"""
+        entities = [(i, True, [], [("Pos", ("x", "y"), (i, i))]) for i in range(50)]
+        data = _write(entities, compress=compress)
+
+        for length in range(0, len(data), max(1, len(data) // 40)):
+            with pytest.raises(SaveFormatError):
+                _read(data[:length])
+
+    def test_unclosed_writer(self):
+        """A save whose writer was never closed raises"""
+        stream = io.BytesIO()
+        writer = BinarySaveWriter(stream, {}, compress=False)
+        writer.write_entity(1, True, [], [])
+        writer._flush()
+
+        with pytest.raises(SaveFormatError):
+            _read(stream.getvalue())
+
+    def test_unknown_record(self):
+        """An unknown record type in the body raises"""
+        data = bytearray(_write([(1, True, [], [("Pos", ("x",), (1,))])], compress=False))
+        data[-5] = 0xFF  # End record opcode
+
+        with pytest.raises(SaveFormatError):
+            _read(bytes(data))
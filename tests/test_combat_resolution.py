@@ -0,0 +1,220 @@
+"""
+Tests for batched combat resolution
+
+Tests that batched attacks and spells match per-target rules, seeded
+critical/dodge/status rolls, writing results back to components, and the
+battle and magic systems using the batched path.
+"""
+
+import numpy as np
+import pytest
+
+from neonworks.core.ecs import World
+from neonworks.core.events import EventManager, EventType
+from neonworks.gameplay.combat import Health
+from neonworks.gameplay.combat_resolution import (
+    CRITICAL_MULTIPLIER,
+    TargetBatch,
+    resolve_attack,
+    resolve_spell,
+)
+from neonworks.gameplay.jrpg_combat import (
+    BattleCommand,
+    BattleState,
+    ElementalResistances,
+    ElementType,
+    JRPGStats,
+    MagicPoints,
+    Spell,
+    SpellList,
+    TargetType,
+)
+from neonworks.systems.jrpg_battle_system import BattlePhase, JRPGBattleSystem
+from neonworks.systems.magic_system import MagicSystem
+
+
+def _targets(world, count, defending=(), resist=None):
+    targets = []
+    for i in range(count):
+        entity = world.create_entity(f"Target {i}")
+        entity.add_component(Health(max_hp=100, hp=100 - i))
+        entity.add_component(JRPGStats(defense=i, magic_defense=2 * i, speed=5 + i, luck=5))
+        state = BattleState()
+        state.is_defending = i in defending
+        entity.add_component(state)
+        if resist is not None:
+            resistances = ElementalResistances()
+            resistances.resistances[ElementType.FIRE] = resist[i % len(resist)]
+            entity.add_component(resistances)
+        targets.append(entity)
+    return targets
+
+
+def _events(event_manager, kind):
+    return [
+        event.data
+        for event in event_manager._event_queue
+        if event.event_type == EventType.CUSTOM and event.data.get("type") == kind
+    ]
+
+
+class TestResolveAttack:
+    """Test batched physical attacks"""
+
+    def test_matches_per_target_damage(self):
+        """Damage equals calculate_physical_damage, halved for defenders"""
+        world = World()
+        targets = _targets(world, 20, defending={3, 7})
+        attacker = JRPGStats(attack=15)
+
+        result = resolve_attack(
+            attacker, TargetBatch.from_entities(targets), np.random.default_rng(0)
+        )
+
+        for i, target in enumerate(targets):
+            expected = attacker.calculate_physical_damage(target.get_component(JRPGStats))
+            if i in (3, 7):
+                expected = int(expected * 0.5)
+            assert result.damage[i] == expected
+            assert result.hp[i] == max(0, target.get_component(Health).hp - expected)
+        assert not result.critical.any()
+        assert not result.dodged.any()
+
+    def test_dead_and_healthless_targets_are_skipped(self):
+        """Only living targets with Health are hit"""
+        world = World()
+        targets = _targets(world, 3)
+        targets[1].get_component(Health).is_alive = False
+        targets[2].remove_component(Health)
+
+        result = resolve_attack(
+            JRPGStats(attack=15), TargetBatch.from_entities(targets), np.random.default_rng(0)
+        )
+        result.write_back()
+
+        assert result.affected.tolist() == [True, False, False]
+        assert targets[1].get_component(Health).hp == 99
+
+    def test_seeded_rolls_are_reproducible(self):
+        """The same seed gives the same criticals and dodges"""
+        world = World()
+        batch = TargetBatch.from_entities(_targets(world, 200))
+        attacker = JRPGStats(attack=40, speed=10, luck=10)
+
+        first = resolve_attack(attacker, batch, np.random.default_rng(5), 0.2, 0.2)
+        second = resolve_attack(attacker, batch, np.random.default_rng(5), 0.2, 0.2)
+
+        assert np.array_equal(first.critical, second.critical)
+        assert np.array_equal(first.dodged, second.dodged)
+        assert first.critical.any() and first.dodged.any()
+        assert (first.damage[first.dodged] == 0).all()
+
+    def test_critical_hits_multiply_damage(self):
+        """A certain critical hit multiplies damage"""
+        world = World()
+        batch = TargetBatch.from_entities(_targets(world, 5))
+        attacker = JRPGStats(attack=30, luck=5)
+
+        normal = resolve_attack(attacker, batch, np.random.default_rng(0))
+        critical = resolve_attack(attacker, batch, np.random.default_rng(0), critical_rate=1.0)
+
+        assert critical.critical.all()
+        assert critical.damage.tolist() == [
+            int(d * CRITICAL_MULTIPLIER) for d in normal.damage.tolist()
+        ]
+
+
+class TestResolveSpell:
+    """Test batched spells"""
+
+    def test_elements_and_absorption(self):
+        """Weak, resistant and absorbing targets scale or heal"""
+        world = World()
+        targets = _targets(world, 4, resist=[2.0, 0.5, 1.0, -1.0])
+        spell = Spell("fire", "Fire", "", 5, 20, ElementType.FIRE, TargetType.ALL_ENEMIES, 20)
+        caster = JRPGStats(magic_attack=10)
+
+        result = resolve_spell(
+            spell, caster, TargetBatch.from_entities(targets, spell.element), None
+        )
+        result.write_back()
+
+        base = [caster.calculate_magic_damage(20, t.get_component(JRPGStats)) for t in targets]
+        assert result.damage.tolist()[:3] == [int(base[0] * 2.0), int(base[1] * 0.5), base[2]]
+        assert result.absorbed.tolist() == [False, False, False, True]
+        assert targets[3].get_component(Health).hp == 100  # 97 + heal, capped
+        assert targets[0].get_component(Health).hp == 100 - int(base[0] * 2.0)
+
+    def test_healing_and_status(self):
+        """Healing is capped at max HP and statuses are rolled per target"""
+        world = World()
+        targets = _targets(world, 50)
+        spell = Spell(
+            "mend",
+            "Mend",
+            "",
+            5,
+            0,
+            ElementType.HOLY,
+            TargetType.ALL_ALLIES,
+            healing=10,
+            status_effect="regen",
+            status_chance=50.0,
+        )
+
+        result = resolve_spell(
+            spell, None, TargetBatch.from_entities(targets), np.random.default_rng(3)
+        )
+        result.write_back()
+
+        assert result.healing.tolist() == [min(10, i) for i in range(50)]
+        applied = [t.get_component(JRPGStats).has_status("regen") for t in targets]
+        assert applied == result.status.tolist()
+        assert 0 < sum(applied) < 50
+
+
+class TestSystemsUseBatches:
+    """Test the battle and magic systems on many targets"""
+
+    def test_attack_events_for_every_target(self):
+        """A multi-target attack emits one damage event per living target"""
+        world = World()
+        event_manager = EventManager()
+        system = JRPGBattleSystem(event_manager, seed=1)
+        system.critical_rate = 1.0
+        attacker = world.create_entity("Hero")
+        attacker.add_component(JRPGStats(attack=20))
+        targets = _targets(world, 30)
+
+        system._execute_attack(attacker, targets)
+
+        events = _events(event_manager, "battle_damage")
+        assert [e["target_id"] for e in events] == [t.id for t in targets]
+        assert all(e["is_critical"] and not e["is_dodged"] for e in events)
+        assert all(t.get_component(Health).hp < 100 - i for i, t in enumerate(targets))
+
+    def test_magic_command_casts_through_magic_system(self):
+        """The MAGIC command casts the chosen spell on all targets"""
+        world = World()
+        event_manager = EventManager()
+        magic = MagicSystem(event_manager, seed=2)
+        system = JRPGBattleSystem(event_manager, magic_system=magic, seed=2)
+
+        caster = world.create_entity("Mage")
+        caster.add_component(MagicPoints(current_mp=50, max_mp=50))
+        spells = SpellList()
+        spells.learn_spell("fire")
+        caster.add_component(spells)
+        caster.add_component(BattleState())
+        targets = _targets(world, 10)
+
+        system.in_battle = True
+        system.battle_phase = BattlePhase.PLAYER_TURN
+        system.current_actor = caster
+        system.turn_order = [caster]
+        system.player_select_action(world, BattleCommand.MAGIC, targets, {"spell_id": "fire"})
+        system._execute_action(world, caster, caster.get_component(BattleState))
+
+        assert len(_events(event_manager, "spell_damage")) == 10
+        assert caster.get_component(MagicPoints).current_mp == 45
+        assert caster.get_component(BattleState).pending_spell is None
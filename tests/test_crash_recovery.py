@@ -4,13 +4,16 @@ Tests for Crash Recovery and Auto-Save System
 Tests automatic saving, crash logging, and safe execution.
 """
 
+import gc
 import json
+import threading
 import os
 import time
 from pathlib import Path
 
 import pytest
 
+from neonworks.core.background_save import BackgroundSaver, SaveStatus
 from neonworks.core.crash_recovery import (
     AutoSaveManager,
     CrashRecovery,
@@ -73,6 +76,7 @@ class TestAutoSaveManager:
 
         # Update to reach interval
         manager.update(5.0)
+        manager.wait()
 
         # Timer should reset
         assert manager.last_save_time == 0.0
@@ -274,6 +278,107 @@ class TestAutoSaveManager:
         assert "Error loading auto-save" in captured.out
 
 
+class TestBackgroundAutoSave:
+    """Test auto-saves written on a background thread"""
+
+    def test_update_snapshots_and_writes_behind(self, tmp_path):
+        """update() returns before the write; later edits don't reach the save"""
+        manager = AutoSaveManager(save_dir=str(tmp_path / "autosaves"), interval=1.0)
+        state = {"player": {"hp": 100}, "inventory": ["sword"]}
+        manager.register_save_callback(lambda: state)
+
+        release = threading.Event()
+        write = manager._write_autosave
+
+        def slow_write(data):
+            release.wait(5)
+            write(data)
+
+        manager._write_autosave = slow_write
+
+        manager.update(1.0)
+        assert list(manager.save_dir.glob("autosave_*.json")) == []
+
+        # The game keeps mutating its state while the save is written
+        state["player"]["hp"] = 1
+        state["inventory"].append("shield")
+
+        # A second auto-save never overlaps the first; it is retried later
+        manager.update(1.0)
+        assert manager.last_save_time == 1.0
+
+        release.set()
+        assert manager.wait(5)
+
+        assert manager.load_autosave() == {"player": {"hp": 100}, "inventory": ["sword"]}
+        stats = manager.get_stats()
+        assert stats["saves_started"] == 1
+        assert stats["saves_completed"] == 1
+        assert stats["saves_skipped"] == 1
+        assert 0 < stats["max_hitch"] < 1.0
+
+        manager.update(0.0)
+        manager.wait(5)
+        assert manager.get_stats()["saves_started"] == 2
+
+    def test_snapshot_over_budget_is_counted(self, tmp_path, capsys):
+        """A snapshot slower than the budget is counted without printing"""
+        manager = AutoSaveManager(save_dir=str(tmp_path / "autosaves"), snapshot_budget=0.0)
+        manager.register_save_callback(lambda: {"test": "data"})
+
+        assert manager.save_async() is SaveStatus.STARTED
+        manager.wait(5)
+
+        stats = manager.get_stats()
+        assert stats["over_budget"] == 1
+        assert stats["saves_completed"] == 1  # Reported, not enforced
+        assert stats["max_snapshot"] == stats["last_snapshot"] > 0.0
+        assert "budget" not in capsys.readouterr().out
+
+    def test_gc_pause_is_optional(self):
+        """The process-wide GC pause can be turned off"""
+        seen = []
+        saver = BackgroundSaver(pause_gc=False)
+
+        saver.save(lambda: seen.append(gc.isenabled()), lambda state: None)
+        saver.wait(5)
+        BackgroundSaver().save(lambda: seen.append(gc.isenabled()), lambda state: None)
+
+        assert seen == [True, False]
+        assert gc.isenabled()
+
+    def test_failed_snapshot_waits_for_next_interval(self, tmp_path, capsys):
+        """A failing save callback is reported once, not retried every update"""
+        manager = AutoSaveManager(save_dir=str(tmp_path / "autosaves"), interval=1.0)
+        calls = []
+
+        def broken_callback():
+            calls.append(1)
+            raise RuntimeError("broken")
+
+        manager.register_save_callback(broken_callback)
+
+        assert manager.save_async() is SaveStatus.FAILED
+        manager.update(1.0)
+        manager.update(0.1)
+        manager.update(0.1)
+
+        assert len(calls) == 2 and manager.last_save_time == pytest.approx(0.2)
+        assert manager.get_stats()["saves_failed"] == 2
+        assert "broken" in capsys.readouterr().out
+
+    def test_failed_write_keeps_previous_save(self, tmp_path):
+        """A failed background write leaves no partial file behind"""
+        manager = AutoSaveManager(save_dir=str(tmp_path / "autosaves"))
+        manager.register_save_callback(lambda: {"value": object()})
+
+        assert manager.save_async() is SaveStatus.STARTED
+        manager.wait(5)
+
+        assert manager.get_stats()["saves_failed"] == 1
+        assert list(manager.save_dir.iterdir()) == []
+
+
 class TestCrashRecovery:
     """Test suite for CrashRecovery"""
 
@@ -626,6 +731,7 @@ class TestIntegration:
 
         # Trigger autosave via update
         manager.update(1.0)
+        manager.wait()
 
         # Verify save was created
         latest = manager.get_latest_autosave()
@@ -5,11 +5,13 @@ Tests game state serialization, save/load functionality, and auto-save.
 """
 
 import json
+import threading
 import time
 from pathlib import Path
 
 import pytest
 
+from neonworks.core.background_save import SaveStatus
 from neonworks.core.ecs import (
     Building,
     Collider,
@@ -594,6 +596,86 @@ class TestSaveGameManager:
         assert info is None
 
 
+class TestBinarySaves:
+    """Test binary saves in SaveGameManager"""
+
+    @pytest.fixture
+    def mock_project(self, tmp_path):
+        """Create a project whose saves live in a temporary directory"""
+        project_dir = tmp_path / "test_project"
+        (project_dir / "saves").mkdir(parents=True)
+
+        project = Project(str(project_dir))
+        project.config = ProjectConfig(
+            metadata=ProjectMetadata(
+                name="TestGame", version="1.0.0", description="Test", author="Test Author"
+            )
+        )
+        project.saves_dir = project_dir / "saves"
+        return project
+
+    @staticmethod
+    def _build_world():
+        world = World()
+        for i in range(40):
+            entity = world.create_entity(f"Unit{i}")
+            entity.add_tag("unit")
+            entity.active = i % 4 != 0
+            entity.add_component(GridPosition(grid_x=i, grid_y=-i, layer=i % 3))
+            entity.add_component(Transform(x=i * 0.5, y=i, rotation=1.5))
+            entity.add_component(Health(current=i, maximum=100.0))
+            entity.add_component(Sprite(texture=f"unit_{i % 2}.png", color=(255, i, 0, 255)))
+            entity.add_component(ResourceStorage(resources={"wood": i}, capacity={"wood": 500}))
+            if i % 10 == 0:
+                entity.add_component(Building(building_type="hut", level=2))
+                entity.add_component(
+                    Navmesh(walkable_cells={(i, 0), (i, 1)}, cost_multipliers={(i, 0): 2.0})
+                )
+        return world
+
+    def test_binary_save_matches_json(self, mock_project):
+        """A binary save loads into the same world as a JSON save"""
+        world = self._build_world()
+
+        SaveGameManager(mock_project).save_game("json_slot", world)
+        SaveGameManager(mock_project, binary=True).save_game("binary_slot", world)
+
+        from_json = SaveGameManager(mock_project).load_game("json_slot")
+        from_binary = SaveGameManager(mock_project).load_game("binary_slot")
+        assert GameSerializer.serialize_world(from_binary) == GameSerializer.serialize_world(
+            from_json
+        )
+
+        saves_dir = mock_project.saves_dir
+        assert (saves_dir / "binary_slot.sav").stat().st_size < (
+            saves_dir / "json_slot.json"
+        ).stat().st_size
+        assert mock_project.list_saves() == ["binary_slot", "json_slot"]
+
+    def test_get_save_info_reads_header(self, mock_project):
+        """get_save_info works from the header of a binary save"""
+        manager = SaveGameManager(mock_project, binary=True, compress=False)
+        manager.save_game("slot", self._build_world(), metadata={"player_name": "Hero"})
+
+        info = manager.get_save_info("slot")
+        assert info["project"] == "TestGame"
+        assert info["metadata"] == {"player_name": "Hero"}
+        assert info["entity_count"] == 40
+
+    def test_switching_format_replaces_save(self, mock_project):
+        """Saving in one format removes the other format's file of the same name"""
+        world = self._build_world()
+        SaveGameManager(mock_project).save_game("slot", world)
+        SaveGameManager(mock_project, binary=True).save_game("slot", world)
+
+        assert not mock_project.get_save_path("slot").exists()
+        assert mock_project.list_saves() == ["slot"]
+
+        manager = SaveGameManager(mock_project)
+        assert manager.delete_save("slot") is True
+        assert mock_project.list_saves() == []
+
+
 class TestAutoSaveManager:
     """Test suite for AutoSaveManager"""
 
@@ -655,6 +737,7 @@ class TestAutoSaveManager:
         world.create_entity("TestEntity")
 
         auto_save.update(world, 150.0)  # 150 > 100, should trigger
+        auto_save.wait()
 
         # Auto-save should have been created
         saves = save_manager.list_saves()
@@ -671,8 +754,11 @@ class TestAutoSaveManager:
 
         # Trigger 3 auto-saves
         auto_save.update(world, 150.0)
+        auto_save.wait()
         auto_save.update(world, 250.0)
+        auto_save.wait()
         auto_save.update(world, 350.0)
+        auto_save.wait()
 
         saves = save_manager.list_saves()
         assert len(saves) == 3
@@ -685,6 +771,7 @@ class TestAutoSaveManager:
         # Trigger 5 auto-saves (more than max_auto_saves=3)
         for i in range(5):
             auto_save.update(world, 150.0 + (i * 100))
+            auto_save.wait()
 
         # Should have autosave_0, autosave_1, autosave_2 (rotating)
         saves = save_manager.list_saves()
@@ -692,6 +779,92 @@ class TestAutoSaveManager:
         assert "autosave_1" in saves
         assert "autosave_2" in saves
 
+    def test_background_save_matches_sync_save(self, save_manager):
+        """A background save writes the same world as a synchronous one"""
+        world = World()
+        for i in range(20):
+            entity = world.create_entity(f"Entity{i}")
+            entity.add_tag("unit")
+            entity.add_component(Transform(x=i, y=i * 2))
+            entity.add_component(ResourceStorage(resources={"wood": i}))
+            entity.add_component(Navmesh(walkable_cells={(i, 0)}))
+
+        save_manager.save_game("sync", world)
+        assert save_manager.save_game_async("background", world) is SaveStatus.STARTED
+        assert save_manager.wait(5)
+
+        saves_dir = save_manager.project.get_save_path("sync").parent
+        sync_data = json.loads((saves_dir / "sync.json").read_text())
+        background_data = json.loads((saves_dir / "background.json").read_text())
+        assert background_data["world"] == sync_data["world"]
+        assert save_manager.get_save_stats()["saves_completed"] == 1
+
+    def test_snapshot_isolated_from_later_edits(self):
+        """Edits made while a background save is writing don't reach the save"""
+        world = World()
+        entity = world.create_entity("Base")
+        storage = ResourceStorage(resources={"wood": 10.0})
+        entity.add_component(storage)
+        entity.add_component(Health(current=50, maximum=100))
+
+        records = GameSerializer.snapshot_world(world)
+        storage.resources["wood"] = 0.0
+        entity.get_component(Health).current = 1
+        entity.add_tag("late")
+
+        [entity_data] = GameSerializer.records_to_dict(records)["entities"]
+        components = {c["_type"]: c for c in entity_data["components"]}
+        assert components["ResourceStorage"]["resources"] == {"wood": 10.0}
+        assert components["Health"]["current"] == 50
+        assert entity_data["tags"] == []
+
+    def test_overlapping_auto_save_is_retried(self, save_manager):
+        """An auto-save due while the previous one is writing waits for the next update"""
+        auto_save = AutoSaveManager(save_manager, interval=100)
+        world = World()
+
+        release = threading.Event()
+        write_save = save_manager._write_save
+
+        def slow_write(*args):
+            release.wait(5)
+            write_save(*args)
+
+        save_manager._write_save = slow_write
+
+        auto_save.update(world, 150.0)
+        auto_save.update(world, 300.0)
+        assert auto_save.auto_save_count == 1
+        assert auto_save.last_save_time == 150.0
+
+        release.set()
+        auto_save.wait()
+        auto_save.update(world, 301.0)
+        auto_save.wait()
+
+        assert auto_save.auto_save_count == 2
+        assert sorted(save_manager.list_saves()) == ["autosave_0", "autosave_1"]
+
+    def test_failed_auto_save_waits_for_next_interval(self, save_manager, monkeypatch):
+        """A failing snapshot resets the timer instead of retrying every update"""
+        auto_save = AutoSaveManager(save_manager, interval=100)
+        world = World()
+        calls = []
+
+        def broken_snapshot(world):
+            calls.append(world)
+            raise RuntimeError("broken")
+
+        monkeypatch.setattr(GameSerializer, "snapshot_world", broken_snapshot)
+
+        auto_save.update(world, 150.0)
+        auto_save.update(world, 151.0)
+        auto_save.update(world, 200.0)
+
+        assert len(calls) == 1 and auto_save.last_save_time == 150.0
+        assert auto_save.auto_save_count == 0
+        assert save_manager.get_save_stats()["saves_failed"] == 1
+
     def test_perform_auto_save(self, save_manager):
         """Test _perform_auto_save directly"""
         auto_save = AutoSaveManager(save_manager, interval=100)
@@ -699,6 +872,7 @@ class TestAutoSaveManager:
         world.create_entity("AutoSavedEntity")
 
         auto_save._perform_auto_save(world)
+        auto_save.wait()
 
         # Verify save was created
         info = save_manager.get_save_info("autosave_0")
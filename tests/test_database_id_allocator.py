@@ -0,0 +1,78 @@
+"""
+Tests for DatabaseManager ID allocation
+
+Tests freed ID reuse, explicit IDs, batch reservation, and that the per-
+category allocator follows compaction, clearing, reloading and direct
+storage edits.
+"""
+
+import pytest
+
+from neonworks.engine.data.database_manager import DatabaseManager
+from neonworks.engine.data.database_schema import Item
+
+
+def _create(manager, count, name="Item"):
+    for _ in range(count):
+        manager.create("items", Item(name=name, icon_index=1), auto_id=True)
+
+
+@pytest.fixture
+def manager():
+    manager = DatabaseManager()
+    _create(manager, 10)
+    manager.bulk_delete("items", [7, 3, 5])
+    return manager
+
+
+class TestAllocation:
+    """Test which IDs are handed out"""
+
+    def test_lowest_freed_id_is_reused_first(self, manager):
+        assert manager.get_next_id("items") == 3
+        assert manager.find_gaps("items") == [3, 5, 7]
+
+    def test_explicit_ids_keep_allocator_consistent(self, manager):
+        """Explicit IDs fill gaps and extend the high-water mark"""
+        manager.create("items", Item(id=3, name="Explicit", icon_index=1))
+        manager.create("items", Item(id=15, name="Far", icon_index=1))
+
+        assert manager.get_next_id("items") == 5
+        assert manager.find_gaps("items") == [5, 7, 11, 12, 13, 14]
+
+    def test_reserved_blocks_are_contiguous_and_released(self, manager):
+        manager.create("items", Item(id=15, name="Far", icon_index=1))
+        ids = manager.reserve_ids("items", 4)
+        assert list(ids) == [16, 17, 18, 19]
+
+        for entry_id in list(ids)[:2]:
+            manager.create("items", Item(id=entry_id, name="Bulk", icon_index=1))
+        manager.release_ids("items", ids)
+        _create(manager, 9, "Fill")
+
+        assert manager.get_next_id("items") == 20
+        assert manager.find_gaps("items", max_id=20) == [20]
+
+
+class TestAllocatorSync:
+    """Test that the allocator follows bulk changes to a category"""
+
+    def test_compaction(self, manager):
+        manager.compact_ids("items")
+
+        assert manager.get_next_id("items") == manager.get_count("items") + 1
+
+    def test_clear_and_reload(self, manager, tmp_path):
+        filepath = tmp_path / "database.json"
+        manager.save_to_file(filepath)
+
+        manager.clear_category("items")
+        assert manager.get_next_id("items") == 1
+
+        manager.load_from_file(filepath)
+        assert manager.get_next_id("items") == 3
+
+    def test_direct_storage_edits(self, manager):
+        manager.items[3] = Item(id=3, name="Direct", icon_index=1)
+
+        assert manager.get_next_id("items") == 5
@@ -0,0 +1,282 @@
+"""
+Tests for the DatabaseManager write-ahead journal
+
+Tests replay of journaled edits, torn-write recovery, crash consistency when
+the process is killed mid-write, compaction and checkpoint backups.
+"""
+
+import json
+import os
+import signal
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+from neonworks.engine.data.database_journal import journal_path_for, read_journal
+from neonworks.engine.data.database_manager import DatabaseManager, EntryNotFoundError
+from neonworks.engine.data.database_schema import Item, Skill
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+def _make_manager(tmp_path, **kwargs):
+    return DatabaseManager(backup_dir=tmp_path / "backups", **kwargs)
+
+
+def _snapshot(manager):
+    return {
+        category: [entry.to_dict() for entry in manager.read_all(category)]
+        for category in manager.get_categories()
+    }
+
+
+def _populate(manager, count=5):
+    for i in range(1, count + 1):
+        manager.create("items", Item(id=i, name=f"Item {i}", price=i * 10))
+
+
+class TestJournalReplay:
+    """Test that load replays snapshot plus journal"""
+
+    def test_edits_survive_reload(self, tmp_path):
+        """Creates, updates, deletes, compaction and clears are replayed in order"""
+        filepath = tmp_path / "database.json"
+        manager = _make_manager(tmp_path)
+        _populate(manager)
+        manager.enable_journal(filepath)
+
+        manager.create("items", Item(id=0, name="Auto"), auto_id=True)
+        item = manager.read("items", 2)
+        item.price = 999
+        manager.update("items", item)
+        manager.delete("items", 3)
+        manager.compact_ids("items")
+        manager.create("skills", Skill(id=1, name="Fire"))
+        manager.clear_category("skills")
+        manager.create("skills", Skill(id=2, name="Ice"))
+
+        loaded = _make_manager(tmp_path)
+        loaded.load_from_file(filepath)
+
+        assert _snapshot(loaded) == _snapshot(manager)
+        assert loaded.journal_enabled
+        assert [r.entry.name for r in loaded.search("auto")] == ["Auto"]
+        assert [i.id for i in loaded.filter_by_field("items", "price", 999)] == [2]
+
+    def test_edit_appends_instead_of_rewriting(self, tmp_path):
+        """An edit leaves the snapshot untouched and grows the journal by one record"""
+        filepath = tmp_path / "database.json"
+        manager = _make_manager(tmp_path)
+        _populate(manager, 100)
+        manager.enable_journal(filepath)
+
+        snapshot_before = filepath.read_bytes()
+        item = manager.read("items", 50)
+        item.name = "Edited"
+        manager.update("items", item)
+
+        assert filepath.read_bytes() == snapshot_before
+        _, records, _ = read_journal(journal_path_for(filepath))
+        assert [record["op"] for record in records] == ["put"]
+        assert records[0]["e"]["name"] == "Edited"
+
+    def test_save_to_journaled_file_compacts(self, tmp_path):
+        """Saving to the journaled file folds the journal into the snapshot"""
+        filepath = tmp_path / "database.json"
+        manager = _make_manager(tmp_path)
+        manager.enable_journal(filepath)
+        _populate(manager)
+
+        manager.save_to_file(filepath)
+
+        _, records, _ = read_journal(journal_path_for(filepath))
+        assert records == []
+        data = json.loads(filepath.read_text(encoding="utf-8"))
+        assert len(data["items"]) == 5
+
+        # Saving elsewhere is a plain export
+        export = tmp_path / "export.json"
+        manager.save_to_file(export)
+        assert "journal_id" not in json.loads(export.read_text(encoding="utf-8"))
+
+    def test_commit_compacts_large_journal(self, tmp_path):
+        """commit() compacts once the journal outgrows the snapshot"""
+        filepath = tmp_path / "database.json"
+        manager = _make_manager(tmp_path)
+        manager.COMPACT_MIN_BYTES = 0
+        _populate(manager, 3)
+        manager.enable_journal(filepath)
+
+        for _ in range(20):
+            item = manager.read("items", 1)
+            item.price += 1
+            manager.update("items", item)
+        manager.commit()
+
+        _, records, _ = read_journal(journal_path_for(filepath))
+        assert records == []
+
+        loaded = _make_manager(tmp_path)
+        loaded.load_from_file(filepath)
+        assert loaded.read("items", 1).price == 30
+
+
+class TestCrashConsistency:
+    """Test recovery from writes interrupted by a crash"""
+
+    def test_torn_record_is_dropped(self, tmp_path):
+        """A half-written last record is ignored and cut off before appending"""
+        filepath = tmp_path / "database.json"
+        manager = _make_manager(tmp_path)
+        manager.enable_journal(filepath)
+        _populate(manager, 3)
+        manager.disable_journal()
+
+        journal_path = journal_path_for(filepath)
+        with open(journal_path, "ab") as f:
+            f.write(b'{"op":"del","c":"items","id":1')
+
+        loaded = _make_manager(tmp_path)
+        loaded.load_from_file(filepath)
+        assert sorted(loaded.items) == [1, 2, 3]
+
+        loaded.create("items", Item(id=4, name="After crash"))
+        reloaded = _make_manager(tmp_path)
+        reloaded.load_from_file(filepath)
+        assert sorted(reloaded.items) == [1, 2, 3, 4]
+
+    def test_interrupted_compaction(self, tmp_path):
+        """A journal left behind by an interrupted compaction is not replayed twice"""
+        filepath = tmp_path / "database.json"
+        manager = _make_manager(tmp_path)
+        _populate(manager, 3)
+        manager.enable_journal(filepath)
+        manager.delete("items", 2)
+        manager.compact_ids("items")
+        manager.create("items", Item(id=9, name="Late"))
+
+        # Crash after the new snapshot was renamed into place
+        journal_path = journal_path_for(filepath)
+        stale_journal = journal_path.read_bytes()
+        manager.compact()
+        journal_path.write_bytes(stale_journal)
+
+        loaded = _make_manager(tmp_path)
+        loaded.load_from_file(filepath)
+        assert _snapshot(loaded) == _snapshot(manager)
+
+    @pytest.mark.skipif(not hasattr(signal, "SIGKILL"), reason="Requires SIGKILL")
+    @pytest.mark.parametrize("kill_after", [1, 37, 150])
+    def test_killed_mid_write(self, tmp_path, kill_after):
+        """Every acknowledged edit survives the process being killed at any point"""
+        filepath = tmp_path / "database.json"
+        script = textwrap.dedent(f"""
+            import time
+            from pathlib import Path
+            from neonworks.engine.data.database_manager import DatabaseManager
+            from neonworks.engine.data.database_schema import Item
+
+            manager = DatabaseManager(backup_dir=Path({str(tmp_path / "backups")!r}))
+            manager.COMPACT_MIN_BYTES = 4096  # Compact often to hit that path too
+            manager.enable_journal(Path({str(filepath)!r}))
+            for i in range(1, 9000):
+                manager.create("items", Item(id=i, name="Item " + str(i), price=i))
+                if i % 3 == 0:
+                    manager.delete("items", i - 1)
+                manager.commit()
+                print(i, flush=True)
+            time.sleep(60)
+            """)
+        env = dict(os.environ, PYTHONPATH=str(REPO_ROOT), PYGAME_HIDE_SUPPORT_PROMPT="1")
+        process = subprocess.Popen(
+            [sys.executable, "-c", script], stdout=subprocess.PIPE, env=env, cwd=tmp_path
+        )
+        try:
+            acknowledged = 0
+            for line in process.stdout:
+                acknowledged = int(line)
+                if acknowledged >= kill_after:
+                    break
+            process.send_signal(signal.SIGKILL)
+        finally:
+            process.wait(timeout=30)
+            process.stdout.close()
+
+        assert acknowledged >= kill_after
+
+        loaded = _make_manager(tmp_path)
+        loaded.load_from_file(filepath)
+
+        # State is the result of a prefix of the edit sequence at least as
+        # long as what was acknowledged
+        ids = set(loaded.items)
+        highest = max(ids)
+        assert highest >= acknowledged
+
+        completed = {i for i in range(1, highest + 1) if not (i % 3 == 2 and i < highest)}
+        between_create_and_delete = completed | {highest - 1}
+        assert ids in (completed, between_create_and_delete)
+        assert all(loaded.read("items", i).price == i for i in ids)
+
+
+class TestCheckpoints:
+    """Test backups as journal checkpoints"""
+
+    def test_auto_backup_writes_checkpoints(self, tmp_path):
+        """Auto-backup appends checkpoint records instead of full copies"""
+        filepath = tmp_path / "database.json"
+        manager = _make_manager(tmp_path, auto_backup=True)
+        _populate(manager)
+        manager.enable_journal(filepath)
+
+        item = manager.read("items", 1)
+        item.name = "Renamed"
+        manager.update("items", item)
+        manager.delete("items", 2)
+
+        assert list((tmp_path / "backups").iterdir()) == []
+        names = [checkpoint["name"] for checkpoint in manager.list_checkpoints()]
+        assert len(names) == 2
+        assert names[0].startswith("auto_update_items_1")
+        assert names[1].startswith("auto_delete_items_2")
+
+    def test_restore_checkpoint_across_compaction(self, tmp_path):
+        """Checkpoints stay restorable after their journal was compacted away"""
+        filepath = tmp_path / "database.json"
+        manager = _make_manager(tmp_path)
+        _populate(manager)
+        manager.enable_journal(filepath)
+
+        manager.delete("items", 1)
+        manager.create_backup("before_price_change")
+        manager.bulk_edit("items", [2, 3], {"price": 0})
+        manager.compact()
+        manager.delete("items", 4)
+
+        name = manager.list_checkpoints()[0]["name"]
+        manager.restore_checkpoint(name)
+
+        assert sorted(manager.items) == [2, 3, 4, 5]
+        assert manager.read("items", 2).price == 20
+
+        # The restore is persisted and can itself be undone
+        loaded = _make_manager(tmp_path)
+        loaded.load_from_file(filepath)
+        assert _snapshot(loaded) == _snapshot(manager)
+
+        undo = [
+            c["name"] for c in loaded.list_checkpoints() if c["name"].startswith("before_restore")
+        ]
+        loaded.restore_checkpoint(undo[-1])
+        assert sorted(loaded.items) == [2, 3, 5]
+
+    def test_unknown_checkpoint(self, tmp_path):
+        """Restoring an unknown checkpoint raises"""
+        manager = _make_manager(tmp_path)
+        manager.enable_journal(tmp_path / "database.json")
+
+        with pytest.raises(EntryNotFoundError):
+            manager.restore_checkpoint("missing")
@@ -0,0 +1,95 @@
+"""
+Tests for DatabaseManager secondary indexes
+
+Tests that hash, sorted and token indexes answer filter_by_field() and
+search() queries and stay in sync with create/update/delete/bulk_edit,
+compaction, reloading and direct storage edits.
+"""
+
+import pytest
+
+from neonworks.engine.data.database_manager import DatabaseManager
+from neonworks.engine.data.database_schema import ElementType, Item, ItemType, Skill
+
+
+def _ids(entries):
+    return [entry.id for entry in entries]
+
+
+@pytest.fixture
+def manager():
+    manager = DatabaseManager()
+    for i in range(1, 21):
+        item = Item(
+            id=i,
+            name=f"Item {i}",
+            icon_index=1,
+            description="Fire charm" if i % 2 else "Ice charm",
+            price=i * 10,
+            item_type=ItemType.KEY if i <= 5 else ItemType.REGULAR,
+        )
+        manager.create("items", item)
+    return manager
+
+
+class TestIndexedQueries:
+    """Test queries answered from the indexes"""
+
+    def test_hash_index(self, manager):
+        key_items = manager.filter_by_field("items", "item_type", ItemType.KEY)
+        assert _ids(key_items) == [1, 2, 3, 4, 5]
+
+    def test_sorted_index_range(self, manager):
+        assert _ids(manager.filter_by_field("items", "price", 30, operator="le")) == [1, 2, 3]
+
+    def test_token_index_matches_substrings(self, manager):
+        """Substrings inside words match, like the full scan"""
+        assert len(manager.search("harm")) == 20
+        assert len(manager.search("fire ch")) == 10
+
+    def test_skill_element_index(self, manager):
+        manager.create("skills", Skill(id=1, name="Fire", element_type=ElementType.FIRE))
+        manager.create("skills", Skill(id=2, name="Ice", element_type=ElementType.ICE))
+
+        fire = manager.filter_by_field("skills", "element_type", ElementType.FIRE)
+        assert [skill.name for skill in fire] == ["Fire"]
+
+
+class TestIndexMaintenance:
+    """Test that indexes follow edits to the database"""
+
+    def test_update_reindexes_entry(self, manager):
+        item = manager.read("items", 20)
+        item.price = 5
+        item.item_type = ItemType.KEY
+        manager.update("items", item)
+
+        assert _ids(manager.filter_by_field("items", "price", 10, operator="lt")) == [20]
+        assert 20 in _ids(manager.filter_by_field("items", "item_type", ItemType.KEY))
+
+    def test_bulk_edit_and_delete(self, manager):
+        manager.bulk_edit("items", [1, 2], {"description": "Thunder charm"})
+        manager.delete("items", 3)
+
+        assert [result.entry.id for result in manager.search("thunder")] == [1, 2]
+        assert _ids(manager.filter_by_field("items", "price", 30, operator="le")) == [1, 2]
+        assert len(manager.search("harm")) == 19
+
+    def test_compaction_rebuilds_indexes(self, manager):
+        manager.delete("items", 1)
+        manager.compact_ids("items")
+
+        assert _ids(manager.filter_by_field("items", "price", 30, operator="le")) == [1, 2]
+
+    def test_reload_rebuilds_indexes(self, manager, tmp_path):
+        manager.bulk_edit("items", [1, 2], {"description": "Thunder charm"})
+        filepath = tmp_path / "database.json"
+        manager.save_to_file(filepath)
+        manager.load_from_file(filepath)
+
+        assert len(manager.search("thunder")) == 2
+
+    def test_direct_storage_edits_are_picked_up(self, manager):
+        manager.items[100] = Item(id=100, name="Direct", icon_index=1, price=1)
+
+        assert _ids(manager.filter_by_field("items", "price", 1)) == [100]
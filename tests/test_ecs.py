@@ -663,6 +663,145 @@ class TestWorld:
         assert len(world._entities) == 0
 
 
+class TestChangeTracking:
+    """Test suite for World change tracking used by delta saves."""
+
+    def test_off_by_default(self, world):
+        """Test that nothing is recorded until tracking starts."""
+        world.create_entity("A").add_component(Transform())
+
+        assert not world.tracking_changes
+        with pytest.raises(RuntimeError):
+            world.take_changes()
+
+    def test_structural_changes_mark_entities(self, world):
+        """Test that component, tag and active changes mark the entity."""
+        entities = [world.create_entity(f"E{i}") for i in range(6)]
+        entities[0].add_component(Health())
+        world.start_change_tracking()
+
+        entities[1].add_component(Transform())
+        entities[0].remove_component(Health)
+        entities[2].add_tag("enemy")
+        entities[3].active = False
+        entities[4].get_component(Transform)  # Reads don't mark
+        entities[5].mark_dirty()
+
+        dirty, removed = world.take_changes()
+        assert dirty == {"E0", "E1", "E2", "E3", "E5"}
+        assert removed == set()
+        assert world.take_changes() == (set(), set())
+
+    def test_added_and_removed_entities(self, world):
+        """Test that adding and removing entities is recorded once per id."""
+        world.create_entity("Old")
+        world.start_change_tracking()
+
+        world.create_entity("New")
+        world.create_entity("Temp")
+        world.remove_entity("Temp")
+        world.remove_entity("Old")
+
+        assert world.take_changes() == ({"New"}, {"Temp", "Old"})
+
+        world.create_entity("Old")
+        world.clear()
+        assert world.take_changes() == (set(), {"Old", "New"})
+
+
+class TestGridIndex:
+    """Test suite for the World grid spatial index."""
+
+    def test_entities_at(self, world):
+        """Entities are indexed by their grid cell."""
+        a = world.create_entity("A").add_component(GridPosition(grid_x=2, grid_y=3))
+        b = world.create_entity("B").add_component(GridPosition(grid_x=2, grid_y=3, layer=1))
+        world.create_entity("C").add_component(GridPosition(grid_x=5, grid_y=5))
+
+        assert world.entities_at(2, 3) == [a, b]
+        assert world.entities_at(2, 3, layer=1) == [b]
+        assert world.entities_at(9, 9) == []
+
+    def test_index_follows_position_changes(self, world):
+        """Mutating GridPosition fields moves the entity in the index."""
+        entity = world.create_entity("Mover").add_component(GridPosition(grid_x=0, grid_y=0))
+        grid_pos = entity.get_component(GridPosition)
+
+        grid_pos.grid_x = 4
+        grid_pos.grid_y = 1
+
+        assert world.entities_at(0, 0) == []
+        assert world.entities_at(4, 1) == [entity]
+
+    def test_index_follows_component_and_entity_lifecycle(self, world):
+        """Adding, replacing and removing components or entities updates the index."""
+        entity = Entity("Late")
+        entity.add_component(GridPosition(grid_x=1, grid_y=1))
+        world.add_entity(entity)
+        assert world.entities_at(1, 1) == [entity]
+
+        old_pos = entity.get_component(GridPosition)
+        entity.add_component(GridPosition(grid_x=7, grid_y=7))
+        old_pos.grid_x = 3  # Detached component no longer affects the index
+        assert world.entities_at(1, 1) == []
+        assert world.entities_at(3, 1) == []
+        assert world.entities_at(7, 7) == [entity]
+
+        entity.remove_component(GridPosition)
+        assert world.entities_at(7, 7) == []
+
+        entity.add_component(GridPosition(grid_x=2, grid_y=2))
+        world.remove_entity("Late")
+        assert world.entities_at(2, 2) == []
+        assert len(world.grid_index) == 0
+
+    def test_entities_in_rect(self, world):
+        """Rectangle queries return entities inside the rect only."""
+        inside = []
+        for x in range(10):
+            entity = world.create_entity(f"E{x}").add_component(GridPosition(grid_x=x, grid_y=x))
+            if 2 <= x < 5:
+                inside.append(entity)
+
+        assert sorted(e.id for e in world.entities_in_rect(2, 2, 3, 3)) == ["E2", "E3", "E4"]
+        assert len(world.entities_in_rect(0, 0, 100, 100)) == 10
+        assert world.entities_in_rect(0, 0, 0, 5) == []
+
+    def test_is_cell_blocked(self, world):
+        """Only components declaring blocks_movement occupy a cell."""
+
+        class Solid(Component):
+            blocks_movement = True
+
+        wall = world.create_entity("Wall").add_component(GridPosition(grid_x=1, grid_y=0))
+        world.create_entity("Decal").add_component(GridPosition(grid_x=2, grid_y=0))
+        wall.add_component(Solid())
+
+        assert world.is_cell_blocked(1, 0)
+        assert not world.is_cell_blocked(2, 0)
+        assert not world.is_cell_blocked(1, 0, ignore_entity=wall)
+        assert not world.is_cell_blocked(1, 0, layer=3)
+
+    def test_clear_resets_index(self, world):
+        """Clearing the world empties the grid index."""
+        entity = world.create_entity("A").add_component(GridPosition(grid_x=1, grid_y=1))
+        world.clear()
+
+        entity.get_component(GridPosition).grid_x = 5
+        assert len(world.grid_index) == 0
+
+    def test_copied_position_is_unbound(self, world):
+        """Copies of an indexed GridPosition do not update the original index."""
+        import copy
+
+        entity = world.create_entity("A").add_component(GridPosition(grid_x=1, grid_y=1))
+        clone = copy.deepcopy(entity.get_component(GridPosition))
+        clone.grid_x = 9
+
+        assert world.entities_at(1, 1) == [entity]
+        assert world.entities_at(9, 1) == []
+
+
 class TestSystem:
     """Test suite for System base class."""
 
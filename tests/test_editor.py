@@ -4,11 +4,13 @@ Comprehensive tests for Editor module
 Tests AI-assisted level building, navmesh generation, and writing tools.
 """
 
+import random
 from unittest.mock import Mock, patch
 
 import pytest
 
 from neonworks.core.ecs import Building, Entity, GridPosition, Navmesh, World
+from neonworks.data.map_layers import EnhancedTileLayer
 from neonworks.editor.ai_level_builder import (
     AILevelBuilder,
     PlacementPriority,
@@ -23,6 +25,7 @@ from neonworks.editor.ai_writer import (
     QuestTemplate,
     QuestType,
 )
+from neonworks.rendering.autotiles import AutotileFormat, AutotileManager, AutotileSet
 
 # ===========================
 # AILevelBuilder Tests
@@ -92,6 +95,27 @@ class TestAILevelBuilder:
         assert (20, 20) in builder.occupied_cells
         assert (15, 15) not in builder.occupied_cells
 
+    @pytest.mark.parametrize("terrain_type", ["water", "wall"])
+    def test_generate_autotile_terrain(self, terrain_type):
+        """Test that generated terrain is fully autotiled"""
+        manager = AutotileManager()
+        autotile_set = AutotileSet(
+            name="Water", tileset_name="terrain", format=AutotileFormat.TILE_16, base_tile_id=1
+        )
+        manager.register_autotile_set(autotile_set)
+        layer = EnhancedTileLayer(width=30, height=30)
+        builder = AILevelBuilder(grid_width=30, grid_height=30)
+
+        random.seed(7)
+        builder.generate_autotile_terrain(manager, autotile_set, layer, terrain_type, 0.2)
+
+        painted = [(x, y) for y in range(30) for x in range(30) if layer.get_tile(x, y)]
+        assert painted
+        for x, y in painted:
+            assert layer.get_tile(x, y) == manager.get_autotile_for_position(
+                layer, x, y, autotile_set
+            )
+
 
 # ===========================
 # AINavmeshGenerator Tests
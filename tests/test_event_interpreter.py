@@ -5,6 +5,8 @@ Comprehensive tests for the event command interpreter including
 flow control, wait states, and sample game events.
 """
 
+import gc
+import weakref
 from dataclasses import dataclass, field
 from typing import Any, Dict, List
 from unittest.mock import MagicMock, Mock
@@ -28,6 +30,7 @@ from neonworks.core.event_commands import (
     TriggerType,
     WaitCommand,
 )
+from neonworks.core.event_triggers import EventTriggerManager
 from neonworks.core.events import Event, EventManager, EventType
 from neonworks.engine.core.event_interpreter import (
     CommandExecutionError,
@@ -667,6 +670,228 @@ def test_interpreter_statistics(interpreter, game_state):
     assert stats["total_events_completed"] >= 1
 
 
+def test_statistics_report_compiled_pages(interpreter, game_state):
+    """Test that statistics expose the page compile cache"""
+    page = EventPage(commands=[ControlSwitchesCommand(switch_id=1, value=True)])
+    interpreter.start_event(GameEvent(id=1, name="Stats", x=0, y=0), page)
+
+    stats = interpreter.get_statistics()
+    assert stats["compiled_pages"] == 1
+    assert stats["pages_compiled"] == 1
+
+
+def test_script_conditions_use_cache(interpreter, game_state):
+    """Test that script conditions and commands are compiled once and reported"""
+    game_state.set_variable(1, 5)
+    page = EventPage(
+        commands=[
+            ConditionalBranchCommand("script", script="game_state.get_variable(1) > 3"),
+            EventCommand(
+                command_type=CommandType.SCRIPT,
+                parameters={"script": "game_state.set_switch(1, True)"},
+                indent=1,
+            ),
+        ]
+    )
+    event = GameEvent(id=1, name="Scripted", x=0, y=0, pages=[page])
+    assert interpreter.precompile_events([event]) == 2
+
+    for _ in range(3):
+        instance = interpreter.start_event(event, page)
+        while not instance.is_finished():
+            interpreter.update(0.016)
+
+    assert game_state.get_switch(1) is True
+    scripts = interpreter.get_statistics()["scripts"]
+    assert scripts["scripts_cached"] == 2
+    assert scripts["cache_misses"] == 0
+    assert scripts["hit_rate"] == 1.0
+    assert scripts["script_timings"]["game_state.get_variable(1) > 3"]["calls"] == 3
+
+    interpreter.clear_compile_cache()
+    assert interpreter.get_statistics()["scripts"]["scripts_cached"] == 0
+
+
+def test_loading_map_events_precompiles_them(interpreter, game_state):
+    """Test that loading a map's events compiles them for the interpreter"""
+    page = EventPage(
+        commands=[
+            EventCommand(
+                command_type=CommandType.SCRIPT,
+                parameters={"script": "game_state.set_switch(1, True)"},
+            )
+        ]
+    )
+    manager = EventTriggerManager(game_state=game_state)
+    manager.add_event(GameEvent(id=1, name="Scripted", x=0, y=0, pages=[page]))
+
+    loaded = EventTriggerManager.from_json(manager.to_json(), game_state, interpreter)
+
+    stats = interpreter.get_statistics()
+    assert stats["pages_compiled"] == 1
+    assert stats["scripts"]["scripts_cached"] == 1
+    event = loaded.events[1]
+    interpreter.start_event(event, event.pages[0])
+    assert interpreter.get_statistics()["pages_compiled"] == 1
+
+
+# ========== Compilation Tests ==========
+
+
+def test_compiled_page_is_cached_per_page(interpreter, game_state):
+    """Test that starting the same page again reuses its compiled program"""
+    page = EventPage(commands=[ControlSwitchesCommand(switch_id=1, value=True)])
+
+    first = interpreter.start_event(GameEvent(id=1, name="A", x=0, y=0), page)
+    second = interpreter.start_event(GameEvent(id=2, name="B", x=0, y=0), page)
+
+    assert first.program is second.program
+    assert interpreter.pages_compiled == 1
+
+
+def test_compiled_page_rebuilt_after_edit(interpreter, game_state):
+    """Test that editing a page invalidates its compiled program"""
+    page = EventPage(commands=[ControlSwitchesCommand(switch_id=1, value=True)])
+    program = interpreter.get_compiled_page(page)
+
+    # Appending a command changes the signature
+    page.commands.append(ControlSwitchesCommand(switch_id=2, value=True))
+    appended = interpreter.get_compiled_page(page)
+    assert appended is not program
+    assert len(appended) == 2
+
+    # Replacing a command is picked up without mark_dirty()
+    page.commands[1] = ControlSwitchesCommand(switch_id=3, value=True)
+    rebuilt = interpreter.get_compiled_page(page)
+    assert rebuilt is not appended
+    assert interpreter.get_compiled_page(page) is rebuilt
+
+    instance = interpreter.start_event(GameEvent(id=1, name="Edited", x=0, y=0), page)
+    while not instance.is_finished():
+        interpreter.update(0.016)
+
+    assert game_state.get_switch(3) == True
+    assert game_state.get_switch(2) == False
+
+
+def test_compiled_page_rebuilt_after_in_place_edit(interpreter, game_state):
+    """Test that in-place indent and label edits invalidate the compiled program"""
+    page = EventPage(
+        commands=[
+            EventCommand(command_type=CommandType.LABEL, parameters={"name": "a"}),
+            EventCommand(command_type=CommandType.JUMP_TO_LABEL, parameters={"label": "b"}),
+        ]
+    )
+    assert interpreter.get_compiled_page(page).jump_targets[1] is None
+
+    page.commands[0].parameters["name"] = "b"
+    assert interpreter.get_compiled_page(page).jump_targets[1] == 0
+
+    page.commands[1].indent = 1
+    assert interpreter.get_compiled_page(page).indents == (0, 1)
+    assert interpreter.pages_compiled == 3
+
+
+def test_compiled_page_dropped_with_page(interpreter):
+    """Test that the compile cache doesn't keep discarded pages alive"""
+    page = EventPage(commands=[ControlSwitchesCommand(switch_id=1, value=True)])
+    interpreter.get_compiled_page(page)
+    page_ref = weakref.ref(page)
+
+    del page
+    gc.collect()
+
+    assert page_ref() is None
+    assert interpreter.get_statistics()["compiled_pages"] == 0
+
+
+def test_compiled_branch_targets_resolved(interpreter, game_state):
+    """Test that branch, loop and label targets are resolved at compile time"""
+    page = EventPage(
+        commands=[
+            EventCommand(command_type=CommandType.LABEL, parameters={"name": "top"}),
+            EventCommand(command_type=CommandType.LOOP, parameters={}, indent=0),
+            EventCommand(command_type=CommandType.BREAK_LOOP, parameters={}, indent=1),
+            EventCommand(command_type=CommandType.COMMENT, parameters={"text": ""}, indent=0),
+            EventCommand(
+                command_type=CommandType.CONDITIONAL_BRANCH,
+                parameters={"condition_type": "switch", "switch_id": 1, "value": True},
+                indent=0,
+            ),
+            EventCommand(
+                command_type=CommandType.CONTROL_SWITCHES,
+                parameters={"switch_id": 2, "value": True, "end_id": None},
+                indent=1,
+            ),
+            EventCommand(command_type=CommandType.COMMENT, parameters={"text": ""}, indent=0),
+            EventCommand(command_type=CommandType.JUMP_TO_LABEL, parameters={"label": "top"}),
+        ]
+    )
+
+    program = interpreter.get_compiled_page(page)
+
+    assert program.label_map == {"top": 0}
+    assert program.loop_ends[1] == 3
+    assert program.branch_targets[4] == (None, 5)
+    assert program.jump_targets[7] == 0
+    assert program.next_unindented[5] == 6
+
+
+def test_skipped_branch_body_not_executed(interpreter, game_state):
+    """Test that a false branch skips its whole body"""
+    page = EventPage(
+        commands=[
+            EventCommand(
+                command_type=CommandType.CONDITIONAL_BRANCH,
+                parameters={"condition_type": "switch", "switch_id": 1, "value": True},
+                indent=0,
+            ),
+            EventCommand(
+                command_type=CommandType.CONTROL_SWITCHES,
+                parameters={"switch_id": 2, "value": True, "end_id": None},
+                indent=1,
+            ),
+            EventCommand(
+                command_type=CommandType.CONTROL_SWITCHES,
+                parameters={"switch_id": 3, "value": True, "end_id": None},
+                indent=1,
+            ),
+            EventCommand(
+                command_type=CommandType.CONTROL_SWITCHES,
+                parameters={"switch_id": 4, "value": True, "end_id": None},
+                indent=0,
+            ),
+        ]
+    )
+
+    executed = []
+    interpreter.on_command_execute = lambda command, context: executed.append(command)
+    instance = interpreter.start_event(GameEvent(id=1, name="Skip", x=0, y=0), page)
+    while not instance.is_finished():
+        interpreter.update(0.016)
+
+    assert game_state.get_switch(2) == False
+    assert game_state.get_switch(3) == False
+    assert game_state.get_switch(4) == True
+    assert executed == [page.commands[0], page.commands[3]]
+
+
+def test_unimplemented_command_is_skipped(interpreter, game_state):
+    """Test that commands without a handler are skipped"""
+    page = EventPage(
+        commands=[
+            EventCommand(command_type=CommandType.SHAKE_SCREEN, parameters={}),
+            ControlSwitchesCommand(switch_id=1, value=True),
+        ]
+    )
+
+    instance = interpreter.start_event(GameEvent(id=1, name="Unknown", x=0, y=0), page)
+    while not instance.is_finished():
+        interpreter.update(0.016)
+
+    assert game_state.get_switch(1) == True
+
+
 # ========== Integration Tests ==========
 
 
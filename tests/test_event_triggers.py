@@ -13,6 +13,7 @@ from neonworks.core.event_commands import (
     ControlSwitchesCommand,
     EventPage,
     GameEvent,
+    GameState,
     ShowTextCommand,
     TriggerType,
     WaitCommand,
@@ -586,6 +587,190 @@ class TestEventTriggerManager:
         assert len(manager2.events) == 1
 
 
+class NotifyingGameState(GameState):
+    """Game state that reports switch/variable changes to listeners"""
+
+    reports_changes = True
+
+    def __init__(self):
+        self.switches = {}
+        self.variables = {}
+        self.items = set()
+        self.actors = set()
+        self.reads = 0
+
+    def get_switch(self, switch_id: int) -> bool:
+        self.reads += 1
+        return self.switches.get(switch_id, False)
+
+    def set_switch(self, switch_id: int, value: bool):
+        self.switches[switch_id] = value
+        self.notify_changed("switch", switch_id)
+
+    def get_variable(self, variable_id: int) -> int:
+        self.reads += 1
+        return self.variables.get(variable_id, 0)
+
+    def set_variable(self, variable_id: int, value: int):
+        self.variables[variable_id] = value
+        self.notify_changed("variable", variable_id)
+
+    def has_item(self, item_id: int) -> bool:
+        return item_id in self.items
+
+    def has_actor(self, actor_id: int) -> bool:
+        return actor_id in self.actors
+
+
+def _make_switch_event(event_id: int, switch_id: int, x: int = 0, y: int = 0) -> GameEvent:
+    """Event whose second page requires a switch"""
+    event = GameEvent(id=event_id, name=f"Event {event_id}", x=x, y=y)
+    event.pages.append(EventPage())
+    event.pages.append(EventPage(condition_switch1_valid=True, condition_switch1_id=switch_id))
+    return event
+
+
+class TestReactiveTriggers:
+    """Test dependency tracking and the trigger index"""
+
+    def test_page_dependencies(self):
+        """Test pages report the values their conditions read"""
+        page = EventPage(
+            condition_switch1_valid=True,
+            condition_switch1_id=3,
+            condition_variable_valid=True,
+            condition_variable_id=7,
+            condition_item_valid=True,
+            condition_item_id=2,
+        )
+
+        assert page.get_dependencies() == (("switch", 3), ("variable", 7), ("item", 2))
+        assert EventPage().get_dependencies() == ()
+
+    def test_only_dependent_events_reevaluated(self):
+        """Test changing a switch only re-evaluates events reading it"""
+        game_state = MockGameState()
+        manager = EventTriggerManager(game_state=game_state)
+        for event_id in range(1, 11):
+            manager.add_event(_make_switch_event(event_id, switch_id=event_id))
+
+        manager.update_event_handlers()
+        assert manager.page_evaluations == 10
+
+        # Nothing changed
+        manager.update_event_handlers()
+        assert manager.page_evaluations == 10
+
+        game_state.set_switch(3, True)
+        manager.update_event_handlers()
+
+        assert manager.page_evaluations == 11
+        assert manager.active_handlers[3].page == manager.events[3].pages[1]
+        assert manager.active_handlers[4].page == manager.events[4].pages[0]
+
+    def test_notifying_state_marks_events_dirty(self):
+        """Test game states with change notifications are not polled"""
+        game_state = NotifyingGameState()
+        manager = EventTriggerManager(game_state=game_state)
+        manager.add_event(_make_switch_event(1, switch_id=5))
+        manager.add_event(_make_switch_event(2, switch_id=6))
+        manager.update_event_handlers()
+
+        reads = game_state.reads
+        manager.update_event_handlers()
+        assert game_state.reads == reads
+
+        game_state.set_switch(5, True)
+        assert manager.get_dirty_events() == {1}
+
+        manager.update_event_handlers()
+        assert manager.active_handlers[1].page == manager.events[1].pages[1]
+
+    def test_items_polled_with_notifying_state(self):
+        """Test item conditions are still picked up without notifications"""
+        game_state = NotifyingGameState()
+        manager = EventTriggerManager(game_state=game_state)
+
+        event = GameEvent(id=1, name="Chest", x=0, y=0)
+        event.pages.append(EventPage(condition_item_valid=True, condition_item_id=4))
+        manager.add_event(event)
+        manager.update_event_handlers()
+        assert 1 not in manager.active_handlers
+
+        game_state.items.add(4)
+        manager.update_event_handlers()
+        assert 1 in manager.active_handlers
+
+    def test_remove_and_invalidate_event(self):
+        """Test removing events drops dependencies and invalidation re-reads pages"""
+        game_state = MockGameState()
+        manager = EventTriggerManager(game_state=game_state)
+        event = _make_switch_event(1, switch_id=1)
+        manager.add_event(event)
+        manager.update_event_handlers()
+
+        # Edit the page conditions of a registered event
+        event.pages[1].condition_switch1_id = 2
+        manager.invalidate_event(1)
+        game_state.set_switch(2, True)
+        manager.update_event_handlers()
+        assert manager.active_handlers[1].page == event.pages[1]
+
+        manager.remove_event(1)
+        game_state.set_switch(2, False)
+        assert manager.get_dirty_events() == set()
+        assert 1 not in manager.active_handlers
+
+    def test_positional_triggers_use_index(self):
+        """Test only events near the player are checked"""
+        game_state = MockGameState()
+        manager = EventTriggerManager(game_state=game_state)
+        for event_id in range(100):
+            event = GameEvent(id=event_id, name="Tile", x=event_id * 3, y=0)
+            event.pages.append(EventPage(trigger=TriggerType.PLAYER_TOUCH))
+            manager.add_event(event)
+
+        autorun = GameEvent(id=500, name="Auto", x=999, y=999)
+        autorun.pages.append(EventPage(trigger=TriggerType.AUTORUN))
+        manager.add_event(autorun)
+        manager.update_event_handlers()
+
+        checked = []
+        original = EventTriggerHandler.check_trigger
+
+        def spy(handler, context):
+            checked.append(handler.event.id)
+            return original(handler, context)
+
+        EventTriggerHandler.check_trigger = spy
+        try:
+            context = TriggerContext(
+                game_state=game_state, player_position=(9, 0), player_direction=2
+            )
+            triggered = manager.check_triggers(context)
+        finally:
+            EventTriggerHandler.check_trigger = original
+
+        assert sorted(checked) == [3, 500]
+        assert [event.id for event, _ in triggered] == [3, 500]
+
+    def test_move_event_updates_index(self):
+        """Test moved events trigger at their new tile"""
+        game_state = MockGameState()
+        manager = EventTriggerManager(game_state=game_state)
+        event = GameEvent(id=1, name="Mover", x=0, y=0)
+        event.pages.append(EventPage(trigger=TriggerType.PLAYER_TOUCH))
+        manager.add_event(event)
+        manager.update_event_handlers()
+
+        manager.move_event(1, 10, 10)
+        context = TriggerContext(
+            game_state=game_state, player_position=(10, 10), player_direction=2
+        )
+
+        assert manager.check_triggers(context) == [(event, event.pages[0])]
+
+
 class TestTriggerFactories:
     """Test trigger factory functions"""
 
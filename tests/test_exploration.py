@@ -789,6 +789,25 @@ class TestCollisionDetection:
         # Triggers don't block movement
         assert system._is_tile_walkable(world, 5, 5)
 
+    def test_blocker_moving_updates_walkability(self):
+        """Test solid entity leaving a tile frees it"""
+        input_mgr = Mock()
+        event_mgr = Mock()
+        system = ExplorationSystem(input_mgr, event_mgr)
+        system.set_collision_map(TileCollisionMap(width=10, height=10))
+
+        world = World()
+        npc = world.create_entity()
+        npc.add_component(GridPosition(grid_x=5, grid_y=5))
+        npc.add_component(Collider2D(is_solid=True))
+
+        assert not system._is_tile_walkable(world, 5, 5)
+
+        npc.get_component(GridPosition).grid_x = 6
+
+        assert system._is_tile_walkable(world, 5, 5)
+        assert not system._is_tile_walkable(world, 6, 5)
+
 
 class TestFullUpdate:
     """Test full update cycle"""
@@ -381,6 +381,79 @@ class TestPerformanceStats:
                 assert isinstance(value, (int, float))
 
 
+class TestFramePacing:
+    """Test frame pacing and the accumulator on a headless engine"""
+
+    @pytest.fixture
+    def engine(self, monkeypatch):
+        """Real engine on the dummy SDL drivers"""
+        monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+        monkeypatch.setenv("SDL_AUDIODRIVER", "dummy")
+        engine = GameEngine(target_fps=100, fixed_timestep=1.0 / 100.0)
+        yield engine
+        pygame.quit()
+
+    def _run_frames(self, engine, frames, on_frame=None):
+        """Run the engine loop for a number of frames, returning per-frame stats"""
+        recorded = []
+
+        def render():
+            recorded.append((engine.stats["updates"], engine.alpha, engine.state_manager.alpha))
+            if on_frame:
+                on_frame()
+            if len(recorded) >= frames:
+                engine.stop()
+
+        engine.state_manager.render = render
+        engine.running = True
+        engine.run()
+        return recorded
+
+    def test_frame_jitter(self, engine):
+        """Frames are paced to the target interval with low jitter"""
+        self._run_frames(engine, 60)
+
+        pacing = engine.get_frame_pacing()
+        assert pacing["frames"] == 60
+        assert pacing["mean_ms"] == pytest.approx(10.0, abs=1.0)
+        assert pacing["jitter_ms"] < 2.0
+
+    def test_slow_updates_drop_time_instead_of_spiraling(self, engine):
+        """Updates slower than real time run once per frame and drop the rest"""
+        original = engine._fixed_update
+
+        def slow_update(delta_time):
+            time.sleep(0.025)
+            original(delta_time)
+
+        engine._fixed_update = slow_update
+        frames = self._run_frames(engine, 8)
+
+        assert all(updates <= 1 for updates, _, _ in frames[1:])
+        assert engine.stats["dropped_updates"] > 0
+        assert engine.stats["dropped_time"] > 0
+        for _, alpha, state_alpha in frames:
+            assert 0.0 <= alpha < 1.0 and state_alpha == alpha
+
+    def test_long_stall_is_clamped(self, engine):
+        """A stall longer than MAX_FRAME_TIME is dropped, not simulated"""
+        engine._last_time = time.perf_counter() - 2.0
+        frames = self._run_frames(engine, 1)
+
+        assert frames[0][0] <= engine.max_updates
+        assert engine.stats["dropped_time"] >= 2.0 - GameEngine.MAX_FRAME_TIME
+
+    def test_stats_do_not_list_entities(self, engine):
+        """Per-frame stats use counts instead of building entity lists"""
+        engine.world.create_entity()
+        engine.world.get_entities = Mock(side_effect=AssertionError("allocates a list"))
+
+        self._run_frames(engine, 2)
+
+        assert engine.stats["entity_count"] == 1
+        assert engine.stats["audio_playing"] == 0
+
+
 # Run tests with: pytest engine/tests/test_game_loop.py -v
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
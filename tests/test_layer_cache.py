@@ -0,0 +1,223 @@
+"""
+Tests for the layer composite cache
+
+Tests that cached character frames and faces match uncached compositing
+pixel for pixel, that integer tinting matches the float multiply, and that
+changing one layer recomposites only from that layer upward.
+"""
+
+import numpy as np
+import pygame
+import pytest
+
+from neonworks.engine.tools.character_generator import (
+    CharacterGenerator,
+    CharacterPreset,
+    ColorTint,
+    ComponentLayer,
+    ComponentSprite,
+    Direction,
+    LayerType,
+)
+from neonworks.engine.tools.face_generator import (
+    Expression,
+    FaceComponent,
+    FaceGenerator,
+    FaceLayer,
+    FaceLayerType,
+    FacePreset,
+)
+from neonworks.engine.tools.layer_cache import LayerCompositeCache, multiply_tint
+
+
+def _random_surface(rng, width, height):
+    """SRCALPHA surface of random colors and alpha"""
+    surface = pygame.Surface((width, height), pygame.SRCALPHA)
+    pixels = rng.integers(0, 256, (width, height, 4), dtype=np.uint8)
+    pygame.surfarray.pixels3d(surface)[:] = pixels[..., :3]
+    pygame.surfarray.pixels_alpha(surface)[:] = pixels[..., 3]
+    return surface
+
+
+def _pixels(surface):
+    return pygame.image.tobytes(surface, "RGBA")
+
+
+def _float_tint(surface, tint):
+    """The float multiply tint the integer tint replaced"""
+    tinted = surface.copy()
+    pixels = pygame.surfarray.pixels3d(tinted)
+    rgb = np.array([tint.r, tint.g, tint.b], dtype=np.float32)
+    pixels[:] = (pixels.astype(np.float32) * rgb / 255).astype(np.uint8)
+    del pixels
+    return tinted
+
+
+@pytest.fixture
+def generator():
+    """Generator with 16x16 four-frame, four-direction components"""
+    rng = np.random.default_rng(3)
+    gen = CharacterGenerator(default_size=32)
+    for layer_type in (LayerType.BODY, LayerType.TORSO, LayerType.HAIR_FRONT):
+        component_id = layer_type.name.lower()
+        gen.component_library[component_id] = ComponentSprite(
+            component_id=component_id,
+            layer_type=layer_type,
+            surface=_random_surface(rng, 64, 64),
+            frame_width=16,
+            frame_height=16,
+            num_frames=4,
+            num_directions=4,
+        )
+    return gen
+
+
+@pytest.fixture
+def preset():
+    preset = CharacterPreset(name="Knight")
+    preset.add_layer(ComponentLayer(LayerType.BODY, "body", ColorTint(255, 220, 180)))
+    preset.add_layer(ComponentLayer(LayerType.TORSO, "torso", ColorTint(100, 100, 200)))
+    preset.add_layer(ComponentLayer(LayerType.HAIR_FRONT, "hair_front"))
+    return preset
+
+
+def _reference_frame(gen, preset, frame, direction, size):
+    """Compose a frame without any caching"""
+    output = pygame.Surface((size, size), pygame.SRCALPHA)
+    output.fill((0, 0, 0, 0))
+    for layer in preset.layers:
+        surface = gen.component_library[layer.component_id].get_frame(frame, direction)
+        if layer.tint:
+            surface = _float_tint(surface, layer.tint)
+        output.blit(pygame.transform.scale(surface, (size, size)), (0, 0))
+    return output
+
+
+def _record_builds(monkeypatch, cache):
+    """Record the keys of layers built on cache misses"""
+    built = []
+    original = cache.get_layer
+
+    def get_layer(key, build):
+        return original(key, lambda: built.append(key) or build())
+
+    monkeypatch.setattr(cache, "get_layer", get_layer)
+    return built
+
+
+def test_integer_tint_matches_float_tint():
+    """Integer tint math gives the same pixels as the float multiply"""
+    rng = np.random.default_rng(0)
+    surface = _random_surface(rng, 64, 64)
+    for tint in (ColorTint(255, 0, 128), ColorTint(1, 254, 77), ColorTint(255, 255, 255)):
+        assert _pixels(multiply_tint(surface, (tint.r, tint.g, tint.b))) == _pixels(
+            _float_tint(surface, tint)
+        )
+
+
+class TestCharacterCache:
+    """Test cached character compositing"""
+
+    def test_sprite_sheet_matches_uncached(self, generator, preset):
+        """Cached frames match per-frame tinting and compositing"""
+        sheet = generator.render_sprite_sheet(preset, num_frames=4)
+        again = generator.render_sprite_sheet(preset, num_frames=4)
+
+        for row, direction in enumerate([Direction.DOWN, Direction.LEFT, Direction.RIGHT]):
+            for frame in range(4):
+                expected = _reference_frame(generator, preset, frame, direction, 32)
+                cell = sheet.subsurface((frame * 32, row * 32, 32, 32))
+                assert _pixels(cell) == _pixels(expected)
+        assert _pixels(again) == _pixels(sheet)
+
+    def test_repeat_renders_build_nothing(self, generator, preset, monkeypatch):
+        """Rendering the same sheet twice reuses every layer and stack"""
+        generator.render_sprite_sheet(preset, num_frames=4)
+        built = _record_builds(monkeypatch, generator.layer_cache)
+
+        generator.render_sprite_sheet(preset, num_frames=4)
+        generator.compose_frame(preset, 2, Direction.UP)
+
+        assert built == []
+
+    def test_layer_change_recomposites_from_that_layer(self, generator, preset, monkeypatch):
+        """Changing one layer rebuilds only that layer, on top of the cached stack below"""
+        generator.compose_frame(preset, 1, Direction.LEFT, output_size=64)
+        built = _record_builds(monkeypatch, generator.layer_cache)
+        preset.get_layer(LayerType.TORSO).tint = ColorTint(200, 80, 80)
+
+        frame = generator.compose_frame(preset, 1, Direction.LEFT, output_size=64)
+
+        assert [key[0] for key in built] == ["torso", "torso"]  # Tinted sheet, then frame
+        expected = _reference_frame(generator, preset, 1, Direction.LEFT, 64)
+        assert _pixels(frame) == _pixels(expected)
+
+    def test_returned_frames_are_independent(self, generator, preset):
+        """Callers may draw on composed frames without corrupting the cache"""
+        first = generator.compose_frame(preset)
+        first.fill((255, 0, 0, 255))
+
+        assert _pixels(generator.compose_frame(preset)) != _pixels(first)
+
+    def test_clear_cache(self, generator, preset):
+        """Clearing drops every cached surface"""
+        generator.compose_frame(preset)
+        assert len(generator.layer_cache) > 0
+
+        generator.clear_cache()
+        assert len(generator.layer_cache) == 0
+
+
+class TestFaceCache:
+    """Test cached face compositing"""
+
+    def test_expressions_match_uncached(self, monkeypatch):
+        """Cached faces match uncached compositing, including expression offsets"""
+        rng = np.random.default_rng(5)
+        gen = FaceGenerator(default_size=48)
+        for layer_type in (FaceLayerType.BASE, FaceLayerType.EYES):
+            component_id = layer_type.name.lower()
+            gen.component_library[component_id] = FaceComponent(
+                component_id=component_id,
+                layer_type=layer_type,
+                expressions={
+                    Expression.NEUTRAL: _random_surface(rng, 24, 24),
+                    Expression.HAPPY: _random_surface(rng, 24, 24),
+                },
+            )
+        preset = FacePreset(name="Face")
+        preset.add_layer(FaceLayer(FaceLayerType.BASE, "base", ColorTint(240, 200, 170)))
+        preset.add_layer(
+            FaceLayer(FaceLayerType.EYES, "eyes", expression_offset={Expression.HAPPY: (2, -1)})
+        )
+
+        faces = gen.render_all_expressions(preset)
+        built = _record_builds(monkeypatch, gen.layer_cache)
+        assert _pixels(gen.render_all_expressions(preset)[Expression.SAD]) == _pixels(
+            faces[Expression.SAD]
+        )
+        assert built == []
+
+        for expression in (Expression.NEUTRAL, Expression.HAPPY):
+            expected = pygame.Surface((48, 48), pygame.SRCALPHA)
+            expected.fill((0, 0, 0, 0))
+            for layer in preset.layers:
+                surface = gen.component_library[layer.component_id].get_expression(expression)
+                if layer.tint:
+                    surface = _float_tint(surface, layer.tint)
+                offset = layer.expression_offset.get(expression, (0, 0))
+                expected.blit(pygame.transform.scale(surface, (48, 48)), offset)
+            assert _pixels(faces[expression]) == _pixels(expected)
+
+
+def test_cache_evicts_least_recently_used():
+    """Layer and stack caches stay within their limits"""
+    cache = LayerCompositeCache(max_layers=2, max_stacks=2)
+    surfaces = [pygame.Surface((4, 4), pygame.SRCALPHA) for _ in range(3)]
+    for index, surface in enumerate(surfaces):
+        cache.get_layer(index, lambda surface=surface: surface)
+    cache.compose((4, 4), [("a", lambda: surfaces[0], (0, 0)), ("b", lambda: surfaces[1], (0, 0))])
+
+    assert len(cache._layers) == 2 and len(cache._stacks) == 2
+    assert list(cache._layers) == ["a", "b"]
+    assert cache.get_layer("b", lambda: pytest.fail("evicted")) is surfaces[1]
@@ -0,0 +1,359 @@
+"""
+Tests for the simulation level-of-detail system
+
+Tests LOD classification against the camera view, reduced-rate scheduling
+with aggregated delta time, freezing/fast-forwarding and dormant zones.
+"""
+
+from unittest.mock import Mock
+
+import pytest
+
+from neonworks.core.ecs import GridPosition, Transform, World
+from neonworks.core.events import EventManager
+from neonworks.gameplay.movement import AnimationState, Movement, NPCBehavior
+from neonworks.rendering.camera import Camera
+from neonworks.systems.exploration import ExplorationSystem
+from neonworks.systems.lod_system import FarMode, LODLevel, LODSystem
+from neonworks.systems.zone_system import ZoneSystem
+
+
+def _make_camera():
+    camera = Camera(screen_width=320, screen_height=240)
+    camera.x = 160.0
+    camera.y = 120.0
+    return camera  # View covers world (0, 0) - (320, 240)
+
+
+def _make_entity(world, entity_id, x, y):
+    entity = world.create_entity(entity_id)
+    entity.add_component(Transform(x=x, y=y))
+    return entity
+
+
+def _run(world, lod, entity, frames, dt=0.1):
+    results = []
+    for _ in range(frames):
+        lod.update(world, dt)
+        results.append(lod.get_delta(entity))
+    return results
+
+
+class TestClassification:
+    """Test LOD level classification"""
+
+    def test_levels_from_camera_view(self):
+        """Entities are classified by distance from the view rect"""
+        world = World()
+        lod = LODSystem(camera=_make_camera(), margin=32.0, far_distance=500.0)
+        lod.update(world, 0.016)
+
+        near = _make_entity(world, "near", 100, 100)
+        margin = _make_entity(world, "margin", 340, 100)
+        mid = _make_entity(world, "mid", 600, 100)
+        far = _make_entity(world, "far", 2000, 100)
+
+        assert lod.classify(near) == LODLevel.NEAR
+        assert lod.classify(margin) == LODLevel.NEAR
+        assert lod.classify(mid) == LODLevel.MID
+        assert lod.classify(far) == LODLevel.FAR
+
+    def test_grid_position_fallback(self):
+        """Entities without a Transform are placed via their GridPosition"""
+        world = World()
+        lod = LODSystem(camera=_make_camera(), margin=0.0, far_distance=100.0, tile_size=32)
+        lod.update(world, 0.016)
+
+        entity = world.create_entity("grid")
+        entity.add_component(GridPosition(grid_x=100, grid_y=0))
+
+        assert lod.classify(entity) == LODLevel.FAR
+
+    def test_player_and_no_camera_always_near(self):
+        """Player-tagged entities and camera-less schedulers never reduce detail"""
+        world = World()
+        player = _make_entity(world, "player", 5000, 5000).add_tag("player")
+
+        lod = LODSystem(camera=_make_camera())
+        lod.update(world, 0.016)
+        assert lod.classify(player) == LODLevel.NEAR
+
+        other = _make_entity(world, "other", 5000, 5000)
+        assert LODSystem().classify(other) == LODLevel.NEAR
+
+
+class TestScheduling:
+    """Test reduced-rate scheduling"""
+
+    def test_near_ticks_every_update(self):
+        """NEAR entities receive the plain delta each update"""
+        world = World()
+        lod = LODSystem(camera=_make_camera())
+        entity = _make_entity(world, "near", 100, 100)
+
+        assert _run(world, lod, entity, 3) == [pytest.approx(0.1)] * 3
+
+    def test_mid_aggregates_delta(self):
+        """MID entities tick every N updates with the skipped time aggregated"""
+        world = World()
+        lod = LODSystem(camera=_make_camera(), margin=0.0, mid_interval=4)
+        entity = _make_entity(world, "mid", 600, 100)
+
+        results = _run(world, lod, entity, 12)
+        ticks = [r for r in results if r is not None]
+
+        first_tick = next(i for i, r in enumerate(results) if r is not None)
+
+        assert len(ticks) == 3
+        assert ticks[0] == pytest.approx(0.1 * (first_tick + 1))
+        assert all(t == pytest.approx(0.4) for t in ticks[1:])
+        assert lod.tick_counts[LODLevel.MID] == 3
+        assert lod.skip_counts[LODLevel.MID] == 9
+
+    def test_delta_is_stable_within_an_update(self):
+        """Several queries in the same update see the same scheduling decision"""
+        world = World()
+        lod = LODSystem(camera=_make_camera(), margin=0.0, mid_interval=2)
+        entity = _make_entity(world, "mid", 600, 100)
+
+        for _ in range(4):
+            lod.update(world, 0.1)
+            first = lod.get_delta(entity)
+            assert lod.get_delta(entity) == first
+
+    def test_far_freeze_drops_time(self):
+        """Frozen FAR entities resume with a single normal delta"""
+        world = World()
+        lod = LODSystem(camera=_make_camera(), far_distance=100.0)
+        entity = _make_entity(world, "far", 5000, 100)
+
+        assert _run(world, lod, entity, 5) == [None] * 5
+
+        entity.get_component(Transform).x = 100
+        assert _run(world, lod, entity, 1) == [pytest.approx(0.1)]
+
+    def test_far_fast_forward_caps_catchup_without_handlers(self):
+        """Without catch-up handlers the step is capped and the rest is counted"""
+        world = World()
+        lod = LODSystem(
+            camera=_make_camera(),
+            far_distance=100.0,
+            far_mode=FarMode.FAST_FORWARD,
+            max_catchup=0.25,
+        )
+        entity = _make_entity(world, "far", 100, 100)
+
+        _run(world, lod, entity, 1)
+        entity.get_component(Transform).x = 5000
+        _run(world, lod, entity, 5)
+
+        entity.get_component(Transform).x = 100
+        assert _run(world, lod, entity, 1) == [pytest.approx(0.25)]
+        assert lod.get_stats()["dropped_time"] == pytest.approx(0.35)
+
+    def test_far_fast_forward_delivers_full_time_to_handlers(self):
+        """Catch-up handlers get the whole time away, however long"""
+        world = World()
+        lod = LODSystem(
+            camera=_make_camera(),
+            far_distance=100.0,
+            far_mode=FarMode.FAST_FORWARD,
+            max_catchup=0.25,
+        )
+        caught_up = []
+        lod.add_catchup_handler(lambda entity, elapsed: caught_up.append((entity.id, elapsed)))
+        entity = _make_entity(world, "far", 100, 100)
+
+        _run(world, lod, entity, 1)
+        entity.get_component(Transform).x = 5000
+        _run(world, lod, entity, 50)
+
+        entity.get_component(Transform).x = 100
+        assert _run(world, lod, entity, 2) == [pytest.approx(0.1)] * 2
+        assert caught_up == [("far", pytest.approx(5.0))]
+        assert lod.dropped_time == 0.0
+
+    def test_far_fast_forward_catches_up(self):
+        """Fast-forwarded FAR entities get the elapsed time in one step on return"""
+        world = World()
+        lod = LODSystem(
+            camera=_make_camera(),
+            far_distance=100.0,
+            far_mode=FarMode.FAST_FORWARD,
+            max_catchup=10.0,
+        )
+        entity = _make_entity(world, "far", 100, 100)
+
+        _run(world, lod, entity, 1)  # Establish state while NEAR
+        entity.get_component(Transform).x = 5000
+        _run(world, lod, entity, 5)
+
+        entity.get_component(Transform).x = 100
+        assert _run(world, lod, entity, 1) == [pytest.approx(0.6)]
+
+    def test_disabled_scheduler_passes_delta_through(self):
+        """A disabled scheduler never skips entities"""
+        world = World()
+        lod = LODSystem(camera=_make_camera(), far_distance=100.0)
+        lod.enabled = False
+        entity = _make_entity(world, "far", 5000, 100)
+
+        lod.update(world, 0.1)
+        assert lod.get_delta(entity) == pytest.approx(0.1)
+
+    def test_stats(self):
+        """Stats report per-level tick counts"""
+        world = World()
+        lod = LODSystem(camera=_make_camera(), far_distance=100.0)
+        near = _make_entity(world, "near", 100, 100)
+        far = _make_entity(world, "far", 5000, 100)
+
+        for _ in range(3):
+            lod.update(world, 0.1)
+            lod.get_delta(near)
+            lod.get_delta(far)
+
+        stats = lod.get_stats()
+        assert stats["near"]["ticks"] == 3
+        assert stats["far"]["skipped"] == 3
+        assert stats["far"]["entities"] == 1
+        assert stats["dormant"] == 0
+
+
+class TestDormantZones:
+    """Test parking entities of unloaded zones"""
+
+    def test_round_trip(self):
+        """Dormant entities leave the World and come back with their state"""
+        world = World()
+        lod = LODSystem()
+        npc = world.create_entity("npc_1").add_tag("npc")
+        npc.add_component(GridPosition(grid_x=3, grid_y=4))
+        npc.add_component(NPCBehavior(behavior_type="wander", wander_timer=1.5))
+
+        lod.make_dormant(world, "town", [npc])
+
+        assert world.get_entity("npc_1") is None
+        assert world.entities_at(3, 4) == []
+        assert lod.has_dormant("town")
+        assert lod.get_stats()["dormant"] == 1
+        assert 0 < lod.get_dormant_bytes() == lod.get_stats()["dormant_bytes"]
+
+        restored = lod.restore_dormant(world, "town")
+
+        assert [e.id for e in restored] == ["npc_1"]
+        entity = world.get_entity("npc_1")
+        assert entity.has_tag("npc")
+        assert entity.get_component(NPCBehavior).wander_timer == 1.5
+        assert world.entities_at(3, 4) == [entity]
+        assert world.get_entities_with_tag("npc") == [entity]
+        assert not lod.has_dormant("town")
+
+        # Restored grid positions are indexed again
+        entity.get_component(GridPosition).grid_x = 7
+        assert world.entities_at(7, 4) == [entity]
+
+    def test_zone_unload_parks_multi_tagged_entities_once(self):
+        """An entity with several zone tags is parked and restored once"""
+        world = World()
+        lod = LODSystem()
+        zones = ZoneSystem(EventManager())
+        zones.set_lod_system(lod)
+        zones.current_zone_id = "town"
+        npc = _make_entity(world, "guard", 10, 10)
+        npc.add_tag("npc")
+        npc.add_tag("object")
+
+        zones._unload_current_zone(world)
+        assert lod.get_dormant_count() == 1
+
+        assert [entity.id for entity in lod.restore_dormant(world, "town")] == ["guard"]
+        assert len(world.get_entities_with_tag("npc")) == 1
+
+    def test_unpicklable_entity_is_removed(self, capsys):
+        """Entities that can't be serialized are dropped with a warning"""
+        world = World()
+        lod = LODSystem()
+        keep = _make_entity(world, "keep", 10, 10)
+        broken = _make_entity(world, "broken", 20, 20)
+        broken.add_component(Movement())
+        broken.get_component(Movement).on_move_complete = lambda x, y: None
+
+        lod.make_dormant(world, "town", [keep, broken])
+
+        assert "broken" in capsys.readouterr().out
+        assert world.get_entity("broken") is None
+        assert [entity.id for entity in lod.restore_dormant(world, "town")] == ["keep"]
+
+
+class TestExplorationIntegration:
+    """Test ExplorationSystem scheduling NPCs through the LOD system"""
+
+    def test_far_npc_animation_frozen(self):
+        """Far NPCs are skipped while near NPCs animate"""
+        world = World()
+        lod = LODSystem(camera=_make_camera(), far_distance=100.0)
+        world.add_system(lod)
+
+        system = ExplorationSystem(Mock(), Mock())
+        system.set_lod_system(lod)
+
+        near = _make_entity(world, "near", 100, 100)
+        near.add_component(AnimationState())
+        far = _make_entity(world, "far", 5000, 100)
+        far.add_component(AnimationState())
+
+        lod.update(world, 0.05)
+        system._update_animations(world, 0.05)
+
+        assert near.get_component(AnimationState).frame_timer == pytest.approx(0.05)
+        assert far.get_component(AnimationState).frame_timer == 0.0
+
+    def test_mid_npc_movement_uses_aggregated_delta(self):
+        """Reduced-rate NPCs still cover the same distance over time"""
+        world = World()
+        lod = LODSystem(camera=_make_camera(), margin=0.0, mid_interval=4)
+
+        system = ExplorationSystem(Mock(), Mock())
+        system.set_lod_system(lod)
+
+        npc = _make_entity(world, "npc", 600, 100)
+        npc.add_component(GridPosition(grid_x=18, grid_y=3))
+        movement = Movement(speed=1.0)
+        movement.is_moving = True
+        movement.target_grid_x = 19
+        movement.target_grid_y = 3
+        npc.add_component(movement)
+
+        for _ in range(8):
+            lod.update(world, 0.1)
+            system._update_movement_interpolation(world, 0.1)
+
+        assert movement.move_progress == pytest.approx(0.8, abs=0.31)
+
+    def test_fast_forwarded_npc_animation_catches_up(self):
+        """NPCs returning from FAR advance their animation by the time away"""
+        world = World()
+        lod = LODSystem(camera=_make_camera(), far_distance=100.0, far_mode=FarMode.FAST_FORWARD)
+        system = ExplorationSystem(Mock(), Mock())
+        system.set_lod_system(lod)
+
+        npc = _make_entity(world, "npc", 100, 100)
+        anim_state = AnimationState(frame_duration=0.35)
+        anim_state.animations["idle_down"] = [0, 1, 2]
+        npc.add_component(anim_state)
+
+        lod.update(world, 0.1)
+        system._update_animations(world, 0.1)
+        npc.get_component(Transform).x = 5000
+        for _ in range(99):
+            lod.update(world, 0.1)
+            system._update_animations(world, 0.1)
+        npc.get_component(Transform).x = 100
+        lod.update(world, 0.1)
+        system._update_animations(world, 0.1)
+
+        # 0.1s before leaving and 9.9s away: 28 whole frames and 0.2s over,
+        # then 0.1s of this update
+        assert anim_state.frame_index == 28 % 3
+        assert anim_state.frame_timer == pytest.approx(0.3)
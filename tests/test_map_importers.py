@@ -26,6 +26,14 @@ from neonworks.engine.tools.map_importers import (
 )
 from neonworks.data.map_manager import MapData, MapManager
 from neonworks.data.tileset_manager import TilesetManager
+from neonworks.rendering.autotiles import (
+    NEIGHBOR_BOTTOM,
+    NEIGHBOR_LEFT,
+    NEIGHBOR_RIGHT,
+    AutotileFormat,
+    AutotileManager,
+    AutotileSet,
+)
 
 
 class TestPNGExporter:
@@ -133,6 +141,34 @@ class TestTiledTMXImporter:
         # For now, just test that the method exists and can be called
         assert hasattr(importer, "import_tmx")
 
+    def test_import_resolves_autotiles(self, tmp_path):
+        """Test that imported layers are autotiled when a manager is given."""
+        tmx_content = """<?xml version="1.0" encoding="UTF-8"?>
+<map version="1.10" orientation="orthogonal" width="4" height="3"
+     tilewidth="32" tileheight="32">
+ <layer id="1" name="Water" width="4" height="3">
+  <data encoding="csv">
+0,1,1,1,
+0,1,0,0,
+0,0,0,20
+  </data>
+ </layer>
+</map>"""
+        tmx_path = tmp_path / "water.tmx"
+        tmx_path.write_text(tmx_content)
+        manager = AutotileManager()
+        water = AutotileSet(
+            name="Water", tileset_name="terrain", format=AutotileFormat.TILE_16, base_tile_id=1
+        )
+        manager.register_autotile_set(water)
+
+        map_data = TiledTMXImporter(tmp_path, autotile_manager=manager).import_tmx(str(tmx_path))
+        layer = next(iter(map_data.layer_manager.layers.values()))
+
+        assert layer.tiles[0][1] == water.get_tile_for_bitmask(NEIGHBOR_RIGHT | NEIGHBOR_BOTTOM)
+        assert layer.tiles[0][3] == water.get_tile_for_bitmask(NEIGHBOR_LEFT)
+        assert layer.tiles[2][3] == 20
+
 
 class TestTiledTMXExporter:
     """Test Tiled TMX export functionality."""
@@ -253,6 +289,3 @@ class TestIntegration:
             assert "<?xml version" in content
             assert f'width="15"' in content
             assert f'height="15"' in content
-
-
-
@@ -0,0 +1,239 @@
+"""
+Tests for memory diagnostics
+
+Tests the exact cache sizes reported by asset managers, tilemap renderers,
+generator layer caches and undo managers, the grouping of tracemalloc
+snapshot diffs by subsystem, interval snapshots from the game loop, and the
+debug console summary and JSON dump.
+"""
+
+import gc
+import inspect
+import json
+import tracemalloc
+
+import pygame
+import pytest
+
+from neonworks.core.ecs import Transform, World
+from neonworks.core.game_loop import GameEngine
+from neonworks.core.undo_manager import UndoManager
+from neonworks.engine.tools.layer_cache import LayerCompositeCache
+from neonworks.rendering.assets import AssetManager, SpriteSheet
+from neonworks.rendering import tilemap as tilemap_module
+from neonworks.rendering.tilemap import OptimizedTilemapRenderer, Tile, Tilemap
+from neonworks.ui.debug_console_ui import DebugConsoleUI
+from neonworks.utils.memory_diagnostics import (
+    ASSET_CACHES,
+    CHUNK_CACHE,
+    ECS,
+    THUMBNAILS,
+    TILEMAP,
+    UNDO_HISTORY,
+    MemoryDiagnostics,
+    MemoryReporter,
+    collect_cache_memory,
+    get_memory_diagnostics,
+    start_memory_diagnostics,
+    stop_memory_diagnostics,
+)
+
+
+@pytest.fixture(autouse=True)
+def no_global_diagnostics():
+    stop_memory_diagnostics()
+    yield
+    stop_memory_diagnostics()
+
+
+@pytest.fixture
+def asset_manager(tmp_path):
+    return AssetManager(tmp_path)
+
+
+def _caches(reporter):
+    return {(cache.subsystem, cache.name): cache for cache in reporter.report_memory()}
+
+
+class TestMemoryReporters:
+    """Test the exact cache sizes of cache-owning classes"""
+
+    def test_asset_manager_counts_shared_surfaces_once(self, asset_manager):
+        """Pixel bytes are exact and surfaces in several caches count once"""
+        sprite = pygame.Surface((30, 20), pygame.SRCALPHA)
+        sheet_surface = pygame.Surface((64, 64), pygame.SRCALPHA)
+        thumbnail = pygame.Surface((16, 16))
+        asset_manager._sprites["hero"] = sprite
+        asset_manager._sprite_sheets["tiles"] = SpriteSheet(sheet_surface, 32, 32)
+        asset_manager._loaded_assets["tiles"] = type("Loaded", (), {"resource": sprite})
+        asset_manager._thumbnails["hero"] = thumbnail
+
+        assert isinstance(asset_manager, MemoryReporter)
+        caches = _caches(asset_manager)
+        assert caches[ASSET_CACHES, "sprites"].bytes == sprite.get_pitch() * 20
+        assert caches[ASSET_CACHES, "sprite sheets"].bytes == 64 * 64 * 4
+        assert caches[ASSET_CACHES, "loaded assets"].entries == 0
+        assert caches[THUMBNAILS, "asset thumbnails"].bytes == thumbnail.get_pitch() * 16
+        assert asset_manager.get_memory_usage() == sum(c.bytes for c in caches.values())
+
+    def test_chunk_cache(self, asset_manager):
+        renderer = OptimizedTilemapRenderer(asset_manager)
+        renderer._chunk_cache[("ground", 0, 0)] = pygame.Surface((512, 512), pygame.SRCALPHA)
+
+        chunks = _caches(renderer)[CHUNK_CACHE, "chunks"]
+        assert (chunks.bytes, chunks.entries) == (512 * 512 * 4, 1)
+
+        renderer.clear_cache()
+        assert _caches(renderer)[CHUNK_CACHE, "chunks"].bytes == 0
+
+    def test_layer_cache(self):
+        cache = LayerCompositeCache()
+        cache.get_layer("body", lambda: pygame.Surface((32, 32), pygame.SRCALPHA))
+
+        assert _caches(cache)[ASSET_CACHES, "generator layers"].bytes == 32 * 32 * 4
+
+    def test_undo_manager(self):
+        manager = UndoManager()
+        usage = manager.get_memory_usage()
+
+        caches = _caches(manager)
+        assert sum(cache.bytes for cache in caches.values()) == usage["total_bytes"]
+        assert caches[UNDO_HISTORY, "undo stack"].entries == usage["undo_count"]
+
+    def test_registry_sums_instances_and_drops_dead_reporters(self):
+        """Reports sum over live instances and don't keep caches alive"""
+
+        def chunk_bytes():
+            return sum(c.bytes for c in collect_cache_memory() if c.subsystem == CHUNK_CACHE)
+
+        gc.collect()
+        before = chunk_bytes()
+        renderers = [OptimizedTilemapRenderer(AssetManager()) for _ in range(2)]
+        for renderer in renderers:
+            renderer._chunk_cache["a", 0, 0] = pygame.Surface((100, 100), pygame.SRCALPHA)
+        assert chunk_bytes() == before + 2 * 100 * 100 * 4
+
+        del renderers, renderer
+        gc.collect()
+        assert chunk_bytes() == before
+
+
+class TestMemoryDiagnostics:
+    """Test snapshot diffs grouped by subsystem"""
+
+    def test_growth_is_attributed_to_subsystem(self):
+        """Allocations are grouped by the NeonWorks module that made them"""
+        diagnostics = MemoryDiagnostics(top_n=5)
+        diagnostics.start()
+        try:
+            world = World()
+            for index in range(2000):
+                world.create_entity().add_component(Transform(x=index))
+            report = diagnostics.take_snapshot()
+
+            ecs = report.subsystems[ECS]
+            assert ecs.change_bytes > 200_000 and ecs.growth_bytes == ecs.change_bytes
+            assert report.top_growth[0].site.startswith("core/ecs.py:")
+
+            world.clear()
+            del world
+            gc.collect()
+            second = diagnostics.take_snapshot()
+            assert second.subsystems[ECS].change_bytes < -200_000
+            assert second.snapshot == 1 and len(diagnostics.reports) == 2
+        finally:
+            diagnostics.stop()
+
+        assert not tracemalloc.is_tracing() and not diagnostics.running
+        with pytest.raises(RuntimeError):
+            diagnostics.take_snapshot()
+
+    def test_tilemap_module_split_between_tilemaps_and_chunk_cache(self):
+        """Tile data counts as tilemap memory; only the chunk renderer is chunk cache"""
+        diagnostics = MemoryDiagnostics()
+        diagnostics.start()
+        try:
+            tilemap = Tilemap(100, 100)
+            for index in range(5000):
+                tilemap.set_tile(index % 100, index // 100, 0, Tile(tile_id=index))
+            report = diagnostics.take_snapshot()
+        finally:
+            diagnostics.stop()
+
+        assert report.subsystems[TILEMAP].change_bytes > 100_000
+        assert CHUNK_CACHE not in report.subsystems or (
+            report.subsystems[CHUNK_CACHE].change_bytes < 10_000
+        )
+
+        def subsystem_at(function):
+            line = inspect.getsourcelines(function)[1] + 1
+            traceback = tracemalloc.Traceback(((tilemap_module.__file__, line),))
+            return diagnostics._attribute(traceback)[0]
+
+        assert subsystem_at(OptimizedTilemapRenderer.clear_cache) == CHUNK_CACHE
+        assert subsystem_at(Tilemap.set_tile) == TILEMAP
+
+    def test_tick_takes_interval_snapshots(self):
+        diagnostics = MemoryDiagnostics(interval_minutes=1)
+        assert diagnostics.tick(0.0) is None
+
+        diagnostics.start()
+        try:
+            start = diagnostics._start_time
+            assert diagnostics.tick(start + 30) is None
+            assert diagnostics.tick(start + 61) is not None
+            assert diagnostics.tick(start + 62) is None
+        finally:
+            diagnostics.stop()
+
+    def test_dump_and_summary(self, tmp_path, asset_manager):
+        """Reports are dumped as JSON and summarized per subsystem"""
+        asset_manager._thumbnails["icon"] = pygame.Surface((64, 64), pygame.SRCALPHA)
+        diagnostics = start_memory_diagnostics()
+        assert start_memory_diagnostics() is diagnostics
+        assert diagnostics.format_summary() == ["No memory snapshots yet"]
+
+        diagnostics.take_snapshot()
+        path = diagnostics.dump(tmp_path / "memory" / "report.json")
+
+        (report,) = json.loads(path.read_text())["reports"]
+        subsystems = {s["name"]: s for s in report["subsystems"]}
+        assert subsystems[THUMBNAILS]["reported_bytes"] >= 64 * 64 * 4
+        assert report["rss_bytes"] > 0
+        assert any(line.startswith(THUMBNAILS) for line in diagnostics.format_summary())
+        assert stop_memory_diagnostics() is diagnostics and get_memory_diagnostics() is None
+
+
+def test_game_loop_ticks_diagnostics(monkeypatch):
+    """The engine takes interval snapshots while diagnostics run"""
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    monkeypatch.setenv("SDL_AUDIODRIVER", "dummy")
+    engine = GameEngine()
+    diagnostics = start_memory_diagnostics(interval_minutes=1e-9)
+    engine.state_manager.render = engine.stop
+
+    engine.running = True
+    engine.run()
+
+    assert len(diagnostics.reports) == 1
+    pygame.quit()
+
+
+def test_debug_console_mem_command(tmp_path):
+    """The debug console starts diagnostics, shows a summary and dumps reports"""
+    console = DebugConsoleUI(pygame.Surface((320, 240)), World())
+
+    console.execute_command("mem")
+    assert "off" in console.output_log[-1][0]
+
+    console.execute_command("mem start 5")
+    assert get_memory_diagnostics().interval == 300
+    console.execute_command("mem snap")
+    assert any(line.startswith("Subsystem") for line, _ in console.output_log)
+
+    output = tmp_path / "memory.json"
+    console.execute_command(f"mem dump {output}")
+    assert len(json.loads(output.read_text())["reports"]) == 1
+
+    console.execute_command("mem stop")
+    assert get_memory_diagnostics() is None
@@ -0,0 +1,140 @@
+"""
+Tests for the minimap
+
+Tests that the vectorized minimap colors tiles like the per-tile drawing did,
+that tilemap edits recompose only their rectangle, zoom rescaling, and entity
+markers drawn from the grid index.
+"""
+
+import numpy as np
+import pygame
+import pytest
+
+from neonworks.core.ecs import GridPosition, World
+from neonworks.rendering.tilemap import Tile, Tilemap
+from neonworks.ui.map_components.minimap import (
+    BLOCKED_COLOR,
+    UPPER_LAYER_ALPHA,
+    WALKABLE_COLOR,
+    MinimapUI,
+)
+
+
+@pytest.fixture
+def screen():
+    pygame.init()
+    return pygame.Surface((300, 300))
+
+
+@pytest.fixture
+def tilemap():
+    tilemap = Tilemap(20, 10, tile_size=16)
+    tilemap.create_enhanced_layer("Ground")
+    tilemap.create_enhanced_layer("Decor")
+    for x in range(10):
+        tilemap.get_enhanced_layer_by_name("Ground").set_tile(x, 0, 3)
+    return tilemap
+
+
+def _minimap(tilemap, screen):
+    minimap = MinimapUI(0, 0, width=200, height=100)
+    minimap.set_tilemap(tilemap)
+    minimap.render(screen)
+    return minimap
+
+
+def _pixel(minimap, x, y):
+    """Color of the minimap pixel at the top-left of a tile (10 px per tile)"""
+    return tuple(minimap.minimap_surface.get_at((x * 10, y * 10)))[:3]
+
+
+class TestComposition:
+    """Test tile colors"""
+
+    def test_layers_and_walkability(self, tilemap, screen):
+        """The top non-empty layer wins; upper layers are blended over the background"""
+        tilemap.set_tile(1, 0, 1, Tile(tile_id=5))
+        tilemap.set_tile(2, 0, 0, Tile(tile_id=4, walkable=False))
+        minimap = _minimap(tilemap, screen)
+
+        blended = tuple(
+            (c * UPPER_LAYER_ALPHA + b * (255 - UPPER_LAYER_ALPHA)) // 255
+            for c, b in zip(WALKABLE_COLOR, minimap.bg_color)
+        )
+        assert _pixel(minimap, 0, 0) == WALKABLE_COLOR
+        assert _pixel(minimap, 1, 0) == blended
+        assert _pixel(minimap, 2, 0) == BLOCKED_COLOR
+        assert _pixel(minimap, 15, 5) == minimap.bg_color
+
+    def test_filled_tiles_keep_walkability(self, tilemap, screen):
+        """Tiles placed by masked fills are colored by their walkability"""
+        mask = np.zeros((2, 2), dtype=bool)
+        mask[0] = True
+        tilemap.fill_masked(0, mask, Tile(tile_id=3, walkable=False), 4, 2)
+        minimap = _minimap(tilemap, screen)
+
+        assert _pixel(minimap, 4, 2) == _pixel(minimap, 5, 2) == BLOCKED_COLOR
+        assert _pixel(minimap, 4, 3) == minimap.bg_color
+
+    def test_tile_colors(self, tilemap, screen):
+        """Tile IDs can be given their own colors"""
+        minimap = _minimap(tilemap, screen)
+        minimap.set_tile_colors({3: (200, 50, 10)})
+        minimap.render(screen)
+
+        assert _pixel(minimap, 4, 0) == (200, 50, 10)
+
+
+class TestIncrementalRedraw:
+    """Test dirty-rectangle updates"""
+
+    def test_edit_updates_only_its_rect(self, tilemap, screen, monkeypatch):
+        """A tile edit recomposes one tile instead of the whole map"""
+        minimap = _minimap(tilemap, screen)
+        composed = []
+        original = minimap._compose
+        monkeypatch.setattr(
+            minimap, "_compose", lambda *rect: composed.append(rect) or original(*rect)
+        )
+
+        tilemap.set_tile(7, 6, 0, Tile(tile_id=2, walkable=False))
+        minimap.render(screen)
+
+        assert composed == [(7, 6, 8, 7)]
+        assert _pixel(minimap, 7, 6) == BLOCKED_COLOR
+
+    def test_zoom_rescales_without_recomposing(self, tilemap, screen, monkeypatch):
+        """Zooming reuses the composed map"""
+        tilemap.get_enhanced_layer_by_name("Ground").set_tile(19, 0, 3)
+        minimap = _minimap(tilemap, screen)
+        monkeypatch.setattr(minimap, "_compose", lambda *rect: pytest.fail("recomposed"))
+
+        minimap.zoom_in()
+        minimap.render(screen)
+
+        # 20 tiles at zoom 1.25 fill 160 of 200 pixels
+        assert tuple(minimap.minimap_surface.get_at((159, 0)))[:3] == WALKABLE_COLOR
+        assert tuple(minimap.minimap_surface.get_at((160, 0)))[:3] == minimap.bg_color
+
+    def test_new_layer_recomposes(self, tilemap, screen):
+        """Changing the layer stack redraws the whole map"""
+        minimap = _minimap(tilemap, screen)
+        layer_id = tilemap.create_enhanced_layer("Roof")
+        tilemap.get_enhanced_layer(layer_id).set_tile(19, 9, 1)
+        minimap.render(screen)
+
+        assert _pixel(minimap, 19, 9) != minimap.bg_color
+
+
+def test_entity_markers(tilemap, screen):
+    """Entities are drawn as one marker per occupied minimap pixel"""
+    world = World()
+    for _ in range(3):
+        world.create_entity().add_component(GridPosition(grid_x=5, grid_y=5))
+    minimap = _minimap(tilemap, screen)
+    minimap.set_world(world)
+    screen.fill((0, 0, 0))
+
+    minimap.render(screen)
+
+    assert tuple(screen.get_at((50, 50)))[:3] == minimap.entity_color
@@ -5,10 +5,12 @@ Tests the A* pathfinding algorithm, path smoothing, line of sight,
 and movement range calculations.
 """
 
+import gc
+
 import pytest
 
 from neonworks.core.ecs import Navmesh, World
-from neonworks.systems.pathfinding import PathfindingSystem, PathNode
+from neonworks.systems.pathfinding import PathfindingSystem, PathNode, ReachabilityMap
 
 
 class TestPathNode:
@@ -561,6 +563,114 @@ class TestPathfindingSystem:
         assert len(reachable) == 25
 
 
+class TestReachabilityMap:
+    """Test suite for Dijkstra reachability maps"""
+
+    def _open_grid(self, width, height):
+        return {(x, y) for x in range(width) for y in range(height)}
+
+    def test_weighted_costs_use_cheapest_route(self):
+        """Cells first discovered via an expensive route are still reachable cheaply"""
+        system = PathfindingSystem()
+
+        # Direct route east is expensive, the detour through row 1 is cheap
+        walkable = self._open_grid(3, 2)
+        navmesh = Navmesh(walkable_cells=walkable, cost_multipliers={(1, 0): 5.0})
+
+        reachable = system.get_movement_range(0, 0, 4, navmesh)
+
+        # (2, 0) costs 4 via (0, 1) -> (1, 1) -> (2, 1) -> (2, 0)
+        assert (2, 0) in reachable
+        assert (1, 0) not in reachable
+
+    def test_costs_and_paths(self):
+        """Reachability map exposes accumulated cost and predecessor paths"""
+        system = PathfindingSystem()
+        navmesh = Navmesh(walkable_cells=self._open_grid(4, 4))
+
+        reach_map = system.get_reachability_map(0, 0, 3, navmesh)
+
+        assert isinstance(reach_map, ReachabilityMap)
+        assert reach_map.get_cost(0, 0) == 0.0
+        assert reach_map.get_cost(2, 1) == 3.0
+        assert reach_map.get_cost(3, 3) is None
+
+        path = reach_map.get_path(2, 1)
+        assert path[0] == (0, 0)
+        assert path[-1] == (2, 1)
+        assert len(path) == 4
+        assert reach_map.get_path(3, 3) is None
+        assert reach_map.get_path(0, 0) == [(0, 0)]
+
+    def test_reachable_mask_matches_cells(self):
+        """NumPy mask and tuple set describe the same cells"""
+        system = PathfindingSystem()
+        navmesh = Navmesh(walkable_cells=self._open_grid(5, 5))
+
+        reach_map = system.get_reachability_map(2, 2, 1, navmesh)
+
+        assert int(reach_map.reachable_mask.sum()) == len(reach_map) == 5
+        assert (2, 2) in reach_map
+        assert (4, 4) not in reach_map
+
+    def test_results_are_cached(self):
+        """Same position, budget and navmesh version reuse the cached map"""
+        system = PathfindingSystem()
+        navmesh = Navmesh(walkable_cells=self._open_grid(5, 5))
+
+        first = system.get_reachability_map(0, 0, 3, navmesh)
+        second = system.get_reachability_map(0, 0, 3, navmesh)
+        other = system.get_reachability_map(0, 0, 2, navmesh)
+
+        assert first is second
+        assert other is not first
+
+    def test_cache_invalidated_by_navmesh_edit(self):
+        """Editing the navmesh bumps its version and invalidates cached maps"""
+        system = PathfindingSystem()
+        navmesh = Navmesh(walkable_cells=self._open_grid(3, 1))
+
+        assert (2, 0) in system.get_movement_range(0, 0, 2, navmesh)
+
+        navmesh.set_cost(1, 0, 3.0)
+        assert (2, 0) not in system.get_movement_range(0, 0, 2, navmesh)
+
+        navmesh.set_cost(1, 0, 1.0)
+        navmesh.set_walkable(1, 0, False)
+        assert system.get_movement_range(0, 0, 2, navmesh) == {(0, 0)}
+
+    def test_in_place_cost_edit_needs_mark_dirty(self):
+        """The version is the only invalidation; mark_dirty() picks up direct edits"""
+        system = PathfindingSystem()
+        navmesh = Navmesh(walkable_cells=self._open_grid(3, 1), cost_multipliers={(1, 0): 1.0})
+        assert (2, 0) in system.get_movement_range(0, 0, 2, navmesh)
+
+        navmesh.cost_multipliers[(1, 0)] *= 5.0
+        navmesh.mark_dirty()
+        assert (2, 0) not in system.get_movement_range(0, 0, 2, navmesh)
+
+    def test_grid_cache_follows_navmesh_lifetime(self):
+        """Collected navmeshes are evicted and never match a new navmesh"""
+        system = PathfindingSystem()
+        navmesh = Navmesh(walkable_cells=self._open_grid(3, 1))
+        assert (2, 0) in system.get_movement_range(0, 0, 2, navmesh)
+
+        del navmesh
+        gc.collect()
+        assert system._grid_cache == {}
+
+        # Same version and sizes as the discarded navmesh, different contents
+        blocked = Navmesh(walkable_cells=self._open_grid(3, 1), cost_multipliers={(1, 0): 5.0})
+        assert system.get_movement_range(0, 0, 2, blocked) == {(0, 0)}
+
+    def test_origin_outside_navmesh(self):
+        """An origin outside the navmesh only reaches itself"""
+        system = PathfindingSystem()
+        navmesh = Navmesh(walkable_cells=self._open_grid(2, 2))
+
+        assert system.get_movement_range(10, 10, 5, navmesh) == {(10, 10)}
+
+
 class TestIntegration:
     """Integration tests for pathfinding system"""
 
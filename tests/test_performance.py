@@ -13,10 +13,48 @@ Run with: pytest tests/test_performance.py -v -m performance
 import time
 from typing import List
 
+import numpy as np
+import pygame
 import pytest
 
 from neonworks.core.ecs import Entity, GridPosition, Health, Transform, World
+from neonworks.core.event_commands import (
+    CommandType,
+    EventCommand,
+    EventPage,
+    GameEvent,
+    GameState,
+    TriggerType,
+)
+from neonworks.core.event_triggers import EventTriggerManager, TriggerContext
 from neonworks.core.events import Event, EventManager, EventType
+from neonworks.core.project import Project, ProjectConfig, ProjectMetadata
+from neonworks.core.serialization import GameSerializer, SerializationFormat
+from neonworks.core.tile_mask import flood_mask
+from neonworks.data.map_layers import EnhancedTileLayer
+from neonworks.data.serialization import SaveGameManager
+from neonworks.engine.core.event_interpreter import EventInterpreter
+from neonworks.engine.data.database_manager import DatabaseManager
+from neonworks.engine.data.database_schema import (
+    Actor,
+    Class,
+    DamageType,
+    Effect,
+    EffectType,
+    Enemy,
+    Item,
+    ItemType,
+    Skill,
+)
+from neonworks.gameplay.battle_simulator import BattleSetup, run_simulation
+from neonworks.gameplay.combat import Health as CombatHealth
+from neonworks.gameplay.combat_resolution import TargetBatch, resolve_attack
+from neonworks.gameplay.jrpg_combat import BattleState, JRPGStats
+from neonworks.rendering.autotiles import AutotileFormat, AutotileManager, AutotileSet
+from neonworks.rendering.tilemap import Tile, Tilemap
+from neonworks.ui.map_components.minimap import MinimapUI
+from neonworks.ui.map_tools import FillTool, ToolContext
+from neonworks.ui.map_tools import UndoManager as MapToolUndoManager
 from neonworks.utils.performance_monitor import PerformanceMonitor
 
 
@@ -223,6 +261,197 @@ class TestEventPerformance:
         assert all(count == 100 for count in handler_calls)
         assert elapsed < 1.0  # Should complete in under 1 second
 
+    def test_500_parallel_events_performance(self):
+        """Benchmark 500 concurrent parallel events with branches and loops."""
+
+        class DictGameState(GameState):
+            def __init__(self):
+                self.switches = {}
+                self.variables = {}
+
+            def get_switch(self, switch_id):
+                return self.switches.get(switch_id, False)
+
+            def set_switch(self, switch_id, value):
+                self.switches[switch_id] = value
+
+            def get_variable(self, variable_id):
+                return self.variables.get(variable_id, 0)
+
+            def set_variable(self, variable_id, value):
+                self.variables[variable_id] = value
+
+        game_state = DictGameState()
+        interpreter = EventInterpreter(game_state)
+
+        def command(command_type, indent=0, **parameters):
+            return EventCommand(command_type=command_type, parameters=parameters, indent=indent)
+
+        # Shared page: a branch followed by a loop that waits one frame per pass
+        page = EventPage(
+            commands=[
+                command(CommandType.CONTROL_SWITCHES, switch_id=1, value=True),
+                command(
+                    CommandType.CONDITIONAL_BRANCH, condition_type="switch", switch_id=1, value=True
+                ),
+                command(CommandType.CONTROL_SWITCHES, indent=1, switch_id=2, value=True),
+                command(CommandType.COMMENT, text=""),
+                command(CommandType.LOOP),
+                command(
+                    CommandType.CONTROL_VARIABLES,
+                    indent=1,
+                    variable_id=1,
+                    operation="add",
+                    operand_type="constant",
+                    operand_value=1,
+                ),
+                command(CommandType.CONTROL_SWITCHES, indent=1, switch_id=3, value=True),
+                command(CommandType.WAIT, indent=1, duration=1),
+                command(CommandType.COMMENT, text=""),
+            ]
+        )
+
+        for i in range(500):
+            interpreter.start_event(GameEvent(id=i, name=f"Parallel {i}", x=0, y=0), page, True)
+
+        start = time.perf_counter()
+        for _ in range(60):
+            interpreter.update(1 / 60)
+        elapsed = time.perf_counter() - start
+
+        assert interpreter.pages_compiled == 1
+        assert game_state.get_variable(1) >= 500 * 30
+        assert elapsed < 2.0  # 60 frames of 500 events in under 2 seconds
+
+    def test_script_conditions_performance(self):
+        """Benchmark 500 parallel events running script conditions and commands."""
+
+        class DictGameState(GameState):
+            def __init__(self):
+                self.switches = {}
+                self.variables = {}
+
+            def get_switch(self, switch_id):
+                return self.switches.get(switch_id, False)
+
+            def set_switch(self, switch_id, value):
+                self.switches[switch_id] = value
+
+            def get_variable(self, variable_id):
+                return self.variables.get(variable_id, 0)
+
+            def set_variable(self, variable_id, value):
+                self.variables[variable_id] = value
+
+        condition = "game_state.get_variable(1) >= 0 and not game_state.get_switch(5)"
+        script = "game_state.set_variable(1, game_state.get_variable(1) + 1)"
+
+        def command(command_type, indent=0, **parameters):
+            return EventCommand(command_type=command_type, parameters=parameters, indent=indent)
+
+        # Each pass evaluates the condition, runs the script and waits a frame
+        page = EventPage(
+            commands=[
+                command(CommandType.LOOP),
+                command(
+                    CommandType.CONDITIONAL_BRANCH,
+                    indent=1,
+                    condition_type="script",
+                    script=condition,
+                ),
+                command(CommandType.SCRIPT, indent=2, script=script),
+                command(CommandType.WAIT, indent=1, duration=1),
+                command(CommandType.COMMENT, text=""),
+            ]
+        )
+        events = [GameEvent(id=i, name=f"Script {i}", x=0, y=0, pages=[page]) for i in range(500)]
+
+        game_state = DictGameState()
+        interpreter = EventInterpreter(game_state)
+        assert interpreter.precompile_events(events) == 2
+        for event in events:
+            interpreter.start_event(event, page, True)
+
+        start = time.perf_counter()
+        for _ in range(60):
+            interpreter.update(1 / 60)
+        elapsed = time.perf_counter() - start
+
+        scripts = interpreter.get_statistics()["scripts"]
+        runs = scripts["script_timings"][condition]["calls"]
+        script_time = sum(timing["total_time"] for timing in scripts["script_timings"].values())
+
+        # The same scripts through eval()/exec() of the source text
+        namespace = {"game_state": game_state}
+        start = time.perf_counter()
+        for _ in range(runs):
+            if eval(condition, namespace):
+                exec(script, dict(namespace))
+        uncached = time.perf_counter() - start
+
+        assert runs >= 500 * 30
+        assert scripts["fast_path_scripts"] == 2
+        assert scripts["hit_rate"] == 1.0
+        assert script_time * 3 < uncached
+        print(
+            f"\n{runs} script runs: {script_time * 1000:.0f}ms in scripts, "
+            f"{elapsed * 1000:.0f}ms total (eval/exec of source: {uncached * 1000:.0f}ms)"
+        )
+
+    def test_1000_event_triggers_performance(self):
+        """Benchmark trigger checks on a map with 1000 conditional events."""
+
+        class PollingGameState(GameState):
+            def __init__(self):
+                self.switches = {}
+                self.variables = {}
+
+            def get_switch(self, switch_id):
+                return self.switches.get(switch_id, False)
+
+            def set_switch(self, switch_id, value):
+                self.switches[switch_id] = value
+
+            def get_variable(self, variable_id):
+                return self.variables.get(variable_id, 0)
+
+            def set_variable(self, variable_id, value):
+                self.variables[variable_id] = value
+
+        game_state = PollingGameState()
+        manager = EventTriggerManager(game_state=game_state)
+        for i in range(1000):
+            event = GameEvent(id=i, name=f"Event {i}", x=i % 50, y=i // 50)
+            event.pages.append(EventPage(trigger=TriggerType.ACTION_BUTTON))
+            event.pages.append(
+                EventPage(
+                    trigger=TriggerType.PLAYER_TOUCH,
+                    condition_switch1_valid=True,
+                    condition_switch1_id=i % 20,
+                    condition_variable_valid=True,
+                    condition_variable_id=i % 10,
+                    condition_variable_value=5,
+                )
+            )
+            manager.add_event(event)
+        manager.update_event_handlers()
+
+        start = time.perf_counter()
+        for frame in range(600):
+            game_state.set_variable(frame % 10, frame)
+            manager.update_event_handlers()
+            context = TriggerContext(
+                game_state=game_state,
+                player_position=(frame % 50, frame % 20),
+                player_direction=2,
+                action_button_pressed=True,
+            )
+            manager.check_triggers(context)
+        elapsed = time.perf_counter() - start
+
+        assert len(manager.active_handlers) == 1000
+        assert elapsed < 1.0  # 600 frames in under a second
+
 
 @pytest.mark.performance
 class TestDatabasePerformance:
@@ -344,6 +573,202 @@ class TestDatabasePerformance:
         assert elapsed < 0.5  # Should complete in under 500ms
         print(f"\nUpdated 2000 entries in {elapsed * 1000:.3f}ms")
 
+    def test_indexed_queries_on_100k_items_performance(self, monkeypatch):
+        """Benchmark search and field filters on a 100k entry category."""
+        monkeypatch.setattr(Item, "MAX_ID", 200000)
+        manager = DatabaseManager()
+
+        adjectives = ["Rusty", "Shiny", "Ancient", "Cursed", "Blessed", "Heavy", "Crimson"]
+        nouns = ["Potion", "Sword", "Shield", "Ring", "Amulet", "Herb", "Scroll"]
+        item_types = list(ItemType)
+        for i in range(1, 100001):
+            manager.create(
+                "items",
+                Item(
+                    id=i,
+                    name=f"{adjectives[i % 7]} {nouns[(i // 7) % 7]} {i}",
+                    description=f"Found in zone {i % 500}",
+                    price=(i * 7919) % 100000,
+                    item_type=item_types[i % len(item_types)],
+                ),
+            )
+
+        queries = [
+            lambda: manager.search("crimson sw"),
+            lambda: manager.search("4242"),
+            lambda: manager.filter_by_field("items", "price", 99000, operator="ge"),
+            lambda: manager.filter_by_field("items", "price", 500),
+            lambda: manager.filter_by_field("items", "name", "Amulet 77", operator="contains"),
+        ]
+        for query in queries:
+            query()  # Warm up lazily built index structures
+
+        # Simulate an editor session: edit an entry, then re-run every query
+        start = time.perf_counter()
+        for i in range(1, 21):
+            entry = manager.read("items", i)
+            entry.price += 1
+            manager.update("items", entry)
+            for query in queries:
+                query()
+        elapsed = time.perf_counter() - start
+
+        assert len(manager.search("4242")) == 20
+        assert elapsed / 20 < 0.1  # Each keystroke's worth of queries under 100ms
+        print(f"\nIndexed queries on 100k items: {elapsed / 20 * 1000:.1f}ms per edit")
+
+    def test_auto_id_bulk_insert_performance(self, monkeypatch):
+        """Benchmark auto-ID creates and duplicates into a 50k entry category."""
+        monkeypatch.setattr(Item, "MAX_ID", 100000)
+        manager = DatabaseManager()
+
+        start = time.perf_counter()
+        for i in range(50000):
+            manager.create("items", Item(name=f"Item {i}"), auto_id=True)
+        manager.bulk_delete("items", list(range(2, 50001, 2)))
+        for i in range(1, 50000, 2):
+            manager.duplicate("items", i)
+        elapsed = time.perf_counter() - start
+
+        assert manager.get_count("items") == 50000
+        assert manager.find_gaps("items") == []
+        assert elapsed < 10.0  # Linear: no per-create scan over existing IDs
+        print(f"\n50k auto-ID creates plus 25k duplicates in {elapsed:.3f}s")
+
+    @pytest.mark.parametrize("count", [10000, 50000])
+    def test_journaled_edit_latency_performance(self, monkeypatch, tmp_path, count):
+        """Benchmark saving single edits through the journal vs full snapshots."""
+        monkeypatch.setattr(Item, "MAX_ID", 100000)
+        manager = DatabaseManager(auto_backup=True, backup_dir=tmp_path / "backups")
+        for i in range(1, count + 1):
+            manager.create("items", Item(id=i, name=f"Item {i}", price=i))
+
+        start = time.perf_counter()
+        manager.save_to_file(tmp_path / "full.json")
+        full_save = time.perf_counter() - start
+
+        manager.enable_journal(tmp_path / "database.json")
+
+        # Each edit: auto-backup checkpoint, journaled update, durable commit
+        edits = 200
+        start = time.perf_counter()
+        for i in range(1, edits + 1):
+            entry = manager.read("items", i)
+            entry.price += 1
+            manager.update("items", entry)
+            manager.commit()
+        elapsed = time.perf_counter() - start
+
+        assert elapsed / edits < 0.01  # Under 10ms per durable edit
+        assert elapsed / edits < full_save
+        print(
+            f"\nJournaled edit on {count} items: {elapsed / edits * 1000:.2f}ms "
+            f"(full save: {full_save * 1000:.0f}ms)"
+        )
+
+
+@pytest.mark.performance
+class TestSavePerformance:
+    """Performance benchmarks for binary vs JSON save games (20k entities)."""
+
+    @staticmethod
+    def _build_world(count: int) -> World:
+        world = World()
+        for i in range(count):
+            entity = world.create_entity(f"Unit_{i}")
+            entity.add_component(Transform(x=i * 0.5, y=i * 0.25, rotation=i % 360))
+            entity.add_component(Health(current=100 - i % 100, maximum=100))
+            entity.add_component(GridPosition(grid_x=i % 200, grid_y=i // 200))
+            entity.add_tag("unit")
+        return world
+
+    def test_binary_save_20k_entities_performance(self, tmp_path):
+        """Benchmark saving and loading 20k entities as binary vs JSON."""
+        serializer = GameSerializer()
+        serializer.register_components([Transform, Health, GridPosition])
+        world = self._build_world(20000)
+
+        timings = {}
+        sizes = {}
+        for format in (SerializationFormat.JSON, SerializationFormat.BINARY):
+            path = tmp_path / f"save.{format.value}"
+            start = time.perf_counter()
+            serializer.save_game(world, path, format)
+            save_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            loaded = serializer.load_game(path, format)
+            load_time = time.perf_counter() - start
+
+            assert len(loaded._entities) == 20000
+            timings[format] = (save_time, load_time)
+            sizes[format] = path.stat().st_size
+
+        json_save, json_load = timings[SerializationFormat.JSON]
+        binary_save, binary_load = timings[SerializationFormat.BINARY]
+        assert binary_save < json_save
+        assert sizes[SerializationFormat.BINARY] * 5 < sizes[SerializationFormat.JSON]
+        print(
+            f"\n20k entity save: binary {binary_save * 1000:.0f}ms / "
+            f"{sizes[SerializationFormat.BINARY] // 1024}KB, "
+            f"JSON {json_save * 1000:.0f}ms / {sizes[SerializationFormat.JSON] // 1024}KB; "
+            f"load: binary {binary_load * 1000:.0f}ms, JSON {json_load * 1000:.0f}ms"
+        )
+
+    def test_incremental_save_20k_entities_performance(self, tmp_path):
+        """Benchmark quicksaves of a few changed entities vs full saves."""
+        serializer = GameSerializer()
+        serializer.register_components([Transform, Health, GridPosition])
+        world = self._build_world(20000)
+        path = tmp_path / "quick.sav"
+
+        start = time.perf_counter()
+        serializer.save_game(world, path, SerializationFormat.BINARY, incremental=True)
+        full_save = time.perf_counter() - start
+
+        entities = world.get_entities()
+        saves = 10
+        start = time.perf_counter()
+        for i in range(saves):
+            for entity in entities[i * 20 : i * 20 + 20]:
+                entity.get_component(Health).current -= 1
+                entity.mark_dirty()
+            serializer.save_game(world, path, SerializationFormat.BINARY, incremental=True)
+        elapsed = time.perf_counter() - start
+
+        loaded = serializer.load_game(path, SerializationFormat.BINARY)
+        assert len(loaded._entities) == 20000
+        assert elapsed / saves * 20 < full_save
+        print(
+            f"\n20k entity quicksave (20 changed): {elapsed / saves * 1000:.1f}ms "
+            f"(full save: {full_save * 1000:.0f}ms)"
+        )
+
+    def test_background_autosave_hitch_performance(self, tmp_path):
+        """Benchmark the main-thread pause of a background save vs a blocking save."""
+        project = Project(str(tmp_path))
+        project.config = ProjectConfig(
+            metadata=ProjectMetadata(name="Bench", version="1.0", description="", author="")
+        )
+        project.saves_dir = tmp_path
+        manager = SaveGameManager(project, snapshot_budget=1.0)
+        world = self._build_world(20000)
+
+        start = time.perf_counter()
+        manager.save_game("blocking", world)
+        blocking = time.perf_counter() - start
+
+        assert manager.save_game_async("background", world)
+        hitch = manager.get_save_stats()["last_hitch"]
+        assert manager.wait(60)
+
+        assert manager.get_save_stats()["saves_completed"] == 1
+        assert hitch * 3 < blocking
+        print(
+            f"\n20k entity autosave: {hitch * 1000:.0f}ms main-thread hitch "
+            f"(blocking save: {blocking * 1000:.0f}ms)"
+        )
+
 
 @pytest.mark.performance
 class TestMapPerformance:
@@ -443,6 +868,195 @@ class TestMapPerformance:
         assert elapsed < 1.0  # Should complete in under 1 second
         print(f"\nPathfinding on 500x500 map: {elapsed * 1000:.3f}ms (path length: {path_length})")
 
+    def test_minimap_render_performance(self):
+        """Benchmark drawing a 512x512 4-layer minimap and redrawing tile edits."""
+        pygame.init()
+        screen = pygame.Surface((256, 256))
+        tilemap = Tilemap(512, 512)
+        for layer in range(4):
+            tilemap.create_enhanced_layer(f"Layer {layer}")
+            for y, row in enumerate(tilemap.get_layer_tiles(layer)):
+                row[:] = [(x * y + layer) % 7 for x in range(512)]
+        minimap = MinimapUI(0, 0, width=256, height=256)
+        minimap.set_tilemap(tilemap)
+
+        start = time.perf_counter()
+        minimap.render(screen)
+        full_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for i in range(100):
+            tilemap.set_tile(i * 5, i * 3, 1, Tile(tile_id=3, walkable=False))
+            minimap.render(screen)
+        edit_time = (time.perf_counter() - start) / 100
+
+        assert full_time < 5.0
+        assert edit_time < 0.05
+        print(
+            f"\n512x512x4 minimap: full draw {full_time * 1000:.1f}ms, "
+            f"{edit_time * 1000:.2f}ms per edited frame"
+        )
+
+    def test_flood_fill_1m_tiles_performance(self):
+        """Benchmark flood filling, undoing and redoing a 1024x1024 map."""
+        tilemap = Tilemap(1024, 1024)
+        tilemap.create_enhanced_layer("Ground")
+        context = ToolContext(
+            tilemap=tilemap,
+            world=World(),
+            events=[],
+            tile_palette={"water": {"walkable": False}},
+            entity_templates={},
+            event_templates={},
+            current_layer=0,
+            selected_tile="water",
+            selected_entity_type=None,
+            selected_event_template=None,
+            grid_width=1024,
+            grid_height=1024,
+            tile_size=32,
+            undo_manager=MapToolUndoManager(),
+        )
+
+        start = time.perf_counter()
+        assert FillTool()._flood_fill(512, 512, context)
+        fill_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        assert context.undo_manager.undo()
+        undo_time = time.perf_counter() - start
+
+        match = np.ones((4096, 4096), dtype=bool)
+        match[::64, :4000] = False
+        start = time.perf_counter()
+        region = flood_mask(match, 0, 1)
+        scan_time = time.perf_counter() - start
+
+        assert tilemap.get_tile(512, 512, 0) is None
+        assert region.sum() == match.sum()
+        assert fill_time < 10.0
+        assert undo_time < 10.0
+        assert scan_time < 2.0
+        print(
+            f"\n1M tile fill: {fill_time:.2f}s, undo {undo_time:.2f}s; "
+            f"4096x4096 scanline region: {scan_time * 1000:.1f}ms"
+        )
+
+    def test_autotile_region_fill_performance(self):
+        """Benchmark autotile-filling a 512x512 region and painting scattered terrain."""
+        manager = AutotileManager()
+        water = AutotileSet(
+            name="Water", tileset_name="terrain", format=AutotileFormat.TILE_16, base_tile_id=1
+        )
+        manager.register_autotile_set(water)
+        layer = EnhancedTileLayer(width=512, height=512)
+        for y in range(0, 512, 32):
+            layer.tiles[y][:500] = [99] * 500
+
+        start = time.perf_counter()
+        manager.fill_with_autotile(layer, 0, 1, water)
+        fill_time = time.perf_counter() - start
+
+        cells = [(x, (x * 7) % 512) for x in range(512)] * 4
+        start = time.perf_counter()
+        manager.paint_cells(layer, cells, water)
+        paint_time = time.perf_counter() - start
+
+        assert layer.get_tile(0, 1) in water.tile_ids
+        assert fill_time < 5.0
+        assert paint_time < 5.0
+        print(
+            f"\n512x512 autotile fill: {fill_time * 1000:.1f}ms, "
+            f"{len(cells)} painted cells: {paint_time * 1000:.1f}ms"
+        )
+
+
+@pytest.mark.performance
+class TestCombatPerformance:
+    """Performance tests for headless battle simulation."""
+
+    def test_battle_simulation_performance(self):
+        """Benchmark simulating 2000 battles of a 4-member party against a boss."""
+        db = DatabaseManager()
+        db.skills[1] = Skill(
+            id=1,
+            name="Cure",
+            mp_cost=6,
+            scope=3,
+            damage_type=DamageType.HP_RECOVER,
+            effects=[Effect(effect_type=EffectType.RECOVER_HP, value1=80.0)],
+        )
+        db.skills[2] = Skill(
+            id=2,
+            name="Flare",
+            mp_cost=10,
+            hit_type=2,
+            damage_type=DamageType.HP_DAMAGE,
+            effects=[Effect(effect_type=EffectType.DAMAGE_HP, value1=40.0, value2=15.0)],
+        )
+        db.classes[1] = Class(
+            id=1, name="Sage", learnings=[{"level": 1, "skill_id": 1}, {"level": 1, "skill_id": 2}]
+        )
+        for actor_id in range(1, 5):
+            db.actors[actor_id] = Actor(id=actor_id, name=f"Hero {actor_id}", class_id=1)
+        db.enemies[1] = Enemy(
+            id=1,
+            name="Boss",
+            params=[450, 100, 32, 20, 30, 20, 12, 10],
+            actions=[{"skill_id": 0, "rating": 6}, {"skill_id": 2, "rating": 4}],
+        )
+        setup = BattleSetup.from_database(db, [1, 2, 3, 4], [1])
+
+        start = time.perf_counter()
+        report = run_simulation(setup, 2000, seed=1, workers=1)
+        elapsed = time.perf_counter() - start
+
+        assert report.battles == 2000
+        assert elapsed < 10.0
+        turns = report.to_dict()["turns"]["mean"]
+        print(
+            f"\nSimulated 2000 battles in {elapsed:.2f}s "
+            f"({elapsed / 2000 * 1000:.2f}ms/battle, {turns:.1f} turns, "
+            f"win rate {report.win_rate:.1%})"
+        )
+
+    def test_aoe_resolution_performance(self):
+        """Benchmark resolving 500 attacks against 200 targets in batches."""
+        world = World()
+        targets = []
+        for i in range(200):
+            entity = world.create_entity(f"Slime {i}")
+            entity.add_component(CombatHealth(max_hp=1_000_000, hp=1_000_000))
+            entity.add_component(JRPGStats(defense=i % 30, speed=5 + i % 10))
+            entity.add_component(BattleState())
+            targets.append(entity)
+        attacker = JRPGStats(attack=60, speed=12, luck=12)
+        rng = np.random.default_rng(0)
+
+        start = time.perf_counter()
+        for _ in range(500):
+            result = resolve_attack(attacker, TargetBatch.from_entities(targets), rng, 0.05, 0.05)
+            result.write_back()
+        batched = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(500):
+            for target in targets:
+                health = target.get_component(CombatHealth)
+                stats = target.get_component(JRPGStats)
+                damage = attacker.calculate_physical_damage(stats)
+                if target.get_component(BattleState).is_defending:
+                    damage = int(damage * 0.5)
+                health.hp = max(0, health.hp - damage)
+        per_target = time.perf_counter() - start
+
+        assert all(t.get_component(CombatHealth).is_alive for t in targets)
+        assert batched < 10.0
+        print(
+            f"\nResolved 500 attacks on 200 targets in {batched:.2f}s batched "
+            f"vs {per_target:.2f}s per target"
+        )
+
 
 @pytest.mark.performance
 class TestIntegratedPerformance:
@@ -0,0 +1,169 @@
+"""
+Tests for the event script cache
+
+Tests that lowered scripts behave like eval()/exec() of the same source, that
+unsupported scripts fall back to cached code objects, and cache statistics.
+"""
+
+from typing import Dict
+
+import pytest
+
+from neonworks.core.event_commands import (
+    CommandType,
+    ConditionalBranchCommand,
+    EventCommand,
+    EventPage,
+    GameState,
+)
+from neonworks.engine.core.script_cache import EVAL, EXEC, CompiledScript, ScriptCache
+
+
+class DictGameState(GameState):
+    """Game state backed by dicts"""
+
+    def __init__(self):
+        self.switches: Dict[int, bool] = {5: True}
+        self.variables: Dict[int, int] = {1: 7, 2: 3, 3: 0}
+
+    def get_switch(self, switch_id: int) -> bool:
+        return self.switches.get(switch_id, False)
+
+    def set_switch(self, switch_id: int, value: bool):
+        self.switches[switch_id] = value
+
+    def get_variable(self, variable_id: int) -> int:
+        return self.variables.get(variable_id, 0)
+
+    def set_variable(self, variable_id: int, value: int):
+        self.variables[variable_id] = value
+
+
+EXPRESSIONS = [
+    "True",
+    "42",
+    "game_state.get_switch(5)",
+    "game_state.get_variable(1) >= 5",
+    "game_state.get_variable(1) + game_state.get_variable(2) * 2 == 13",
+    "game_state.get_variable(1) // 2 - 1",
+    "game_state.get_variable(1) % game_state.get_variable(2) / 2",
+    "-game_state.get_variable(2)",
+    "not game_state.get_switch(5)",
+    "0 < game_state.get_variable(2) < game_state.get_variable(1) != 9",
+    "1 < game_state.get_variable(3) < 5",
+    "game_state.get_switch(5) and game_state.get_variable(3)",
+    "game_state.get_switch(6) or game_state.get_variable(2) or 10",
+    "game_state.get_variable(game_state.get_variable(2))",
+]
+
+
+class TestLowering:
+    """Test the closure fast path"""
+
+    @pytest.mark.parametrize("source", EXPRESSIONS)
+    def test_expression_matches_eval(self, source):
+        """Lowered expressions return what eval() returns"""
+        script = CompiledScript(source, EVAL)
+        game_state = DictGameState()
+
+        assert script.fast is not None
+        assert script.code is None
+        assert script.run(game_state) == eval(source, {"game_state": game_state})
+
+    def test_statements_match_exec(self):
+        """Lowered switch/variable writes behave like exec()"""
+        source = (
+            "game_state.set_variable(4, game_state.get_variable(1) * 3)\n"
+            "pass\n"
+            "game_state.set_switch(2, game_state.get_variable(4) > 20)"
+        )
+        lowered_state = DictGameState()
+        script = CompiledScript(source, EXEC)
+        assert script.fast is not None
+        assert script.run(lowered_state) is None
+
+        exec_state = DictGameState()
+        exec(source, {"game_state": exec_state})
+        assert lowered_state.variables == exec_state.variables
+        assert lowered_state.switches == exec_state.switches
+
+    @pytest.mark.parametrize(
+        "source,mode",
+        [
+            ("game_state.items", EVAL),
+            ("len([1, 2])", EVAL),
+            ("game_state.set_variable(1, 2)", EVAL),  # Writes only as statements
+            ("game_state.get_variable(variable_id=1)", EVAL),
+            ("x = game_state.get_variable(1)", EXEC),
+            ("context.advance()", EXEC),
+        ],
+    )
+    def test_unsupported_scripts_use_code_objects(self, source, mode):
+        """Scripts outside the supported subset are compiled normally"""
+        script = CompiledScript(source, mode)
+
+        assert script.fast is None
+        assert script.code is not None
+
+    def test_fallback_gets_extra_names(self):
+        """Code-object scripts can use the extra names passed to run()"""
+        script = CompiledScript("result.append(event)", EXEC)
+        result = []
+        script.run(DictGameState(), {"event": "door", "result": result})
+
+        assert result == ["door"]
+
+
+class TestScriptCache:
+    """Test caching and statistics"""
+
+    def test_scripts_compiled_once(self):
+        """Repeated lookups return the same compiled script"""
+        cache = ScriptCache()
+        first = cache.get("game_state.get_switch(1)", EVAL)
+
+        assert cache.get("game_state.get_switch(1)", EVAL) is first
+        assert cache.get("game_state.get_switch(1)", EXEC) is not first
+        assert (cache.hits, cache.misses) == (1, 2)
+
+    def test_syntax_error_cached_and_raised(self):
+        """Broken scripts are compiled once and raise on every run"""
+        cache = ScriptCache()
+        script = cache.get("game_state.get_switch(", EVAL)
+
+        for _ in range(2):
+            with pytest.raises(SyntaxError):
+                cache.get("game_state.get_switch(", EVAL).run(DictGameState())
+        assert script.calls == 2
+        assert cache.misses == 1
+
+    def test_precompile_page(self):
+        """Script commands and script conditions are compiled ahead of time"""
+        page = EventPage(
+            commands=[
+                ConditionalBranchCommand("script", script="game_state.get_switch(1)"),
+                EventCommand(command_type=CommandType.SCRIPT, parameters={"script": "x = 1"}),
+                ConditionalBranchCommand("switch", switch_id=1),
+            ]
+        )
+        cache = ScriptCache()
+
+        assert cache.precompile_page(page) == 2
+        assert cache.precompile_page(page) == 0
+        assert len(cache) == 2
+        assert cache.hits == cache.misses == 0
+
+    def test_statistics(self):
+        """Statistics report the hit rate and per-script timings"""
+        cache = ScriptCache()
+        game_state = DictGameState()
+        for _ in range(4):
+            cache.get("game_state.get_variable(1) > 3", EVAL).run(game_state)
+
+        stats = cache.get_statistics()
+        assert stats["hit_rate"] == 0.75
+        assert stats["fast_path_scripts"] == 1
+        timing = stats["script_timings"]["game_state.get_variable(1) > 3"]
+        assert timing["calls"] == 4
+        assert timing["fast_path"] is True
+        assert timing["avg_time"] == pytest.approx(timing["total_time"] / 4)
@@ -389,6 +389,76 @@ class TestGameSerializer:
         finally:
             temp_path.unlink()
 
+    def test_binary_save_matches_json(self, tmp_path):
+        """A binary save loads into the same world as a JSON save"""
+        serializer = GameSerializer()
+        serializer.register_components([DummyComponent, ComplexComponent, Transform, GridPosition])
+
+        world = World()
+        for i in range(50):
+            entity = world.create_entity()
+            entity.add_tag("enemy" if i % 2 else "ally")
+            entity.active = i % 7 != 0
+            entity.add_component(Transform(x=i * 1.5, y=-i, rotation=i % 360))
+            entity.add_component(DummyComponent(value=i * 2**40, name=f"unit {i % 3}"))
+            if i % 5 == 0:
+                entity.add_component(
+                    ComplexComponent(values=[i, "x", None, 2.5], settings={"a": {"b": [True]}})
+                )
+        metadata = SerializationMetadata(game_version="1.2.0", custom_data={"slot": 3})
+
+        json_path = tmp_path / "save.json"
+        binary_path = tmp_path / "save.dat"
+        serializer.save_game(world, json_path, SerializationFormat.JSON, metadata)
+        serializer.save_game(world, binary_path, SerializationFormat.BINARY, metadata)
+
+        from_json = serializer.load_game(json_path, SerializationFormat.JSON)
+        from_binary = serializer.load_game(binary_path, SerializationFormat.BINARY)
+
+        # Entity ids are reassigned on load, so compare everything else
+        def contents(loaded_world):
+            entities = serializer.world_serializer.serialize_world(loaded_world)["entities"]
+            return [{**entity, "id": None} for entity in entities]
+
+        assert contents(from_binary) == contents(from_json)
+        assert binary_path.stat().st_size < json_path.stat().st_size
+
+        loaded_metadata = serializer.get_metadata(binary_path, SerializationFormat.BINARY)
+        assert loaded_metadata.game_version == "1.2.0"
+        assert loaded_metadata.custom_data == {"slot": 3}
+
+    def test_load_legacy_pickle_save(self, tmp_path):
+        """BINARY saves written before the binary format (pickle) still load"""
+        import pickle
+
+        serializer = GameSerializer()
+        serializer.register_component(DummyComponent)
+
+        world = World()
+        world.create_entity().add_component(DummyComponent(value=5))
+        temp_path = tmp_path / "legacy.dat"
+        with open(temp_path, "wb") as f:
+            pickle.dump(serializer.world_serializer.serialize_world(world), f)
+
+        loaded_world = serializer.load_game(temp_path, SerializationFormat.BINARY)
+        [entity] = loaded_world._entities.values()
+        assert entity.get_component(DummyComponent).value == 5
+
+    def test_load_truncated_binary_save(self, tmp_path):
+        """A truncated binary save raises SerializationError"""
+        serializer = GameSerializer()
+        serializer.register_component(DummyComponent)
+
+        world = World()
+        for i in range(100):
+            world.create_entity().add_component(DummyComponent(value=i))
+        temp_path = tmp_path / "save.dat"
+        serializer.save_game(world, temp_path, SerializationFormat.BINARY)
+        temp_path.write_bytes(temp_path.read_bytes()[:-20])
+
+        with pytest.raises(SerializationError):
+            serializer.load_game(temp_path, SerializationFormat.BINARY)
+
     def test_save_load_game_string(self):
         """Test saving and loading game to/from string"""
         serializer = GameSerializer()
@@ -432,6 +502,132 @@ class TestGameSerializer:
             temp_path.unlink()
 
 
+class TestDeltaSaves:
+    """Test incremental saves (base plus chained deltas)"""
+
+    @staticmethod
+    def _make_serializer():
+        serializer = GameSerializer()
+        serializer.register_components([DummyComponent, ComplexComponent, Transform])
+        return serializer
+
+    @staticmethod
+    def _contents(serializer, world):
+        """World contents without entity ids (which are reassigned on load)"""
+        entities = serializer.world_serializer.serialize_world(world)["entities"]
+        return sorted(json.dumps({**entity, "id": None}, sort_keys=True) for entity in entities)
+
+    @pytest.mark.parametrize("format", [SerializationFormat.BINARY, SerializationFormat.JSON])
+    def test_chain_replays_to_current_world(self, tmp_path, format):
+        """Loading base plus deltas gives the world as of the last save"""
+        serializer = self._make_serializer()
+        path = tmp_path / f"quick.{format.value}"
+
+        world = World()
+        entities = []
+        for i in range(30):
+            entity = world.create_entity()
+            entity.add_component(Transform(x=i))
+            entity.add_component(DummyComponent(value=i))
+            entities.append(entity)
+        serializer.save_game(world, path, format, incremental=True)
+
+        entities[0].get_component(Transform).x = 99
+        entities[0].mark_dirty()
+        entities[1].remove_component(DummyComponent)
+        entities[2].add_tag("boss")
+        world.remove_entity(entities[3].id)
+        serializer.save_game(world, path, format, incremental=True)
+
+        new = world.create_entity()
+        new.add_component(ComplexComponent(values=[1, 2]))
+        entities[4].active = False
+        world.remove_entity(entities[2].id)
+        metadata = SerializationMetadata(custom_data={"playtime": 42})
+        serializer.save_game(world, path, format, metadata=metadata, incremental=True)
+
+        assert serializer.get_delta_chain(path, format).sequence == 2
+        assert serializer.get_delta_chain(path, format).delta_path(2).exists()
+
+        loaded = serializer.load_game(path, format)
+        assert self._contents(serializer, loaded) == self._contents(serializer, world)
+        assert serializer.get_metadata(path, format).custom_data == {"playtime": 42}
+
+    def test_delta_holds_only_changed_entities(self, tmp_path):
+        """A delta contains the changed entities and the removed ids, nothing else"""
+        serializer = self._make_serializer()
+        path = tmp_path / "quick.sav"
+
+        world = World()
+        entities = [world.create_entity() for _ in range(200)]
+        for entity in entities:
+            entity.add_component(DummyComponent(value=1))
+        serializer.save_game(world, path, SerializationFormat.BINARY, incremental=True)
+
+        entities[5].get_component(DummyComponent).value = 2
+        entities[5].mark_dirty()
+        world.remove_entity(entities[6].id)
+        serializer.save_game(world, path, SerializationFormat.BINARY, incremental=True)
+
+        chain = serializer.get_delta_chain(path)
+        with open(chain.delta_path(1), "rb") as f:
+            header, body = serializer.world_serializer.read_entities(f)
+            body = list(body)
+        assert header["entity_count"] == 1
+        assert header["_chain"]["removed"] == [entities[6].id]
+        assert body[0]["id"] == entities[5].id
+        assert chain.delta_path(1).stat().st_size * 20 < path.stat().st_size
+
+    def test_rebase_replaces_chain(self, tmp_path):
+        """A new base is written after rebase_interval deltas or a large change"""
+        serializer = self._make_serializer()
+        path = tmp_path / "quick.sav"
+        world = World()
+        entities = [world.create_entity() for _ in range(10)]
+
+        chain = serializer.get_delta_chain(path)
+        chain.rebase_interval = 2
+        for i in range(4):
+            entities[i].mark_dirty()
+            chain.save(world)
+        assert chain.sequence == 0  # Base, delta 1, delta 2, new base
+        assert not chain.delta_path(1).exists()
+
+        for entity in entities[:6]:
+            entity.mark_dirty()
+        assert chain.save(world) == path  # More than half changed
+
+        entities[0].mark_dirty()
+        assert chain.save(world) == chain.delta_path(1)
+
+        # Saving another world, or loading, starts a new chain
+        loaded = serializer.load_game(path, SerializationFormat.BINARY)
+        assert chain.save(loaded) == path
+        assert len(serializer.load_game(path, SerializationFormat.BINARY)._entities) == 10
+
+    def test_full_save_ends_chain(self, tmp_path):
+        """A full save over a chain's base is not combined with its old deltas"""
+        serializer = self._make_serializer()
+        path = tmp_path / "quick.sav"
+        world = World()
+        entity = world.create_entity()
+        entity.add_component(DummyComponent(value=1))
+        serializer.save_game(world, path, SerializationFormat.BINARY, incremental=True)
+        entity.add_tag("changed")
+        serializer.save_game(world, path, SerializationFormat.BINARY, incremental=True)
+
+        world.remove_entity(entity.id)
+        serializer.save_game(world, path, SerializationFormat.BINARY)
+        assert len(serializer.load_game(path, SerializationFormat.BINARY)._entities) == 0
+
+        # The next incremental save starts over with a base
+        world.create_entity().add_component(DummyComponent(value=3))
+        serializer.save_game(world, path, SerializationFormat.BINARY, incremental=True)
+        loaded = serializer.load_game(path, SerializationFormat.BINARY)
+        [loaded_entity] = loaded._entities.values()
+        assert loaded_entity.get_component(DummyComponent).value == 3
+
+
 class TestGlobalSerializer:
     """Test global serializer"""
 
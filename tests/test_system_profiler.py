@@ -0,0 +1,166 @@
+"""
+Tests for the system profiler
+
+Tests per-system timing of World updates: the method swap that turns
+profiling on and off, rolling percentiles, slow update captures, and the
+timings reported by the performance monitor, the engine and the debug console.
+"""
+
+import time
+
+import pygame
+import pytest
+
+from neonworks.core.ecs import System, World
+from neonworks.core.game_loop import GameEngine
+from neonworks.ui.debug_console_ui import DebugConsoleUI
+from neonworks.utils.performance_monitor import PerformanceMonitor
+from neonworks.utils.system_profiler import SystemProfiler
+
+
+class SleepySystem(System):
+    """System that sleeps for a set time on chosen updates"""
+
+    def __init__(self, seconds=0.0, on_updates=None):
+        super().__init__()
+        self.seconds = seconds
+        self.on_updates = on_updates
+        self.updates = 0
+
+    def update(self, world, delta_time):
+        if self.on_updates is None or self.updates in self.on_updates:
+            time.sleep(self.seconds)
+        self.updates += 1
+
+
+class QuickSystem(System):
+    def update(self, world, delta_time):
+        pass
+
+
+@pytest.fixture
+def world():
+    world = World()
+    world.add_system(QuickSystem())
+    world.add_system(SleepySystem(0.02, on_updates={3}))
+    return world
+
+
+class TestWorldProfiling:
+    """Test opt-in profiling of World.update"""
+
+    def test_profiling_swaps_update_method(self, world):
+        """Enabling swaps in the timed update; disabling restores the plain one"""
+        assert "update" not in vars(world) and world.profiler is None
+
+        profiler = world.enable_profiling()
+        assert world.update == world._update_instrumented
+        world.update(0.016)
+        assert profiler.update_count == 1
+
+        world.disable_profiling()
+        assert "update" not in vars(world) and world.profiler is None
+        world.update(0.016)
+        assert profiler.update_count == 1
+
+    def test_times_each_enabled_system(self, world):
+        """Every enabled system is timed under its class name"""
+        profiler = world.enable_profiling()
+        world._systems[0].enabled = False
+
+        for _ in range(5):
+            world.update(0.016)
+
+        stats = profiler.get_stats()
+        assert list(stats) == [SystemProfiler.TOTAL, "SleepySystem"]
+        assert stats["SleepySystem"].samples == 5
+        assert stats["SleepySystem"].max_ms >= 20
+        assert stats[SystemProfiler.TOTAL].max_ms >= stats["SleepySystem"].max_ms
+
+    def test_slow_updates_capture_breakdown(self, world):
+        """Updates over the threshold keep their per-system breakdown"""
+        profiler = world.enable_profiling(SystemProfiler(slow_threshold_ms=10))
+
+        for _ in range(6):
+            world.update(0.016)
+
+        assert len(profiler.slow_updates) == 1
+        slow = profiler.slow_updates[0]
+        assert slow.update_number == 3 and slow.total_ms >= 20
+        assert list(slow.systems) == ["SleepySystem", "QuickSystem"]
+
+
+class TestSystemProfiler:
+    """Test rolling statistics"""
+
+    def test_percentiles(self):
+        """Percentiles use the nearest rank of the rolling window"""
+        profiler = SystemProfiler(window_size=100)
+        for ms in range(1, 201):
+            profiler.record_update([("Physics", ms * 1_000_000)], ms * 1_000_000)
+
+        stats = profiler.get_system_stats("Physics")
+        assert stats.samples == 100
+        assert (stats.p50_ms, stats.p95_ms, stats.p99_ms, stats.max_ms) == (150, 195, 199, 200)
+        assert stats.mean_ms == pytest.approx(150.5)
+        assert profiler.get_system_stats("Missing") is None
+
+    def test_systems_sorted_by_p95_and_reset(self):
+        """Stats list the total first, then the slowest systems"""
+        profiler = SystemProfiler(slow_threshold_ms=1000)
+        profiler.record_update([("Fast", 1_000), ("Slow", 9_000)], 10_000)
+
+        assert list(profiler.get_stats()) == ["total", "Slow", "Fast"]
+        assert len(profiler.format_report(top_n=1)) == 3
+
+        profiler.reset()
+        assert profiler.get_stats() == {} and profiler.update_count == 0
+
+
+def test_performance_monitor_reports_system_times(world):
+    """The performance monitor includes attached system timings"""
+    monitor = PerformanceMonitor(enable_warnings=False)
+    assert monitor.get_stats().system_times == {}
+
+    monitor.attach_system_profiler(world.enable_profiling(SystemProfiler(slow_threshold_ms=10)))
+    monitor.begin_frame()
+    for _ in range(4):
+        world.update(0.016)
+    monitor.end_frame()
+
+    stats = monitor.get_stats()
+    assert stats.system_times["SleepySystem"].samples == 4
+    assert len(stats.slow_updates) == 1
+
+
+def test_engine_reports_system_times():
+    """The engine profiles its world and reports the timings in its stats"""
+    engine = GameEngine()
+    engine.world.add_system(QuickSystem())
+    assert "system_times" not in engine.get_stats()
+
+    profiler = engine.enable_profiling()
+    engine.world.update(engine.fixed_timestep)
+    assert profiler.slow_threshold_ms == pytest.approx(1000 / 60)
+    assert set(engine.get_stats()["system_times"]["QuickSystem"]) == {"p50_ms", "p95_ms", "p99_ms"}
+
+    engine.disable_profiling()
+    assert engine.world.profiler is None
+    assert "system_times" not in engine.get_stats()
+
+
+def test_debug_console_perf_command(world):
+    """The debug console turns profiling on and shows the timings"""
+    console = DebugConsoleUI(pygame.Surface((320, 240)), world)
+
+    console.execute_command("perf")
+    assert "off" in console.output_log[-1][0]
+
+    console.execute_command("perf on")
+    world.update(0.016)
+    console.execute_command("perf")
+    lines = [line for line, _ in console.output_log]
+    assert any(line.startswith("QuickSystem") for line in lines)
+
+    console.execute_command("perf off")
+    assert world.profiler is None
@@ -0,0 +1,305 @@
+"""
+Tests for tile masks and the mask-based map tools
+
+Tests the scanline flood fill against a per-cell BFS, mask selections and
+their combinations, masked tilemap writes, and the fill and select tools
+filling, selecting and undoing through masks.
+"""
+
+from collections import deque
+
+import numpy as np
+import pytest
+
+from neonworks.core.ecs import World
+from neonworks.core.tile_mask import TileMask, crop_mask, flood_mask
+from neonworks.rendering.tilemap import Tile, Tilemap
+from neonworks.ui.map_tools import FillTool, SelectTool, ToolContext, UndoManager
+
+PALETTE = {
+    "grass": {"walkable": True},
+    "water": {"walkable": False},
+    "sand": {"walkable": True},
+}
+
+
+def _bfs(match, x, y, eight_way):
+    """Reference per-cell flood fill"""
+    height, width = match.shape
+    region = np.zeros_like(match)
+    if not match[y, x]:
+        return region
+    steps = [(0, 1), (0, -1), (1, 0), (-1, 0)]
+    if eight_way:
+        steps += [(1, 1), (1, -1), (-1, 1), (-1, -1)]
+    queue = deque([(x, y)])
+    region[y, x] = True
+    while queue:
+        cx, cy = queue.popleft()
+        for dx, dy in steps:
+            nx, ny = cx + dx, cy + dy
+            if 0 <= nx < width and 0 <= ny < height and match[ny, nx] and not region[ny, nx]:
+                region[ny, nx] = True
+                queue.append((nx, ny))
+    return region
+
+
+def _layer_id(tilemap):
+    """ID of the bottom layer"""
+    return tilemap.layer_manager.get_render_order()[0]
+
+
+def _context(tilemap, selected_tile="water"):
+    return ToolContext(
+        tilemap=tilemap,
+        world=World(),
+        events=[],
+        tile_palette=PALETTE,
+        entity_templates={},
+        event_templates={},
+        current_layer=0,
+        selected_tile=selected_tile,
+        selected_entity_type=None,
+        selected_event_template=None,
+        grid_width=tilemap.width,
+        grid_height=tilemap.height,
+        tile_size=32,
+        undo_manager=UndoManager(),
+    )
+
+
+def _types(tilemap):
+    return [
+        [
+            (tile.tile_type if tile else None)
+            for tile in (tilemap.get_tile(x, y, 0) for x in range(tilemap.width))
+        ]
+        for y in range(tilemap.height)
+    ]
+
+
+@pytest.fixture
+def tilemap():
+    """12x8 map of grass with a sand wall splitting it and a sand island"""
+    tilemap = Tilemap(12, 8)
+    tilemap.create_enhanced_layer("Ground")
+    for y in range(8):
+        for x in range(12):
+            tile_type = "sand" if x == 6 and y != 7 or (x, y) == (2, 2) else "grass"
+            tilemap.set_tile(x, y, 0, Tile(tile_id=1, tile_type=tile_type))
+    return tilemap
+
+
+class TestFloodMask:
+    """Test the scanline fill"""
+
+    @pytest.mark.parametrize("seed", [0, 1, 2, 3])
+    @pytest.mark.parametrize("eight_way", [False, True])
+    def test_matches_bfs(self, seed, eight_way):
+        """The scanline fill finds the same region as a per-cell BFS"""
+        rng = np.random.default_rng(seed)
+        match = rng.random((40, 50)) < 0.6
+        for x, y in [(0, 0), (25, 20), (49, 39), (10, 30)]:
+            assert np.array_equal(flood_mask(match, x, y, eight_way), _bfs(match, x, y, eight_way))
+
+    def test_non_matching_seed(self):
+        """A seed outside the matching cells fills nothing"""
+        match = np.zeros((4, 4), dtype=bool)
+
+        assert not flood_mask(match, 1, 1).any()
+        assert not flood_mask(match, 9, 9).any()
+
+    def test_crop_mask(self):
+        """Masks are cropped to the bounds of their set cells"""
+        mask = np.zeros((10, 10), dtype=bool)
+        mask[2:4, 5:9] = True
+
+        cropped, x, y = crop_mask(mask)
+        assert (x, y) == (5, 2)
+        assert cropped.shape == (2, 4) and cropped.all()
+        assert crop_mask(np.zeros((3, 3), dtype=bool)) is None
+
+
+class TestTileMask:
+    """Test selection masks"""
+
+    def test_combinations(self):
+        """Masks support union, intersection and subtraction"""
+        a = TileMask.from_rect(10, 10, 0, 0, 4, 4)
+        b = TileMask.from_rect(10, 10, 2, 2, 4, 4)
+
+        assert len(a | b) == 28
+        assert (a & b).cells() == [(2, 2), (3, 2), (2, 3), (3, 3)]
+        assert len(a - b) == 12
+        assert (3, 3) not in a - b
+        assert (a | b).bounds() == (0, 0, 5, 5)
+
+    def test_from_cells_and_mismatched_sizes(self):
+        """Cells outside the map are dropped and sizes must match"""
+        mask = TileMask.from_cells(5, 5, [(1, 1), (4, 4), (7, 0), (-1, 2)])
+
+        assert mask.cells() == [(1, 1), (4, 4)]
+        with pytest.raises(ValueError):
+            mask | TileMask(6, 5)
+
+
+class TestMaskedWrites:
+    """Test masked tilemap reads and writes"""
+
+    def test_fill_and_restore(self, tilemap):
+        """Masked fills behave like set_tile and restore exactly"""
+        mask = np.ones((2, 3), dtype=bool)
+        mask[1, 1] = False
+        before = _types(tilemap)
+        old_ids, old_metadata = tilemap.read_masked(0, mask, 4, 3)
+        assert len(old_ids) == 5 and len(old_metadata) == 5
+
+        tilemap.fill_masked(0, mask, Tile(tile_id=9, tile_type="water"), 4, 3)
+        assert tilemap.get_tile(4, 3, 0).tile_type == "water"
+        assert tilemap.get_tile(5, 4, 0).tile_type == "grass"
+        assert tilemap.get_layer_tiles(0)[3][4:7] == [9, 9, 9]
+
+        tilemap.fill_masked(0, mask, None, 4, 3)
+        assert tilemap.get_tile(4, 3, 0) is None
+
+        tilemap.restore_masked(0, mask, old_ids, old_metadata, 4, 3)
+        assert _types(tilemap) == before
+
+    def test_fill_metadata_is_one_palette_entry(self):
+        """Fills share one palette entry per layer; undo keeps arrays, not dicts"""
+        tilemap = Tilemap(64, 64)
+        tilemap.create_enhanced_layer("Ground")
+        tilemap.set_tile(3, 3, 0, Tile(tile_type="sand"))
+        mask = np.ones((64, 64), dtype=bool)
+
+        water = Tile(tile_id=2, tile_type="water", walkable=False)
+        tilemap.fill_masked(0, mask, water)
+        assert tilemap._tile_metadata == {}
+        assert tilemap._fill_tiles[_layer_id(tilemap)] == [None, water]
+        assert tilemap.get_tile(3, 3, 0) is water and tilemap.get_tile(64, 0, 0) is None
+
+        old_ids, old_metadata = tilemap.read_masked(0, mask)
+        assert old_ids.dtype == np.uint8 and old_metadata.codes.dtype == np.uint8
+        assert old_metadata.palette == [None, water] and len(old_metadata) == 64 * 64
+
+        tilemap.fill_masked(0, mask, Tile(tile_type="lava"))
+        tilemap.set_tile(1, 1, 0, Tile(tile_type="sand"))
+        assert tilemap.tile_type_mask(0, "lava").sum() == 64 * 64 - 1
+
+        tilemap.restore_masked(0, mask, old_ids, old_metadata)
+        assert tilemap.tile_type_mask(0, "water").all()
+        assert tilemap.get_tile_metadata(0, 0, 0, 2, 1) == {(0, 0): water, (1, 0): water}
+
+    def test_fill_palette_drops_unused_tiles(self, monkeypatch):
+        """Tiles no cell uses anymore are dropped from the fill palette"""
+        monkeypatch.setattr("neonworks.rendering.tilemap.MAX_FILL_PALETTE", 4)
+        tilemap = Tilemap(4, 4)
+        tilemap.create_enhanced_layer("Ground")
+        mask = np.ones((4, 4), dtype=bool)
+        corner = np.zeros((4, 4), dtype=bool)
+        corner[0, 0] = True
+
+        tilemap.fill_masked(0, corner, Tile(tile_type="sand"))
+        for tile_type in ["a", "b", "c", "d"]:
+            tilemap.fill_masked(0, mask & ~corner, Tile(tile_type=tile_type))
+
+        palette = tilemap._fill_tiles[_layer_id(tilemap)]
+        assert [tile.tile_type for tile in palette[1:]] == ["sand", "c", "d"]
+        assert tilemap.get_tile(0, 0, 0).tile_type == "sand"
+        assert tilemap.get_tile(3, 3, 0).tile_type == "d"
+
+    def test_type_mask(self, tilemap):
+        """Type masks mark cells by legacy tile type"""
+        mask = tilemap.tile_type_mask(0, "sand")
+
+        assert mask.sum() == 8
+        assert mask[2, 2] and mask[0, 6] and not mask[7, 6]
+
+
+class TestFillTool:
+    """Test mask-based flood fill"""
+
+    def test_fill_region_and_undo(self, tilemap):
+        """Fill stops at other tile types and undoes in one step"""
+        context = _context(tilemap)
+        before = _types(tilemap)
+
+        assert FillTool()._flood_fill(0, 0, context)
+        after = _types(tilemap)
+        # The bottom row connects both sides of the sand wall
+        assert after[0] == ["water"] * 6 + ["sand"] + ["water"] * 5
+        assert after[7] == ["water"] * 12
+        assert after[2][2] == "sand"
+        assert not tilemap.get_tile(0, 0, 0).walkable
+
+        assert context.undo_manager.undo()
+        assert _types(tilemap) == before
+        assert context.undo_manager.redo()
+        assert _types(tilemap) == after
+
+    @pytest.mark.parametrize("use_8way,filled", [(False, 1), (True, 3)])
+    def test_eight_way_crosses_diagonals(self, use_8way, filled):
+        """8-way fill connects diagonal neighbors"""
+        tilemap = Tilemap(3, 3)
+        tilemap.create_enhanced_layer("Ground")
+        for y in range(3):
+            for x in range(3):
+                if x != y:
+                    tilemap.set_tile(x, y, 0, Tile(tile_type="sand"))
+        tool = FillTool()
+        tool.use_8way = use_8way
+
+        assert tool._flood_fill(0, 0, _context(tilemap))
+        assert tilemap.tile_type_mask(0, "water").sum() == filled
+
+    def test_fill_is_not_capped(self):
+        """Large fills change every cell"""
+        tilemap = Tilemap(300, 300)
+        tilemap.create_enhanced_layer("Ground")
+
+        assert FillTool()._flood_fill(150, 150, _context(tilemap))
+        assert tilemap.tile_type_mask(0, "water").all()
+
+
+class TestSelectTool:
+    """Test mask selections"""
+
+    def test_magic_wand_and_combine_modes(self, tilemap):
+        """Wand selections combine with rectangle selections"""
+        context = _context(tilemap)
+        tool = SelectTool()
+
+        tool.on_mouse_down(2, 2, 2, context)
+        assert tool.get_selected_tiles() == {(2, 2)}
+
+        tool.set_combine_mode("add")
+        tool.on_mouse_down(6, 0, 2, context)
+        assert len(tool.selection) == 8
+
+        tool.set_combine_mode("subtract")
+        tool.on_mouse_down(5, 0, 0, context)
+        tool.on_mouse_up(7, 3, 0, context)
+        assert tool.get_selection_bounds() == (2, 2, 6, 6)
+
+        tool.set_combine_mode("intersect")
+        tool.on_mouse_down(0, 0, 0, context)
+        tool.on_mouse_up(3, 3, 0, context)
+        assert tool.get_selected_tiles() == {(2, 2)}
+
+        with pytest.raises(ValueError):
+            tool.set_combine_mode("xor")
+
+    def test_cut_is_undoable(self, tilemap):
+        """Cutting clears the selection in one undoable step"""
+        context = _context(tilemap)
+        tool = SelectTool()
+        before = _types(tilemap)
+        tool.on_mouse_down(0, 0, 0, context)
+        tool.on_mouse_up(1, 1, 0, context)
+
+        tool.cut_selection(context)
+        assert len(tool.clipboard["tiles"]) == 4
+        assert tilemap.get_tile(1, 1, 0) is None
+
+        assert context.undo_manager.undo()
+        assert _types(tilemap) == before
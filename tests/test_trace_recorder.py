@@ -0,0 +1,189 @@
+"""
+Tests for the trace recorder
+
+Tests the span ring buffer, Chrome Trace Event export with thread ids and
+last-N-seconds filtering, the global tracing helpers, and the spans recorded
+by World updates, background saves and the debug console.
+"""
+
+import json
+import threading
+import time
+
+import pygame
+import pytest
+
+from neonworks.core.background_save import BackgroundSaver
+from neonworks.core.ecs import System, World
+from neonworks.ui.debug_console_ui import DebugConsoleUI
+from neonworks.utils.trace_recorder import (
+    TraceRecorder,
+    get_trace_recorder,
+    start_tracing,
+    stop_tracing,
+    trace_span,
+    traced,
+)
+
+
+class QuickSystem(System):
+    def update(self, world, delta_time):
+        pass
+
+
+@pytest.fixture(autouse=True)
+def no_global_tracing():
+    stop_tracing()
+    yield
+    stop_tracing()
+
+
+def _spans(trace):
+    return [event for event in trace["traceEvents"] if event["ph"] == "X"]
+
+
+class TestTraceRecorder:
+    """Test the span ring buffer and its export"""
+
+    def test_ring_buffer_keeps_newest_spans(self):
+        """A full buffer overwrites its oldest spans"""
+        recorder = TraceRecorder(capacity=4)
+        now = time.perf_counter_ns()
+        for index in range(6):
+            recorder.record(f"span{index}", "test", now + index * 1000, now + index * 1000 + 500)
+
+        assert len(recorder) == 4 and recorder.dropped == 2
+        spans = _spans(recorder.to_chrome_trace())
+        assert [span["name"] for span in spans] == ["span2", "span3", "span4", "span5"]
+        assert spans[1]["ts"] - spans[0]["ts"] == pytest.approx(1.0)
+        assert spans[0]["dur"] == pytest.approx(0.5)
+
+        recorder.clear()
+        assert len(recorder) == 0 and _spans(recorder.to_chrome_trace()) == []
+
+    def test_chrome_trace_format(self, tmp_path):
+        """Dumps are Chrome Trace Event JSON with complete events and metadata"""
+        recorder = TraceRecorder()
+        with recorder.span("load", "asset", {"path": "hero.png"}):
+            pass
+
+        path = recorder.dump(tmp_path / "traces" / "trace.json")
+        trace = json.loads(path.read_text())
+
+        assert trace["displayTimeUnit"] == "ms"
+        (span,) = _spans(trace)
+        assert span["name"] == "load" and span["cat"] == "asset"
+        assert span["args"] == {"path": "hero.png"}
+        assert span["tid"] == threading.get_native_id()
+        names = {e["args"]["name"] for e in trace["traceEvents"] if e["ph"] == "M"}
+        assert threading.current_thread().name in names
+
+    def test_last_seconds(self):
+        """Flight recorder dumps keep only recent spans"""
+        recorder = TraceRecorder()
+        now = time.perf_counter_ns()
+        recorder.record("old", "test", now - 10_000_000_000, now - 9_000_000_000)
+        recorder.record("new", "test", now - 1_000_000, now)
+
+        assert [s["name"] for s in _spans(recorder.to_chrome_trace(last_seconds=5))] == ["new"]
+        assert len(_spans(recorder.to_chrome_trace())) == 2
+
+    def test_spans_from_worker_threads(self):
+        """Spans carry the native id and name of their thread"""
+        recorder = TraceRecorder()
+
+        def work():
+            with recorder.span("work", "worker"):
+                pass
+
+        threads = [threading.Thread(target=work, name=f"worker-{i}") for i in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        trace = recorder.to_chrome_trace()
+        assert len({span["tid"] for span in _spans(trace)}) == 3
+        thread_names = [
+            e["args"]["name"] for e in trace["traceEvents"] if e["name"] == "thread_name"
+        ]
+        assert sorted(thread_names) == ["worker-0", "worker-1", "worker-2"]
+
+    def test_invalid_capacity(self):
+        with pytest.raises(ValueError):
+            TraceRecorder(capacity=0)
+
+
+class TestGlobalTracing:
+    """Test the global recorder helpers"""
+
+    def test_spans_are_free_while_off(self):
+        """trace_span returns a shared no-op and traced calls straight through"""
+
+        @traced("double", "test")
+        def double(value):
+            return value * 2
+
+        assert trace_span("a") is trace_span("b")
+        assert double(2) == 4
+        assert get_trace_recorder() is None
+
+        recorder = start_tracing()
+        assert start_tracing() is recorder
+        with trace_span("block", "test"):
+            assert double(3) == 6
+
+        names = [span["name"] for span in _spans(recorder.to_chrome_trace())]
+        assert sorted(names) == ["block", "double"]
+        assert stop_tracing() is recorder and get_trace_recorder() is None
+
+
+def test_world_records_update_and_system_spans():
+    """Traced worlds record each update and system; untraced worlds use the plain loop"""
+    world = World()
+    world.add_system(QuickSystem())
+    recorder = world.enable_tracing(TraceRecorder())
+    profiler = world.enable_profiling()
+
+    world.update(0.016)
+    world.disable_profiling()
+    world.update(0.016)
+
+    names = [span["name"] for span in _spans(recorder.to_chrome_trace())]
+    assert names == ["World.update", "QuickSystem"] * 2
+    assert profiler.update_count == 1
+
+    world.disable_tracing()
+    assert "update" not in vars(world)
+
+
+def test_background_save_spans_on_worker_thread():
+    """Save snapshots are traced on the caller and writes on the save thread"""
+    recorder = start_tracing()
+    saver = BackgroundSaver()
+
+    assert saver.save(lambda: 1, lambda state: None)
+    assert saver.wait(5)
+
+    spans = {span["name"]: span for span in _spans(recorder.to_chrome_trace())}
+    assert spans["save_snapshot"]["tid"] == threading.get_native_id()
+    assert spans["save_write"]["tid"] != spans["save_snapshot"]["tid"]
+
+
+def test_debug_console_trace_command(tmp_path):
+    """The debug console starts the flight recorder and dumps recent spans"""
+    world = World()
+    world.add_system(QuickSystem())
+    console = DebugConsoleUI(pygame.Surface((320, 240)), world)
+
+    console.execute_command("trace dump")
+    assert "off" in console.output_log[-1][0]
+
+    console.execute_command("trace start")
+    world.update(0.016)
+    output = tmp_path / "trace.json"
+    console.execute_command(f"trace dump 10 {output}")
+
+    assert "QuickSystem" in [span["name"] for span in _spans(json.loads(output.read_text()))]
+    console.execute_command("trace stop")
+    assert get_trace_recorder() is None and world.tracer is None
@@ -1608,5 +1608,96 @@ class TestUndoManagerAdditionalCoverage:
         assert "(5, 5)" in description
 
 
+class SizedCommand(Command):
+    """Command holding a payload of a known size."""
+
+    def __init__(self, size):
+        super().__init__()
+        self.payload = bytes(size)
+
+    def execute(self):
+        return True
+
+    def undo(self):
+        return True
+
+    def get_description(self):
+        return f"Sized {len(self.payload)}"
+
+    def serialize(self):
+        return {"type": "sized", "size": len(self.payload)}
+
+    @classmethod
+    def deserialize(cls, data):
+        return cls(data["size"])
+
+
+class TestUndoManagerMemoryBudget:
+    """Test suite for byte-budgeted history."""
+
+    def test_memory_usage_counts_payloads(self):
+        """Test that memory usage includes data owned by commands."""
+        manager = UndoManager()
+        manager.execute(SizedCommand(100_000))
+
+        memory = manager.get_memory_usage()
+        assert memory["undo_stack_bytes"] > 100_000
+
+    def test_shared_attributes_not_counted(self):
+        """Test that referenced objects are left out of command sizes."""
+        walkable = {(x, y) for x in range(100) for y in range(100)}
+        cmd = NavmeshPaintCommand(walkable, set(), [(0, 0, True, False)])
+
+        assert cmd.memory_size() < 2048
+
+    def test_budget_drops_oldest_commands(self):
+        """Test that the oldest commands are dropped to stay within budget."""
+        manager = UndoManager(enable_compression=False, max_bytes=500_000)
+        for _ in range(10):
+            manager.execute(SizedCommand(100_000))
+
+        memory = manager.get_memory_usage()
+        assert memory["total_bytes"] <= 500_000
+        assert memory["undo_count"] == 4
+        assert manager.get_statistics()["dropped_count"] == 6
+
+    def test_budget_keeps_newest_command(self):
+        """Test that a command larger than the budget stays undoable."""
+        manager = UndoManager(max_bytes=1000)
+        manager.execute(SizedCommand(10_000))
+
+        assert manager.can_undo()
+
+    def test_old_commands_compressed_in_batches(self):
+        """Test that old commands are compressed together."""
+        manager = UndoManager(auto_compress_threshold=20, compress_batch_size=8)
+        for _ in range(21):
+            manager.execute(SizedCommand(10))
+
+        assert len(manager.compressed_history) == 1
+        assert len(manager.undo_stack) == 12
+        assert manager.get_memory_usage()["compressed_count"] == 9
+
+        commands = manager.compressor.decompress(manager.compressed_history[0])
+        assert commands == [{"type": "sized", "size": 10}] * 9
+
+    def test_compressed_blocks_dropped_first(self):
+        """Test that compressed history is dropped before live commands."""
+        manager = UndoManager(auto_compress_threshold=4, compress_batch_size=2)
+        for _ in range(5):
+            manager.execute(SizedCommand(100_000))
+        assert len(manager.compressed_history) == 1
+        assert len(manager.undo_stack) == 2
+
+        # Leave room for the live commands but not the compressed block
+        small = SizedCommand(10)
+        manager.max_bytes = manager.get_memory_usage()["undo_stack_bytes"] + small.memory_size()
+        manager.execute(small)
+
+        assert len(manager.compressed_history) == 0
+        assert len(manager.undo_stack) == 3
+        assert manager.get_statistics()["dropped_count"] == 3
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -12,7 +12,10 @@ from unittest.mock import Mock, patch
 import pytest
 
 from neonworks.core.ecs import Entity, GridPosition, Sprite, Transform, World
+from neonworks.core.event_commands import ControlSwitchesCommand, EventPage, GameEvent, GameState
+from neonworks.core.event_triggers import EventTriggerManager
 from neonworks.core.events import EventType
+from neonworks.engine.core.event_interpreter import EventInterpreter
 from neonworks.gameplay.movement import Direction, TileCollisionMap, ZoneTrigger
 from neonworks.systems.zone_system import ZoneData, ZoneSystem
 
@@ -140,6 +143,32 @@ class TestZoneLoading:
         assert zone.spawn_points["entrance"] == (10, 14, Direction.UP)
         assert zone.properties["weather"] == "sunny"
 
+    def test_load_zone_precompiles_events(self, tmp_path):
+        """Test that zone events are compiled for the interpreter as the zone loads"""
+        game_state = GameState()
+        interpreter = EventInterpreter(game_state)
+        manager = EventTriggerManager(game_state=game_state)
+        page = EventPage(commands=[ControlSwitchesCommand(switch_id=1, value=True)])
+        manager.add_event(GameEvent(id=1, name="Sign", x=2, y=3, pages=[page]))
+
+        maps_dir = tmp_path / "maps"
+        maps_dir.mkdir()
+        zone_data = {"name": "Town", "events": manager.to_dict()["events"]}
+        (maps_dir / "town.json").write_text(json.dumps(zone_data))
+
+        system = ZoneSystem(Mock(), asset_base_path=str(tmp_path))
+        system.set_event_interpreter(interpreter)
+        assert system.load_zone(World(), "town")
+
+        events = system.get_current_zone_data().events
+        assert events.game_state is game_state
+        assert [event.name for event in events.events.values()] == ["Sign"]
+        assert interpreter.get_statistics()["pages_compiled"] == 1
+
+        event = next(iter(events.events.values()))
+        interpreter.start_event(event, event.pages[0])
+        assert interpreter.get_statistics()["pages_compiled"] == 1
+
     def test_load_zone_creates_default_spawn(self, tmp_path):
         """Test loading zone creates default spawn point if missing"""
         zone_data = {